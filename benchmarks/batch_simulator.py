@@ -0,0 +1,142 @@
+"""
+Colocaciones por segundo del simulador en lote frente a partidas individuales.
+
+Ambos caminos juegan con la misma política aleatoria (rotación y columna al azar + hard drop);
+las partidas terminadas se reinician para mantener el lote lleno. Antes de medir se comprueba
+que BatchSimulator.press puntúa igual que GameBoardController: teclas al azar y un T-spin double
+armado a mano (dos veces seguidas, para cubrir el back-to-back).
+
+Uso:
+    python -m benchmarks.batch_simulator
+"""
+import time
+import numpy as np
+from benchmarks.common import load_gameplay_config
+from src.core.batch_simulator import BatchSimulator
+from src.core.gameboard_controller import GameBoardController
+from src.core.action import Action
+
+KEYS = np.array([Action.MOVE_LEFT, Action.MOVE_RIGHT, Action.SOFT_DROP, Action.SOFT_DROP,
+                 Action.ROTATE_RIGHT, Action.ROTATE_LEFT, Action.HARD_DROP, Action.HOLD])
+
+
+def check_random_keys(config: dict, ruleset: dict, num_games: int = 16, steps: int = 2000) -> None:
+    """Teclas al azar: tablero, score y game over deben coincidir partida a partida."""
+    rng = np.random.default_rng(1)
+    sim = BatchSimulator(config, ruleset, num_games, seed=7)
+    sim.start()
+    games = [GameBoardController(config, ruleset, seed=7 + i, animate_clears=False) for i in range(num_games)]
+    for game in games:
+        game.start()
+
+    for step in range(steps):
+        keys = KEYS[rng.integers(len(KEYS), size=num_games)]
+        sim.press(keys)
+        for i, game in enumerate(games):
+            if game.is_game_over():
+                continue
+            locked = game.pieces_locked
+            game.perform(Action(keys[i]))
+            game.update(0.0)
+            if game.pieces_locked > locked:
+                game.update(0.0)    # el controlador genera la pieza siguiente en el próximo frame
+            same = (np.array_equal(np.asarray(game.board.matrix) != 0, sim.boards[i] != 0)
+                    and game.current_score == sim.score[i] and game.is_game_over() == sim.game_over[i])
+            assert same, f"teclas al azar: la partida {i} difiere en el paso {step}"
+
+
+def t_spin_double_board() -> np.ndarray:
+    """Hueco de T-spin double en las dos filas de abajo, tapado por un bloque en (17, 3)."""
+    matrix = np.zeros((20, 10), dtype=np.int64)
+    matrix[18:, :] = 1
+    matrix[18, 3:6] = 0
+    matrix[19, 4] = 0
+    matrix[17, 3] = 1
+    return matrix
+
+
+def check_t_spin_double(config: dict, ruleset: dict) -> None:
+    """Una T apoyada en el hueco rota a su lugar: dos T-spin doubles seguidos (el segundo con back-to-back)."""
+    game = GameBoardController(config, ruleset, seed=0, animate_clears=False)
+    game.start()
+    sim = BatchSimulator(config, ruleset, 1, seed=0)
+    sim.start()
+    t_id = sim.piece_names.index("T")
+
+    for _ in range(2):
+        game.board.set_matrix(t_spin_double_board())
+        game.restore(game.snapshot()._replace(piece=("T", 17, 3, 1, 17, 3, 1, True)))
+        game.perform(Action.ROTATE_RIGHT)
+        game.update(1.0)    # sin gravedad ni lock delay pendientes la pieza se bloquea en el lugar
+
+        sim.boards[0] = t_spin_double_board()
+        sim.piece[0], sim.rot[0], sim.row[0], sim.col[0] = t_id, 1, 17, 3
+        sim.press(np.array([Action.ROTATE_RIGHT]))
+        if sim.last_lines[0] == 0:
+            sim.press(np.array([Action.SOFT_DROP]))    # con lock delay bloquea al no poder bajar
+
+        assert game.score.last_move_type == "t_spin" and game.last_lines_cleared == 2, "el controlador no hizo el T-spin double"
+        assert game.current_score == sim.score[0], f"T-spin double: {game.current_score} != {sim.score[0]}"
+        game.update(0.0)
+
+
+def check_equivalence(config: dict) -> None:
+    """Comprueba que BatchSimulator.press puntúa como GameBoardController."""
+    check_random_keys(config, config["rulesets"]["nes"])
+    for name in ("nes", "guideline"):
+        check_t_spin_double(config, config["rulesets"][name])
+    print("BatchSimulator.press coincide con GameBoardController (teclas al azar y T-spin double)")
+
+
+def single_games(config: dict, ruleset: dict, placements: int) -> float:
+    """Colocaciones por segundo con GameBoardController, una partida a la vez."""
+    rng = np.random.default_rng(0)
+    game = GameBoardController(config, ruleset, animate_clears=False)
+    game.start()
+    start = time.perf_counter()
+    for _ in range(placements):
+        if game.is_game_over():
+            game = GameBoardController(config, ruleset, animate_clears=False)
+            game.start()
+        for _ in range(rng.integers(4)):
+            game.rotate_right()
+        target = int(rng.integers(-2, 10))
+        while game.piece.col != target:
+            if not (game.move_left() if target < game.piece.col else game.move_right()):
+                break
+        game.hard_drop()
+        game.update(0.0)
+    return placements / (time.perf_counter() - start)
+
+
+def batch_games(config: dict, ruleset: dict, num_games: int, steps: int) -> float:
+    """Colocaciones por segundo con BatchSimulator de num_games partidas."""
+    rng = np.random.default_rng(0)
+    sim = BatchSimulator(config, ruleset, num_games)
+    sim.start()
+    placed = 0
+    start = time.perf_counter()
+    for _ in range(steps):
+        finished = np.flatnonzero(sim.game_over)
+        if finished.size:
+            sim.reset(finished)
+        sim.step(rng.integers(0, 4, num_games), rng.integers(-2, 10, num_games))
+        placed += num_games
+    return placed / (time.perf_counter() - start)
+
+
+def main() -> None:
+    config = load_gameplay_config()
+    ruleset = config["rulesets"]["guideline"]
+    check_equivalence(config)
+
+    base = single_games(config, ruleset, 20000)
+    print("\nColocaciones por segundo (política aleatoria, un núcleo)")
+    print(f"{'GameBoardController':<28}{base:>14,.0f} /s{1:>8.1f}x")
+    for num_games in (64, 1024, 4096):
+        rate = batch_games(config, ruleset, num_games, steps=max(20, 200000 // num_games))
+        print(f"{f'BatchSimulator N={num_games}':<28}{rate:>14,.0f} /s{rate / base:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
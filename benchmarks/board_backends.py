@@ -0,0 +1,111 @@
+"""
+Compara el backend matricial (Board) contra el backend de bits (BitBoard).
+
+Mide is_valid_move, calculate_ghost y clear_lines sobre una pila de mitad de partida:
+la detección tras un bloqueo que no completa filas (el caso de casi todas las piezas)
+y la remoción de 4 filas.
+
+Uso:
+    python -m benchmarks.board_backends
+"""
+import time
+import numpy as np
+from benchmarks.common import random_stack, measure, report
+from src.constants import ROWS, COLS, PIECE_SPAWN_OFFSET
+from src.core.board import Board
+from src.core.bitboard import BitBoard
+from src.core.piece import Piece
+from src.core.piece_shapes import build_piece_shapes
+from src.core.piece_mechanics import PieceMechanics
+from src.core.strategy.gravity_strategy import FixedGravity
+from src.core.strategy.lock_strategy import FixedLock
+
+
+def make_board(board_class: type[Board], stack: np.ndarray) -> Board:
+    board = board_class(ROWS, COLS)
+    board.set_matrix(stack)
+    return board
+
+
+def bench_is_valid_move(board: Board, pieces) -> float:
+    probes = [Piece(name, pieces[name], row, col, rot)
+              for name in pieces for rot in range(4)
+              for row, col in ((2, 3), (10, 0), (12, 6))]
+
+    def run() -> None:
+        for piece in probes:
+            board.is_valid_move(piece)
+
+    return measure(run, number=200) / len(probes)
+
+
+def bench_ghost(board: Board, pieces) -> float:
+    mechanics = PieceMechanics(FixedGravity("fixed", {"fall_delay": 0.8}),
+                               FixedLock("fixed", {"lock_delay": 0.8}), board)
+    probes = []
+    for name in pieces:
+        piece = Piece(name, pieces[name])
+        piece.center(COLS, spawn_offset=PIECE_SPAWN_OFFSET)
+        probes.append(piece)
+
+    def run() -> None:
+        for piece in probes:
+            piece.ghost_row = -1  # fuerza el recálculo
+            mechanics.calculate_ghost(piece)
+
+    return measure(run, number=200) / len(probes)
+
+
+def bench_clear_lines(board_class: type[Board], stack: np.ndarray, pieces) -> tuple[float, float]:
+    """Devuelve (bloqueo + clear_lines sin filas completas, remoción de 4 filas)."""
+    board = make_board(board_class, stack)
+    board.clear_lines()
+    # Bloquear otra vez en las mismas celdas no cambia el tablero: cada vuelta mide lo mismo
+    piece = Piece("T", pieces["T"], 0, 3, 0)
+
+    def lock_and_detect() -> None:
+        board.lock_piece(piece)
+        board.clear_lines()
+
+    detect = measure(lock_and_detect, number=2000)
+
+    # Cuatro filas completas en la base para forzar la remoción. Solo se cronometra la
+    # remoción: restar el costo de set_matrix deja un número dominado por el ruido
+    full = stack.copy()
+    full[-4:, :] = 1
+    board = make_board(board_class, full)
+    remove = float("inf")
+    for _ in range(5):
+        elapsed = 0.0
+        for _ in range(1000):
+            board.set_matrix(full)
+            fullrows = board._find_fullrows()
+            start = time.perf_counter()
+            board._remove_filled_lines(fullrows)
+            elapsed += time.perf_counter() - start
+        remove = min(remove, elapsed / 1000)
+    return detect, remove
+
+
+def main() -> None:
+    pieces = build_piece_shapes()
+    stack = np.array(random_stack(ROWS, COLS, height=8))
+
+    results = []
+    matrix_board = make_board(Board, stack)
+    bit_board = make_board(BitBoard, stack)
+
+    results.append(("is_valid_move", bench_is_valid_move(matrix_board, pieces),
+                    bench_is_valid_move(bit_board, pieces)))
+    results.append(("calculate_ghost", bench_ghost(matrix_board, pieces),
+                    bench_ghost(bit_board, pieces)))
+    base_detect, base_remove = bench_clear_lines(Board, stack, pieces)
+    bit_detect, bit_remove = bench_clear_lines(BitBoard, stack, pieces)
+    results.append(("lock_piece + clear_lines", base_detect, bit_detect))
+    results.append(("remoción de 4 filas", base_remove, bit_remove))
+
+    report("Board (matrix) vs BitBoard", results)
+
+
+if __name__ == "__main__":
+    main()
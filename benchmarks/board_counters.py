@@ -0,0 +1,70 @@
+"""
+Cálculo del ghost y detección de filas completas con y sin contadores incrementales.
+
+"Antes" reproduce el camino original: el ghost baja fila a fila con is_valid_move y las
+filas completas se buscan con np.all sobre todo el tablero después de cada bloqueo.
+
+Uso:
+    python -m benchmarks.board_counters
+"""
+import numpy as np
+from benchmarks.common import random_stack, measure, report
+from src.constants import ROWS, COLS
+from src.core.board import Board
+from src.core.bitboard import BitBoard
+from src.core.piece import Piece
+from src.core.piece_shapes import build_piece_shapes
+
+
+def legacy_ghost(board: Board, piece: Piece) -> int:
+    floor_row = board.rows - 1 - piece.bounds[1]
+    row = piece.row
+    while row < floor_row and board.is_valid_move(piece, row + 1, piece.col):
+        row += 1
+    return row
+
+
+def legacy_fullrows(board: Board) -> np.ndarray:
+    return np.where(np.all(board.matrix != 0, axis=1))[0]
+
+
+def main() -> None:
+    pieces = build_piece_shapes()
+    stack = np.array(random_stack(ROWS, COLS, height=8))
+    rows = []
+
+    for board_class in (Board, BitBoard):
+        board = board_class(ROWS, COLS)
+        board.set_matrix(stack)
+        # Piezas recién generadas en cada columna y rotación posibles
+        spawned = []
+        for name in pieces:
+            for rot in range(4):
+                _, _, left, right = pieces[name]["bounds"][rot]
+                spawned += [Piece(name, pieces[name], row=-2, col=col, rot=rot)
+                            for col in range(-left, COLS - right)]
+        touched = set(range(14, 18))
+
+        def ghost_before() -> None:
+            for piece in spawned:
+                legacy_ghost(board, piece)
+
+        def ghost_after() -> None:
+            for piece in spawned:
+                board.drop_row(piece)
+
+        def fullrows_after() -> None:
+            board._touched_rows = set(touched)
+            board._find_fullrows()
+
+        name = board_class.__name__
+        rows.append((f"{name}: ghost x{len(spawned)}",
+                     measure(ghost_before, number=200), measure(ghost_after, number=200)))
+        rows.append((f"{name}: filas completas",
+                     measure(lambda: legacy_fullrows(board)), measure(fullrows_after)))
+
+    report("Contadores incrementales de fila y columna", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Chequeos de colisión por segundo antes y después de las tablas de offsets por rotación.
+
+"Antes" reproduce el camino original: Piece.get_cells con np.ndenumerate sobre la matriz
+de rotación y la validación celda por celda contra Board.matrix.
+
+Uso:
+    python -m benchmarks.collision_checks
+"""
+import numpy as np
+from benchmarks.common import random_stack, measure
+from src.constants import ROWS, COLS
+from src.core.board import Board
+from src.core.bitboard import BitBoard
+from src.core.piece import Piece
+from src.core.piece_shapes import build_piece_shapes
+
+
+def legacy_get_cells(piece: Piece, row: int, col: int) -> list[tuple[int, int]]:
+    cells: list[tuple[int, int]] = []
+    for (r, c), block in np.ndenumerate(piece.matrix):
+        if block:
+            cells.append((row + r, col + c))
+    return cells
+
+
+def legacy_is_valid_move(board: Board, piece: Piece, row: int, col: int) -> bool:
+    for r, c in legacy_get_cells(piece, row, col):
+        if r >= board.rows or (c < 0 or c >= board.cols) or (r >= 0 and board.matrix[r, c]):
+            return False
+    return True
+
+
+def main() -> None:
+    pieces = build_piece_shapes()
+    stack = np.array(random_stack(ROWS, COLS, height=8))
+
+    matrix_board = Board(ROWS, COLS)
+    matrix_board.set_matrix(stack)
+    bit_board = BitBoard(ROWS, COLS)
+    bit_board.set_matrix(stack)
+
+    # Mezcla de posiciones: espacio libre, contacto con la pila y fuera de los bordes
+    probes = [(Piece(name, pieces[name], rot=rot), row, col)
+              for name in pieces for rot in range(4)
+              for row, col in ((-2, 3), (4, 4), (10, 0), (12, 6), (17, 8), (5, -2))]
+
+    def legacy() -> None:
+        for piece, row, col in probes:
+            legacy_is_valid_move(matrix_board, piece, row, col)
+
+    def with_offsets() -> None:
+        for piece, row, col in probes:
+            matrix_board.is_valid_move(piece, row, col)
+
+    def with_row_masks() -> None:
+        for piece, row, col in probes:
+            bit_board.is_valid_move(piece, row, col)
+
+    print(f"\nChequeos de colisión por segundo ({len(probes)} posiciones de prueba)")
+    base = None
+    for name, fn in (("antes (ndenumerate)", legacy),
+                     ("offsets + Board", with_offsets),
+                     ("row masks + BitBoard", with_row_masks)):
+        per_check = measure(fn, number=200) / len(probes)
+        base = base or per_check
+        print(f"{name:<24}{1 / per_check:>14,.0f} /s{base / per_check:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
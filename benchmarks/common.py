@@ -0,0 +1,140 @@
+"""
+Utilidades compartidas por los micro-benchmarks.
+
+Los benchmarks se ejecutan desde la raíz del proyecto, por ejemplo:
+    python -m benchmarks.board_backends
+"""
+import os
+import json
+import time
+import random
+from pathlib import Path
+from typing import Callable, TYPE_CHECKING
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from src.constants import PIECE_DEFINITIONS, BLOCK_W, BLOCK_H, ROWS, COLS
+
+if TYPE_CHECKING:
+    import pygame
+    from src.core.types import PieceDataType
+    from src.states.play_state import PlayState
+
+
+def load_gameplay_config() -> dict:
+    """Lee config/gameplay.json sin pasar por src.util (que importa pygame)."""
+    path = Path(__file__).resolve().parents[1] / "config" / "gameplay.json"
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def build_pieces() -> "PieceDataType":
+    """
+    Registra las piezas con surfaces vacías (no requiere cargar assets).
+
+    pygame se importa aquí para que los benchmarks sin render no lo carguen.
+    """
+    import pygame
+    from src.resources.piece_library import PieceLibrary
+
+    library = PieceLibrary()
+    for name, info in PIECE_DEFINITIONS.items():
+        block = pygame.Surface((BLOCK_W, BLOCK_H))
+        library.register_piece(name, info["matrix"], {"normal": block, "placed": block, "ghost": block},
+                               info["spritesheet_col"])
+    return library.pieces
+
+
+def board_surface() -> "pygame.Surface":
+    import pygame
+    return pygame.Surface((BLOCK_W * COLS, BLOCK_H * ROWS), pygame.SRCALPHA)
+
+
+def random_stack(rows: int, cols: int, height: int, seed: int = 0) -> list[list[int]]:
+    """
+    Genera una pila de tipo mitad de partida: `height` filas inferiores con un hueco aleatorio
+    por fila y algunas celdas vacías adicionales.
+    """
+    rng = random.Random(seed)
+    matrix = [[0] * cols for _ in range(rows)]
+    for r in range(rows - height, rows):
+        for c in range(cols):
+            matrix[r][c] = rng.randint(1, 7)
+        matrix[r][rng.randrange(cols)] = 0
+        if rng.random() < 0.5:
+            matrix[r][rng.randrange(cols)] = 0
+    return matrix
+
+
+def measure(fn: Callable[[], object], repeat: int = 5, number: int = 1000) -> float:
+    """Devuelve el mejor tiempo por llamada (segundos) entre `repeat` rondas de `number` llamadas."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def report(title: str, rows: list[tuple[str, float, float]]) -> None:
+    """Imprime una tabla (operación, base, optimizado) en microsegundos con el speedup."""
+    print(f"\n{title}")
+    print(f"{'operación':<28}{'base (us)':>12}{'nuevo (us)':>12}{'speedup':>10}")
+    for name, base, new in rows:
+        print(f"{name:<28}{base * 1e6:>12.2f}{new * 1e6:>12.2f}{base / new:>9.1f}x")
+
+
+def make_play_state(ruleset_name: str = "guideline", autoplay: bool = False,
+                    royale: bool = False) -> "tuple[object, PlayState]":
+    """
+    Arma un juego mínimo con los recursos reales (driver de video dummy) y entra a PlayState.
+
+    Reemplaza a src.core.game.Game, que depende del SDK de la máquina arcade.
+
+    Args:
+        ruleset_name: Ruleset de la partida.
+        autoplay: Si la partida la juega el bot (modo demo).
+        royale: Si se entra al battle royale (RoyaleState) en lugar de PlayState.
+
+    Returns:
+        tuple: (juego, PlayState activo con su partida iniciada).
+    """
+    import pygame
+    from types import SimpleNamespace
+    from src.config import ControlsConfig, BaseConfig
+    from src.database import Database
+    from src.resources import ResourceManager
+    from src.audio import AudioManager
+    from src.controller import InputManager
+    from src.states import StateManager, StateID
+    from src.states.play_state import PlayState
+    from src.constants import SCREEN_SIZE
+    from src.util.paths import get_path
+
+    pygame.init()
+    game = SimpleNamespace()
+    game.surface = pygame.display.set_mode(SCREEN_SIZE)
+    game.controls_config = ControlsConfig(path=str(get_path("config", "controls.json")))
+    game.gameplay_config = BaseConfig(path=str(get_path("config", "gameplay.json")))
+    game.database = Database(get_path("src", "database", "game_data.json"))
+    game.resources = ResourceManager()
+    game.resources.load()
+    game.audio = AudioManager()
+    game.audio.register_sounds(game.resources.get_sounds())
+    game.input = InputManager(game.controls_config.data)
+    game.state = StateManager(game)
+    game.background = game.resources.get_image("Background")
+
+    config = game.gameplay_config.data
+    ruleset = config["rulesets"][ruleset_name]
+    if royale:
+        game.state.change(StateID.ROYALE, session_data=config, ruleset=ruleset, ruleset_name=ruleset_name)
+    else:
+        game.state.change(StateID.PLAY, session_data=config, ruleset=ruleset, ruleset_name=ruleset_name,
+                          autoplay=autoplay)
+    play = next(state for state in game.state.stack if isinstance(state, PlayState))
+    if not autoplay:
+        play.session.start()
+    return game, play
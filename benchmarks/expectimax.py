@@ -0,0 +1,88 @@
+"""
+ExpectimaxBot: profundidad alcanzada y líneas por partida según el tiempo por jugada.
+
+Juega partidas sin render viendo solo las primeras PREVIEW piezas del preview, comparando
+HeuristicBot (que mira todas las piezas conocidas) con ExpectimaxBot, que además sigue
+por la distribución de la bolsa más allá del preview. Se informa el tiempo por jugada, la
+profundidad media (piezas miradas contando la actual), cuántas de ellas fueron nodos de azar,
+el porcentaje de subárboles resueltos por la caché y las líneas por partida. El p99 del
+tiempo por jugada muestra cuánto se pasa el bot de su budget.
+
+Uso:
+    python -m benchmarks.expectimax
+"""
+import time
+import numpy as np
+from src.core import GameBoardController
+from src.ai import ExpectimaxBot, HeuristicBot
+from benchmarks.common import load_gameplay_config
+
+
+def run(config: dict, make_bot, preview: int, games: int, pieces: int) -> dict[str, float]:
+    """Juega `games` partidas de hasta `pieces` piezas y devuelve los promedios."""
+    elapsed = decisions = lines = depth = chance = nodes = hits = 0
+    times = []
+    for seed in range(games):
+        controller = GameBoardController(config, config["rulesets"]["guideline"], animate_clears=False, seed=seed)
+        bot = make_bot(controller)
+        controller.start()
+        placed = 0
+        while not controller.is_game_over() and placed < pieces:
+            piece = controller.piece
+            if piece is None or piece.is_locked():
+                controller.update(0.0)
+                continue
+            hold = controller.hold_piece
+            known = controller.preview[:preview]
+            start = time.perf_counter()
+            if isinstance(bot, ExpectimaxBot):
+                plan = bot.choose(controller.board, piece.name, hold.name if hold else None, known,
+                                  controller.bag_remaining(len(known)), controller.bag_lot, controller.can_hold,
+                                  start=(piece.row, piece.col, piece.rot))
+                depth += bot.stats.depth
+                chance += bot.stats.chance_depth
+                nodes += bot.stats.nodes
+                hits += bot.stats.cache_hits
+            else:
+                plan = bot.choose(controller.board, piece.name, hold.name if hold else None, known,
+                                  controller.can_hold, start=(piece.row, piece.col, piece.rot),
+                                  depth=len(known) + 1)
+                depth += len(known) + 1
+            times.append(time.perf_counter() - start)
+            elapsed += times[-1]
+            decisions += 1
+            if plan is None:
+                break
+            for action in plan.actions:
+                controller.perform(action)
+            placed += 1
+            controller.update(0.0)
+        lines += controller.total_lines_cleared
+    return {
+        "ms":     elapsed / decisions * 1e3,
+        "p99":    float(np.percentile(times, 99)) * 1e3,
+        "depth":  depth / decisions,
+        "chance": chance / decisions,
+        "cache":  hits / max(1, hits + nodes) * 100,
+        "lines":  lines / games,
+    }
+
+
+def main(games: int = 2, pieces: int = 100) -> None:
+    config = load_gameplay_config()
+    print(f"\nExpectimaxBot ({games} partidas de hasta {pieces} piezas)")
+    print(f"{'preview':>8}  {'bot':<26}{'ms/jugada':>11}{'p99 ms':>8}{'profundidad':>13}{'azar':>7}{'caché %':>9}{'líneas':>9}")
+    for preview in (1, 3):
+        for name, make_bot in (
+            ("HeuristicBot", lambda c: HeuristicBot.for_controller(c)),
+            ("ExpectimaxBot 20 ms", lambda c: ExpectimaxBot.for_controller(c, budget=0.02)),
+            ("ExpectimaxBot 50 ms", lambda c: ExpectimaxBot.for_controller(c, budget=0.05)),
+            ("ExpectimaxBot 200 ms", lambda c: ExpectimaxBot.for_controller(c, budget=0.2)),
+        ):
+            result = run(config, make_bot, preview, games, pieces)
+            print(f"{preview:>8}  {name:<26}{result['ms']:>11.1f}{result['p99']:>8.1f}{result['depth']:>13.2f}{result['chance']:>7.2f}"
+                  f"{result['cache']:>9.1f}{result['lines']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
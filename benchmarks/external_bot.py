@@ -0,0 +1,70 @@
+"""
+ExternalBot: cuánto de la latencia del bot externo esconde el pipeline.
+
+Juega PIECES piezas en tiempo real (frames de 1/60 s) con BotInput y el bot de referencia
+(`python -m src.ai.bot_server`) como subproceso, con y sin pipeline y con distintos retrasos
+artificiales por jugada. Se informa la espera media desde que aparece la pieza hasta su primer
+input, las piezas cuya jugada ya estaba lista al aparecer y los timeouts.
+
+Uso:
+    python -m benchmarks.external_bot
+"""
+import sys
+import time
+from benchmarks.common import load_gameplay_config
+from src.core import GameBoardController
+from src.ai import BotInput, ExternalBot
+
+PIECES = 40
+FRAME  = 1 / 60
+
+
+def run(config: dict, ruleset: dict, delay: float, pipeline: bool) -> tuple[float, ExternalBot]:
+    """Devuelve (espera media por pieza en segundos, bot con sus estadísticas)."""
+    controller = GameBoardController(config, ruleset, animate_clears=False, seed=0)
+    command = [sys.executable, "-m", "src.ai.bot_server", "--delay", str(delay)]
+    bot = ExternalBot.for_controller(controller, command, timeout=0.5, pipeline=pipeline)
+    player = BotInput(controller, actions_per_second=60.0, think_delay=0.0, service=bot)
+    controller.start()
+
+    waits, spawned, piece = [], time.perf_counter(), None
+    last = time.perf_counter()
+    try:
+        while len(waits) < PIECES and not controller.is_game_over():
+            now = time.perf_counter()
+            dt, last = now - last, now
+            if controller.piece is not piece:
+                piece, spawned, waiting = controller.piece, now, True
+            actions = player.poll(dt)
+            if actions and waiting:
+                waits.append(now - spawned)
+                waiting = False
+            for action in actions:
+                if not controller.perform(action):
+                    player.reject()
+                    break
+            controller.update(dt)
+            time.sleep(max(0.0, FRAME - (time.perf_counter() - now)))
+    finally:
+        bot.close()
+    return sum(waits) / max(1, len(waits)), bot
+
+
+def main() -> None:
+    config = load_gameplay_config()
+    ruleset = config["rulesets"]["guideline"]
+
+    print(f"\nBot externo (HeuristicBot por stdin/stdout), {PIECES} piezas en tiempo real")
+    print(f"{'retraso ms':>11}{'pipeline':>10}{'espera ms':>11}{'latencia ms':>13}{'listas':>8}"
+          f"{'aciertos':>10}{'fallos':>8}{'timeouts':>10}")
+    for delay in (0.0, 0.05, 0.2):
+        for pipeline in (False, True):
+            wait, bot = run(config, ruleset, delay, pipeline)
+            stats = bot.stats
+            print(f"{delay * 1e3:>11.0f}{'sí' if pipeline else 'no':>10}{wait * 1e3:>11.1f}"
+                  f"{stats.mean_latency * 1e3:>13.1f}{stats.ready:>8}{stats.hits:>10}{stats.misses:>8}"
+                  f"{stats.timeouts:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Partidas completas sin render con el núcleo de simulación (sin pygame).
+
+Mide el tiempo de importación del núcleo y las partidas/piezas por segundo con una política
+aleatoria (rotación y columna al azar + hard drop) y líneas sin animación.
+
+Uso:
+    python -m benchmarks.headless_games
+"""
+import sys
+import time
+import random
+
+start = time.perf_counter()
+from src.core.gameboard_controller import GameBoardController
+import_time = time.perf_counter() - start
+
+from benchmarks.common import load_gameplay_config
+
+
+def play_random_game(config: dict, ruleset: dict, rng: random.Random) -> int:
+    """Juega una partida completa y devuelve la cantidad de piezas colocadas."""
+    game = GameBoardController(config, ruleset, animate_clears=False)
+    game.start()
+    placed = 0
+    while not game.is_game_over():
+        for _ in range(rng.randrange(4)):
+            game.rotate_right()
+        shift = rng.randint(-5, 5)
+        for _ in range(abs(shift)):
+            game.move_left() if shift < 0 else game.move_right()
+        game.hard_drop()
+        placed += 1
+        game.update(0.0)  # genera la siguiente pieza
+    return placed
+
+
+def main(games: int = 2000) -> None:
+    config = load_gameplay_config()
+    ruleset = config["rulesets"]["guideline"]
+    rng = random.Random(0)
+
+    start = time.perf_counter()
+    pieces = sum(play_random_game(config, ruleset, rng) for _ in range(games))
+    elapsed = time.perf_counter() - start
+
+    print(f"\nimport del núcleo: {import_time * 1e3:.1f} ms (pygame cargado: {'pygame' in sys.modules})")
+    print(f"{games} partidas en {elapsed:.2f} s -> {games / elapsed:,.0f} partidas/s, {pieces / elapsed:,.0f} piezas/s")
+
+
+if __name__ == "__main__":
+    main()
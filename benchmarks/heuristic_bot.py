@@ -0,0 +1,67 @@
+"""
+HeuristicBot: tiempo por decisión y líneas por partida sin render, con una jugada y con
+dos jugadas, evaluando la segunda tablero por tablero o en un solo lote.
+
+Uso:
+    python -m benchmarks.heuristic_bot
+"""
+import time
+import numpy as np
+from src.core import GameBoardController
+from src.ai import HeuristicBot
+from src.ai.evaluator import clear_full_rows, drop_all
+from benchmarks.common import load_gameplay_config
+
+
+class PerBoardBot(HeuristicBot):
+    """Misma búsqueda, pero la segunda jugada se evalúa con una llamada por tablero."""
+
+    def _score(self, board, name, placements, following):
+        scores = super()._score(board, name, placements, [])
+        if not following:
+            return scores
+
+        shape = self._data[name]
+        final = np.full(len(placements), -np.inf)
+        for index in np.argsort(scores)[::-1][:self.beam]:
+            placement = placements[index]
+            matrix = (board.matrix != 0)[None].copy()
+            for dr, dc in shape["offsets"][placement.rot]:
+                if placement.row + dr >= 0:
+                    matrix[0, placement.row + dr, placement.col + dc] = True
+            matrix, lines = clear_full_rows(matrix)
+            results, next_lines, valid, _ = drop_all(matrix, self._data[following[0]])
+            for move in np.flatnonzero(valid[0]):
+                value = self.evaluator.evaluate(results[0, move][None], lines + next_lines[0, move])[0]
+                final[index] = max(final[index], value)
+        return final
+
+
+def run(make_bot, config: dict, games: int, pieces: int) -> tuple[float, float]:
+    """Devuelve (ms por decisión, líneas por partida)."""
+    elapsed, decisions, lines = 0.0, 0, 0
+    for seed in range(games):
+        controller = GameBoardController(config, config["rulesets"]["guideline"], animate_clears=False, seed=seed)
+        bot = make_bot(controller)
+        start = time.perf_counter()
+        decisions += bot.play(controller, max_pieces=pieces)
+        elapsed += time.perf_counter() - start
+        lines += controller.total_lines_cleared
+    return elapsed / decisions * 1e3, lines / games
+
+
+def main(games: int = 3, pieces: int = 150) -> None:
+    config = load_gameplay_config()
+    print(f"\nHeuristicBot ({games} partidas de hasta {pieces} piezas)")
+    print(f"{'búsqueda':<40}{'ms/decisión':>14}{'líneas/partida':>18}")
+    for name, make_bot in (
+        ("una jugada", lambda c: HeuristicBot.for_controller(c, lookahead=False)),
+        ("dos jugadas, tablero por tablero", lambda c: PerBoardBot(None, c.pieces, c.mechanics.wall_kicks)),
+        ("dos jugadas, en lote", lambda c: HeuristicBot.for_controller(c)),
+    ):
+        ms, lines = run(make_bot, config, games, pieces)
+        print(f"{name:<40}{ms:>14.2f}{lines:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
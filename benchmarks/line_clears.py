@@ -0,0 +1,98 @@
+"""
+Carga con muchas líneas: un tetris cada pocas piezas, con y sin remoción en el lugar.
+
+"Antes" reproduce la remoción original (np.delete + np.vstack, que reemplaza `matrix`).
+Para cada variante se mide el tiempo por clear (bloqueo + detección + remoción) y, con
+tracemalloc, los bytes pico reservados durante el clear expresados también en tableros
+completos, y si `matrix` sigue siendo el mismo arreglo después de limpiar. Con la remoción en
+el lugar los bytes que quedan son los conjuntos y listas de índices de filas y la copia
+temporal que NumPy hace al bajar un bloque de filas sobre sí mismo, no un tablero nuevo.
+
+Uso:
+    python -m benchmarks.line_clears
+"""
+import time
+import tracemalloc
+import numpy as np
+from benchmarks.common import random_stack
+from src.constants import ROWS, COLS
+from src.core.board import Board
+from src.core.bitboard import BitBoard
+from src.core.piece import Piece
+from src.core.piece_shapes import build_piece_shapes
+
+
+class LegacyBoard(Board):
+    """Board con la remoción de filas original, que reserva arreglos nuevos en cada clear."""
+
+    def _remove_filled_lines(self, fullrows: "list[int] | np.ndarray") -> None:
+        removed = {int(r) for r in fullrows}
+        self.matrix = np.delete(self.matrix, fullrows, axis=0)
+        new_emptyrows = np.zeros((len(fullrows), self.cols), dtype=self.matrix.dtype)
+        self.matrix = np.vstack((new_emptyrows, self.matrix))
+        self._row_fill = [0] * len(removed) + [n for r, n in enumerate(self._row_fill) if r not in removed]
+        self._row_masks = [0] * len(removed) + [m for r, m in enumerate(self._row_masks) if r not in removed]
+        self._shift_surface(removed)
+
+
+def tetris_stack() -> np.ndarray:
+    """Pila de 12 filas cuyas 4 inferiores solo tienen libre la columna 0."""
+    stack = np.array(random_stack(ROWS, COLS, height=12))
+    stack[-4:, :] = 1
+    stack[-4:, 0] = 0
+    return stack
+
+
+def run(board_class: type[Board], clears: int = 2000, trace: bool = False) -> tuple[float, int, bool]:
+    """
+    Devuelve (segundos por clear, bytes pico por clear, matrix conservada).
+
+    Con trace=False no se mide memoria (tracemalloc distorsiona los tiempos).
+    """
+    pieces = build_piece_shapes()
+    stack = tetris_stack()
+    board = board_class(ROWS, COLS, animated=False)
+    matrix = board.matrix
+
+    # Tres piezas de relleno sobre la pila y luego una I vertical en la columna 0
+    fillers = [Piece("O", pieces["O"], row=ROWS - 14, col=col) for col in (2, 5, 7)]
+    tetris = Piece("I", pieces["I"], row=ROWS - 4, col=-2, rot=1)
+
+    elapsed, peak = 0.0, 0
+    if trace:
+        tracemalloc.start()
+    for _ in range(clears):
+        board.set_matrix(stack)
+        for piece in fillers:
+            board.lock_piece(piece)
+        board.clear_lines()
+
+        if trace:
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        board.lock_piece(tetris)
+        lines = board.clear_lines()
+        elapsed += time.perf_counter() - start
+        if trace:
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+        assert lines == 4
+    if trace:
+        tracemalloc.stop()
+    return elapsed / clears, peak, board.matrix is matrix
+
+
+def main() -> None:
+    print("\nTetris cada 4 piezas (bloqueo + detección + remoción)")
+    print(f"{'backend':<22}{'us/clear':>10}{'bytes pico':>12}{'tableros':>10}{'matrix igual':>14}")
+    for name, board_class in (("antes (delete+vstack)", LegacyBoard),
+                              ("Board en el lugar", Board),
+                              ("BitBoard en el lugar", BitBoard)):
+        per_clear, _, _ = run(board_class)
+        _, peak, same = run(board_class, clears=200, trace=True)
+        boards = peak / board_class(ROWS, COLS).matrix.nbytes
+        print(f"{name:<22}{per_clear * 1e6:>10.2f}{peak:>12,}{boards:>10.1f}{str(same):>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+PerfectClearSolver: tiempo de respuesta del perfect clear de 4 líneas desde tablero vacío.
+
+Para cada semilla arma una partida guideline (con hold), busca el perfect clear con la pieza
+activa y las próximas piezas de la bolsa, y verifica jugando los inputs en el controlador que
+el tablero queda vacío. Se mide con una tabla nueva por búsqueda (fría) y con una tabla
+compartida entre búsquedas, como la usaría un bot a lo largo de una partida, y con un budget
+de BUDGET segundos: las búsquedas que lo agotan cuentan como "unknown".
+
+Uso:
+    python -m benchmarks.perfect_clear
+"""
+import numpy as np
+from benchmarks.common import load_gameplay_config
+from src.core import GameBoardController
+from src.ai import PC_STATUSES, PerfectClearSolver
+
+SEEDS      = range(30)
+MAX_PIECES = 10
+BUDGET     = 0.1
+
+
+def play(controller: GameBoardController, actions: list) -> None:
+    for action in actions:
+        controller.perform(action)
+        controller.update(0.0)
+
+
+def main() -> None:
+    config = load_gameplay_config()
+    ruleset = config["rulesets"]["guideline"]
+    shared = PerfectClearSolver(budget=BUDGET)
+
+    print(f"\nPerfect clear de 4 líneas desde vacío, {len(SEEDS)} semillas, hasta {MAX_PIECES} piezas, "
+          f"budget {BUDGET * 1e3:.0f} ms")
+    print(f"{'tabla':<12}" + "".join(f"{status:>12}" for status in PC_STATUSES)
+          + f"{'mediana ms':>12}{'p90 ms':>9}{'máx ms':>9}{'nodos':>8}{'reinicios':>11}")
+    for label in ("fría", "compartida"):
+        times, nodes, restarts = [], [], []
+        counts = dict.fromkeys(PC_STATUSES, 0)
+        for seed in SEEDS:
+            solver = shared if label == "compartida" else PerfectClearSolver(budget=BUDGET)
+            controller = GameBoardController(config, ruleset, animate_clears=False, seed=seed)
+            controller.start()
+            result = solver.solve_controller(controller, MAX_PIECES)
+            times.append(solver.stats.seconds)
+            nodes.append(solver.stats.nodes)
+            restarts.append(solver.stats.restarts)
+            counts[result.status] += 1
+            if not result.solved:
+                continue
+            play(controller, result.solution.actions)
+            assert not controller.board.matrix.any(), f"semilla {seed}: el tablero no quedó vacío"
+
+        ms = np.array(times) * 1e3
+        print(f"{label:<12}" + "".join(f"{counts[status]:>12}" for status in PC_STATUSES)
+              + f"{np.median(ms):>12.1f}{np.percentile(ms, 90):>9.1f}{ms.max():>9.1f}"
+              f"{np.median(nodes):>8.0f}{np.median(restarts):>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
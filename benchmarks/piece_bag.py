@@ -0,0 +1,62 @@
+"""
+Piezas por segundo de PieceBag: cola con list.pop(0) y random global frente a la bolsa
+con semilla sobre deque, pidiendo pieza a pieza y con stream().
+
+Uso:
+    python -m benchmarks.piece_bag
+"""
+import random
+import time
+from src.constants import PIECE_DEFINITIONS
+from src.core.piece_bag import PieceBag
+
+
+class LegacyPieceBag:
+    """Bolsa original: list.pop(0) y random.shuffle global."""
+
+    def __init__(self, pieces: dict, multiplier: int) -> None:
+        self.available_pieces = list(pieces.keys())
+        self.multiplier = multiplier
+        self.queue: list[str] = []
+
+    def get_next_piece(self) -> str:
+        if not self.queue:
+            batch = self.available_pieces * self.multiplier
+            random.shuffle(batch)
+            self.queue.extend(batch)
+        return self.queue.pop(0)
+
+
+def legacy_pieces(multiplier: int, count: int) -> None:
+    bag = LegacyPieceBag(PIECE_DEFINITIONS, multiplier)
+    for _ in range(count):
+        bag.get_next_piece()
+
+
+def seeded_pieces(multiplier: int, count: int) -> None:
+    bag = PieceBag(PIECE_DEFINITIONS, multiplier, seed=1)
+    for _ in range(count):
+        bag.get_next_piece()
+
+
+def streamed_pieces(multiplier: int, count: int) -> None:
+    for _ in PieceBag(PIECE_DEFINITIONS, multiplier, seed=1).stream(count):
+        pass
+
+
+def main(count: int = 1_000_000) -> None:
+    print(f"\nPiezas por segundo ({count:,} piezas)")
+    print(f"{'bolsa':<34}{'bag_size 1':>16}{'bag_size 4':>16}")
+    for name, fn in (("antes (pop(0), random global)", legacy_pieces),
+                     ("get_next_piece con semilla", seeded_pieces),
+                     ("stream() con semilla", streamed_pieces)):
+        rates = []
+        for multiplier in (1, 4):
+            start = time.perf_counter()
+            fn(multiplier, count)
+            rates.append(count / (time.perf_counter() - start))
+        print(f"{name:<34}" + "".join(f"{r:>14,.0f}/s" for r in rates))
+
+
+if __name__ == "__main__":
+    main()
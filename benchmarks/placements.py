@@ -0,0 +1,67 @@
+"""
+Enumeración de posiciones finales: BFS directo con Piece y PieceMechanics (try_move /
+try_rotate sobre la pieza) frente a PlacementFinder, en tableros de mitad de partida.
+
+Uso:
+    python -m benchmarks.placements
+"""
+import numpy as np
+from collections import deque
+from src.constants import PIECE_DEFINITIONS, ROWS, COLS, PIECE_SPAWN_OFFSET
+from src.core import BitBoard, Piece, PieceMechanics, build_piece_shapes
+from src.core.placement_finder import PlacementFinder
+from src.core.strategy import create_gravity, create_lock
+from benchmarks.common import load_gameplay_config, random_stack, measure
+
+
+def mechanics_placements(board: BitBoard, mechanics: PieceMechanics, shapes: dict, name: str) -> set:
+    """BFS sobre (rot, row, col) moviendo una Piece real; devuelve las celdas de cada posición final."""
+    piece = Piece(name, shapes[name])
+    piece.center(board.cols, spawn_offset=PIECE_SPAWN_OFFSET)
+    start = (piece.rot, piece.row, piece.col)
+    seen, queue, finals = {start}, deque([start]), set()
+    moves = ((mechanics.try_move, (0, -1)), (mechanics.try_move, (0, 1)), (mechanics.try_move, (1, 0)),
+             (mechanics.try_rotate, (1,)), (mechanics.try_rotate, (-1,)))
+    while queue:
+        state = queue.popleft()
+        piece.rot, piece.row, piece.col = state
+        finals.add(frozenset(piece.get_cells(board.drop_row(piece), piece.col)))
+        for move, args in moves:
+            piece.rot, piece.row, piece.col = state
+            if move(piece, *args):
+                new_state = (piece.rot, piece.row, piece.col)
+                if new_state not in seen:
+                    seen.add(new_state)
+                    queue.append(new_state)
+    return finals
+
+
+def main(boards: int = 8) -> None:
+    config  = load_gameplay_config()
+    ruleset = config["rulesets"]["guideline"]
+    shapes  = build_piece_shapes()
+    finder  = PlacementFinder(shapes, wall_kicks=True)
+
+    print(f"\nPosiciones finales por pieza ({boards} tableros con pilas de 4 a 11 filas)")
+    print(f"{'pieza':<8}{'posiciones':>12}{'BFS con Piece (us)':>22}{'PlacementFinder (us)':>24}{'speedup':>10}")
+    for name in PIECE_DEFINITIONS:
+        base = new = 0.0
+        count = 0
+        for seed in range(boards):
+            board = BitBoard(ROWS, COLS, animated=False)
+            board.set_matrix(np.array(random_stack(ROWS, COLS, 4 + seed, seed)))
+            mechanics = PieceMechanics(create_gravity(ruleset, config), create_lock(ruleset, config),
+                                       board, wall_kicks=True)
+            expected = mechanics_placements(board, mechanics, shapes, name)
+            found = {frozenset(Piece(name, shapes[name], p.row, p.col, p.rot).get_cells())
+                     for p in finder.find(board, name)}
+            assert found == expected, f"{name}: las posiciones no coinciden (tablero {seed})"
+            count += len(found)
+            base += measure(lambda: mechanics_placements(board, mechanics, shapes, name), repeat=3, number=20)
+            new  += measure(lambda: finder.find(board, name), repeat=3, number=200)
+        print(f"{name:<8}{count / boards:>12.1f}{base / boards * 1e6:>22.0f}{new / boards * 1e6:>24.0f}"
+              f"{base / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
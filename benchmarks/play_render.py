@@ -0,0 +1,62 @@
+"""
+Tiempo por frame de PlayState.render con una pila alta, antes y después de la capa cacheada.
+
+"Antes" reproduce el BoardView original, que recorre la matriz con np.ndenumerate y hace un
+blit por bloque fijo en cada frame.
+
+Uso:
+    python -m benchmarks.play_render
+"""
+import numpy as np
+from benchmarks.common import make_play_state, random_stack, measure
+from src.constants import NUM_TO_PIECE, ROWS, COLS
+from src.render.board_view import BoardView
+
+
+class LegacyBoardView(BoardView):
+    """BoardView que redibuja todos los bloques fijos en cada frame."""
+
+    def draw(self, surface, board, pieces) -> None:
+        surface.blit(self._surface, self._rect)
+        center = board.cols // 2
+        anim_rows = board.anim_rows
+        anim_step = board.anim_step
+
+        for (row, col), block in np.ndenumerate(board.matrix):
+            if not block:
+                continue
+            if anim_rows and row in anim_rows and center - anim_step <= col <= center + anim_step - 1:
+                continue
+            bx = self._rect.x + col * self.cell_width
+            by = self._rect.y + row * self.cell_height
+            surface.blit(pieces[NUM_TO_PIECE[block]]["block"]["placed"], (bx, by))
+
+
+def main(frames: int = 300) -> None:
+    game, play = make_play_state()
+    play.session.board.set_matrix(np.array(random_stack(ROWS, COLS, height=16)))
+    screen = game.surface
+    view = play.view
+    cached = view.board_view
+    legacy = LegacyBoardView(cached._surface, cached.cell_width, cached.cell_height,
+                             cached._rect.x, cached._rect.y)
+
+    results = []
+    for name, board_view in (("antes (ndenumerate)", legacy), ("capa cacheada", cached)):
+        view._board = board_view
+        board = play.session.board
+        results.append((name,
+                        measure(lambda: play.render(screen), number=frames),
+                        measure(lambda: board_view.draw(screen, board, play.pieces), number=frames)))
+    view._board = cached
+
+    base_frame, base_board = results[0][1:]
+    print(f"\nPlayState.render con pila de 16 filas ({frames} frames)")
+    print(f"{'':<24}{'frame (ms)':>12}{'':>8}{'tablero (ms)':>14}")
+    for name, per_frame, per_board in results:
+        print(f"{name:<24}{per_frame * 1e3:>12.3f}{base_frame / per_frame:>7.1f}x"
+              f"{per_board * 1e3:>14.3f}{base_board / per_board:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
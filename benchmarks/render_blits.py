@@ -0,0 +1,52 @@
+"""
+Blits individuales frente a RenderBatch (Surface.blits) en el render del tablero y la UI.
+
+Se usa el driver de video dummy de SDL. "Antes" dibuja directo sobre la pantalla con un
+Surface.blit por llamada; "después" acumula los comandos de la capa y los envía con un solo
+Surface.blits. La última fila aísla el costo por llamada con los 200 bloques de una capa
+de tablero llena.
+
+Uso:
+    python -m benchmarks.render_blits
+"""
+import numpy as np
+from benchmarks.common import make_play_state, random_stack, measure, report
+from src.constants import ROWS, COLS, BLOCK_W, BLOCK_H
+from src.render.render_batch import RenderBatch
+
+
+def main(frames: int = 2000) -> None:
+    game, play = make_play_state()
+    play.session.board.set_matrix(np.array(random_stack(ROWS, COLS, height=16)))
+    screen = game.surface
+    view, ui = play.view, play.ui
+
+    def ui_direct() -> None:
+        for element in ui.elements:
+            if element.visible:
+                element.render(screen)
+
+    block = play.pieces["T"]["block"]["placed"]
+    cells = [(block, (c * BLOCK_W, r * BLOCK_H)) for r in range(ROWS) for c in range(COLS)]
+    batch = RenderBatch()
+
+    def cells_direct() -> None:
+        for source, dest in cells:
+            screen.blit(source, dest)
+
+    def cells_batched() -> None:
+        for source, dest in cells:
+            batch.blit(source, dest)
+        batch.flush(screen)
+
+    report("Blits por capa: individuales vs Surface.blits", [
+        ("GameBoardView.draw", measure(lambda: view._draw_layer(screen), number=frames),
+         measure(lambda: view.draw(screen), number=frames)),
+        ("UIManager.render", measure(ui_direct, number=frames), measure(lambda: ui.render(screen), number=frames)),
+        (f"{len(cells)} bloques de tablero", measure(cells_direct, number=frames // 4),
+         measure(cells_batched, number=frames // 4)),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Saltos dentro de un replay largo: graba una partida de MINUTES minutos jugada por BotInput
+(el bot de la demo) a 60 fps, con un keyframe cada KEYFRAME_INTERVAL piezas, y mide cuánto
+tarda ReplayPlayer.seek_time en llegar a instantes al azar, hacia adelante y hacia atrás,
+restaurando el keyframe más cercano frente a re-simular desde el inicio (replay sin
+keyframes, como los de la versión 1). Cada salto se verifica contra el estado obtenido
+reproduciendo el replay de corrido.
+
+Uso:
+    python -m benchmarks.replay_seek
+"""
+import random
+import time
+from dataclasses import replace
+from src.ai import BotInput
+from src.core import GameBoardController
+from src.replay import Replay, ReplayPlayer, ReplayRecorder
+from benchmarks.common import load_gameplay_config
+
+MINUTES = 8
+FRAME   = 1 / 60
+SEEKS   = 40
+
+
+def record_game(config: dict, ruleset_name: str, seed: int = 0) -> Replay:
+    """Graba MINUTES minutos (o hasta perder) jugados por BotInput."""
+    session = GameBoardController(config, config["rulesets"][ruleset_name], seed=seed)
+    recorder = ReplayRecorder(session.seed, ruleset_name, config)
+    bot = BotInput(session, actions_per_second=20.0, think_delay=0.05)
+    session.start()
+    for _ in range(int(MINUTES * 60 / FRAME)):
+        for action in bot.poll(FRAME):
+            recorder.record(action)
+            if not session.perform(action):
+                bot.reject()
+                break
+        session.update(recorder.advance(FRAME))
+        recorder.capture(session)
+        if session.is_game_over():
+            break
+    return recorder.finish(session.final_stats)
+
+
+def reference_states(replay: Replay, config: dict, frames: set[int]) -> dict[int, tuple]:
+    """Snapshots de la reproducción de corrido en los frames pedidos."""
+    player, states = ReplayPlayer(replay, config), {}
+    while True:
+        if player.frame in frames:
+            states[player.frame] = player.session.snapshot()
+        if not player.step():
+            return states
+
+
+def measure(replay: Replay, config: dict, targets: list[float]) -> tuple[list[float], list[int], list[int]]:
+    """Latencia y frames re-simulados de cada salto, y el frame al que llegó."""
+    player = ReplayPlayer(replay, config)
+    latencies, resimulated, frames = [], [], []
+    for seconds in targets:
+        started = time.perf_counter()
+        player.seek_time(seconds)
+        latencies.append(time.perf_counter() - started)
+        resimulated.append(player.resimulated)
+        frames.append(player.frame)
+    return latencies, resimulated, frames
+
+
+def main(ruleset_name: str = "guideline") -> None:
+    config = load_gameplay_config()
+    replay = Replay.from_bytes(record_game(config, ruleset_name).to_bytes())
+    bare = replace(replay, keyframe_interval=0, keyframes=())
+    duration = replay.duration
+
+    rng = random.Random(0)
+    targets = [rng.uniform(0, duration) for _ in range(SEEKS)]
+    with_keys, keyed_frames, reached = measure(replay, config, targets)
+    from_start, bare_frames, _ = measure(bare, config, targets)
+
+    # Cada salto tiene que dejar el mismo estado que reproducir de corrido
+    player, expected = ReplayPlayer(replay, config), reference_states(replay, config, set(reached))
+    for seconds, frame in zip(targets, reached):
+        player.seek_time(seconds)
+        assert player.session.snapshot() == expected[frame], f"estado distinto al saltar a {seconds:.1f} s"
+
+    print(f"\nReplay de {duration / 60:.1f} min, {replay.frame_count:,} frames, "
+          f"{len(replay.keyframes)} keyframes (uno cada {replay.keyframe_interval} piezas)")
+    print(f"{'tamaño con keyframes (zlib)':<34}{len(replay.to_bytes()):>12,} B")
+    print(f"{'tamaño sin keyframes (zlib)':<34}{len(bare.to_bytes()):>12,} B")
+    for label, latencies, frames in (("con keyframes", with_keys, keyed_frames),
+                                     ("desde el inicio", from_start, bare_frames)):
+        latencies = sorted(latencies)
+        print(f"{'salto ' + label:<34}media {sum(latencies) / SEEKS * 1e3:>7.1f} ms, "
+              f"máx {latencies[-1] * 1e3:>7.1f} ms, {sum(frames) / SEEKS:>8,.0f} frames re-simulados")
+    print(f"{SEEKS} saltos al azar con el mismo estado que la reproducción de corrido")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Tamaño y velocidad de los replays: graba partidas sin render a 60 fps con jitter en el dt
+y un jugador aleatorio que acomoda cada pieza con algunas pulsaciones por segundo, luego
+reproduce cada replay y verifica que el resultado final coincida.
+
+Uso:
+    python -m benchmarks.replay_size
+"""
+import random
+import time
+from src.core import Action, GameBoardController
+from src.replay import Replay, ReplayPlayer, ReplayRecorder
+from benchmarks.common import load_gameplay_config
+
+FRAME = 1 / 60
+
+
+def record_game(config: dict, ruleset_name: str, seed: int) -> tuple[Replay, dict]:
+    """Juega una partida con inputs aleatorios y devuelve su replay y sus stats finales."""
+    rng = random.Random(seed)
+    session = GameBoardController(config, config["rulesets"][ruleset_name], seed=seed)
+    recorder = ReplayRecorder(session.seed, ruleset_name, config)
+    session.start()
+
+    plan: list[Action] = []
+    wait = 0
+    while not session.is_game_over():
+        if not plan:
+            shifts = rng.randint(-5, 4)
+            plan = [Action.ROTATE_RIGHT] * rng.randint(0, 3)
+            plan += [Action.MOVE_LEFT if shifts < 0 else Action.MOVE_RIGHT] * abs(shifts)
+            plan.append(Action.HARD_DROP if rng.random() < 0.8 else Action.SOFT_DROP)
+        # Una pulsación cada 4 a 12 frames (5 a 15 por segundo)
+        if wait <= 0:
+            action = plan.pop(0)
+            recorder.record(action)
+            session.perform(action)
+            wait = rng.randint(4, 12)
+        wait -= 1
+        session.update(recorder.advance(FRAME + rng.uniform(-0.002, 0.002)))
+    return recorder.finish(session.final_stats), session.final_stats
+
+
+def main(games: int = 20, ruleset_name: str = "guideline") -> None:
+    config = load_gameplay_config()
+    raw_sizes, zlib_sizes, minutes = [], [], []
+    encode = decode = playback = 0.0
+    frames = 0
+
+    for seed in range(games):
+        replay, stats = record_game(config, ruleset_name, seed)
+
+        start = time.perf_counter()
+        data = replay.to_bytes()
+        encode += time.perf_counter() - start
+        raw_sizes.append(len(replay.to_bytes(compress=False)))
+        zlib_sizes.append(len(data))
+        minutes.append(replay.duration / 60)
+
+        start = time.perf_counter()
+        loaded = Replay.from_bytes(data)
+        decode += time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = ReplayPlayer(loaded, config).run()
+        playback += time.perf_counter() - start
+        frames += loaded.frame_count
+
+        for key in ("score", "lines", "level", "tetrises"):
+            assert result[key] == stats[key], f"replay {seed}: {key} {result[key]} != {stats[key]}"
+
+    total_min = sum(minutes)
+    print(f"\nReplays ({games} partidas, {total_min:.1f} min de juego, {frames:,} frames)")
+    print(f"{'tamaño medio sin comprimir':<32}{sum(raw_sizes) / games:>12,.0f} B")
+    print(f"{'tamaño medio con zlib':<32}{sum(zlib_sizes) / games:>12,.0f} B")
+    print(f"{'bytes por minuto (zlib)':<32}{sum(zlib_sizes) / total_min:>12,.0f} B")
+    print(f"{'codificación':<32}{encode / games * 1e3:>12.2f} ms/replay")
+    print(f"{'decodificación':<32}{decode / games * 1e3:>12.2f} ms/replay")
+    print(f"{'reproducción':<32}{frames / playback:>12,.0f} frames/s")
+    print("resultado final idéntico en todas las reproducciones")
+
+
+if __name__ == "__main__":
+    main()
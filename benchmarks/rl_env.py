@@ -0,0 +1,44 @@
+"""
+Pasos por segundo de VecEnv con acciones aleatorias, por espacio de acción y cantidad de partidas.
+
+Cada paso incluye la simulación, el cálculo de recompensas, el reinicio de las partidas
+terminadas y el llenado de las observaciones. En "placement" un paso coloca una pieza; en
+"keypress" un paso es una tecla (con gravedad cada 8 pasos), así que hacen falta varios por pieza.
+
+Uso:
+    python -m benchmarks.rl_env
+"""
+import time
+import numpy as np
+from benchmarks.common import load_gameplay_config
+from src.ai import VecEnv
+
+SIZES = (64, 1024, 4096)
+
+
+def steps_per_second(config: dict, ruleset: dict, action_space: str, num_envs: int, steps: int) -> float:
+    """Pasos de entorno por segundo (un paso por partida)."""
+    rng = np.random.default_rng(0)
+    env = VecEnv(config, ruleset, num_envs, action_space, fall_every=8, seed=0)
+    env.reset()
+    actions = rng.integers(0, env.num_actions, (steps, num_envs))
+    start = time.perf_counter()
+    for i in range(steps):
+        env.step(actions[i])
+    return steps * num_envs / (time.perf_counter() - start)
+
+
+def main() -> None:
+    config = load_gameplay_config()
+    ruleset = config["rulesets"]["guideline"]
+
+    print("\nVecEnv con acciones aleatorias (un núcleo)")
+    print(f"{'espacio':<12}{'K':>6}{'pasos/s':>14}")
+    for action_space in ("placement", "keypress"):
+        for num_envs in SIZES:
+            rate = steps_per_second(config, ruleset, action_space, num_envs, steps=max(20, 100000 // num_envs))
+            print(f"{action_space:<12}{num_envs:>6}{rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+RollbackSession: profundidad y costo del rollback según la latencia y el input delay.
+
+Juega FRAMES frames entre dos peers en localhost (src.net.harness) con latencia simulada,
+JITTER de jitter y LOSS de pérdida, para cada combinación de latencia e input delay. Por
+cada una se informa la profundidad media y máxima de los rollbacks, el costo máximo de
+re-simular en un frame (debe entrar en los 16.7 ms de un frame de render), el porcentaje de
+frames en que un peer tuvo que esperar al otro y si ambos terminaron sincronizados.
+
+Uso:
+    python -m benchmarks.rollback_netcode
+"""
+from src.net.harness import run_match
+from benchmarks.common import load_gameplay_config
+
+FRAMES = 900
+JITTER = 0.010
+LOSS   = 0.02
+
+
+def main() -> None:
+    config = load_gameplay_config()
+    ruleset = config["rulesets"]["guideline"]
+    print(f"\nRollback en localhost ({FRAMES} frames, jitter {JITTER * 1e3:.0f} ms, pérdida {LOSS:.0%})")
+    print(f"{'latencia ms':>12}{'delay':>7}{'rollbacks':>11}{'prof. media':>13}{'prof. máx':>11}"
+          f"{'costo máx ms':>14}{'esperas %':>11}{'sincronía':>11}")
+    for latency in (0.0, 0.016, 0.033, 0.050, 0.100):
+        for delay in (0, 1, 2, 3, 4):
+            result = run_match(config, ruleset, FRAMES, latency, JITTER, LOSS, delay)
+            rollbacks = sum(stats.rollbacks for stats in result.stats)
+            depth = sum(stats.resimulated for stats in result.stats) / max(1, rollbacks)
+            max_depth = max(stats.max_depth for stats in result.stats)
+            max_cost = max(stats.max_cost for stats in result.stats)
+            stalls = sum(stats.stalls for stats in result.stats) / (2 * result.ticks)
+            print(f"{latency * 1e3:>12.0f}{delay:>7}{rollbacks:>11}{depth:>13.1f}{max_depth:>11}"
+                  f"{max_cost * 1e3:>14.2f}{stalls:>11.1%}{'sí' if result.in_sync else 'NO':>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+RolloutWorkers: pasos de entorno por segundo según la cantidad de procesos.
+
+Las K partidas se reparten entre los workers y el learner solo escribe las acciones y lee las
+observaciones del bloque compartido, así que los pasos/s deberían crecer casi linealmente con
+los procesos hasta la cantidad de núcleos. La primera fila de cada tabla es un VecEnv en el
+proceso principal. Se mide con los dos motores: BatchSimulator y GameBoardController por partida.
+
+Uso:
+    python -m benchmarks.rollout_scaling
+"""
+import os
+import time
+import numpy as np
+from benchmarks.common import load_gameplay_config
+from src.ai import VecEnv, RolloutWorkers
+
+# Partidas por motor: el de controladores avanza de a una partida y es mucho más lento
+NUM_ENVS = {"batch": 4096, "controller": 256}
+STEPS    = 60
+
+
+def run(env: VecEnv | RolloutWorkers, actions: np.ndarray) -> float:
+    """Pasos de entorno por segundo jugando las acciones dadas."""
+    env.reset()
+    start = time.perf_counter()
+    for step_actions in actions:
+        env.step(step_actions)
+    return actions.size / (time.perf_counter() - start)
+
+
+def main() -> None:
+    config = load_gameplay_config()
+    ruleset = config["rulesets"]["guideline"]
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, 16, 32, cores} & set(range(1, cores + 1)))
+
+    for engine, num_envs in NUM_ENVS.items():
+        print(f"\nRolloutWorkers ({engine}): {num_envs} partidas, acciones de colocación al azar, {cores} núcleos")
+        print(f"{'procesos':>10}{'pasos/s':>14}{'speedup':>10}{'eficiencia':>12}")
+        env = VecEnv(config, ruleset, num_envs, seed=0, engine=engine)
+        actions = np.random.default_rng(0).integers(0, env.num_actions, (STEPS, num_envs))
+        base = run(env, actions)
+        print(f"{'VecEnv':>10}{base:>14,.0f}{1:>9.1f}x")
+        for workers in counts:
+            with RolloutWorkers(config, ruleset, num_envs, workers, seed=0, engine=engine) as env:
+                rate = run(env, actions)
+            print(f"{workers:>10}{rate:>14,.0f}{rate / base:>9.1f}x{rate / base / workers:>11.0%}")
+
+
+if __name__ == "__main__":
+    main()
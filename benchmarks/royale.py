@@ -0,0 +1,88 @@
+"""
+Battle royale: simulación de los 98 rivales y costo por frame del hilo de render.
+
+Primero mide RoyaleField solo: segundos de CPU por segundo de juego con los 98 rivales
+colocando piezas en lotes de 50 ms, y piezas por segundo que puede resolver. Después entra
+a RoyaleState con el driver de video dummy de SDL y los rivales en su RoyaleWorker, y corre
+FRAMES frames a 60 FPS en tiempo real: se informa el tiempo de update + render por frame
+(media, p99 y máximo contra 16.7 ms) y el costo de las miniaturas redibujando solo las que
+cambiaron frente a redibujar las 98 en cada frame.
+
+Uso:
+    python -m benchmarks.royale
+"""
+import time
+from src.ai import RoyaleField
+from benchmarks.common import load_gameplay_config, make_play_state
+
+GAME_SECONDS = 60.0
+BATCH  = 0.05
+FRAMES = 600   # 10 s en tiempo real
+DT     = 1 / 60
+
+
+def field_throughput() -> None:
+    config = load_gameplay_config()
+    field = RoyaleField(config, config["rulesets"]["guideline"], 98, seed=0)
+    batches = []
+    for _ in range(int(GAME_SECONDS / BATCH)):
+        started = time.perf_counter()
+        field.advance(BATCH)
+        batches.append(time.perf_counter() - started)
+    stats = field.stats
+    print(f"\nRoyaleField: 98 rivales, {GAME_SECONDS:.0f} s de juego en lotes de {BATCH * 1e3:.0f} ms")
+    print(f"  CPU por segundo de juego: {stats.seconds / GAME_SECONDS * 1e3:.1f} ms "
+          f"({stats.seconds / GAME_SECONDS:.1%} de un núcleo)")
+    print(f"  piezas: {stats.pieces} ({stats.pieces / stats.seconds:.0f} por segundo de CPU), "
+          f"lote medio {sum(batches) / len(batches) * 1e3:.2f} ms, máx {max(batches) * 1e3:.2f} ms")
+    print(f"  rivales vivos al final: {field.alive}")
+
+
+def render_frames() -> None:
+    game, play = make_play_state(royale=True)
+    # Se saltea la cuenta regresiva: la partida ya se inició en make_play_state
+    play._started = True
+    view, field, screen = play._royale_view, play._field, game.surface
+
+    frames, redrawn, views, full = [], 0, [], []
+    deadline = time.perf_counter()
+    try:
+        for _ in range(FRAMES):
+            started = time.perf_counter()
+            play.update(DT)
+            # Las miniaturas que cambiaron se redibujan acá; el draw dentro de render ya no tiene trabajo
+            began = time.perf_counter()
+            view.draw(screen, field)
+            views.append(time.perf_counter() - began)
+            redrawn += view.redrawn
+            play.render(screen)
+            frames.append(time.perf_counter() - started)
+
+            view._drawn[:] = -1
+            began = time.perf_counter()
+            view.draw(screen, field)
+            full.append(time.perf_counter() - began)
+
+            deadline += DT
+            time.sleep(max(0.0, deadline - time.perf_counter()))
+        alive = field.alive
+    finally:
+        field.close()
+
+    frames.sort()
+    print(f"\nRoyaleState: {FRAMES} frames a 60 FPS, rivales en un RoyaleWorker (presupuesto 16.7 ms)")
+    print(f"  update + render: media {sum(frames) / len(frames) * 1e3:.2f} ms, "
+          f"p99 {frames[int(len(frames) * 0.99)] * 1e3:.2f} ms, máx {frames[-1] * 1e3:.2f} ms")
+    print(f"  miniaturas redibujadas por frame: {redrawn / FRAMES:.2f}")
+    print(f"  RoyaleView.draw: solo las que cambiaron {sum(views) / len(views) * 1e3:.3f} ms, "
+          f"las 98 en cada frame {sum(full) / len(full) * 1e3:.3f} ms")
+    print(f"  rivales vivos: {alive}")
+
+
+def main() -> None:
+    field_throughput()
+    render_frames()
+
+
+if __name__ == "__main__":
+    main()
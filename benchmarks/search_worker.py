@@ -0,0 +1,67 @@
+"""
+Modo demo en tiempo real: tiempo de trabajo por frame (update + render) con la búsqueda
+completa del bot en el hilo del juego y con SearchService, más la profundidad alcanzada.
+
+Los frames se ejecutan a 60 FPS de reloj real (se duerme lo que sobra de cada frame) para que
+el worker tenga el mismo tiempo que tendría en el juego.
+
+Uso:
+    python -m benchmarks.search_worker
+"""
+import time
+from benchmarks.common import make_play_state
+from src.ai import BotInput, HeuristicBot
+
+
+class DeepBot(HeuristicBot):
+    """Busca en el hilo del juego hasta la última pieza del preview, como SearchService."""
+
+    def plan(self, controller, depth=None):
+        return super().plan(controller, depth=len(controller.preview) + 1)
+
+
+def run(play, frames: int) -> int:
+    """Juega `frames` frames a 60 FPS (o hasta el game over) y devuelve las líneas hechas."""
+    dt = 1 / 60
+    screen = play.game.surface
+    deadline = time.perf_counter()
+    for _ in range(frames):
+        if play.session.is_game_over():
+            break
+        play.update(dt)
+        play.render(screen)
+        deadline += dt
+        time.sleep(max(0.0, deadline - time.perf_counter()))
+    return play.session.total_lines_cleared
+
+
+def main(seconds: float = 30.0) -> None:
+    frames = int(seconds * 60)
+    print(f"\nModo demo, {seconds:.0f} s a 60 FPS")
+    print(f"{'búsqueda':<28}{'promedio (ms)':>15}{'peor (ms)':>12}{'> 16.7 ms':>11}{'líneas':>8}")
+
+    for name, threaded in (("en el hilo del juego", False), ("SearchService", True)):
+        game, play = make_play_state(autoplay=True)
+        # El game over del demo vuelve al menú; acá solo se corta la medición
+        game.state.change = lambda *args, **kwargs: None
+        if not threaded:
+            play._search.close()
+            play._search = None
+            play._bot = BotInput(play.session, DeepBot.for_controller(play.session))
+        lines = run(play, frames)
+        budget = play.frame_budget
+        print(f"{name:<28}{budget.average * 1e3:>15.2f}{budget.worst * 1e3:>12.2f}"
+              f"{budget.over_budget:>11}{lines:>8}")
+
+        if play._search is not None:
+            stats = play._search.stats
+            play.on_exit()
+            depths = ", ".join(f"{depth}: {count}" for depth, count in sorted(stats.depths.items()))
+            print(f"    profundidad alcanzada por pieza -> {depths}")
+            print(f"    pedidos {stats.requests}, cancelados {stats.cancelled}, "
+                  f"peor submit/poll {stats.worst_call * 1e3:.2f} ms, "
+                  f"peor primer resultado {stats.worst_first * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
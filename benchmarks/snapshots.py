@@ -0,0 +1,49 @@
+"""
+Snapshots de GameBoardController: costo de snapshot/restore frente a copy.deepcopy y pickle.
+
+Juega unas piezas con HeuristicBot para tener un tablero con bloques y mide, por operación,
+capturar y restaurar el estado completo con cada método.
+
+Uso:
+    python -m benchmarks.snapshots
+"""
+import copy
+import pickle
+import timeit
+from src.core import GameBoardController
+from src.ai import HeuristicBot
+from benchmarks.common import load_gameplay_config
+
+REPEAT = 20_000
+SLOW   = 500   # repeticiones para deepcopy y pickle
+
+
+def measure(function, repeat: int = REPEAT) -> float:
+    """Microsegundos por llamada."""
+    return timeit.timeit(function, number=repeat) / repeat * 1e6
+
+
+def main() -> None:
+    config = load_gameplay_config()
+    print("\nSnapshot del estado completo")
+    print(f"{'backend':<10}{'método':<22}{'captura µs':>12}{'restauración µs':>17}{'bytes':>8}")
+    for backend in ("matrix", "bitboard"):
+        config["general"]["board_backend"] = backend
+        controller = GameBoardController(config, config["rulesets"]["guideline"], animate_clears=False, seed=0)
+        HeuristicBot.for_controller(controller).play(controller, max_pieces=30)
+
+        snapshot = controller.snapshot()
+        size = len(pickle.dumps(snapshot))
+        print(f"{backend:<10}{'snapshot/restore':<22}{measure(controller.snapshot):>12.2f}"
+              f"{measure(lambda: controller.restore(snapshot)):>17.2f}{size:>8}")
+
+        clone = copy.deepcopy(controller)
+        print(f"{backend:<10}{'copy.deepcopy':<22}{measure(lambda: copy.deepcopy(controller), SLOW):>12.2f}"
+              f"{measure(lambda: copy.deepcopy(clone), SLOW):>17.2f}{'-':>8}")
+        data = pickle.dumps(controller)
+        print(f"{backend:<10}{'pickle':<22}{measure(lambda: pickle.dumps(controller), SLOW):>12.2f}"
+              f"{measure(lambda: pickle.loads(data), SLOW):>17.2f}{len(data):>8}")
+
+
+if __name__ == "__main__":
+    main()
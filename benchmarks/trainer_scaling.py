@@ -0,0 +1,43 @@
+"""
+Trainer: partidas por segundo de una generación según la cantidad de procesos del pool.
+
+Con trabajo repartido en tareas independientes y resultados de pocos bytes, las partidas/s
+deberían crecer casi linealmente con los procesos hasta la cantidad de núcleos.
+
+Uso:
+    python -m benchmarks.trainer_scaling
+"""
+import os
+import time
+import multiprocessing as mp
+import numpy as np
+from benchmarks.common import load_gameplay_config
+from src.ai import EvalWeights, FEATURES, create_optimizer
+from src.ai.trainer import Trainer, _init_worker
+
+
+def main(population: int = 16, games: int = 16, max_pieces: int = 300) -> None:
+    config = load_gameplay_config()
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, 16, 32, cores} & set(range(1, cores + 1)))
+
+    print(f"\nTrainer: una generación de {population} candidatos x {games} partidas "
+          f"(hasta {max_pieces} piezas), {cores} núcleos")
+    print(f"{'procesos':>10}{'partidas/s':>14}{'speedup':>10}{'eficiencia':>12}")
+    base = None
+    for workers in counts:
+        optimizer = create_optimizer("cmaes", len(FEATURES), population, seed=0, initial=EvalWeights().as_array())
+        trainer = Trainer(optimizer, config, games=games, max_pieces=max_pieces, workers=workers, checkpoint=None)
+        candidates = optimizer.ask()
+        init_args = (config, config["rulesets"]["guideline"], max_pieces)
+        with mp.get_context("fork").Pool(workers, initializer=_init_worker, initargs=init_args) as pool:
+            start = time.perf_counter()
+            trainer.evaluate(pool, candidates, trainer.seeds_for(0))
+            elapsed = time.perf_counter() - start
+        rate = population * games / elapsed
+        base = base or rate
+        print(f"{workers:>10}{rate:>14.1f}{rate / base:>9.1f}x{rate / base / workers:>11.0%}")
+
+
+if __name__ == "__main__":
+    main()
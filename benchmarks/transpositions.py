@@ -0,0 +1,117 @@
+"""
+Hash de Zobrist y TranspositionTable en una búsqueda en profundidad con hold.
+
+Primero compara leer el hash incremental de Board con recalcularlo entero. Después hace una
+búsqueda en profundidad de 4 piezas con hold sobre una pila de mitad de partida, siguiendo las
+WIDTH mejores caídas de cada nodo: colocar A y después B o B y después A (usando el hold) lleva
+al mismo tablero con el mismo hold, y la tabla evita volver a buscarlo. Se informan nodos expandidos,
+tiempo, tasa de aciertos y memoria por tamaño y política de reemplazo.
+
+Uso:
+    python -m benchmarks.transpositions
+"""
+import time
+import numpy as np
+from benchmarks.common import random_stack, measure
+from src.constants import ROWS, COLS
+from src.core import Board, Piece, build_piece_shapes, hash_matrix, hash_boards
+from src.core.zobrist import hold_key, bag_key
+from src.ai import BoardEvaluator, TranspositionTable, drop_all
+
+SEQUENCE = ["T", "S", "Z", "O", "L"]
+DEPTH    = 4
+WIDTH    = 8
+
+
+class Search:
+    """Máximo de la evaluación tras DEPTH piezas, eligiendo orden con el hold (WIDTH caídas por nodo)."""
+
+    def __init__(self, table: TranspositionTable | None) -> None:
+        self.table  = table
+        self.shapes = build_piece_shapes()
+        self.evaluator = BoardEvaluator()
+        self.nodes  = 0
+
+    def run(self, board: np.ndarray) -> float:
+        return self._search(board, hash_matrix(board), 0, None, DEPTH)
+
+    def _search(self, board: np.ndarray, board_hash: int, index: int, hold: str | None, depth: int) -> float:
+        key = board_hash ^ hold_key(hold, True) ^ bag_key(index)
+        if self.table is not None:
+            entry = self.table.probe(key, depth)
+            if entry is not None:
+                return entry.value
+        self.nodes += 1
+
+        best = -np.inf
+        # (pieza que se coloca, hold que queda, próxima posición en la secuencia)
+        options = [(SEQUENCE[index], hold, index + 1)]
+        if hold is None:
+            options.append((SEQUENCE[index + 1], SEQUENCE[index], index + 2))
+        elif hold != SEQUENCE[index]:
+            options.append((hold, SEQUENCE[index], index + 1))
+
+        for name, next_hold, next_index in options:
+            results, lines, valid, _ = drop_all(board[None], self.shapes[name])
+            children = results[0][valid[0]]
+            if not len(children):
+                continue
+            scores = self.evaluator.evaluate(children, lines[0][valid[0]])
+            if depth == 1:
+                best = max(best, float(scores.max()))
+                continue
+            children = children[np.argsort(scores)[::-1][:WIDTH]]
+            for child, child_hash in zip(children, hash_boards(children)):
+                best = max(best, self._search(child, int(child_hash), next_index, next_hold, depth - 1))
+
+        if self.table is not None:
+            self.table.store(key, depth, best)
+        return best
+
+
+def main() -> None:
+    stack = np.array(random_stack(ROWS, COLS, height=6, seed=3))
+
+    # Costo de mantener el hash en lock_piece + clear_lines, y de recalcularlo
+    board = Board(ROWS, COLS, animated=False)
+    board.set_matrix(stack)
+    piece = Piece("I", build_piece_shapes()["I"], row=-1, col=6)
+    piece.row = board.drop_row(piece)
+    snapshot = board.matrix.copy()
+
+    def lock_and_clear() -> None:
+        board.lock_piece(piece)
+        board.clear_lines()
+
+    def restore() -> None:
+        board.set_matrix(snapshot)
+
+    locked = measure(lambda: (lock_and_clear(), restore()), number=2000) - measure(restore, number=2000)
+    print("\nHash de Zobrist")
+    print(f"  lock_piece + clear_lines (incluye el hash): {locked * 1e6:8.2f} us")
+    print(f"  leer Board.zobrist:                         {measure(lambda: board.zobrist) * 1e6:8.2f} us")
+    print(f"  recalcular con hash_matrix:                 {measure(lambda: hash_matrix(board.matrix)) * 1e6:8.2f} us")
+
+    print(f"\nBúsqueda de {DEPTH} piezas con hold ({'-'.join(SEQUENCE)})")
+    print(f"{'tabla':<22}{'nodos':>8}{'ms':>9}{'aciertos':>10}{'reemplazos':>12}{'ocupación':>11}{'KiB':>8}")
+    reference = None
+    for size, policy in ((None, ""), (1 << 6, "always"), (1 << 6, "depth"), (1 << 12, "always"), (1 << 12, "depth")):
+        table = TranspositionTable(size, policy) if size else None
+        search = Search(table)
+        start = time.perf_counter()
+        value = search.run(stack)
+        elapsed = time.perf_counter() - start
+        reference = value if reference is None else reference
+        assert value == reference, "la tabla cambió el resultado"
+
+        name = f"{size} / {policy}" if table else "sin tabla"
+        if table is None:
+            print(f"{name:<22}{search.nodes:>8}{elapsed * 1e3:>9.1f}")
+            continue
+        stats = table.stats
+        print(f"{name:<22}{search.nodes:>8}{elapsed * 1e3:>9.1f}{stats.hit_rate:>10.1%}{stats.replaced:>12}"
+              f"{table.fill_rate:>11.1%}{table.memory_bytes / 1024:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+VersusMatch: costo por frame de 4 jugadores más N bots en el mismo proceso.
+
+Simula FRAMES frames de un versus con intercambio de basura: 4 partidas con inputs de guion
+(el ritmo de una persona, ver src.net.harness.ScriptedInput) y N partidas jugadas por
+HeuristicBot a través de BotInput. Cada frame aplica los inputs, actualiza las partidas y
+resuelve el intercambio; se informa el tiempo medio, el percentil 99 y el máximo por frame
+frente a los 16.7 ms de un frame a 60 FPS, aparte el p99 del motor (update de las partidas e
+intercambio, sin la búsqueda de los bots), y la basura enviada e insertada. Los picos del
+total vienen de varios bots planificando en el mismo frame; en el juego esa búsqueda va a
+un SearchService en segundo plano.
+
+Uso:
+    python -m benchmarks.versus
+"""
+import time
+from src.core import GameBoardController, VersusMatch
+from src.ai import BotInput, HeuristicBot
+from src.net.harness import ScriptedInput
+from benchmarks.common import load_gameplay_config
+
+FRAMES = 3600   # 60 s de juego
+HUMANS = 4
+DT     = 1 / 60
+
+
+def run(config: dict, bots: int) -> tuple[list[float], list[float], VersusMatch]:
+    """Juega el versus y devuelve los segundos de cada frame, totales y del motor."""
+    ruleset = config["rulesets"]["guideline"]
+    players = [GameBoardController(config, ruleset, seed=index) for index in range(HUMANS + bots)]
+    for player in players:
+        player.start()
+    match = VersusMatch(players, seed=0)
+
+    bot = HeuristicBot.for_controller(players[0])
+    inputs = [ScriptedInput(index) for index in range(HUMANS)]
+    inputs += [BotInput(player, bot) for player in players[HUMANS:]]
+
+    times, engine = [], []
+    for _ in range(FRAMES):
+        began = time.perf_counter()
+        for index, (player, source) in enumerate(zip(players, inputs)):
+            actions = source.poll() if index < HUMANS else source.poll(DT)
+            for action in actions:
+                if not player.perform(action) and index >= HUMANS:
+                    source.reject()
+        updated = time.perf_counter()
+        match.update(DT)
+        end = time.perf_counter()
+        times.append(end - began)
+        engine.append(end - updated)
+    return times, engine, match
+
+
+def main() -> None:
+    config = load_gameplay_config()
+    print(f"\nVersus: {HUMANS} jugadores con guion + N bots, {FRAMES} frames (presupuesto 16.7 ms)")
+    print(f"{'bots':>6}{'media ms':>10}{'p99 ms':>9}{'máx ms':>9}{'motor p99 ms':>14}"
+          f"{'enviadas':>10}{'insertadas':>12}{'vivos':>7}")
+    for bots in (0, 4, 8, 16, 32):
+        times, engine, match = run(config, bots)
+        times.sort()
+        engine.sort()
+        mean = sum(times) / len(times)
+        p99 = int(len(times) * 0.99)
+        print(f"{bots:>6}{mean * 1e3:>10.2f}{times[p99] * 1e3:>9.2f}{times[-1] * 1e3:>9.2f}"
+              f"{engine[p99] * 1e3:>14.3f}{sum(match.stats.sent):>10}{sum(match.stats.received):>12}"
+              f"{len(match.alive):>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+from src.ai.evaluator import EvalWeights, BoardEvaluator, FEATURES, clear_full_rows, drop_moves, drop_all
+from src.ai.heuristic_bot import BotPlan, HeuristicBot
+from src.ai.self_play import play_games, greedy_drops
+from src.ai.optimizers import WeightOptimizer, GeneticOptimizer, CMAESOptimizer, OPTIMIZER_MAP, create_optimizer
+from src.ai.priority import lower_priority
+from src.ai.search_worker import SearchRequest, SearchResult, SearchStats, SearchService
+from src.ai.bot_input import BotInput
+from src.ai.transposition import REPLACEMENT_POLICIES, TTEntry, TTStats, TranspositionTable
+from src.ai.perfect_clear import PC_STATUSES, PCStep, PCSolution, PCResult, PCStats, PerfectClearSolver
+from src.ai.controller_sim import ControllerSimulator
+from src.ai.rl_env import ACTION_SPACES, REWARDS, ENGINES, VecEnv, TetrisEnv, buffer_specs
+from src.ai.rollout import RolloutWorkers
+from src.ai.external_bot import PROTOCOL_VERSION, ExternalBotStats, ExternalBot
+from src.ai.expectimax import ExpectimaxStats, ExpectimaxBot
+from src.ai.royale import PLAYER, RoyaleStats, RoyaleField, RoyaleWorker
+
+__all__ = [
+    "EvalWeights",
+    "BoardEvaluator",
+    "FEATURES",
+    "clear_full_rows",
+    "drop_moves",
+    "drop_all",
+    "BotPlan",
+    "HeuristicBot",
+    "play_games",
+    "greedy_drops",
+    "WeightOptimizer",
+    "GeneticOptimizer",
+    "CMAESOptimizer",
+    "OPTIMIZER_MAP",
+    "create_optimizer",
+    "lower_priority",
+    "SearchRequest",
+    "SearchResult",
+    "SearchStats",
+    "SearchService",
+    "BotInput",
+    "REPLACEMENT_POLICIES",
+    "TTEntry",
+    "TTStats",
+    "TranspositionTable",
+    "PCStep",
+    "PCSolution",
+    "PCResult",
+    "PC_STATUSES",
+    "PCStats",
+    "PerfectClearSolver",
+    "ControllerSimulator",
+    "ACTION_SPACES",
+    "REWARDS",
+    "ENGINES",
+    "VecEnv",
+    "TetrisEnv",
+    "buffer_specs",
+    "RolloutWorkers",
+    "PROTOCOL_VERSION",
+    "ExternalBotStats",
+    "ExternalBot",
+    "ExpectimaxStats",
+    "ExpectimaxBot",
+    "PLAYER",
+    "RoyaleStats",
+    "RoyaleField",
+    "RoyaleWorker",
+]
@@ -0,0 +1,104 @@
+from collections import deque
+from typing import TYPE_CHECKING
+from src.core.action import Action
+from src.ai.heuristic_bot import HeuristicBot
+
+if TYPE_CHECKING:
+    from src.ai.external_bot import ExternalBot
+    from src.ai.search_worker import SearchService
+    from src.core.gameboard_controller import GameBoardController
+    from src.core.piece import Piece
+
+
+class BotInput:
+    """
+    Fuente de input automática: reemplaza al teclado en PlayState (modo demo).
+
+    Al aparecer cada pieza pide una jugada al bot y entrega sus inputs de a uno, a un ritmo
+    parecido al de una persona. Si un input no se puede aplicar (por ejemplo, porque la
+    gravedad bajó la pieza) se vuelve a planificar desde la posición actual.
+
+    Con un SearchService la jugada se busca en segundo plano: el pedido sale al aparecer la
+    pieza, durante la pausa se recogen los resultados que van llegando y al terminarla se usa
+    el mejor disponible. Si todavía no llegó ninguno se sigue esperando sin bloquear el frame.
+    Un ExternalBot se usa igual que un SearchService.
+    """
+    def __init__(self, controller: "GameBoardController", bot: HeuristicBot | None = None,
+                 actions_per_second: float = 12.0, think_delay: float = 0.15,
+                 service: "SearchService | ExternalBot | None" = None) -> None:
+        """
+        Args:
+            controller: Partida que juega el bot.
+            bot: Bot que elige las jugadas (uno nuevo para el controlador por defecto).
+                No se usa si hay `service`.
+            actions_per_second: Inputs por segundo.
+            think_delay: Pausa antes del primer input de cada pieza, en segundos.
+            service: Búsqueda en segundo plano. Quien lo crea se encarga de cerrarlo.
+
+        Raises:
+            ValueError: Si actions_per_second no es positivo.
+        """
+        if actions_per_second <= 0:
+            raise ValueError(f"BotInput: ritmo inválido ({actions_per_second}). Debe ser mayor que cero.")
+        self._controller  = controller
+        self._service     = service
+        self._bot         = bot if bot is not None or service is not None else HeuristicBot.for_controller(controller)
+        self._interval    = 1.0 / actions_per_second
+        self._think_delay = think_delay
+
+        self._plan: deque[Action] = deque()
+        self._planned: "Piece | None" = None
+        self._pending = False
+        self._timer = 0.0
+
+    def poll(self, dt: float) -> list[Action]:
+        """
+        Devuelve los inputs a aplicar en este frame.
+
+        Args:
+            dt: Tiempo transcurrido desde el último frame en segundos.
+        """
+        piece = self._controller.piece
+        if piece is None or piece.is_locked() or self._controller.is_game_over():
+            self._plan.clear()
+            self._stop_search()
+            return []
+
+        # Pieza nueva (o la pieza cambió mientras se buscaba): se planifica desde cero
+        if piece is not self._planned and (self._pending or not self._plan):
+            self._plan.clear()
+            if self._service is not None:
+                self._service.submit(self._controller)
+                self._pending = True
+            else:
+                plan = self._bot.plan(self._controller)
+                self._plan.extend(plan.actions if plan is not None else [Action.HARD_DROP])
+            self._planned = piece
+            self._timer = -self._think_delay
+
+        self._timer += dt
+        if self._pending:
+            result = self._service.poll()
+            if self._timer < 0 or result is None:
+                return []
+            # Se usa el mejor resultado disponible; la espera extra no se recupera de golpe
+            self._plan.extend(result.actions)
+            self._stop_search()
+            self._timer = min(self._timer, self._interval)
+        actions = []
+        while self._plan and self._timer >= self._interval:
+            self._timer -= self._interval
+            actions.append(self._plan.popleft())
+        return actions
+
+    def reject(self) -> None:
+        """Avisa que el último input no se pudo aplicar: la jugada se recalcula en el próximo poll."""
+        self._plan.clear()
+        self._planned = None
+        self._stop_search()
+
+    # --- HELPERS ---
+    def _stop_search(self) -> None:
+        if self._pending:
+            self._service.cancel()
+            self._pending = False
@@ -0,0 +1,62 @@
+"""
+Bot de referencia para el protocolo de ExternalBot: responde cada pedido con HeuristicBot.
+
+Uso:
+    python -m src.ai.bot_server [--delay SEGUNDOS]
+"""
+import sys
+import json
+import time
+import argparse
+import numpy as np
+from typing import Any, IO
+from src.core.board import Board
+from src.ai.heuristic_bot import HeuristicBot
+
+
+def serve(stdin: IO[str] = sys.stdin, stdout: IO[str] = sys.stdout, delay: float = 0.0) -> None:
+    """
+    Atiende mensajes del protocolo hasta "quit" o el fin de la entrada.
+
+    Args:
+        stdin: Entrada de mensajes.
+        stdout: Salida de respuestas.
+        delay: Segundos de espera extra antes de cada jugada (para simular un bot lento).
+    """
+    bot: HeuristicBot | None = None
+    board: Board | None = None
+    for line in stdin:
+        message = json.loads(line)
+        kind = message.get("type")
+        if kind == "quit":
+            break
+        if kind == "start":
+            bot = HeuristicBot(wall_kicks=message["wall_kicks"])
+            board = Board(message["rows"], message["cols"], animated=False)
+            reply: dict[str, Any] = {"type": "ready", "name": "HeuristicBot"}
+        elif kind == "suggest" and bot is not None:
+            board.set_matrix(np.array(message["board"], dtype=board.matrix.dtype))
+            position = message.get("position")
+            plan = bot.choose(board, message["current"], message["hold"], message["queue"], message["can_hold"],
+                              start=tuple(position) if position else None)
+            reply = {"type": "move", "id": message["id"]}
+            if plan is not None:
+                p = plan.placement
+                reply.update(hold=plan.use_hold, row=p.row, col=p.col, rot=p.rot)
+            if delay:
+                time.sleep(delay)
+        else:
+            continue
+        stdout.write(json.dumps(reply) + "\n")
+        stdout.flush()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.ai.bot_server", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--delay", type=float, default=0.0, help="segundos extra por jugada")
+    args = parser.parse_args(argv)
+    serve(delay=args.delay)
+
+
+if __name__ == "__main__":
+    main()
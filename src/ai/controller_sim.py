@@ -0,0 +1,204 @@
+import numpy as np
+from typing import TYPE_CHECKING
+from src.core.action import Action
+from src.core.gameboard_controller import GameBoardController
+from src.core.piece_shapes import build_piece_shapes
+from src.core.strategy import create_lock
+
+if TYPE_CHECKING:
+    from src.core.types import PieceShapeType
+    from src.config.gameplay import GameplayConfigType, GameplayRulesetType
+
+
+class ControllerSimulator:
+    """
+    N partidas de GameBoardController con la interfaz de BatchSimulator que usa VecEnv.
+
+    Cada partida es un controlador completo (Board, PieceMechanics y Score), así que las reglas
+    son exactamente las del juego, a cambio de avanzar las partidas de a una en Python. VecEnv
+    la usa con engine="controller" para validar o entrenar contra el juego real; BatchSimulator
+    sigue siendo el motor rápido por defecto.
+
+    `step` y `press` siguen la semántica de BatchSimulator: sin tiempo de por medio, el lock
+    delay se reemplaza por bloquear la pieza cuando SOFT_DROP o la gravedad no pueden bajarla,
+    y la pieza siguiente se genera en el mismo paso que se bloquea la anterior.
+
+    reset no continúa la bolsa: la partida i usa la semilla seed + i y cada reinicio de una
+    partida ya jugada suma num_games a su semilla (reiniciar una sin jugar la repite).
+    """
+    def __init__(self,
+                 session_config: "GameplayConfigType",
+                 ruleset: "GameplayRulesetType",
+                 num_games: int,
+                 pieces: "PieceShapeType | None" = None,
+                 seed: int | None = None) -> None:
+        """
+        Args:
+            session_config: Configuración de gameplay.
+            ruleset: Ruleset de las partidas.
+            num_games: Cantidad de partidas (N).
+            pieces: Formas de las piezas. Si no se indica se construyen desde PIECE_DEFINITIONS.
+            seed: Semilla base; la partida i empieza con seed + i.
+
+        Raises:
+            ValueError: Si num_games no es positivo.
+        """
+        if num_games <= 0:
+            raise ValueError(f"ControllerSimulator: cantidad de partidas inválida ({num_games}).")
+
+        self._config  = session_config
+        self._ruleset = ruleset
+        self._shapes  = pieces if pieces is not None else build_piece_shapes()
+        self._seed    = seed
+        # Tiempo que alcanza para bloquear una pieza apoyada con cualquier estrategia de lock
+        self._lock_time = max(create_lock(ruleset, session_config).delay, 0.0) + 1e-3
+
+        self.num_games = num_games
+        self.piece_names: list[str] = list(self._shapes)
+        self._name_to_id = {name: i for i, name in enumerate(self.piece_names)}
+
+        n = num_games
+        self._episodes = np.zeros(n, dtype=np.int64)
+        self._played   = np.zeros(n, dtype=bool)
+        self.last_lines      = np.zeros(n, dtype=np.int64)
+        self.last_score_gain = np.zeros(n, dtype=np.int64)
+        self._games: list[GameBoardController] = [self._new_game(i) for i in range(n)]
+        self.rows, self.cols = self._games[0].board.rows, self._games[0].board.cols
+
+    @property
+    def games(self) -> list[GameBoardController]:
+        """Controladores de las partidas (solo lectura)."""
+        return self._games
+
+    def start(self) -> None:
+        """Compatibilidad con BatchSimulator: las partidas ya empiezan con su primera pieza."""
+
+    def reset(self, games: np.ndarray | None = None) -> None:
+        """Reinicia las partidas indicadas (todas por defecto) con la semilla siguiente."""
+        indices = range(self.num_games) if games is None else (int(i) for i in games)
+        for i in indices:
+            self._episodes[i] += self._played[i]
+            self._played[i] = False
+            self._games[i] = self._new_game(i)
+
+    # --- PASOS ---
+    def step(self, rots: np.ndarray, cols: np.ndarray, hold: np.ndarray | None = None) -> np.ndarray:
+        """
+        Coloca una pieza en cada partida activa, como BatchSimulator.step.
+
+        Args:
+            rots: Rotaciones horarias a aplicar desde el spawn (0-3), una por partida.
+            cols: Columna objetivo (Piece.col), una por partida.
+            hold: Si se usa el hold antes de colocar, uno por partida (opcional).
+
+        Returns:
+            np.ndarray: Líneas eliminadas por partida en este paso.
+        """
+        self.last_lines[:] = 0
+        self.last_score_gain[:] = 0
+        for i, game in enumerate(self._games):
+            if game.is_game_over():
+                continue
+            before, locked = game.current_score, game.pieces_locked
+            if hold is not None and hold[i]:
+                game.hold()
+            for _ in range(int(rots[i])):
+                game.rotate_right()
+            target = int(cols[i])
+            while game.piece.col != target:
+                if not (game.move_left() if target < game.piece.col else game.move_right()):
+                    break
+            game.hard_drop()
+            self._finish(i, game, before, locked)
+        return self.last_lines.copy()
+
+    def press(self, keys: np.ndarray, fall: np.ndarray | None = None) -> np.ndarray:
+        """
+        Aplica una tecla por partida activa, como BatchSimulator.press.
+
+        Args:
+            keys: Valor de Action por partida; cualquier otro valor no mueve la pieza.
+            fall: Si la pieza baja además una fila por gravedad después de la tecla, uno por partida.
+
+        Returns:
+            np.ndarray: Líneas eliminadas por partida en este paso.
+        """
+        self.last_lines[:] = 0
+        self.last_score_gain[:] = 0
+        for i, game in enumerate(self._games):
+            if game.is_game_over():
+                continue
+            before, locked = game.current_score, game.pieces_locked
+            key = int(keys[i])
+            if 0 <= key < len(Action):
+                moved = game.perform(Action(key))
+                if key == Action.SOFT_DROP and not moved and game.pieces_locked == locked:
+                    game.update(self._lock_time)
+            game.update(0.0)    # lock sin delay (ruleset NES)
+
+            if fall is not None and fall[i] and game.pieces_locked == locked:
+                piece = game.piece
+                if game.board.is_valid_move(piece, piece.row + 1, piece.col):
+                    piece.move(1, 0)
+                    game.update(0.0)
+                else:
+                    game.update(self._lock_time)
+            self._finish(i, game, before, locked)
+        return self.last_lines.copy()
+
+    # --- ESTADO (como los arreglos de BatchSimulator) ---
+    @property
+    def boards(self) -> np.ndarray:
+        """(N, ROWS, COLS) con las celdas de cada tablero."""
+        return np.stack([game.board.matrix for game in self._games])
+
+    @property
+    def piece(self) -> np.ndarray:
+        return np.array([self._name_to_id[game.piece.name] for game in self._games], dtype=np.int64)
+
+    @property
+    def hold(self) -> np.ndarray:
+        return np.array([-1 if game.hold_piece is None else self._name_to_id[game.hold_piece.name]
+                         for game in self._games], dtype=np.int64)
+
+    @property
+    def can_hold(self) -> np.ndarray:
+        return np.array([game.mechanics.can_hold for game in self._games], dtype=bool)
+
+    @property
+    def game_over(self) -> np.ndarray:
+        return np.array([game.is_game_over() for game in self._games], dtype=bool)
+
+    @property
+    def score(self) -> np.ndarray:
+        return np.array([game.current_score for game in self._games], dtype=np.int64)
+
+    @property
+    def lines_total(self) -> np.ndarray:
+        return np.array([game.total_lines_cleared for game in self._games], dtype=np.int64)
+
+    def preview(self, count: int) -> np.ndarray:
+        """Devuelve (N, count) con los ids de las próximas piezas de cada partida."""
+        return np.array([[self._name_to_id[name] for name in game.upcoming(count)] for game in self._games],
+                        dtype=np.int64).reshape(self.num_games, count)
+
+    def active_cells(self) -> tuple[np.ndarray, np.ndarray]:
+        """Devuelve (filas, columnas), cada una (N, 4), de los bloques de la pieza activa de cada partida."""
+        cells = np.array([game.piece.get_cells() for game in self._games], dtype=np.int64)
+        return cells[:, :, 0], cells[:, :, 1]
+
+    # --- HELPERS ---
+    def _new_game(self, index: int) -> GameBoardController:
+        """Controlador de la partida index para su episodio actual, ya con la primera pieza."""
+        seed = None if self._seed is None else self._seed + index + self.num_games * int(self._episodes[index])
+        game = GameBoardController(self._config, self._ruleset, self._shapes, animate_clears=False, seed=seed)
+        game.start()
+        return game
+
+    def _finish(self, index: int, game: GameBoardController, before: int, locked: int) -> None:
+        """Genera la pieza siguiente si la anterior se bloqueó y anota líneas y puntos del paso."""
+        self._played[index] = True
+        if game.pieces_locked != locked:
+            game.update(0.0)
+            self.last_lines[index] = game.last_lines_cleared
+        self.last_score_gain[index] = game.current_score - before
@@ -0,0 +1,221 @@
+import numpy as np
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.core.types import PieceShape
+
+
+@dataclass
+class EvalWeights:
+    """
+    Pesos de la evaluación lineal de un tablero.
+
+    Attributes:
+        height:    Suma de las alturas de las columnas.
+        holes:     Celdas vacías con algún bloque encima.
+        bumpiness: Suma de las diferencias de altura entre columnas vecinas.
+        wells:     Profundidad total de los pozos (columnas más bajas que ambas vecinas).
+        lines:     Líneas eliminadas por la jugada.
+        t_slots:   Huecos con forma de T listos para un T-spin.
+    """
+    height:    float = -0.51
+    holes:     float = -0.36
+    bumpiness: float = -0.18
+    wells:     float = -0.10
+    lines:     float = 0.76
+    t_slots:   float = 0.25
+
+    def as_array(self) -> np.ndarray:
+        """Devuelve los pesos en el orden de FEATURES."""
+        return np.array([getattr(self, name) for name in FEATURES], dtype=np.float64)
+
+    @classmethod
+    def from_array(cls, values: "np.ndarray | list[float]") -> "EvalWeights":
+        """
+        Construye los pesos desde un vector en el orden de FEATURES.
+
+        Raises:
+            ValueError: Si el vector no tiene un valor por característica.
+        """
+        if len(values) != len(FEATURES):
+            raise ValueError(f"EvalWeights: se esperaban {len(FEATURES)} pesos, se recibieron {len(values)}.")
+        return cls(*(float(v) for v in values))
+
+
+# Orden de las características en BoardEvaluator.features y EvalWeights.as_array
+FEATURES = tuple(f.name for f in fields(EvalWeights))
+
+
+class BoardEvaluator:
+    """
+    Evalúa lotes de tableros con NumPy.
+
+    Los tableros se reciben como arreglos (N, rows, cols) donde una celda distinta de cero está
+    ocupada. Todas las operaciones trabajan sobre el lote completo, así que evaluar cientos de
+    tableros candidatos cuesta poco más que evaluar uno.
+    """
+    def __init__(self, weights: EvalWeights | None = None) -> None:
+        """
+        Args:
+            weights: Pesos de la evaluación (los de EvalWeights por defecto).
+        """
+        self.weights = weights if weights is not None else EvalWeights()
+
+    @property
+    def weights(self) -> EvalWeights:
+        return self._weights
+
+    @weights.setter
+    def weights(self, weights: EvalWeights) -> None:
+        self._weights = weights
+        self._vector  = weights.as_array()
+
+    def evaluate(self, boards: np.ndarray, lines: np.ndarray) -> np.ndarray:
+        """
+        Puntúa cada tablero (mayor es mejor).
+
+        Args:
+            boards: Tableros (N, rows, cols), ya sin las filas completas.
+            lines: Líneas eliminadas para llegar a cada tablero (N,).
+
+        Returns:
+            np.ndarray: Puntaje de cada tablero (N,).
+        """
+        return self.features(boards, lines) @ self._vector
+
+    def features(self, boards: np.ndarray, lines: np.ndarray) -> np.ndarray:
+        """
+        Calcula las características de cada tablero en el orden de FEATURES.
+
+        Returns:
+            np.ndarray: Matriz (N, len(FEATURES)).
+        """
+        occupied = boards != 0
+        n, rows, _ = occupied.shape
+
+        filled  = occupied.any(axis=1)
+        tops    = np.where(filled, occupied.argmax(axis=1), rows)
+        heights = rows - tops
+
+        # Hueco: celda vacía con algún bloque encima en su columna
+        covered = np.logical_or.accumulate(occupied, axis=1)
+        holes   = (covered & ~occupied).sum(axis=(1, 2))
+
+        bumpiness = np.abs(np.diff(heights, axis=1)).sum(axis=1)
+
+        # Las paredes cuentan como columnas de altura máxima
+        walls  = np.full((n, 1), rows)
+        padded = np.concatenate((walls, heights, walls), axis=1)
+        wells  = np.clip(np.minimum(padded[:, :-2], padded[:, 2:]) - heights, 0, None).sum(axis=1)
+
+        return np.stack(
+            (heights.sum(axis=1), holes, bumpiness, wells, lines, self._t_slots(occupied)),
+            axis=1,
+        ).astype(np.float64)
+
+    # --- HELPERS ---
+    def _t_slots(self, occupied: np.ndarray) -> np.ndarray:
+        """
+        Cuenta los huecos de T-spin doble: una T invertida vacía cuya fila inferior tiene
+        las dos esquinas ocupadas, con un solo saliente arriba que la tapa de un lado.
+        """
+        empty = ~occupied
+        top, mid, low = occupied[:, :-2], occupied[:, 1:-1], occupied[:, 2:]
+        e_top, e_mid, e_low = empty[:, :-2], empty[:, 1:-1], empty[:, 2:]
+
+        slot = (
+            e_mid[:, :, :-2] & e_mid[:, :, 1:-1] & e_mid[:, :, 2:]  # fila media vacía
+            & low[:, :, :-2] & e_low[:, :, 1:-1] & low[:, :, 2:]    # fila inferior: X . X
+            & e_top[:, :, 1:-1]                                     # entrada libre arriba
+            & (top[:, :, :-2] ^ top[:, :, 2:])                      # un solo saliente
+        )
+        return slot.sum(axis=(1, 2))
+
+
+def clear_full_rows(boards: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Elimina las filas completas de un lote de tableros, bajando las de arriba.
+
+    Solo se compactan los tableros que tienen alguna fila completa.
+
+    Args:
+        boards: Tableros (N, rows, cols). Se modifican en su lugar.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Los tableros compactados y las líneas eliminadas por tablero.
+    """
+    full  = (boards != 0).all(axis=2)
+    lines = full.sum(axis=1)
+    touched = np.flatnonzero(lines)
+    if not len(touched):
+        return boards, lines
+
+    # Las filas completas pasan arriba (orden estable) y se vacían
+    order = np.argsort(~full[touched], axis=1, kind="stable")
+    compacted = np.take_along_axis(boards[touched], order[:, :, None], axis=1)
+    compacted[np.arange(boards.shape[1]) < lines[touched, None]] = 0
+    boards[touched] = compacted
+    return boards, lines
+
+
+def drop_moves(shape: "PieceShape", cols: int) -> list[tuple[int, int]]:
+    """
+    Lista las caídas distintas (rot, col) de una pieza en un tablero de `cols` columnas.
+
+    Las rotaciones que ocupan las mismas celdas se incluyen una sola vez.
+    """
+    moves, seen = [], set()
+    for rot, (cells, (top, _, left, right)) in enumerate(zip(shape["offsets"], shape["bounds"])):
+        normalized = tuple(sorted((dr - top, dc - left) for dr, dc in cells))
+        for col in range(-left, cols - right):
+            if (normalized, col + left) not in seen:
+                seen.add((normalized, col + left))
+                moves.append((rot, col))
+    return moves
+
+
+def drop_all(boards: np.ndarray, shape: "PieceShape") -> tuple[np.ndarray, np.ndarray, np.ndarray, list[tuple[int, int]]]:
+    """
+    Suelta la pieza en cada (rotación, columna) posible de cada tablero, en lote.
+
+    Es la caída directa desde arriba (hard drop sin movimientos bajo salientes), suficiente
+    para mirar una jugada hacia adelante.
+
+    Args:
+        boards: Tableros (N, rows, cols).
+        shape: Formas de la pieza.
+
+    Returns:
+        tuple: Tableros resultantes ya sin filas completas (N, K, rows, cols), líneas eliminadas
+        (N, K), máscara de jugadas válidas (N, K) y la lista de las K jugadas (rot, col) (ver drop_moves).
+    """
+    occupied = boards != 0
+    n, rows, cols = occupied.shape
+    tops  = np.where(occupied.any(axis=1), occupied.argmax(axis=1), rows)
+    moves = drop_moves(shape, cols)
+    k     = len(moves)
+
+    # Columnas y celda inferior de cada jugada, rellenadas con la primera columna (no cambia el mínimo)
+    width   = max(len(shape["column_bottoms"][rot]) for rot, _ in moves)
+    columns = np.empty((k, width), dtype=np.intp)
+    bottoms = np.empty((k, width), dtype=np.intp)
+    cell_rows = np.array([[dr for dr, _ in shape["offsets"][rot]] for rot, _ in moves])
+    cell_cols = np.array([[col + dc for _, dc in shape["offsets"][rot]] for rot, col in moves])
+    tops_dr   = np.array([shape["bounds"][rot][0] for rot, _ in moves])
+    for index, (rot, col) in enumerate(moves):
+        pairs = shape["column_bottoms"][rot]
+        pairs = pairs + (pairs[0],) * (width - len(pairs))
+        columns[index] = [col + dc for dc, _ in pairs]
+        bottoms[index] = [bottom for _, bottom in pairs]
+
+    landing = (tops[:, columns] - 1 - bottoms).min(axis=2)          # (N, K)
+    # Una pieza que queda con celdas sobre el tablero no es una jugada válida
+    valid   = landing + tops_dr >= 0
+
+    results = np.repeat(occupied[:, None], k, axis=1)
+    cells   = np.maximum(landing[:, :, None] + cell_rows, 0)        # (N, K, 4)
+    results[np.arange(n)[:, None, None], np.arange(k)[None, :, None], cells, cell_cols] = True
+
+    flat, lines = clear_full_rows(results.reshape(n * k, rows, cols))
+    return flat.reshape(n, k, rows, cols), lines.reshape(n, k), valid, moves
@@ -0,0 +1,370 @@
+import time
+import numpy as np
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from src.core.piece_shapes import build_piece_shapes
+from src.core.placement_finder import Placement, PlacementFinder
+from src.core.zobrist import hash_boards, name_id, zobrist_key
+from src.ai.evaluator import BoardEvaluator, EvalWeights, clear_full_rows, drop_all
+from src.ai.heuristic_bot import BotPlan
+from src.ai.transposition import TranspositionTable
+
+if TYPE_CHECKING:
+    from src.core.board import Board
+    from src.core.gameboard_controller import GameBoardController
+    from src.core.types import PieceShapeType
+
+
+# Tableros por llamada a drop_all dentro de una capa: entre bloques se consulta el reloj
+_CHUNK = 16
+# Hojas por llamada a evaluate (unas 32 caídas por tablero, como un bloque de drop_all)
+_LEAF_CHUNK = _CHUNK * 32
+# Prefijos de las claves de la composición del lote y de las piezas conocidas, distintos de los tipos de zobrist
+_COUNT_TAG = 0x4558
+_KNOWN_TAG = 0x4B4E
+
+
+@lru_cache(maxsize=None)
+def _known_key(position: int, name: str) -> int:
+    """Clave de la pieza conocida `name` en la posición `position` de la cola pendiente."""
+    return zobrist_key(_KNOWN_TAG, position, name_id(name))
+
+
+class _Timeout(Exception):
+    """Se terminó el tiempo de la jugada en medio de una iteración."""
+
+
+@dataclass
+class ExpectimaxStats:
+    """
+    Instrumentación de la última llamada a ExpectimaxBot.choose.
+
+    Attributes:
+        depth:        Piezas miradas en la última iteración completa, contando la actual.
+        chance_depth: De esas, cuántas salieron de nodos de azar (más allá del preview).
+        nodes:        Tableros expandidos.
+        cache_hits:   Tableros resueltos por la tabla de transposición o repetidos en su capa.
+        seconds:      Duración de la búsqueda.
+        timed_out:    Si la última iteración se abandonó por tiempo.
+    """
+    depth:        int   = 0
+    chance_depth: int   = 0
+    nodes:        int   = 0
+    cache_hits:   int   = 0
+    seconds:      float = 0.0
+    timed_out:    bool  = False
+
+
+class ExpectimaxBot:
+    """
+    Jugador automático que mira más allá del preview con expectimax sobre la bolsa.
+
+    La pieza activa (y la del hold) se colocan en las posiciones alcanzables de PlacementFinder;
+    después siguen las piezas del preview como nodos de decisión y, al agotarse, nodos de azar:
+    la próxima pieza es cualquiera de las que quedan en el lote en curso de PieceBag, con
+    probabilidad proporcional a cuántas quedan (al vaciarse el lote empieza uno nuevo). Cada
+    nodo de decisión vale su mejor hijo y cada nodo de azar el promedio ponderado de sus piezas.
+
+    El árbol se arma por capas: todos los tableros de una capa se expanden con una llamada a
+    drop_all por pieza y solo las `beam` mejores caídas de cada tablero pasan a la siguiente,
+    como en HeuristicBot; de la pieza activa solo se miran en profundidad las `width` mejores
+    posiciones. Los subárboles se guardan en una TranspositionTable con clave
+    (hash de Zobrist del tablero, piezas conocidas pendientes, composición del lote), así que
+    los tableros repetidos de una capa, los de la iteración anterior y los de la jugada
+    anterior no se vuelven a expandir.
+
+    La búsqueda es por profundización iterativa dentro de `budget` segundos: se juega la mejor
+    jugada de la última profundidad completa y `stats` informa hasta dónde llegó. Una iteración
+    no empieza si, según lo que creció la anterior, no llega a terminar en el tiempo que queda;
+    y la que se corta lo hace entre bloques de `_CHUNK` tableros, así que la jugada no se pasa
+    del budget más que lo que tarda un bloque.
+    """
+    # Valor de una rama en la que la pieza no entra en ningún lado (como en HeuristicBot)
+    DEAD = -1e6
+
+    def __init__(self,
+                 weights: EvalWeights | None = None,
+                 pieces: "PieceShapeType | None" = None,
+                 wall_kicks: bool = True,
+                 beam: int = 3,
+                 width: int = 8,
+                 budget: float = 0.05,
+                 max_depth: int | None = None,
+                 table: TranspositionTable | None = None) -> None:
+        """
+        Args:
+            weights: Pesos de la evaluación (los de EvalWeights por defecto).
+            pieces: Formas de las piezas. Si no se indica se construyen desde PIECE_DEFINITIONS.
+            wall_kicks: Si las rotaciones aplican wall kicks (como el ruleset activo).
+            beam: Caídas de cada tablero que pasan a la capa siguiente.
+            width: Posiciones de la pieza activa (por opción de hold) que se miran en profundidad.
+            budget: Segundos por jugada.
+            max_depth: Piezas a mirar como máximo, contando la actual; None para seguir hasta el tiempo.
+            table: Tabla de transposición compartida entre jugadas (una nueva por defecto).
+
+        Raises:
+            ValueError: Si beam, budget o max_depth no son positivos.
+        """
+        if beam <= 0 or width <= 0 or budget <= 0 or (max_depth is not None and max_depth <= 0):
+            raise ValueError(f"ExpectimaxBot: parámetros inválidos (beam={beam}, width={width}, budget={budget}, "
+                             f"max_depth={max_depth}). Deben ser mayores que cero.")
+        self._data      = pieces if pieces is not None else build_piece_shapes()
+        self._finder    = PlacementFinder(self._data, wall_kicks=wall_kicks)
+        self._names     = list(self._data)
+        self.evaluator  = BoardEvaluator(weights)
+        self.beam       = beam
+        self.width      = width
+        self.budget     = budget
+        self.max_depth  = max_depth
+        self.table      = table if table is not None else TranspositionTable(1 << 16, "depth")
+        self.stats      = ExpectimaxStats()
+
+        # Claves de Zobrist de la composición del lote: una por (pieza, cantidad restante)
+        self._count_keys = np.array([[zobrist_key(_COUNT_TAG, name_id(name), n) for n in range(64)]
+                                     for name in self._names], dtype=np.uint64)
+
+    @classmethod
+    def for_controller(cls, controller: "GameBoardController", weights: EvalWeights | None = None,
+                       beam: int = 3, width: int = 8, budget: float = 0.05,
+                       max_depth: int | None = None) -> "ExpectimaxBot":
+        """Crea un bot con las mismas piezas y wall kicks que el controlador."""
+        return cls(weights, controller.pieces, controller.mechanics.wall_kicks, beam, width, budget, max_depth)
+
+    def plan(self, controller: "GameBoardController", budget: float | None = None) -> BotPlan | None:
+        """
+        Elige la jugada para la pieza activa del controlador, desde su posición actual.
+
+        Returns:
+            BotPlan | None: La jugada, o None si no hay pieza activa.
+        """
+        piece = controller.piece
+        if piece is None or piece.is_locked():
+            return None
+        hold = controller.hold_piece
+        preview = controller.preview
+        return self.choose(controller.board, piece.name, hold.name if hold else None, preview,
+                           controller.bag_remaining(len(preview)), controller.bag_lot, controller.can_hold,
+                           start=(piece.row, piece.col, piece.rot), budget=budget)
+
+    def choose(self, board: "Board", current: str, hold: str | None, preview: list[str],
+               remaining: dict[str, int], lot: dict[str, int], can_hold: bool = False,
+               start: tuple[int, int, int] | None = None, budget: float | None = None) -> BotPlan | None:
+        """
+        Elige la mejor jugada.
+
+        Args:
+            board: Tablero actual.
+            current: Pieza activa.
+            hold: Pieza en el hold, o None si está vacío.
+            preview: Próximas piezas conocidas.
+            remaining: Piezas que quedan en el lote en curso después del preview (ver PieceBag.remaining).
+            lot: Composición de un lote completo (ver PieceBag.lot).
+            can_hold: Si el hold está disponible para esta pieza.
+            start: Posición (row, col, rot) de la pieza activa; None para la de spawn.
+            budget: Segundos para esta jugada (los del bot por defecto).
+
+        Returns:
+            BotPlan | None: La mejor jugada, o None si la pieza no tiene posiciones alcanzables.
+        """
+        started = time.perf_counter()
+        deadline = started + (self.budget if budget is None else budget)
+        self.stats = ExpectimaxStats()
+        self.table.new_search()
+
+        options: list[tuple[bool, str, list[str], tuple[int, int, int] | None]] = [
+            (False, current, list(preview), start)
+        ]
+        if can_hold:
+            if hold is not None:
+                options.append((True, hold, list(preview), None))
+            elif preview:
+                options.append((True, preview[0], list(preview[1:]), None))
+
+        roots = []
+        for use_hold, name, known, position in options:
+            placements = self._find(board, name, position)
+            if placements:
+                boards, lines = self._place(board, name, placements)
+                kept = np.argsort(-self.evaluator.evaluate(boards, lines))[:self.width]
+                roots.append((use_hold, placements, known, boards, lines, kept))
+        if not roots:
+            return None
+
+        counts = np.array([remaining.get(name, 0) for name in self._names], dtype=np.int64)
+        full = np.array([lot.get(name, 0) for name in self._names], dtype=np.int64)
+        if not counts.any():
+            counts = full.copy()
+
+        best: BotPlan | None = None
+        depth = 1
+        durations: list[float] = []
+        while self.max_depth is None or depth <= self.max_depth:
+            # La próxima iteración tarda la última por lo que creció respecto de la anterior
+            # (desde la profundidad 2: la 1 solo evalúa las posiciones de la pieza activa)
+            if len(durations) >= 3:
+                growth = max(durations[-1] / max(durations[-2], 1e-9), 1.0)
+                if time.perf_counter() + durations[-1] * growth > deadline:
+                    break
+            iteration = time.perf_counter()
+            try:
+                # La profundidad 1 no consulta el reloj: siempre hay una jugada para devolver
+                results = [self._root_values(boards, lines, kept, known, counts, full, depth - 1, deadline)
+                           for _, _, known, boards, lines, kept in roots]
+            except _Timeout:
+                self.stats.timed_out = True
+                break
+            best = None
+            for (use_hold, placements, *_), values in zip(roots, results):
+                index = int(np.argmax(values))
+                if best is None or values[index] > best.score:
+                    best = BotPlan(placements[index], use_hold, float(values[index]))
+            self.stats.depth = depth
+            self.stats.chance_depth = max(0, depth - 1 - len(preview))
+            depth += 1
+            durations.append(time.perf_counter() - iteration)
+
+        self.stats.seconds = time.perf_counter() - started
+        return best
+
+    # --- HELPERS ---
+    def _find(self, board: "Board", name: str, position: tuple[int, int, int] | None) -> list[Placement]:
+        if position is None:
+            return self._finder.find(board, name)
+        row, col, rot = position
+        return self._finder.find(board, name, row, col, rot)
+
+    def _place(self, board: "Board", name: str, placements: list[Placement]) -> tuple[np.ndarray, np.ndarray]:
+        """Tableros (sin filas completas) y líneas eliminadas de cada posición final."""
+        offsets = self._data[name]["offsets"]
+        rows = np.array([[p.row + dr for dr, _ in offsets[p.rot]] for p in placements])
+        cols = np.array([[p.col + dc for _, dc in offsets[p.rot]] for p in placements])
+        boards = np.repeat((board.matrix != 0)[None], len(placements), axis=0)
+        # Las celdas sobre el tablero se descartan, como en Board.lock_piece
+        inside = rows >= 0
+        owners = np.broadcast_to(np.arange(len(placements))[:, None], rows.shape)
+        boards[owners[inside], rows[inside], cols[inside]] = True
+        return clear_full_rows(boards)
+
+    def _root_values(self, boards: np.ndarray, lines: np.ndarray, kept: np.ndarray, known: list[str],
+                     counts: np.ndarray, full: np.ndarray, plies: int, deadline: float) -> np.ndarray:
+        """Valor de cada posición de la pieza activa; fuera de las `width` mejores solo cuenta sin mirar adelante."""
+        if not plies:
+            return self._search(boards, lines, known, counts, full, 0, deadline)
+        values = np.full(len(boards), -np.inf)
+        values[kept] = self._search(boards[kept], lines[kept], known, counts, full, plies, deadline)
+        return values
+
+    def _search(self, boards: np.ndarray, lines: np.ndarray, known: list[str], counts: np.ndarray,
+                full: np.ndarray, plies: int, deadline: float) -> np.ndarray:
+        """
+        Valor de cada tablero raíz mirando `plies` piezas más.
+
+        El valor de un nodo es w_lines * (líneas de la jugada que lo creó) + el valor de su
+        subárbol; como la evaluación es lineal en las líneas, el subárbol no depende del camino
+        y se puede guardar en la tabla.
+
+        Returns:
+            np.ndarray: Valor de cada tablero (N,).
+        """
+        w_lines = self.evaluator.weights.lines
+        layer_counts = np.repeat(counts[None], len(boards), axis=0)
+        layers = []
+        for ply in range(plies):
+            if time.perf_counter() > deadline:
+                raise _Timeout
+            left = plies - ply
+            keys = self._keys(boards, layer_counts, tuple(known[ply:]))
+            found, cached = self.table.probe_many(keys, left)
+            unique, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+            expand = ~found[first]
+            parents = first[expand]
+            self.stats.nodes += len(parents)
+            self.stats.cache_hits += len(keys) - len(parents)
+
+            piece = known[ply] if ply < len(known) else None
+            children = self._expand(boards[parents], layer_counts[parents], piece, full, deadline)
+            layers.append((lines, keys, cached, first, inverse, expand, parents, left, *children[3:]))
+            boards, layer_counts, lines = children[:3]
+
+        # Hojas: el subárbol vale la evaluación del tablero sin contar líneas
+        values = w_lines * lines.astype(np.float64)
+        for start in range(0, len(boards), _LEAF_CHUNK):
+            if plies and time.perf_counter() > deadline:
+                raise _Timeout
+            block = boards[start:start + _LEAF_CHUNK]
+            values[start:start + _LEAF_CHUNK] += self.evaluator.evaluate(block, np.zeros(len(block)))
+        num = len(self._names)
+        for lines, keys, cached, first, inverse, expand, parents, left, groups, weights in reversed(layers):
+            best = np.full(len(parents) * num, -np.inf)
+            np.maximum.at(best, groups, values)
+            weights = weights.reshape(-1)
+            best = np.where(weights > 0, np.where(np.isfinite(best), best, self.DEAD), 0.0)
+            subtree = (best * weights).reshape(len(parents), num).sum(axis=1)
+            self.table.store_many(keys[parents], left, subtree)
+
+            per_key = cached[first].copy()
+            per_key[expand] = subtree
+            values = w_lines * lines + per_key[inverse]
+        return values
+
+    def _expand(self, boards: np.ndarray, counts: np.ndarray, piece: str | None,
+                full: np.ndarray, deadline: float) -> tuple[np.ndarray, ...]:
+        """
+        Hijos de una capa: las `beam` mejores caídas de cada tablero para cada pieza posible.
+
+        Returns:
+            tuple: (tableros, composición del lote, líneas, grupo de cada hijo, pesos por grupo).
+            El grupo es padre * P + pieza y los pesos (padres, P) son la probabilidad de cada pieza.
+        """
+        num = len(self._names)
+        if piece is not None:
+            weights = np.zeros((len(boards), num))
+            weights[:, self._names.index(piece)] = 1.0
+        else:
+            weights = counts / counts.sum(axis=1, keepdims=True)
+
+        parts: list[tuple[np.ndarray, ...]] = []
+        for t in np.flatnonzero(weights.any(axis=0)):
+            for start in range(0, len(boards), _CHUNK):
+                if time.perf_counter() > deadline:
+                    raise _Timeout
+                owners = start + np.flatnonzero(weights[start:start + _CHUNK, t] > 0)
+                if len(owners):
+                    parts.append(self._expand_piece(boards, counts, owners, t, piece, full))
+
+        if not parts:
+            _, rows, cols = boards.shape
+            return (np.zeros((0, rows, cols), dtype=bool), np.zeros((0, num), dtype=np.int64),
+                    np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), weights)
+        return (*(np.concatenate(column) for column in zip(*parts)), weights)
+
+    def _expand_piece(self, boards: np.ndarray, counts: np.ndarray, owners: np.ndarray, t: int,
+                      piece: str | None, full: np.ndarray) -> tuple[np.ndarray, ...]:
+        """Las `beam` mejores caídas de la pieza t en los tableros `owners` (tableros, lote, líneas, grupo)."""
+        results, lines, valid, _ = drop_all(boards[owners], self._data[self._names[t]])
+        n, k, rows, cols = results.shape
+        scores = self.evaluator.evaluate(results.reshape(n * k, rows, cols), lines.reshape(n * k)).reshape(n, k)
+        scores[~valid] = -np.inf
+
+        top = np.argsort(-scores, axis=1)[:, :self.beam]
+        keep = np.isfinite(np.take_along_axis(scores, top, axis=1))
+        row, col = np.nonzero(keep)
+        chosen = top[row, col]
+        parent = owners[row]
+
+        child_counts = counts[parent].copy()
+        if piece is None:
+            child_counts[:, t] -= 1
+            empty = ~child_counts.any(axis=1)
+            child_counts[empty] = full
+        return results[row, chosen], child_counts, lines[row, chosen], parent * len(self._names) + t
+
+    def _keys(self, boards: np.ndarray, counts: np.ndarray, known: tuple[str, ...]) -> np.ndarray:
+        """Clave de cada nodo: tablero, piezas conocidas pendientes y composición del lote."""
+        known_key = 0
+        for position, name in enumerate(known):
+            known_key ^= _known_key(position, name)
+        keys = hash_boards(boards) ^ np.uint64(known_key)
+        columns = np.arange(len(self._names))
+        return keys ^ np.bitwise_xor.reduce(self._count_keys[columns, np.minimum(counts, 63)], axis=1)
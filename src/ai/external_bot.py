@@ -0,0 +1,434 @@
+"""
+Bots externos: procesos (en cualquier lenguaje) que juegan por stdin/stdout con JSON por líneas.
+
+Protocolo (un objeto JSON por línea, versión PROTOCOL_VERSION):
+
+    juego -> bot
+        {"type": "start", "version": 1, "rows": 20, "cols": 10, "hold": true, "wall_kicks": true,
+         "pieces": {"T": [[[0, 1], [1, 0], ...], ...], ...}}       celdas (fila, col) por rotación
+        {"type": "suggest", "id": 7, "board": [[0, 0, ...], ...], "current": "T",
+         "position": [row, col, rot] | null, "hold": "I" | null, "can_hold": true,
+         "queue": ["S", "Z", ...], "speculative": false}
+        {"type": "quit"}
+
+    bot -> juego
+        {"type": "ready", "name": "..."}                           opcional
+        {"type": "move", "id": 7, "hold": false, "row": 18, "col": 3, "rot": 1}
+
+"board" tiene el tipo de pieza de cada celda (0 = vacía). "position" es la posición actual
+de la pieza activa (null = la de spawn); la jugada es la posición final (row, col, rot) con
+el mismo origen que Piece, y el juego arma los inputs para llegar con PlacementFinder. Una
+jugada sin posición suelta la pieza donde está. Los pedidos con "speculative": true son para
+la pieza siguiente, suponiendo que la jugada anterior se juega tal cual: el bot los responde
+igual que a los demás.
+
+src.ai.bot_server es un bot de referencia que habla este protocolo.
+"""
+import json
+import time
+import queue
+import threading
+import subprocess
+import numpy as np
+from dataclasses import dataclass, replace
+from typing import Any, IO, TYPE_CHECKING
+from src.core.action import Action
+from src.core.board import Board
+from src.core.piece import Piece
+from src.core.piece_shapes import build_piece_shapes
+from src.core.placement_finder import Placement, PlacementFinder
+from src.ai.heuristic_bot import HeuristicBot
+from src.ai.search_worker import SearchResult
+
+if TYPE_CHECKING:
+    from src.core.gameboard_controller import GameBoardController
+    from src.core.types import PieceShapeType
+
+
+PROTOCOL_VERSION = 1
+
+# Marca de fin de stdout del bot (el proceso terminó o cerró la salida)
+_EOF = object()
+
+
+@dataclass(frozen=True)
+class _Request:
+    """Pedido enviado al bot y lo necesario para predecir el siguiente."""
+    request_id:  int
+    matrix:      np.ndarray
+    current:     str
+    hold:        str | None
+    known:       tuple[str, ...]   # próximas piezas conocidas (más que las enviadas en "queue")
+    speculative: bool
+    sent:        float
+
+
+@dataclass
+class ExternalBotStats:
+    """
+    Instrumentación de ExternalBot.
+
+    Attributes:
+        requests:    Pedidos enviados, incluidos los especulativos.
+        speculative: Pedidos especulativos enviados.
+        hits:        Piezas resueltas con un pedido especulativo.
+        misses:      Pedidos especulativos descartados porque el estado real fue otro.
+        ready:       Piezas cuya jugada ya había llegado cuando aparecieron.
+        timeouts:    Piezas jugadas con el respaldo porque el bot no respondió a tiempo.
+        invalid:     Respuestas inutilizables (JSON inválido o posición inalcanzable).
+        replies:     Respuestas "move" recibidas a tiempo.
+        total_latency: Suma de los tiempos de respuesta, en segundos.
+        worst_latency: Peor tiempo de respuesta, en segundos.
+    """
+    requests:      int   = 0
+    speculative:   int   = 0
+    hits:          int   = 0
+    misses:        int   = 0
+    ready:         int   = 0
+    timeouts:      int   = 0
+    invalid:       int   = 0
+    replies:       int   = 0
+    total_latency: float = 0.0
+    worst_latency: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.replies if self.replies else 0.0
+
+
+class ExternalBot:
+    """
+    Bot en un subproceso que recibe el estado por stdin y responde jugadas por stdout.
+
+    Tiene la misma interfaz que SearchService (submit / poll / cancel / close), así que BotInput
+    lo usa para jugar con los mismos inputs que PlayState.handle_input. Hilos aparte escriben y
+    leen los pipes, por lo que submit y poll nunca esperan al bot.
+
+    Con `pipeline`, al llegar la jugada de una pieza se pide enseguida la de la siguiente sobre
+    el tablero que resultaría de jugarla: el bot piensa mientras la pieza actual se mueve y cae.
+    Si al aparecer la pieza el estado real coincide con el supuesto, se usa esa respuesta; si
+    no (o la posición ya no es alcanzable), se hace un pedido nuevo.
+
+    Si el bot no responde en `timeout` segundos, o su proceso terminó, la pieza se juega con el
+    bot de respaldo (o se suelta donde está) y la respuesta tardía se descarta.
+    """
+    def __init__(self,
+                 command: list[str],
+                 pieces: "PieceShapeType | None" = None,
+                 wall_kicks: bool = True,
+                 hold: bool = True,
+                 rows: int = 20,
+                 cols: int = 10,
+                 timeout: float = 1.0,
+                 pipeline: bool = True,
+                 fallback: HeuristicBot | None = None) -> None:
+        """
+        Args:
+            command: Programa del bot y sus argumentos.
+            pieces: Formas de las piezas. Si no se indica se construyen desde PIECE_DEFINITIONS.
+            wall_kicks: Si las rotaciones aplican wall kicks (como el ruleset activo).
+            hold: Si el ruleset tiene hold.
+            rows: Filas del tablero.
+            cols: Columnas del tablero.
+            timeout: Segundos que se espera la jugada de cada pieza desde que aparece.
+            pipeline: Si se pide la jugada de la pieza siguiente antes de que aparezca.
+            fallback: Bot que juega las piezas en las que el externo no respondió a tiempo.
+
+        Raises:
+            ValueError: Si timeout no es positivo.
+            OSError: Si no se pudo lanzar el proceso.
+        """
+        if timeout <= 0:
+            raise ValueError(f"ExternalBot: timeout inválido ({timeout}). Debe ser mayor que cero.")
+        self._data     = pieces if pieces is not None else build_piece_shapes()
+        self._finder   = PlacementFinder(self._data, wall_kicks)
+        self._fallback = fallback
+        self.timeout   = timeout
+        self.pipeline  = pipeline
+        self.name: str | None = None
+        self.stats = ExternalBotStats()
+
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                         text=True, encoding="utf-8", bufsize=1)
+        self._inbox: queue.Queue = queue.Queue()
+        self._outbox: queue.Queue = queue.Queue()
+        threading.Thread(target=_read_lines, args=(self._process.stdout, self._inbox),
+                         name="ExternalBot-reader", daemon=True).start()
+        threading.Thread(target=_write_lines, args=(self._process.stdin, self._outbox),
+                         name="ExternalBot-writer", daemon=True).start()
+        self._alive = True
+
+        self._send({
+            "type": "start", "version": PROTOCOL_VERSION, "rows": rows, "cols": cols,
+            "hold": hold, "wall_kicks": wall_kicks,
+            "pieces": {name: [list(map(list, cells)) for cells in data["offsets"]]
+                       for name, data in self._data.items()},
+        })
+
+        self._next_id = 0
+        self._requests: dict[int, _Request] = {}
+        self._replies: dict[int, dict] = {}
+        self._controller: "GameBoardController | None" = None
+        self._current: int | None = None
+        self._submitted = 0.0
+        self._latest: SearchResult | None = None
+
+    @classmethod
+    def for_controller(cls, controller: "GameBoardController", command: list[str], timeout: float = 1.0,
+                       pipeline: bool = True, fallback: HeuristicBot | None = None) -> "ExternalBot":
+        """Crea un bot externo con las mismas piezas, reglas y tablero que el controlador."""
+        board = controller.board
+        return cls(command, controller.pieces, controller.mechanics.wall_kicks, controller.hold_enabled,
+                   board.rows, board.cols, timeout, pipeline, fallback)
+
+    @property
+    def alive(self) -> bool:
+        """False si el proceso del bot terminó."""
+        return self._alive
+
+    @property
+    def latest(self) -> SearchResult | None:
+        """Jugada del pedido vigente, si ya se resolvió."""
+        return self._latest
+
+    def submit(self, controller: "GameBoardController") -> int:
+        """
+        Pide la jugada de la pieza activa, reemplazando el pedido anterior.
+
+        Returns:
+            int: Identificador del pedido vigente (el especulativo, si coincide con el estado real).
+        """
+        self._controller = controller
+        self._latest = None
+        self._drain()
+        self._submitted = time.perf_counter()
+        piece = controller.piece
+        hold = controller.hold_piece
+        state = (controller.board.matrix != 0, piece.name, hold.name if hold else None, tuple(controller.preview))
+
+        match = None
+        for request in list(self._requests.values()):
+            if request.speculative and match is None and self._matches(request, *state):
+                match = request
+                continue
+            if request.speculative:
+                self.stats.misses += 1
+            del self._requests[request.request_id]
+            self._replies.pop(request.request_id, None)
+
+        if match is not None:
+            self.stats.hits += 1
+            self._current = match.request_id
+            # Las piezas conocidas se renuevan para que la próxima predicción tenga la cola completa
+            self._requests[match.request_id] = replace(match, known=tuple(controller.upcoming(len(controller.preview) + 2)))
+            if match.request_id in self._replies:
+                self.stats.ready += 1
+                self._resolve(match.request_id)
+        else:
+            self._current = self._request(controller.board.matrix, piece.name, state[2],
+                                          tuple(controller.upcoming(len(controller.preview) + 2)),
+                                          len(controller.preview), (piece.row, piece.col, piece.rot),
+                                          controller.can_hold)
+        return self._current
+
+    def poll(self) -> SearchResult | None:
+        """
+        Recoge sin bloquear las respuestas que llegaron.
+
+        Returns:
+            SearchResult | None: La jugada del pedido vigente, o None si todavía no hay.
+        """
+        self._drain()
+        if self._current is not None and self._latest is None:
+            waited = time.perf_counter() - self._submitted
+            if not self._alive or waited > self.timeout:
+                if self._alive:
+                    self.stats.timeouts += 1
+                self._requests.pop(self._current, None)
+                self._finish(self._current, self._fallback_actions())
+        return self._latest
+
+    def cancel(self) -> None:
+        """Da por terminado el pedido vigente; los especulativos siguen en curso."""
+        if self._current is not None:
+            self._requests.pop(self._current, None)
+            self._replies.pop(self._current, None)
+        self._current = None
+        self._latest = None
+
+    def close(self) -> None:
+        """Pide al bot que termine y, si no lo hace en un segundo, lo mata."""
+        if self._process.poll() is None:
+            self._send({"type": "quit"})
+        self._outbox.put(None)
+        try:
+            self._process.wait(timeout=1.0)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        self._alive = False
+
+    # --- HELPERS ---
+    def _drain(self) -> None:
+        """Procesa los mensajes que ya llegaron del bot, sin esperar."""
+        while True:
+            try:
+                received, message = self._inbox.get_nowait()
+            except queue.Empty:
+                return
+            self._receive(received, message)
+
+    def _send(self, message: dict[str, Any]) -> None:
+        self._outbox.put(json.dumps(message, separators=(",", ":")))
+
+    def _request(self, matrix: np.ndarray, current: str, hold: str | None, known: tuple[str, ...],
+                 visible: int, position: tuple[int, int, int] | None, can_hold: bool,
+                 speculative: bool = False) -> int:
+        """Envía un pedido y lo registra; devuelve su identificador."""
+        self._next_id += 1
+        request = _Request(self._next_id, matrix.copy(), current, hold, known, speculative, time.perf_counter())
+        self._requests[request.request_id] = request
+        self._send({
+            "type": "suggest", "id": request.request_id, "board": matrix.tolist(), "current": current,
+            "position": list(position) if position is not None else None, "hold": hold,
+            "can_hold": can_hold, "queue": list(known[:visible]), "speculative": speculative,
+        })
+        self.stats.requests += 1
+        self.stats.speculative += speculative
+        return request.request_id
+
+    def _receive(self, received: float, message: Any) -> None:
+        """Procesa un mensaje del bot."""
+        if message is _EOF:
+            self._alive = False
+            return
+        if not isinstance(message, dict):
+            self.stats.invalid += 1
+            return
+        if message.get("type") == "ready":
+            self.name = str(message.get("name"))
+            return
+        request = self._requests.get(message.get("id")) if message.get("type") == "move" else None
+        if request is None:
+            return   # respuesta tardía o de un pedido descartado
+
+        latency = received - request.sent
+        self.stats.replies += 1
+        self.stats.total_latency += latency
+        self.stats.worst_latency = max(self.stats.worst_latency, latency)
+        self._replies[request.request_id] = message
+        if request.request_id == self._current and self._latest is None:
+            self._resolve(request.request_id)
+
+    def _resolve(self, request_id: int) -> None:
+        """Convierte la respuesta del pedido vigente en inputs y, con pipeline, pide la pieza siguiente."""
+        request = self._requests.pop(request_id)
+        reply = self._replies.pop(request_id)
+        controller = self._controller
+        found = self._placement(controller, reply)
+        if found is None and request.speculative:
+            # La pieza ya no puede llegar a la posición supuesta: se pide de nuevo desde donde está
+            self.stats.misses += 1
+            piece, hold = controller.piece, controller.hold_piece
+            self._current = self._request(controller.board.matrix, piece.name, hold.name if hold else None,
+                                          tuple(controller.upcoming(len(controller.preview) + 2)),
+                                          len(controller.preview), (piece.row, piece.col, piece.rot),
+                                          controller.can_hold)
+            return
+        if found is None:
+            self.stats.invalid += 1
+            self._finish(request_id, self._fallback_actions())
+            return
+
+        use_hold, placement = found
+        self._finish(request_id, ((Action.HOLD,) if use_hold else ()) + tuple(placement.actions))
+        if self.pipeline and self._alive:
+            self._speculate(request, use_hold, placement, len(controller.preview))
+
+    def _finish(self, request_id: int, actions: tuple[Action, ...]) -> None:
+        self._latest = SearchResult(request_id, 1, actions, 0.0, time.perf_counter() - self._submitted, True)
+
+    def _placement(self, controller: "GameBoardController", reply: dict) -> tuple[bool, Placement] | None:
+        """Busca la posición pedida entre las alcanzables desde la pieza actual (o la del hold)."""
+        piece, hold = controller.piece, controller.hold_piece
+        use_hold = bool(reply.get("hold", False))
+        if use_hold and not controller.can_hold:
+            return None
+        if use_hold and hold is None and not controller.preview:
+            return None
+        if use_hold:
+            name = hold.name if hold is not None else controller.preview[0]
+            placements = self._finder.find(controller.board, name)
+        else:
+            name = piece.name
+            placements = self._finder.find(controller.board, name, piece.row, piece.col, piece.rot)
+        if not placements:
+            return None
+
+        try:
+            row, col, rot = int(reply["row"]), int(reply["col"]), int(reply["rot"]) % 4
+        except (KeyError, TypeError, ValueError):
+            # Sin posición: se suelta la pieza donde está (la primera posición es la de cero inputs)
+            return use_hold, placements[0]
+        offsets = self._data[name]["offsets"]
+        target = {(row + dr, col + dc) for dr, dc in offsets[rot]}
+        placement = next((p for p in placements
+                          if {(p.row + dr, p.col + dc) for dr, dc in offsets[p.rot]} == target), None)
+        return None if placement is None else (use_hold, placement)
+
+    def _speculate(self, request: _Request, use_hold: bool, placement: Placement, visible: int) -> None:
+        """Pide la jugada de la pieza siguiente sobre el tablero que deja `placement`."""
+        known, hold = list(request.known), request.hold
+        if use_hold:
+            hold, known = request.current, (known if hold is not None else known[1:])
+        if not known:
+            return
+        board = Board(*request.matrix.shape, animated=False)
+        board.set_matrix(request.matrix)
+        board.lock_piece(Piece(placement.name, self._data[placement.name], placement.row, placement.col, placement.rot))
+        board.clear_lines()
+        self._request(board.matrix, known[0], hold, tuple(known[1:]), visible, None, True, speculative=True)
+
+    def _matches(self, request: _Request, filled: np.ndarray, current: str, hold: str | None,
+                 preview: tuple[str, ...]) -> bool:
+        """Si el estado real de la pieza nueva es el que supuso un pedido especulativo."""
+        return (request.current == current and request.hold == hold
+                and request.known[:len(preview)] == preview
+                and np.array_equal(request.matrix != 0, filled))
+
+    def _fallback_actions(self) -> tuple[Action, ...]:
+        """Jugada de respaldo: la del bot local, o soltar la pieza donde está."""
+        if self._fallback is not None:
+            plan = self._fallback.plan(self._controller)
+            if plan is not None:
+                return tuple(plan.actions)
+        return (Action.HARD_DROP,)
+
+
+def _read_lines(stream: IO[str], inbox: queue.Queue) -> None:
+    """Hilo lector: decodifica cada línea del bot y la deja en la cola con su hora de llegada."""
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            message = json.loads(line)
+        except ValueError:
+            message = None
+        inbox.put((time.perf_counter(), message))
+    inbox.put((time.perf_counter(), _EOF))
+
+
+def _write_lines(stream: IO[str], outbox: queue.Queue) -> None:
+    """Hilo escritor: envía los mensajes encolados hasta recibir None, y cierra stdin del bot."""
+    try:
+        while (line := outbox.get()) is not None:
+            stream.write(line + "\n")
+            stream.flush()
+    except (BrokenPipeError, OSError, ValueError):
+        pass
+    finally:
+        try:
+            stream.close()
+        except (BrokenPipeError, OSError):
+            pass
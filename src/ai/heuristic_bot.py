@@ -0,0 +1,204 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from src.core.action import Action
+from src.core.piece_shapes import build_piece_shapes
+from src.core.placement_finder import Placement, PlacementFinder
+from src.ai.evaluator import BoardEvaluator, EvalWeights, clear_full_rows, drop_all
+
+if TYPE_CHECKING:
+    from src.core.board import Board
+    from src.core.gameboard_controller import GameBoardController
+    from src.core.types import PieceShapeType
+
+
+@dataclass
+class BotPlan:
+    """
+    Jugada elegida por el bot.
+
+    Attributes:
+        placement: Posición final de la pieza que se va a colocar.
+        use_hold:  Si la jugada empieza con HOLD.
+        score:     Valor de la jugada según la búsqueda.
+    """
+    placement: Placement
+    use_hold:  bool
+    score:     float
+
+    @property
+    def actions(self) -> list[Action]:
+        """Inputs de la jugada completa, terminando en HARD_DROP."""
+        return ([Action.HOLD] if self.use_hold else []) + list(self.placement.actions)
+
+
+class HeuristicBot:
+    """
+    Jugador automático con evaluación heurística y búsqueda en haz sobre el preview.
+
+    Para la pieza activa (y la que saldría del hold) enumera todas las posiciones alcanzables
+    con PlacementFinder y las evalúa en lote. Las `beam` mejores pasan a la jugada siguiente:
+    se prueban todas las caídas de la próxima pieza del preview sobre cada tablero resultante,
+    se vuelven a quedar las `beam` mejores y así hasta la profundidad pedida. Cada posición
+    inicial vale lo que su mejor continuación; cada jugada se evalúa en una sola pasada de
+    BoardEvaluator.
+    """
+    def __init__(self,
+                 weights: EvalWeights | None = None,
+                 pieces: "PieceShapeType | None" = None,
+                 wall_kicks: bool = True,
+                 lookahead: bool = True,
+                 beam: int = 10) -> None:
+        """
+        Args:
+            weights: Pesos de la evaluación (los de EvalWeights por defecto).
+            pieces: Formas de las piezas. Si no se indica se construyen desde PIECE_DEFINITIONS.
+            wall_kicks: Si las rotaciones aplican wall kicks (como el ruleset activo).
+            lookahead: Si es False solo se evalúa la jugada actual; si es True se mira una jugada más.
+            beam: Tableros que pasan de cada jugada a la siguiente.
+        """
+        self._data      = pieces if pieces is not None else build_piece_shapes()
+        self._finder    = PlacementFinder(self._data, wall_kicks=wall_kicks)
+        self.evaluator  = BoardEvaluator(weights)
+        self.lookahead  = lookahead
+        self.beam       = beam
+
+    @classmethod
+    def for_controller(cls, controller: "GameBoardController", weights: EvalWeights | None = None,
+                       lookahead: bool = True) -> "HeuristicBot":
+        """Crea un bot con las mismas piezas y wall kicks que el controlador."""
+        return cls(weights, controller.pieces, controller.mechanics.wall_kicks, lookahead)
+
+    def plan(self, controller: "GameBoardController", depth: int | None = None) -> BotPlan | None:
+        """
+        Elige la jugada para la pieza activa del controlador, desde su posición actual.
+
+        Args:
+            controller: Partida en curso.
+            depth: Jugadas a mirar (ver choose).
+
+        Returns:
+            BotPlan | None: La jugada, o None si no hay pieza activa.
+        """
+        piece = controller.piece
+        if piece is None or piece.is_locked():
+            return None
+        hold = controller.hold_piece
+        return self.choose(controller.board, piece.name, hold.name if hold else None,
+                           controller.preview, controller.can_hold,
+                           start=(piece.row, piece.col, piece.rot), depth=depth)
+
+    def choose(self, board: "Board", current: str, hold: str | None, preview: list[str],
+               can_hold: bool = False, start: tuple[int, int, int] | None = None,
+               depth: int | None = None) -> BotPlan | None:
+        """
+        Elige la mejor jugada.
+
+        Args:
+            board: Tablero actual.
+            current: Pieza activa.
+            hold: Pieza en el hold, o None si está vacío.
+            preview: Próximas piezas.
+            can_hold: Si el hold está disponible para esta pieza.
+            start: Posición (row, col, rot) de la pieza activa; None para la de spawn.
+            depth: Jugadas a mirar contando la actual (2 con lookahead y 1 sin él por defecto).
+                Queda limitada por las piezas conocidas.
+
+        Returns:
+            BotPlan | None: La mejor jugada, o None si la pieza no tiene posiciones alcanzables.
+        """
+        if depth is None:
+            depth = 2 if self.lookahead else 1
+        options: list[tuple[bool, str, list[str], tuple[int, int, int] | None]] = [
+            (False, current, list(preview), start)
+        ]
+        if can_hold:
+            if hold is not None:
+                options.append((True, hold, list(preview), None))
+            elif preview:
+                options.append((True, preview[0], list(preview[1:]), None))
+
+        best: BotPlan | None = None
+        for use_hold, name, following, position in options:
+            placements = self._find(board, name, position)
+            if not placements:
+                continue
+            scores = self._score(board, name, placements, following[:depth - 1])
+            index = int(np.argmax(scores))
+            if best is None or scores[index] > best.score:
+                best = BotPlan(placements[index], use_hold, float(scores[index]))
+        return best
+
+    def play(self, controller: "GameBoardController", max_pieces: int | None = None) -> int:
+        """
+        Juega sin render hasta el game over o hasta colocar `max_pieces` piezas.
+
+        El controlador debe eliminar las líneas al instante (animate_clears=False).
+
+        Returns:
+            int: Cantidad de piezas colocadas.
+        """
+        placed = 0
+        if controller.piece is None:
+            controller.start()
+        while not controller.is_game_over() and (max_pieces is None or placed < max_pieces):
+            plan = self.plan(controller)
+            if plan is None:
+                controller.update(0.0)
+                continue
+            for action in plan.actions:
+                controller.perform(action)
+            placed += 1
+            controller.update(0.0)
+        return placed
+
+    # --- HELPERS ---
+    def _find(self, board: "Board", name: str, position: tuple[int, int, int] | None) -> list[Placement]:
+        if position is None:
+            return self._finder.find(board, name)
+        row, col, rot = position
+        return self._finder.find(board, name, row, col, rot)
+
+    def _score(self, board: "Board", name: str, placements: list[Placement], following: list[str]) -> np.ndarray:
+        """Valor de cada posición: su evaluación o la de su mejor continuación con las piezas `following`."""
+        shape = self._data[name]
+        count = len(placements)
+
+        rows = np.array([[p.row + dr for dr, _ in shape["offsets"][p.rot]] for p in placements])
+        cols = np.array([[p.col + dc for _, dc in shape["offsets"][p.rot]] for p in placements])
+        boards = np.repeat((board.matrix != 0)[None], count, axis=0)
+        # Las celdas sobre el tablero se descartan, como en Board.lock_piece
+        inside = rows >= 0
+        owners = np.broadcast_to(np.arange(count)[:, None], rows.shape)
+        boards[owners[inside], rows[inside], cols[inside]] = True
+        boards, lines = clear_full_rows(boards)
+
+        scores = self.evaluator.evaluate(boards, lines)
+        if not following:
+            return scores
+
+        # Solo las mejores posiciones pasan a la jugada siguiente; el resto queda descartado
+        kept  = np.argsort(scores)[::-1][:self.beam]
+        final = np.full(count, -np.inf)
+        final[kept] = scores[kept]
+        boards, lines, roots = boards[kept], lines[kept], kept
+        for piece in following:
+            results, next_lines, valid, _ = drop_all(boards, self._data[piece])
+            n, k, height, width = results.shape
+            total = (lines[:, None] + next_lines).reshape(n * k)
+            ahead = self.evaluator.evaluate(results.reshape(n * k, height, width), total)
+            ahead[~valid.reshape(n * k)] = -np.inf
+
+            kept = np.argsort(ahead)[::-1][:self.beam]
+            kept = kept[np.isfinite(ahead[kept])]
+            if not len(kept):
+                # Si la pieza no cabe en ningún lado queda la evaluación de la jugada anterior, penalizada
+                final[np.isfinite(final)] -= 1e6
+                break
+
+            # Cada posición inicial vale lo que su mejor continuación dentro del haz
+            final = np.full(count, -np.inf)
+            np.maximum.at(final, roots[kept // k], ahead[kept])
+            boards = results.reshape(n * k, height, width)[kept]
+            lines, roots = total[kept], roots[kept // k]
+        return final
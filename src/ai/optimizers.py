@@ -0,0 +1,234 @@
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import Any, Type
+
+
+class WeightOptimizer(ABC):
+    """
+    Optimizador de caja negra con interfaz ask/tell.
+
+    ask() propone una población de vectores de pesos, el entrenador los evalúa y tell() recibe
+    su fitness (mayor es mejor). Todo el estado, incluido el del generador aleatorio, se exporta
+    con get_state como datos JSON para poder retomar un entrenamiento.
+    """
+    def __init__(self, name: str, dimension: int, population: int, seed: int | None = None) -> None:
+        if dimension <= 0 or population < 2:
+            raise ValueError(f"{type(self).__name__}: dimensión ({dimension}) o población ({population}) inválida.")
+        self._name      = name
+        self.dimension  = dimension
+        self.population = population
+        self._rng       = np.random.default_rng(seed)
+        self.generation = 0
+
+    @property
+    def name(self) -> str:
+        """Nombre con el que se registra en OPTIMIZER_MAP."""
+        return self._name
+
+    @abstractmethod
+    def ask(self) -> np.ndarray:
+        """Devuelve la población a evaluar, (population, dimension)."""
+
+    @abstractmethod
+    def tell(self, candidates: np.ndarray, fitness: np.ndarray) -> None:
+        """Actualiza el optimizador con el fitness de los candidatos de ask()."""
+
+    @abstractmethod
+    def best(self) -> np.ndarray:
+        """Mejor estimación actual de los pesos."""
+
+    def get_state(self) -> dict[str, Any]:
+        return {"generation": self.generation, "rng": self._rng.bit_generator.state}
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        self.generation = state["generation"]
+        self._rng.bit_generator.state = state["rng"]
+
+
+class GeneticOptimizer(WeightOptimizer):
+    """
+    Algoritmo genético con torneo, cruce por promedio ponderado según fitness y mutación gaussiana.
+
+    La evaluación es invariante a la escala de los pesos, así que los vectores se normalizan
+    a norma 1 y el algoritmo solo busca direcciones.
+    """
+    def __init__(self, name: str, dimension: int, population: int, seed: int | None = None,
+                 initial: np.ndarray | None = None, elite: int = 2, tournament: int = 4,
+                 mutation: float = 0.2) -> None:
+        """
+        Args:
+            name: Nombre del optimizador.
+            dimension: Cantidad de pesos.
+            population: Individuos por generación.
+            seed: Semilla del generador aleatorio.
+            initial: Pesos alrededor de los que se arma la primera población (aleatoria si no se indica).
+            elite: Mejores individuos que pasan sin cambios a la siguiente generación.
+            tournament: Participantes de cada torneo de selección.
+            mutation: Desvío de la mutación gaussiana.
+        """
+        super().__init__(name, dimension, population, seed)
+        self.elite      = min(elite, population - 1)
+        self.tournament = tournament
+        self.mutation   = mutation
+
+        if initial is None:
+            members = self._rng.uniform(-1.0, 1.0, (population, dimension))
+        else:
+            members = np.asarray(initial, dtype=np.float64) + self._rng.normal(0.0, mutation, (population, dimension))
+            members[0] = initial
+        self._members = self._normalize(members)
+        self._fitness: np.ndarray | None = None
+
+    def ask(self) -> np.ndarray:
+        return self._members.copy()
+
+    def tell(self, candidates: np.ndarray, fitness: np.ndarray) -> None:
+        order = np.argsort(fitness)[::-1]
+        candidates, fitness = candidates[order], np.asarray(fitness, dtype=np.float64)[order]
+
+        children = [candidates[i] for i in range(self.elite)]
+        while len(children) < self.population:
+            a, b = self._select(fitness), self._select(fitness)
+            fa, fb = fitness[a], fitness[b]
+            share = 0.5 if fa + fb <= 0 else fa / (fa + fb)
+            child = share * candidates[a] + (1 - share) * candidates[b]
+            child = child + self._rng.normal(0.0, self.mutation, self.dimension)
+            children.append(child)
+
+        self._members = self._normalize(np.array(children))
+        self._fitness = fitness
+        self._best    = candidates[0].copy()
+        self.generation += 1
+
+    def best(self) -> np.ndarray:
+        return self._best if self._fitness is not None else self._members[0]
+
+    def get_state(self) -> dict[str, Any]:
+        state = super().get_state()
+        state["members"] = self._members.tolist()
+        if self._fitness is not None:
+            state["best"] = self._best.tolist()
+            state["fitness"] = self._fitness.tolist()
+        return state
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        super().set_state(state)
+        self._members = np.array(state["members"], dtype=np.float64)
+        if "fitness" in state:
+            self._best    = np.array(state["best"], dtype=np.float64)
+            self._fitness = np.array(state["fitness"], dtype=np.float64)
+
+    # --- HELPERS ---
+    def _select(self, fitness: np.ndarray) -> int:
+        """Torneo: el mejor de `tournament` individuos al azar (la población viene ordenada)."""
+        return int(self._rng.choice(len(fitness), size=min(self.tournament, len(fitness)), replace=False).min())
+
+    @staticmethod
+    def _normalize(members: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(members, axis=1, keepdims=True)
+        return members / np.where(norms > 0, norms, 1.0)
+
+
+class CMAESOptimizer(WeightOptimizer):
+    """
+    CMA-ES (mu/mu_w, lambda) con adaptación de paso acumulativa y actualizaciones rank-one y rank-mu,
+    con las constantes por defecto de Hansen (The CMA Evolution Strategy: A Tutorial).
+    """
+    def __init__(self, name: str, dimension: int, population: int, seed: int | None = None,
+                 initial: np.ndarray | None = None, sigma: float = 0.3) -> None:
+        """
+        Args:
+            name: Nombre del optimizador.
+            dimension: Cantidad de pesos.
+            population: Candidatos por generación (lambda).
+            seed: Semilla del generador aleatorio.
+            initial: Media inicial (ceros si no se indica).
+            sigma: Paso inicial.
+        """
+        super().__init__(name, dimension, population, seed)
+        n, lam = dimension, population
+        mu = lam // 2
+        raw = np.log(mu + 0.5) - np.log(np.arange(1, mu + 1))
+        self._weights = raw / raw.sum()
+        self._mu_eff  = 1.0 / np.sum(self._weights ** 2)
+
+        self._cc    = (4 + self._mu_eff / n) / (n + 4 + 2 * self._mu_eff / n)
+        self._cs    = (self._mu_eff + 2) / (n + self._mu_eff + 5)
+        self._c1    = 2 / ((n + 1.3) ** 2 + self._mu_eff)
+        self._cmu   = min(1 - self._c1, 2 * (self._mu_eff - 2 + 1 / self._mu_eff) / ((n + 2) ** 2 + self._mu_eff))
+        self._damps = 1 + 2 * max(0.0, np.sqrt((self._mu_eff - 1) / (n + 1)) - 1) + self._cs
+        self._chi_n = np.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n ** 2))
+
+        self.mean  = np.zeros(n) if initial is None else np.asarray(initial, dtype=np.float64).copy()
+        self.sigma = sigma
+        self._cov  = np.eye(n)
+        self._pc   = np.zeros(n)
+        self._ps   = np.zeros(n)
+
+    def ask(self) -> np.ndarray:
+        values, vectors = np.linalg.eigh(self._cov)
+        scale = vectors * np.sqrt(np.maximum(values, 1e-20))
+        z = self._rng.standard_normal((self.population, self.dimension))
+        return self.mean + self.sigma * z @ scale.T
+
+    def tell(self, candidates: np.ndarray, fitness: np.ndarray) -> None:
+        n = self.dimension
+        mu = len(self._weights)
+        order = np.argsort(fitness)[::-1][:mu]
+        steps = (candidates[order] - self.mean) / self.sigma
+
+        old_mean = self.mean
+        self.mean = old_mean + self.sigma * self._weights @ steps
+        delta = (self.mean - old_mean) / self.sigma
+
+        values, vectors = np.linalg.eigh(self._cov)
+        inv_sqrt = vectors @ np.diag(1 / np.sqrt(np.maximum(values, 1e-20))) @ vectors.T
+        self._ps = (1 - self._cs) * self._ps + np.sqrt(self._cs * (2 - self._cs) * self._mu_eff) * inv_sqrt @ delta
+
+        self.generation += 1
+        norm_ps = np.linalg.norm(self._ps)
+        h_sigma = norm_ps / np.sqrt(1 - (1 - self._cs) ** (2 * self.generation)) / self._chi_n < 1.4 + 2 / (n + 1)
+        self._pc = (1 - self._cc) * self._pc + h_sigma * np.sqrt(self._cc * (2 - self._cc) * self._mu_eff) * delta
+
+        rank_mu = (steps.T * self._weights) @ steps
+        correction = (1 - h_sigma) * self._cc * (2 - self._cc)
+        self._cov = ((1 - self._c1 - self._cmu) * self._cov
+                     + self._c1 * (np.outer(self._pc, self._pc) + correction * self._cov)
+                     + self._cmu * rank_mu)
+        self.sigma *= np.exp((self._cs / self._damps) * (norm_ps / self._chi_n - 1))
+
+    def best(self) -> np.ndarray:
+        return self.mean.copy()
+
+    def get_state(self) -> dict[str, Any]:
+        state = super().get_state()
+        state.update(mean=self.mean.tolist(), sigma=self.sigma, cov=self._cov.tolist(),
+                     pc=self._pc.tolist(), ps=self._ps.tolist())
+        return state
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        super().set_state(state)
+        self.mean  = np.array(state["mean"], dtype=np.float64)
+        self.sigma = float(state["sigma"])
+        self._cov  = np.array(state["cov"], dtype=np.float64)
+        self._pc   = np.array(state["pc"], dtype=np.float64)
+        self._ps   = np.array(state["ps"], dtype=np.float64)
+
+
+OPTIMIZER_MAP: dict[str, Type[WeightOptimizer]] = {
+    "ga": GeneticOptimizer,
+    "cmaes": CMAESOptimizer,
+}
+
+
+def create_optimizer(name: str, dimension: int, population: int, seed: int | None = None,
+                     **kwargs: Any) -> WeightOptimizer:
+    """
+    Crea el optimizador registrado con `name` en OPTIMIZER_MAP.
+
+    Raises:
+        ValueError: Si el optimizador no existe.
+    """
+    if name not in OPTIMIZER_MAP:
+        raise ValueError(f"create_optimizer: optimizador '{name}' no reconocido ({', '.join(OPTIMIZER_MAP)}).")
+    return OPTIMIZER_MAP[name](name, dimension, population, seed, **kwargs)
@@ -0,0 +1,885 @@
+import time
+import random
+import numpy as np
+from itertools import combinations
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from src.core.action import Action
+from src.core.board import Board
+from src.core.piece import Piece
+from src.core.piece_shapes import build_piece_shapes
+from src.core.placement_finder import Placement, PlacementFinder
+from src.core.zobrist import cell_key_rows, zobrist_key
+from src.constants import WALL_KICKS
+from src.ai.transposition import TranspositionTable
+
+if TYPE_CHECKING:
+    from src.core.gameboard_controller import GameBoardController
+    from src.core.types import PieceShapeType
+
+
+# Cuánto puede desbalancear cada pieza las celdas de columnas pares e impares
+# (I vertical cubre 4 de una paridad; T, L y J, 3 y 1; O, S y Z siempre 2 y 2)
+_PARITY_CAPACITY = {"I": 4, "T": 2, "L": 2, "J": 2}
+# Prefijo de las claves de piezas restantes, distinto de los tipos de zobrist
+_COUNT_TAG = 0x5043
+
+# Resultados de una búsqueda (PCResult.status):
+#   "solved":     hay solución (PCResult.solution).
+#   "impossible": la búsqueda se agotó: no hay perfect clear con las piezas conocidas, con
+#                 ningún orden ni movimiento (caídas, tucks y rotaciones con kick).
+#   "unknown":    se terminó el tiempo (budget) antes de decidir.
+PC_STATUSES = ("solved", "impossible", "unknown")
+
+# Nodos de la primera pasada de la búsqueda; las siguientes siguen la secuencia de Luby (1, 1, 2, 1, 1, 2, 4, ...)
+_RESTART_NODES = 30
+# Filas de ruido con que se desordenan las posiciones de prioridad parecida en cada reinicio
+_RESTART_NOISE = 4.0
+# Filas de prioridad que vale cada lado apoyado de la pieza y cada columna hacia la derecha
+_CONTACT_WEIGHT = 0.25
+_COLUMN_WEIGHT  = 0.6
+# Campos cuyas posiciones con spin se recuerdan (ver _spins); al llenarse se vacía
+_SPIN_CACHE_SIZE = 1 << 15
+# Filas libres sobre el campo que modela el BFS de _spins (los kicks suben hasta 2)
+_SKY_ROWS = 6
+
+
+def _luby(i: int) -> int:
+    """Término i (desde 1) de la secuencia de Luby: 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ..."""
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    while (1 << k) - 1 != i:
+        i -= (1 << (k - 1)) - 1
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+    return 1 << (k - 1)
+
+
+class _Timeout(Exception):
+    """Se terminó el tiempo de la búsqueda."""
+
+
+class _Restart(Exception):
+    """La pasada actual agotó sus nodos; se reinicia con otro orden."""
+
+
+@dataclass
+class PCStep:
+    """
+    Una pieza de la secuencia de perfect clear.
+
+    Attributes:
+        placement: Posición final de la pieza, con su secuencia de inputs.
+        use_hold:  Si antes de colocarla hay que usar HOLD.
+    """
+    placement: Placement
+    use_hold:  bool
+
+    @property
+    def actions(self) -> list[Action]:
+        return ([Action.HOLD] if self.use_hold else []) + list(self.placement.actions)
+
+
+@dataclass
+class PCSolution:
+    """
+    Secuencia que deja el tablero vacío.
+
+    Attributes:
+        steps:  Piezas en orden de colocación.
+        height: Filas que se limpian.
+    """
+    steps:  list[PCStep]
+    height: int
+
+    @property
+    def actions(self) -> list[Action]:
+        """Todos los inputs de la secuencia, pieza por pieza."""
+        return [action for step in self.steps for action in step.actions]
+
+
+@dataclass
+class PCResult:
+    """
+    Resultado de PerfectClearSolver.solve.
+
+    Attributes:
+        status:   Uno de PC_STATUSES.
+        solution: La secuencia si status es "solved"; si no, None.
+    """
+    status:   str
+    solution: PCSolution | None = None
+
+    @property
+    def solved(self) -> bool:
+        return self.solution is not None
+
+
+@dataclass
+class PCStats:
+    """
+    Instrumentación de la última búsqueda de PerfectClearSolver.
+
+    Attributes:
+        nodes:     Estados de la cola expandidos.
+        pruned:    Posiciones descartadas porque el campo restante no se puede cubrir.
+        subboards: Sub-tableros expandidos al buscar cubrimientos (los demás salen de la tabla).
+        restarts:  Pasadas de la búsqueda que se cortaron por nodos y se reiniciaron.
+        seconds:   Duración total.
+        timed_out: Si la búsqueda se abandonó por tiempo.
+    """
+    nodes:     int   = 0
+    pruned:    int   = 0
+    subboards: int   = 0
+    restarts:  int   = 0
+    seconds:   float = 0.0
+    timed_out: bool  = False
+
+
+@dataclass(frozen=True)
+class _Shape:
+    """Posición (rot, col) de una pieza, con su máscara apoyada en la fila 0 del campo."""
+    rot:    int
+    col:    int
+    mask:   int
+    height: int
+    bottom: int
+    cells:  tuple[tuple[int, int], ...] = field(compare=False)
+
+
+class PerfectClearSolver:
+    """
+    Busca secuencias de piezas que dejen el tablero completamente vacío (perfect clear).
+
+    El campo son las `height` filas inferiores del tablero, guardado como un entero: el bit
+    (y * cols + x) es la celda de la columna x en la fila y contando desde abajo. Colisiones,
+    apoyo y filas completas se resuelven con AND y desplazamientos sobre ese entero.
+
+    La búsqueda sigue el orden real de la cola: en cada paso coloca la pieza activa (o la del
+    hold) en cada posición alcanzable. Primero prueba las caídas desde arriba y los tucks (bajar,
+    deslizar bajo un saliente y volver a bajar), que salen de desplazar máscaras; solo si
+    ninguna sirve prueba las que además necesitan rotar (spins, con o sin kick), con el mismo
+    BFS que PlacementFinder y recordadas por campo. Así se exploran todas las posiciones alcanzables
+    y agotar la búsqueda prueba que no hay solución ("impossible"). Con lock instantáneo no hay
+    tucks ni spins: solo caídas.
+
+    La búsqueda hace pasadas con un límite de nodos creciente (secuencia de Luby) y, en cada
+    reinicio, desordena un poco las posiciones de prioridad parecida. Los estados ya agotados se
+    conservan entre pasadas, así que ningún reinicio repite trabajo probado, y las colas con
+    pocas soluciones no quedan atadas a las primeras decisiones del orden. Con `budget` la
+    búsqueda se corta al vencer el tiempo y devuelve "unknown", como ExpectimaxBot.
+
+    Cada posición se poda si el campo restante no se puede cubrir con las piezas que quedan,
+    sin importar el orden. El cubrimiento se busca llenando siempre la celda vacía de la columna
+    más a la izquierda (y más baja), así cada cubrimiento aparece una sola vez; un sub-tablero se descarta
+    sin expandirlo si alguna zona de celdas vacías no es múltiplo de 4, o si el desbalance entre
+    columnas pares e impares supera lo que pueden corregir las piezas restantes. El resultado
+    de cada sub-tablero se guarda en una TranspositionTable con hash de Zobrist del campo y de
+    las piezas restantes, y se reutiliza entre búsquedas.
+
+    Las filas completas no se eliminan del campo sino que quedan llenas: así el campo conserva
+    sus coordenadas y una pieza colocada después de eliminar una fila queda partida en dos.
+    """
+    def __init__(self,
+                 pieces: "PieceShapeType | None" = None,
+                 wall_kicks: bool = True,
+                 max_height: int = 4,
+                 table: TranspositionTable | None = None,
+                 budget: float | None = None) -> None:
+        """
+        Args:
+            pieces: Formas de las piezas. Si no se indica se construyen desde PIECE_DEFINITIONS.
+            wall_kicks: Si las rotaciones aplican wall kicks (como el ruleset activo).
+            max_height: Filas máximas que se intenta limpiar.
+            table: Tabla de resultados de cubrimiento (una de 2^18 entradas por defecto).
+            budget: Segundos por búsqueda; None = sin límite.
+
+        Raises:
+            ValueError: Si budget no es positivo.
+        """
+        if budget is not None and budget <= 0:
+            raise ValueError(f"PerfectClearSolver: budget inválido ({budget}).")
+        self._data      = pieces if pieces is not None else build_piece_shapes()
+        self._finder    = PlacementFinder(self._data, wall_kicks=wall_kicks)
+        self._wall_kicks = wall_kicks
+        self._names     = sorted(self._data)
+        self._index     = {name: i for i, name in enumerate(self._names)}
+        self._i_piece   = self._index.get("I")
+        self.max_height = max_height
+        self.budget     = budget
+        self.table      = table if table is not None else TranspositionTable(1 << 18, "depth")
+        self.stats      = PCStats()
+        self._shapes: dict[tuple[str, int], list[_Shape]] = {}
+        self._anchors: dict[tuple[str, int, int], list[list[tuple[int, int]]]] = {}
+        self._transpose: dict[tuple[int, int], list[int]] = {}
+        self._parity: dict[tuple[int, int], int] = {}
+        self._spin_cache: dict[tuple, list[tuple[_Shape, int]]] = {}
+        self._spin_tables: dict[tuple[str, int], tuple] = {}
+        # Índices de las piezas que pueden desbalancear la paridad, de mayor a menor capacidad
+        self._by_capacity = sorted(((i, _PARITY_CAPACITY[name]) for i, name in enumerate(self._names)
+                                    if name in _PARITY_CAPACITY), key=lambda item: -item[1])
+
+    def solve(self, board: Board, current: str, hold: str | None, queue: list[str],
+              max_pieces: int = 10, can_hold: bool = True, hold_enabled: bool = True,
+              start: tuple[int, int, int] | None = None, tucks: bool = True,
+              budget: float | None = None) -> PCResult:
+        """
+        Busca el perfect clear de menor altura.
+
+        Args:
+            board: Tablero actual (se usa su ocupación; no se modifica).
+            current: Pieza activa.
+            hold: Pieza en el hold, o None si está vacío.
+            queue: Próximas piezas (por ejemplo PieceBag.peek_next).
+            max_pieces: Piezas que se pueden colocar como máximo.
+            can_hold: Si el hold está disponible para la pieza activa.
+            hold_enabled: Si el ruleset tiene hold.
+            start: Posición (row, col, rot) de la pieza activa; None para la de spawn.
+            tucks: Si se puede deslizar la pieza después de que toca el fondo (False con lock
+                instantáneo).
+            budget: Segundos para esta búsqueda; None usa el del solver.
+
+        Returns:
+            PCResult: "solved" con la secuencia; "impossible" si en ninguna altura hasta
+            `max_height` hay perfect clear con hasta `max_pieces` piezas conocidas; "unknown" si
+            venció el tiempo.
+        """
+        started = time.perf_counter()
+        budget = self.budget if budget is None else budget
+        self._deadline = started + budget if budget is not None else float("inf")
+        self.stats = PCStats()
+        self.table.new_search()
+        rows, cols = board.rows, board.cols
+        self._cols = cols
+        self._row_mask = (1 << cols) - 1
+        self._left_edge = sum(1 << (y * cols) for y in range(self.max_height))
+        self._right_edge = self._left_edge << (cols - 1)
+        key_rows = cell_key_rows(rows, cols)
+        self._keys = [key_rows[rows - 1 - y][x] for y in range(self.max_height) for x in range(cols)]
+        self._count_keys = [[zobrist_key(_COUNT_TAG, i, n) for n in range(max_pieces + 2)]
+                            for i in range(len(self._names))]
+        self._height_keys = [zobrist_key(_COUNT_TAG, -1, h) for h in range(self.max_height + 1)]
+        self._max_pieces = max_pieces
+        self._tucks = tucks
+        self._rows = rows
+        self._start = start
+        self._work = Board(rows, cols, animated=False)
+        sequence = [current, *queue]
+        stack = max(board.column_heights, default=0)
+
+        result = PCResult("impossible")
+        try:
+            for height in range(max(stack, 1), self.max_height + 1):
+                bits = 0
+                for y in range(height):
+                    for x in range(cols):
+                        if board.matrix[rows - 1 - y, x]:
+                            bits |= 1 << (y * cols + x)
+                field_key = self._mask_hash(bits)
+                if not self._tileable(bits, field_key, height, sequence, 0, hold, hold_enabled, max_pieces):
+                    continue
+                path = self._restarts(bits, field_key, height, sequence, hold, can_hold and hold_enabled, hold_enabled)
+                if path is not None:
+                    result = PCResult("solved", self._to_solution(board, height, path, start))
+                    break
+        except _Timeout:
+            self.stats.timed_out = True
+            result = PCResult("unknown")
+
+        self.stats.seconds = time.perf_counter() - started
+        return result
+
+    def solve_controller(self, controller: "GameBoardController", max_pieces: int = 10,
+                         budget: float | None = None) -> PCResult:
+        """Busca el perfect clear desde el estado del controlador, mirando `max_pieces` piezas de la bolsa."""
+        piece = controller.piece
+        if piece is None or piece.is_locked():
+            return PCResult("unknown")
+        hold = controller.hold_piece
+        return self.solve(controller.board, piece.name, hold.name if hold else None,
+                          controller.upcoming(max_pieces), max_pieces, controller.can_hold,
+                          controller.hold_enabled, start=(piece.row, piece.col, piece.rot),
+                          tucks=controller.mechanics.lock_delay > 0, budget=budget)
+
+    # --- HELPERS ---
+    def _restarts(self, bits: int, field_key: int, height: int, sequence: list[str], hold: str | None,
+                  allowed: bool, hold_enabled: bool) -> list[tuple[str, _Shape, int, bool]] | None:
+        """
+        Pasadas de _search con límite de nodos según la secuencia de Luby hasta que una termina.
+
+        Los estados agotados (`_dead`) se comparten entre pasadas: solo se marcan al explorarlos
+        completos, así que un corte por nodos no deja nada mal probado.
+
+        Returns:
+            list | None: La secuencia encontrada, o None si la búsqueda se agotó sin solución.
+        """
+        self._dead: set[tuple[int, int, str | None, bool]] = set()
+        attempt = 0
+        while True:
+            attempt += 1
+            self._node_limit = self.stats.nodes + _RESTART_NODES * _luby(attempt)
+            self._noise = random.Random(attempt) if attempt > 1 else None
+            path: list[tuple[str, _Shape, int, bool]] = []
+            try:
+                found = self._search(bits, field_key, height, sequence, 0, hold, allowed, hold_enabled, path)
+            except _Restart:
+                self.stats.restarts += 1
+                continue
+            return path if found else None
+
+    def _search(self, bits: int, field_key: int, height: int, sequence: list[str], index: int,
+                hold: str | None, allowed: bool, hold_enabled: bool,
+                path: list[tuple[str, _Shape, int, bool]]) -> bool:
+        """
+        Profundidad sobre el orden real de la cola: coloca la próxima pieza (o la del hold) en
+        cada posición alcanzable y sigue mientras el campo restante se pueda cubrir.
+
+        El campo se guarda en coordenadas originales: las filas completas quedan llenas en vez
+        de eliminarse, y las posiciones alcanzables se calculan sobre el campo sin ellas.
+
+        Raises:
+            _Timeout: Si venció el tiempo de la búsqueda.
+            _Restart: Si la pasada agotó sus nodos.
+        """
+        cols, row_mask = self._cols, self._row_mask
+        kept = [y for y in range(height) if (bits >> (y * cols)) & row_mask != row_mask]
+        if not kept:
+            return True
+        # Con el hold vacío y disponible, guardar la pieza activa deja las mismas opciones
+        # (y las mismas piezas) que tenerla ya en el hold: ambos estados comparten la entrada
+        if hold is None and allowed and index < len(sequence):
+            state = (bits, index + 1, sequence[index], allowed)
+        else:
+            state = (bits, index, hold, allowed)
+        if state in self._dead:
+            return False
+        if time.perf_counter() > self._deadline:
+            raise _Timeout
+        if self.stats.nodes >= self._node_limit:
+            raise _Restart
+        self.stats.nodes += 1
+
+        actual = 0
+        for new_y, y in enumerate(kept):
+            actual |= ((bits >> (y * cols)) & row_mask) << (new_y * cols)
+
+        # (pieza que se coloca, si usa hold, hold que queda, índice de la próxima pieza)
+        options = [(sequence[index], False, hold, index + 1)] if index < len(sequence) else []
+        if allowed:
+            if hold is None:
+                if index + 1 < len(sequence):
+                    options.append((sequence[index + 1], True, sequence[index], index + 2))
+            elif index < len(sequence) and hold != sequence[index]:
+                options.append((hold, True, sequence[index], index + 1))
+
+        # Primero las caídas y los tucks; las posiciones que solo se alcanzan con spins se
+        # prueban si ninguna de aquellas sirve, así un estado agotado las probó todas
+        for spins in ((False, True) if self._tucks else (False,)):
+            for name, shape, y, use_hold, next_hold, next_index in self._children(actual, len(kept), index,
+                                                                                  options, spins):
+                compact = shape.mask << (y * cols)
+                placed = 0
+                for new_y, row in enumerate(kept):
+                    placed |= ((compact >> (new_y * cols)) & row_mask) << (row * cols)
+                child, child_key = bits | placed, field_key ^ self._mask_hash(placed)
+                if not self._tileable(child, child_key, height, sequence, next_index, next_hold, hold_enabled,
+                                      self._max_pieces - len(path) - 1):
+                    self.stats.pruned += 1
+                    continue
+                path.append((name, shape, y, use_hold))
+                if self._search(child, child_key, height, sequence, next_index, next_hold, hold_enabled,
+                                hold_enabled, path):
+                    return True
+                path.pop()
+
+        self._dead.add(state)
+        return False
+
+    def _children(self, actual: int, height: int, index: int, options: list[tuple[str, bool, str | None, int]],
+                  spins: bool) -> list[tuple[str, _Shape, int, bool, str | None, int]]:
+        """
+        Posiciones de cada opción de pieza sobre el campo compactado, en el orden en que se prueban.
+
+        Primero las que no tapan celdas vacías; entre ellas las más bajas, las que más se apoyan
+        contra bloques y paredes y las de más a la izquierda, como llena _cover. En los
+        reinicios el ruido desordena las de prioridad parecida.
+
+        Args:
+            spins: False para las caídas y tucks; True para las que solo se alcanzan rotando.
+        """
+        cols, noise = self._cols, self._noise
+        children = []
+        for name, use_hold, next_hold, next_index in options:
+            if spins:
+                # La pieza activa arranca donde está; las demás, en el spawn
+                start = self._start if index == 0 and not use_hold else None
+                placements = self._spins(actual, height, name, start)
+            else:
+                placements = self._placements(actual, height, name)
+            for shape, y in placements:
+                compact = shape.mask << (y * cols)
+                covered = ((compact >> cols) & ~(actual | compact)).bit_count()
+                contact = self._contact(actual, compact)
+                priority = (y + shape.height - _CONTACT_WEIGHT * contact + _COLUMN_WEIGHT * shape.col
+                            + (noise.random() * _RESTART_NOISE if noise else 0.0))
+                children.append((covered, priority, name, shape, y, use_hold, next_hold, next_index))
+        children.sort(key=lambda child: child[:2])
+        return [child[2:] for child in children]
+
+    def _contact(self, field: int, mask: int) -> int:
+        """Lados de las celdas de la máscara apoyados en bloques del campo, en el piso o en las paredes."""
+        cols, left, right = self._cols, self._left_edge, self._right_edge
+        return (((mask >> cols) & field).bit_count() + (mask & self._row_mask).bit_count()
+                + (((mask & ~left) >> 1) & field).bit_count() + (mask & left).bit_count()
+                + (((mask & ~right) << 1) & field).bit_count() + (mask & right).bit_count())
+
+    def _tileable(self, bits: int, field_key: int, height: int, sequence: list[str], index: int,
+                  hold: str | None, hold_enabled: bool, budget: int) -> bool:
+        """
+        Si las celdas vacías se pueden cubrir con las piezas que quedan, sin mirar el orden.
+        `field_key` es el hash de Zobrist de `bits`.
+        """
+        empty = height * self._cols - bits.bit_count()
+        needed = empty // 4
+        if empty % 4 or needed > budget:
+            return False
+        # Con hold se puede dejar una pieza sin usar: la que quede en el hold al final
+        if not hold_enabled:
+            pool = sequence[index:index + needed]
+        elif hold is None:
+            pool = sequence[index:index + needed + 1]
+        else:
+            pool = [hold, *sequence[index:index + needed]]
+        if len(pool) < needed:
+            return False
+        remaining = [0] * len(self._names)
+        for name in pool:
+            remaining[self._index[name]] += 1
+        key = field_key ^ self._counts_hash(remaining) ^ self._height_keys[height]
+        entry = self.table.probe(key)
+        if entry is not None:
+            return entry.value > 0
+        columns = self._to_columns(bits, height)
+        if not self._feasible(columns, height, needed, remaining):
+            return False
+        return self._cover(columns, height, needed, remaining, key)
+
+    def _cover(self, columns: int, height: int, needed: int, remaining: list[int], key: int) -> bool:
+        """
+        Busca un cubrimiento del campo con las piezas restantes, cubriendo siempre la celda vacía
+        de la columna más a la izquierda (y más baja). El resultado de cada sub-tablero queda en
+        la tabla; los que no pasan _feasible se descartan antes de buscarlos en ella.
+
+        El campo va por columnas (bit x * height + y): llenando de izquierda a derecha, las celdas
+        ocupadas más allá de la columna objetivo se limitan a las 3 siguientes, así que muchos
+        caminos llegan al mismo sub-tablero y la tabla los resuelve.
+        """
+        if needed == 0:
+            return True
+        entry = self.table.probe(key)
+        if entry is not None:
+            return entry.value > 0
+        if time.perf_counter() > self._deadline:
+            raise _Timeout
+        free = ~columns & ((1 << (height * self._cols)) - 1)
+        target = (free & -free).bit_length() - 1
+        self.stats.subboards += 1
+
+        found = False
+        for i, name in enumerate(self._names):
+            if not remaining[i]:
+                continue
+            count_key = self._count_keys[i]
+            child_key = key ^ count_key[remaining[i]] ^ count_key[remaining[i] - 1]
+            remaining[i] -= 1
+            for mask, mask_key in self._anchor_table(name, height)[target]:
+                if columns & mask:
+                    continue
+                child = columns | mask
+                if (self._feasible(child, height, needed - 1, remaining)
+                        and self._cover(child, height, needed - 1, remaining, child_key ^ mask_key)):
+                    found = True
+                    break
+            remaining[i] += 1
+            if found:
+                break
+
+        self.table.store(key, 0, 1.0 if found else 0.0)
+        return found
+
+    def _feasible(self, columns: int, height: int, needed: int, remaining: list[int]) -> bool:
+        """
+        Poda por zonas de celdas vacías (múltiplos de 4), por pozos de una columna (solo los
+        cubre la I vertical) y por paridad de columnas.
+
+        Como una pieza partida puede tener celdas de una misma columna separadas por filas que
+        ya se eliminaron, dentro de una columna todas las celdas vacías cuentan como conectadas;
+        dos columnas vecinas se conectan si tienen celdas vacías en una misma fila.
+        """
+        cols, column_mask = self._cols, (1 << height) - 1
+        free = ~columns & ((1 << (height * cols)) - 1)
+        if not free:
+            return True
+        first = ((free & -free).bit_length() - 1) // height
+        # Filas vacías en una columna y en la siguiente: sin ninguna, la zona termina ahí
+        link = free & (free >> height)
+        before, start, wells = 0, first, 0
+        for x in range(first, cols):
+            if x == cols - 1 or not (link >> (x * height)) & column_mask:
+                zone = (free & ((1 << ((x + 1) * height)) - 1)).bit_count()
+                if (zone - before) % 4:
+                    return False
+                if x == start:
+                    wells += (zone - before) // 4
+                before, start = zone, x + 1
+        if wells and (self._i_piece is None or wells > remaining[self._i_piece]):
+            return False
+
+        balance = abs(2 * (free & self._even_columns(height)).bit_count() - free.bit_count())
+        left = needed
+        for i, value in self._by_capacity:
+            if balance <= 0:
+                break
+            take = remaining[i] if remaining[i] < left else left
+            balance -= value * take
+            left -= take
+        return balance <= 0
+
+    def _even_columns(self, height: int) -> int:
+        """Máscara de las columnas pares del campo por columnas de `height` filas."""
+        cols = self._cols
+        if (cols, height) not in self._parity:
+            column_mask = (1 << height) - 1
+            self._parity[cols, height] = sum(column_mask << (x * height) for x in range(0, cols, 2))
+        return self._parity[cols, height]
+
+    def _placements(self, bits: int, height: int, name: str) -> list[tuple[_Shape, int]]:
+        """
+        Posiciones finales de la pieza dentro del campo: caídas desde arriba y tucks.
+
+        Returns:
+            list[tuple[_Shape, int]]: (forma, fila y de la celda más baja).
+        """
+        cols = self._cols
+        shapes = self._shape_table(name)
+        landing: dict[tuple[int, int], int] = {}
+        found: dict[int, tuple[_Shape, int]] = {}
+
+        for shape in shapes:
+            # Cae desde encima del campo, donde no hay bloques
+            y = height
+            mask = shape.mask << (y * cols)
+            while y > 0 and not bits & (mask >> cols):
+                y -= 1
+                mask >>= cols
+            if y + shape.height > height:
+                continue  # sobresale del campo
+            landing[shape.rot, shape.col] = y
+            found.setdefault(mask, (shape, y))
+        if not self._tucks:
+            return list(found.values())
+
+        # Tucks: desde la fila de apoyo se desliza mientras la pieza quede tapada desde arriba
+        by_position = {(s.rot, s.col): s for s in shapes}
+        for (rot, col), y in landing.items():
+            for step in (-1, 1):
+                c = col + step
+                while (rot, c) in by_position:
+                    if (rot, c) in landing and landing[rot, c] <= y:
+                        break  # desde acá la posición ya se alcanza cayendo directo
+                    mask = by_position[rot, c].mask << (y * cols)
+                    if bits & mask:
+                        break
+                    drop = y
+                    while drop > 0 and not bits & (mask >> cols):
+                        drop -= 1
+                        mask >>= cols
+                    found.setdefault(mask, (by_position[rot, c], drop))
+                    c += step
+
+        return list(found.values())
+
+    def _spins(self, bits: int, height: int, name: str,
+               start: tuple[int, int, int] | None) -> list[tuple[_Shape, int]]:
+        """
+        Posiciones finales dentro del campo que no salen de _placements: las que necesitan rotar
+        (con kick o bajo un saliente). Se recuerdan por campo, así los reinicios y las búsquedas
+        siguientes no repiten el BFS.
+
+        El BFS es el de PlacementFinder (bajar, mover a los lados y rotar con el primer kick
+        válido) pero sobre el campo compactado y por columnas de estados: para cada (rotación,
+        columna) un entero con un bit por fila y de la celda más baja, así cada movimiento se
+        aplica a todas las filas con una operación. Las filas por encima del campo están libres
+        y, con la pieza entrando desde el spawn, todas alcanzables; si la pieza activa arranca
+        más abajo se usa PlacementFinder sobre el tablero real.
+
+        Returns:
+            list[tuple[_Shape, int]]: (forma, fila y de la celda más baja).
+        """
+        rows, cols = self._rows, self._cols
+        # Sin celdas vacías bajo un bloque, toda posición apoyada se alcanza cayendo derecho
+        above = 0
+        for k in range(1, height):
+            above |= bits >> (k * cols)
+        if not above & ~bits:
+            return []
+        key = (bits, height, name, start, rows, cols)
+        if key in self._spin_cache:
+            return self._spin_cache[key]
+
+        masks, bottoms, sizes, turns = self._spin_table(name)
+        top = height + _SKY_ROWS
+        if start is not None and rows - 1 - start[0] - bottoms[start[2]] < top + _SKY_ROWS:
+            found = self._spins_from(bits, height, name, start)
+        else:
+            found = self._spins_from_sky(bits, height, name, masks, sizes, turns, top)
+
+        if len(self._spin_cache) >= _SPIN_CACHE_SIZE:
+            self._spin_cache.clear()
+        self._spin_cache[key] = found
+        return found
+
+    def _spins_from_sky(self, bits: int, height: int, name: str, masks: list[dict[int, int]], sizes: list[int],
+                        turns: list[list[tuple[int, list[tuple[int, int]]]]], top: int) -> list[tuple[_Shape, int]]:
+        """
+        BFS de _spins con la pieza entrando desde arriba: parte de todas las filas entre
+        `height` y `top` (cielo) en cada rotación y columna.
+        """
+        cols = self._cols
+        field = (1 << height) - 1
+        # valid[rot][col]: filas y donde la pieza cabe; de `height` para arriba todas (entero negativo)
+        valid = []
+        for by_col in masks:
+            fits = {}
+            for col, mask in by_col.items():
+                free = ~field
+                for y in range(height):
+                    if not bits & (mask << (y * cols)):
+                        free |= 1 << y
+                fits[col] = free
+            valid.append(fits)
+
+        sky = ((1 << top) - 1) & ~field
+        reach = [dict.fromkeys(fits, sky) for fits in valid]
+        pending = [(rot, col) for rot, fits in enumerate(valid) for col in fits]
+        while pending:
+            rot, col = pending.pop()
+            fits = valid[rot]
+            free = fits[col]
+            states = reach[rot][col]
+            while True:
+                lower = states | ((states >> 1) & free)
+                if lower == states:
+                    break
+                states = lower
+            reach[rot][col] = states
+
+            for side in (col - 1, col + 1):
+                if side in fits:
+                    new = states & fits[side] & ~reach[rot][side]
+                    if new:
+                        reach[rot][side] |= new
+                        pending.append((rot, side))
+
+            # Cada fila rota con el primer kick que cabe: las que ya rotaron no prueban los siguientes
+            for new_rot, kicks in turns[rot]:
+                left = states
+                for dx, dy in kicks:
+                    target = valid[new_rot].get(col + dx)
+                    if target is None:
+                        continue
+                    hit = left & (target >> dy if dy >= 0 else target << -dy)
+                    if not hit:
+                        continue
+                    left &= ~hit
+                    moved = (hit << dy if dy >= 0 else hit >> -dy) & ((1 << top) - 1)
+                    new = moved & ~reach[new_rot][col + dx]
+                    if new:
+                        reach[new_rot][col + dx] |= new
+                        pending.append((new_rot, col + dx))
+                    if not left:
+                        break
+
+        known = {shape.mask << (y * cols) for shape, y in self._placements(bits, height, name)}
+        by_mask = {shape.mask: shape for shape in self._shape_table(name)}
+        found = []
+        for rot, fits in enumerate(valid):
+            if sizes[rot] > height:
+                continue
+            for col, free in fits.items():
+                mask = masks[rot][col]
+                # Apoyadas (no pueden bajar) y sin sobresalir del campo
+                resting = reach[rot][col] & ~(free << 1) & ((1 << (height - sizes[rot] + 1)) - 1)
+                while resting:
+                    y = (resting & -resting).bit_length() - 1
+                    resting &= resting - 1
+                    if mask << (y * cols) not in known:
+                        known.add(mask << (y * cols))
+                        found.append((by_mask[mask], y))
+        return found
+
+    def _spins_from(self, bits: int, height: int, name: str,
+                    start: tuple[int, int, int]) -> list[tuple[_Shape, int]]:
+        """
+        _spins para una pieza activa que arranca cerca del campo: PlacementFinder desde `start`
+        sobre un tablero con el campo compactado abajo, igual al que habrá en la partida.
+        """
+        rows, cols = self._rows, self._cols
+        cells = np.zeros((rows, cols), dtype=int)
+        for y in range(height):
+            for x in range(cols):
+                if bits >> (y * cols + x) & 1:
+                    cells[rows - 1 - y, x] = 1
+        self._work.set_matrix(cells)
+        placements = self._finder.find(self._work, name, *start)
+
+        known = {shape.mask << (y * cols) for shape, y in self._placements(bits, height, name)}
+        by_mask = {shape.mask: shape for shape in self._shape_table(name)}
+        offsets = self._data[name]["offsets"]
+        found = []
+        for placement in placements:
+            heights = [rows - 1 - placement.row - dr for dr, _ in offsets[placement.rot]]
+            y = min(heights)
+            if max(heights) >= height:
+                continue  # sobresale del campo
+            mask = sum(1 << ((h - y) * cols + placement.col + dc)
+                       for h, (_, dc) in zip(heights, offsets[placement.rot]))
+            if mask << (y * cols) not in known:
+                known.add(mask << (y * cols))
+                found.append((by_mask[mask], y))
+        return found
+
+    def _spin_table(self, name: str) -> tuple[list[dict[int, int]], list[int], list[int],
+                                              list[list[tuple[int, list[tuple[int, int]]]]]]:
+        """
+        Tablas de la pieza para _spins, por rotación: la máscara en la fila 0 del campo de cada
+        columna (sin descartar formas repetidas), la fila `bottom` y el alto de la forma y los giros como
+        (rotación nueva, kicks). Cada kick es (columnas, filas y hacia arriba), ya corregido por
+        la diferencia de `bottom` entre las dos rotaciones.
+        """
+        cols = self._cols
+        if (name, cols) not in self._spin_tables:
+            shape = self._data[name]
+            rotations = len(shape["offsets"])
+            masks, bottoms, sizes = [], [], []
+            for cells, (top, bottom, left, right) in zip(shape["offsets"], shape["bounds"]):
+                masks.append({col: sum(1 << ((bottom - dr) * cols + col + dc) for dr, dc in cells)
+                              for col in range(-left, cols - right)})
+                bottoms.append(bottom)
+                sizes.append(bottom - top + 1)
+
+            # Mismos giros que PlacementFinder (y que try_rotate); los kicks SRS tienen y hacia arriba
+            table = {} if name == "O" else WALL_KICKS["I"] if name == "I" else WALL_KICKS["OTHERS"]
+            turns = []
+            for rot in range(rotations):
+                options = []
+                for direction in ((1, -1) if name != "O" else ()):
+                    new_rot = (rot + direction) % rotations
+                    kicks = table.get((rot % 4, new_rot % 4), [(0, 0)]) if self._wall_kicks else [(0, 0)]
+                    options.append((new_rot, [(dx, dy + bottoms[rot] - bottoms[new_rot]) for dx, dy in kicks]))
+                turns.append(options)
+            self._spin_tables[name, cols] = (masks, bottoms, sizes, turns)
+        return self._spin_tables[name, cols]
+
+    def _mask_hash(self, mask: int) -> int:
+        """Hash de Zobrist de las celdas de la máscara (el de Board.zobrist para el mismo campo)."""
+        keys, value = self._keys, 0
+        while mask:
+            low = mask & -mask
+            value ^= keys[low.bit_length() - 1]
+            mask ^= low
+        return value
+
+    def _counts_hash(self, remaining: list[int]) -> int:
+        value = 0
+        for i, count in enumerate(remaining):
+            value ^= self._count_keys[i][count]
+        return value
+
+    def _shape_table(self, name: str) -> list[_Shape]:
+        """Posiciones (rot, col) de la pieza con su máscara en la fila 0 del campo, sin formas repetidas."""
+        cols = self._cols
+        if (name, cols) not in self._shapes:
+            shape = self._data[name]
+            table, seen = [], set()
+            for rot, (cells, (top, bottom, left, right)) in enumerate(zip(shape["offsets"], shape["bounds"])):
+                for col in range(-left, cols - right):
+                    mask = sum(1 << ((bottom - dr) * cols + col + dc) for dr, dc in cells)
+                    if mask in seen:
+                        continue
+                    seen.add(mask)
+                    table.append(_Shape(rot, col, mask, bottom - top + 1, bottom, cells))
+            self._shapes[name, cols] = table
+        return self._shapes[name, cols]
+
+    def _to_columns(self, bits: int, height: int) -> int:
+        """Pasa el campo de filas (bit y * cols + x) a columnas (bit x * height + y)."""
+        cols, row_mask = self._cols, self._row_mask
+        if (cols, height) not in self._transpose:
+            # Fila y = 0 por patrón de fila; cada bit suma el de su columna al patrón sin ese bit
+            table = [0] * (1 << cols)
+            for row in range(1, 1 << cols):
+                low = row & -row
+                table[row] = table[row ^ low] | 1 << ((low.bit_length() - 1) * height)
+            self._transpose[cols, height] = table
+        table = self._transpose[cols, height]
+        return sum(table[(bits >> (y * cols)) & row_mask] << y for y in range(height))
+
+    def _anchor_table(self, name: str, height: int) -> list[list[tuple[int, int]]]:
+        """
+        Posiciones de la pieza en el campo por columnas de `height` filas, agrupadas por su celda
+        de la columna más a la izquierda (y más baja): la que cubre la celda vacía objetivo.
+
+        Incluye las posiciones partidas: las filas de la pieza repartidas en filas no contiguas
+        del campo, para colocarla cuando las filas intermedias ya se eliminaron.
+
+        Returns:
+            list[list[tuple[int, int]]]: Por celda, (máscara, hash de Zobrist de la máscara).
+        """
+        cols, row_mask = self._cols, self._row_mask
+        if (name, cols, height) not in self._anchors:
+            table: list[list[tuple[int, int]]] = [[] for _ in range(height * cols)]
+            for shape in self._shape_table(name):
+                for rows in combinations(range(height), shape.height):
+                    mask, mask_key = 0, 0
+                    for j, y in enumerate(rows):
+                        row = (shape.mask >> (j * cols)) & row_mask
+                        for x in range(cols):
+                            if row >> x & 1:
+                                mask |= 1 << (x * height + y)
+                                mask_key ^= self._keys[y * cols + x]
+                    table[(mask & -mask).bit_length() - 1].append((mask, mask_key))
+            self._anchors[name, cols, height] = table
+        return self._anchors[name, cols, height]
+
+    def _to_solution(self, board: Board, height: int, path: list[tuple[str, _Shape, int, bool]],
+                     start: tuple[int, int, int] | None) -> PCSolution:
+        """
+        Traduce la secuencia del campo a Placements sobre una copia del tablero.
+
+        Raises:
+            RuntimeError: Si PlacementFinder no alcanza alguna posición (no debería pasar: la
+                búsqueda solo usa posiciones alcanzables).
+        """
+        work = Board(board.rows, board.cols, animated=False)
+        work.set_matrix(board.matrix)
+        steps = []
+        for number, (name, shape, y, use_hold) in enumerate(path):
+            row = board.rows - 1 - y - shape.bottom
+            target = {(row + dr, shape.col + dc) for dr, dc in shape.cells}
+            if number == 0 and not use_hold and start is not None:
+                placements = self._finder.find(work, name, start[0], start[1], start[2])
+            else:
+                placements = self._finder.find(work, name)
+            offsets = self._data[name]["offsets"]
+            placement = next((p for p in placements
+                              if {(p.row + dr, p.col + dc) for dr, dc in offsets[p.rot]} == target), None)
+            if placement is None:
+                raise RuntimeError(f"PerfectClearSolver: la pieza {name} no alcanza la posición ({row}, {shape.col}).")
+            steps.append(PCStep(placement, use_hold))
+
+            work.lock_piece(Piece(name, self._data[name], placement.row, placement.col, placement.rot))
+            work.clear_lines()
+        return PCSolution(steps, height)
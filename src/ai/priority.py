@@ -0,0 +1,24 @@
+import os
+
+
+def lower_priority() -> None:
+    """
+    Baja la prioridad del proceso actual al mínimo disponible.
+
+    La usan los workers que corren junto al juego (SearchService, RoyaleWorker) para usar solo
+    la CPU que el frame deja libre. SCHED_IDLE (Linux) solo usa la CPU cuando nadie más la pide.
+    Si no existe o el sistema no lo permite (contenedores con seccomp, kernels sin la política)
+    se usa nice 19, la menor prioridad normal; si tampoco se puede, el proceso sigue con la
+    prioridad heredada.
+    """
+    if hasattr(os, "SCHED_IDLE"):
+        try:
+            os.sched_setscheduler(0, os.SCHED_IDLE, os.sched_param(0))
+            return
+        except OSError:
+            pass
+    if hasattr(os, "nice"):
+        try:
+            os.nice(19)
+        except OSError:
+            pass
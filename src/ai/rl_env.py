@@ -0,0 +1,346 @@
+import numpy as np
+from typing import TYPE_CHECKING
+from src.core.action import Action
+from src.core.batch_simulator import BatchSimulator
+from src.core.piece_shapes import build_piece_shapes
+from src.ai.controller_sim import ControllerSimulator
+
+if TYPE_CHECKING:
+    from src.core.types import PieceShapeType
+    from src.config.gameplay import GameplayConfigType, GameplayRulesetType
+
+
+# Espacios de acción: colocación completa (rot, col, hold) o una tecla por paso
+ACTION_SPACES = ("placement", "keypress")
+
+# Recompensa por paso: líneas eliminadas o puntos ganados
+REWARDS = ("lines", "score")
+
+# Motores de simulación: BatchSimulator (vectorizado) o GameBoardController por partida
+ENGINES = ("batch", "controller")
+
+
+def buffer_specs(num_envs: int, rows: int, cols: int, num_pieces: int,
+                 preview: int) -> dict[str, tuple[tuple[int, ...], type]]:
+    """
+    Forma y dtype de cada buffer que VecEnv escribe en su lugar (observación y resultados del paso).
+
+    Sirve para preasignarlos afuera, por ejemplo en memoria compartida (ver RolloutWorkers).
+    """
+    k = num_envs
+    return {
+        "board":         ((k, 2, rows, cols), np.uint8),
+        "piece":         ((k, num_pieces), np.uint8),
+        "hold":          ((k, num_pieces), np.uint8),
+        "can_hold":      ((k,), np.uint8),
+        "preview":       ((k, preview, num_pieces), np.uint8),
+        "rewards":       ((k,), np.float32),
+        "terminated":    ((k,), np.bool_),
+        "truncated":     ((k,), np.bool_),
+        "episode_score": ((k,), np.int64),
+        "episode_lines": ((k,), np.int64),
+    }
+
+
+class VecEnv:
+    """
+    Entorno vectorizado estilo Gym: K partidas que avanzan juntas sobre un BatchSimulator.
+
+    Con engine="controller" las partidas corren sobre ControllerSimulator, es decir sobre
+    GameBoardController (Board, PieceMechanics y Score), con las mismas observaciones y acciones;
+    es mucho más lento, pero las reglas son las del juego sin reimplementar.
+
+    Espacios de acción (enteros, uno por partida):
+        - "placement": índice hold * 4 * C + rot * C + (col - min_col), con C = num_cols. La
+          colocación se juega como BatchSimulator.step; columnas fuera del tablero se detienen
+          en la pared, así que action_mask marca las que colocan la pieza sin chocar.
+        - "keypress": un valor de Action, o NOOP (= len(Action)) para no tocar nada. La pieza
+          baja una fila por gravedad cada `fall_every` pasos (0 = sin gravedad).
+
+    Las observaciones son arreglos preasignados que cada paso sobrescribe en su lugar (quien
+    necesite conservarlos debe copiarlos):
+        - "board":    (K, 2, ROWS, COLS) uint8; plano 0 celdas ocupadas, plano 1 pieza activa.
+        - "piece":    (K, P) uint8, one-hot de la pieza activa.
+        - "hold":     (K, P) uint8, one-hot de la pieza en hold (todo cero si está vacío).
+        - "can_hold": (K,) uint8.
+        - "preview":  (K, preview, P) uint8, one-hot de las próximas piezas.
+
+    Las partidas que terminan (game over o max_episode_steps) se reinician solas dentro de
+    step; la observación devuelta ya es la de la partida nueva y el puntaje y las líneas de la
+    que terminó quedan en episode_score y episode_lines.
+    """
+    NOOP = len(Action)
+
+    def __init__(self,
+                 session_config: "GameplayConfigType",
+                 ruleset: "GameplayRulesetType",
+                 num_envs: int,
+                 action_space: str = "placement",
+                 preview: int = 5,
+                 reward: str = "lines",
+                 fall_every: int = 0,
+                 max_episode_steps: int | None = None,
+                 pieces: "PieceShapeType | None" = None,
+                 seed: int | None = None,
+                 buffers: dict[str, np.ndarray] | None = None,
+                 engine: str = "batch") -> None:
+        """
+        Args:
+            session_config: Configuración de gameplay.
+            ruleset: Ruleset de las partidas.
+            num_envs: Cantidad de partidas simultáneas (K).
+            action_space: "placement" o "keypress".
+            preview: Cantidad de próximas piezas en la observación.
+            reward: "lines" o "score".
+            fall_every: Con "keypress", pasos entre caídas por gravedad (0 = sin gravedad).
+            max_episode_steps: Pasos tras los que la partida se corta (truncated). None = sin límite.
+            pieces: Formas de las piezas. Si no se indica se construyen desde PIECE_DEFINITIONS.
+            seed: Semilla base de las bolsas; la partida i usa seed + i.
+            buffers: Buffers preasignados (ver buffer_specs) en los que escribir; los que falten
+                se crean.
+            engine: "batch" (BatchSimulator) o "controller" (ControllerSimulator).
+
+        Raises:
+            ValueError: Si el espacio de acción, la recompensa, el motor, algún parámetro o algún
+                buffer no son válidos.
+        """
+        if action_space not in ACTION_SPACES:
+            raise ValueError(f"VecEnv: espacio de acción '{action_space}' no reconocido ({', '.join(ACTION_SPACES)}).")
+        if reward not in REWARDS:
+            raise ValueError(f"VecEnv: recompensa '{reward}' no reconocida ({', '.join(REWARDS)}).")
+        if engine not in ENGINES:
+            raise ValueError(f"VecEnv: motor '{engine}' no reconocido ({', '.join(ENGINES)}).")
+        if fall_every < 0:
+            raise ValueError(f"VecEnv: fall_every inválido ({fall_every}).")
+        if max_episode_steps is not None and max_episode_steps <= 0:
+            raise ValueError(f"VecEnv: max_episode_steps inválido ({max_episode_steps}).")
+
+        shapes = pieces if pieces is not None else build_piece_shapes()
+        simulator = BatchSimulator if engine == "batch" else ControllerSimulator
+        self._sim = simulator(session_config, ruleset, num_envs, shapes, seed=seed)
+        self._sim.preview(preview)   # valida el tamaño del preview
+
+        self.num_envs     = num_envs
+        self.action_space = action_space
+        self.engine       = engine
+        self.reward       = reward
+        self.preview      = preview
+        self.fall_every   = fall_every
+        self.max_episode_steps = max_episode_steps
+        self.hold_enabled = ruleset.get("hold", False)
+        self.piece_names  = self._sim.piece_names
+
+        rows, cols = self._sim.rows, self._sim.cols
+        num_pieces = len(self.piece_names)
+        self._build_placements(shapes, cols)
+
+        k = num_envs
+        arrays = self._buffers(buffer_specs(k, rows, cols, num_pieces, preview), buffers or {})
+        self.observation: dict[str, np.ndarray] = {
+            key: arrays[key] for key in ("board", "piece", "hold", "can_hold", "preview")
+        }
+        self._board_planes = arrays["board"].view(bool)
+        self.rewards       = arrays["rewards"]
+        self.terminated    = arrays["terminated"]
+        self.truncated     = arrays["truncated"]
+        self.episode_score = arrays["episode_score"]
+        self.episode_lines = arrays["episode_lines"]
+        self.episode_steps = np.zeros(k, dtype=np.int64)
+
+        self._all      = np.arange(k)
+        self._slots    = np.arange(preview)
+        self._no_hold  = np.zeros(k, dtype=bool)
+        self._fall     = np.zeros(k, dtype=bool)
+
+    @property
+    def num_actions(self) -> int:
+        """Cantidad de acciones discretas del espacio de acción."""
+        if self.action_space == "keypress":
+            return self.NOOP + 1
+        return self._placements.shape[1] * (2 if self.hold_enabled else 1)
+
+    @property
+    def simulator(self) -> BatchSimulator | ControllerSimulator:
+        """Simulador subyacente (solo lectura; modificarlo desincroniza las observaciones)."""
+        return self._sim
+
+    # --- CICLO ---
+    def reset(self) -> dict[str, np.ndarray]:
+        """
+        Reinicia todas las partidas.
+
+        La secuencia de piezas continúa la de cada bolsa; la semilla se fija al construir el entorno.
+
+        Returns:
+            dict[str, np.ndarray]: Observación (buffers preasignados).
+        """
+        self._sim.reset()
+        self.episode_steps[:] = 0
+        self._observe()
+        return self.observation
+
+    def step(self, actions: np.ndarray) -> tuple[dict[str, np.ndarray], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Avanza un paso en todas las partidas.
+
+        Args:
+            actions: Índice de acción por partida, (K,) enteros en [0, num_actions).
+
+        Returns:
+            tuple: (observación, recompensas, terminated, truncated); todos son buffers
+            preasignados que se sobrescriben en el próximo paso.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        sim = self._sim
+        if self.action_space == "placement":
+            cols = self._placements.shape[1] // 4
+            hold = actions >= 4 * cols if self.hold_enabled else self._no_hold
+            placement = actions % (4 * cols)
+            sim.step(placement // cols, placement % cols + self._min_col, hold)
+        else:
+            fall = None
+            if self.fall_every:
+                np.equal((self.episode_steps + 1) % self.fall_every, 0, out=self._fall)
+                fall = self._fall
+            sim.press(actions, fall)
+
+        gain = sim.last_lines if self.reward == "lines" else sim.last_score_gain
+        self.rewards[:] = gain
+        self.episode_steps += 1
+        np.copyto(self.terminated, sim.game_over)
+        if self.max_episode_steps is not None:
+            np.greater_equal(self.episode_steps, self.max_episode_steps, out=self.truncated)
+            self.truncated &= ~self.terminated
+
+        done = np.flatnonzero(self.terminated | self.truncated)
+        if done.size:
+            self.episode_score[done] = sim.score[done]
+            self.episode_lines[done] = sim.lines_total[done]
+            self.episode_steps[done] = 0
+            sim.reset(done)
+        self._observe()
+        return self.observation, self.rewards, self.terminated, self.truncated
+
+    def action_mask(self) -> np.ndarray:
+        """
+        Acciones que tienen efecto, (K, num_actions) bool.
+
+        Con "placement" marca las rotaciones y columnas en las que la pieza (o la del hold, si
+        se puede usar) entra completa en el ancho del tablero; con "keypress", todas.
+        """
+        if self.action_space == "keypress":
+            return np.ones((self.num_envs, self.num_actions), dtype=bool)
+        sim = self._sim
+        current = self._placements[sim.piece.astype(np.int64)]
+        if not self.hold_enabled:
+            return current
+        # Con el hold vacío entra la primera pieza del preview
+        swapped = np.where(sim.hold >= 0, sim.hold, sim.preview(1)[:, 0]).astype(np.int64)
+        held = self._placements[swapped] & sim.can_hold[:, None]
+        return np.concatenate((current, held), axis=1)
+
+    # --- HELPERS ---
+    @staticmethod
+    def _buffers(specs: dict[str, tuple[tuple[int, ...], type]],
+                 given: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        """Valida los buffers recibidos y crea los que faltan."""
+        arrays = {}
+        for key, (shape, dtype) in specs.items():
+            if key not in given:
+                arrays[key] = np.zeros(shape, dtype=dtype)
+                continue
+            array = given[key]
+            if array.shape != shape or array.dtype != dtype or not array.flags.c_contiguous:
+                raise ValueError(f"VecEnv: el buffer '{key}' debe ser {np.dtype(dtype).name} {shape} contiguo "
+                                 f"(se recibió {array.dtype.name} {array.shape}).")
+            arrays[key] = array
+        return arrays
+
+    def _build_placements(self, shapes: "PieceShapeType", cols: int) -> None:
+        """Rango de columnas del espacio "placement" y colocaciones dentro del tablero por pieza."""
+        bounds = [shapes[name]["bounds"][rot] for name in self.piece_names for rot in range(4)]
+        self._min_col = min(-min_dc for _, _, min_dc, _ in bounds)
+        max_col = max(cols - 1 - max_dc for _, _, _, max_dc in bounds)
+        targets = np.arange(self._min_col, max_col + 1)
+
+        self._placements = np.zeros((len(self.piece_names), 4 * targets.size), dtype=bool)
+        for i, name in enumerate(self.piece_names):
+            for rot in range(4):
+                _, _, min_dc, max_dc = shapes[name]["bounds"][rot]
+                inside = (targets + min_dc >= 0) & (targets + max_dc < cols)
+                self._placements[i, rot * targets.size:(rot + 1) * targets.size] = inside
+
+    def _observe(self) -> None:
+        """Escribe el estado del simulador en los buffers de observación."""
+        sim, obs = self._sim, self.observation
+        planes = self._board_planes
+        np.not_equal(sim.boards, 0, out=planes[:, 0])
+
+        active = planes[:, 1]
+        active[:] = False
+        rows, cols = sim.active_cells()
+        visible = (rows >= 0) & ~sim.game_over[:, None]
+        envs = np.broadcast_to(self._all[:, None], rows.shape)
+        active[envs[visible], rows[visible], cols[visible]] = True
+
+        obs["piece"][:] = 0
+        obs["piece"][self._all, sim.piece] = 1
+        obs["hold"][:] = 0
+        held = np.flatnonzero(sim.hold >= 0)
+        obs["hold"][held, sim.hold[held]] = 1
+        obs["can_hold"][:] = sim.can_hold
+
+        obs["preview"][:] = 0
+        obs["preview"][self._all[:, None], self._slots, sim.preview(self.preview)] = 1
+
+
+class TetrisEnv:
+    """
+    Entorno de una sola partida con la interfaz de Gymnasium (reset / step con terminated y truncated).
+
+    Es un VecEnv de tamaño 1; las observaciones son vistas de sus buffers, así que también se
+    sobrescriben en cada paso.
+    """
+    def __init__(self,
+                 session_config: "GameplayConfigType",
+                 ruleset: "GameplayRulesetType",
+                 action_space: str = "placement",
+                 preview: int = 5,
+                 reward: str = "lines",
+                 fall_every: int = 0,
+                 max_episode_steps: int | None = None,
+                 pieces: "PieceShapeType | None" = None,
+                 seed: int | None = None,
+                 engine: str = "batch") -> None:
+        """Los argumentos son los de VecEnv con num_envs = 1."""
+        self._env = VecEnv(session_config, ruleset, 1, action_space, preview, reward,
+                           fall_every, max_episode_steps, pieces, seed, engine=engine)
+        self.observation = {key: buffer[0] for key, buffer in self._env.observation.items()}
+
+    @property
+    def num_actions(self) -> int:
+        return self._env.num_actions
+
+    def reset(self) -> tuple[dict[str, np.ndarray], dict]:
+        """Reinicia la partida. Devuelve (observación, info)."""
+        self._env.reset()
+        return self.observation, {}
+
+    def step(self, action: int) -> tuple[dict[str, np.ndarray], float, bool, bool, dict]:
+        """
+        Aplica una acción.
+
+        Returns:
+            tuple: (observación, recompensa, terminated, truncated, info). Al terminar, la
+            observación ya es la de la partida nueva e info trae "score" y "lines" de la anterior.
+        """
+        env = self._env
+        env.step(np.array([action]))
+        terminated, truncated = bool(env.terminated[0]), bool(env.truncated[0])
+        info = {}
+        if terminated or truncated:
+            info = {"score": int(env.episode_score[0]), "lines": int(env.episode_lines[0])}
+        return self.observation, float(env.rewards[0]), terminated, truncated, info
+
+    def action_mask(self) -> np.ndarray:
+        return self._env.action_mask()[0]
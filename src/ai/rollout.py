@@ -0,0 +1,264 @@
+import traceback
+import multiprocessing as mp
+import numpy as np
+from multiprocessing import shared_memory
+from typing import Any, TYPE_CHECKING
+from src.constants import ROWS, COLS
+from src.core.piece_shapes import build_piece_shapes
+from src.core.types import PieceShape
+from src.ai.rl_env import VecEnv, buffer_specs
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from src.core.types import PieceShapeType
+    from src.config.gameplay import GameplayConfigType, GameplayRulesetType
+
+
+# Comandos del learner a los workers (un byte por mensaje)
+_STEP  = b"s"
+_RESET = b"r"
+_STOP  = b"q"
+_OK    = b"k"
+
+# Alineación de cada buffer dentro del bloque compartido
+_ALIGN = 64
+
+
+class RolloutWorkers:
+    """
+    Reparte K partidas de VecEnv entre procesos, con los buffers en memoria compartida.
+
+    Todos los buffers (acciones, observación, recompensas, terminated, truncated y estadísticas
+    de episodio) viven en un solo bloque de `multiprocessing.shared_memory`. El worker w corre un
+    VecEnv con su tramo de partidas que escribe directamente en las filas de ese tramo, así que
+    el learner lee las observaciones sin copias: `observation`, `rewards`, etc. son vistas del
+    bloque con la misma forma que en un VecEnv de K partidas.
+
+    La sincronización es un byte por worker y por paso a través de un Pipe: el learner escribe
+    las acciones en `actions`, avisa a todos los workers y espera sus respuestas. La partida i
+    usa la semilla seed + i sin importar la cantidad de workers, por lo que los resultados son
+    idénticos a los de un VecEnv en un solo proceso.
+
+    Con engine="controller" cada worker corre sus partidas sobre GameBoardController (ver
+    VecEnv), con las reglas exactas del juego; "batch" usa BatchSimulator, mucho más rápido.
+
+    El bloque compartido y los procesos se liberan con close (o al salir del bloque with).
+    """
+    def __init__(self,
+                 session_config: "GameplayConfigType",
+                 ruleset: "GameplayRulesetType",
+                 num_envs: int,
+                 workers: int,
+                 action_space: str = "placement",
+                 preview: int = 5,
+                 reward: str = "lines",
+                 fall_every: int = 0,
+                 max_episode_steps: int | None = None,
+                 pieces: "PieceShapeType | None" = None,
+                 seed: int | None = None,
+                 engine: str = "batch") -> None:
+        """
+        Args:
+            session_config: Configuración de gameplay.
+            ruleset: Ruleset de las partidas.
+            num_envs: Cantidad total de partidas (K).
+            workers: Cantidad de procesos; cada uno recibe un tramo contiguo de partidas.
+            action_space, preview, reward, fall_every, max_episode_steps, pieces, seed, engine: Los de VecEnv.
+
+        Raises:
+            ValueError: Si la cantidad de workers no está entre 1 y num_envs.
+            RuntimeError: Si algún worker no pudo crear su entorno.
+        """
+        if not 1 <= workers <= num_envs:
+            raise ValueError(f"RolloutWorkers: cantidad de workers inválida ({workers}). "
+                             f"Debe estar entre 1 y {num_envs}.")
+
+        # Solo los datos lógicos: las surfaces de pygame no viajan a los workers
+        shapes = pieces if pieces is not None else build_piece_shapes()
+        shapes = {name: {key: data[key] for key in PieceShape.__required_keys__} for name, data in shapes.items()}
+
+        # Valida los argumentos del entorno en este proceso, antes de lanzar los workers
+        self.num_actions: int = VecEnv(session_config, ruleset, 1, action_space, preview, reward, fall_every,
+                                       max_episode_steps, shapes, engine=engine).num_actions
+        self.num_envs = num_envs
+        self.workers  = workers
+        specs = {"actions": ((num_envs,), np.int64), **buffer_specs(num_envs, ROWS, COLS, len(shapes), preview)}
+        layout, size = _layout(specs)
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self._arrays = _views(self._shm, layout)
+        self._observation = {key: self._arrays[key] for key in ("board", "piece", "hold", "can_hold", "preview")}
+        self._closed = False
+
+        bounds = np.linspace(0, num_envs, workers + 1).astype(int)
+        self.slices = [slice(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:])]
+        env_args = (session_config, ruleset, action_space, preview, reward, fall_every, max_episode_steps, shapes, engine)
+
+        context = mp.get_context("fork" if "fork" in mp.get_all_start_methods() else "spawn")
+        self._pipes: list["Connection"] = []
+        self._processes: list[Any] = []
+        try:
+            for index, part in enumerate(self.slices):
+                parent, child = context.Pipe()
+                part_seed = None if seed is None else seed + part.start
+                process = context.Process(target=_worker_main, name=f"RolloutWorker-{index}", daemon=True,
+                                          args=(child, self._shm.name, layout, part, env_args, part_seed))
+                process.start()
+                child.close()
+                self._pipes.append(parent)
+                self._processes.append(process)
+            self._wait()
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def actions(self) -> np.ndarray:
+        """Acción de cada partida para el próximo step, (K,) int64 en memoria compartida."""
+        return self._arrays["actions"]
+
+    @property
+    def observation(self) -> dict[str, np.ndarray]:
+        """Observación con las claves y formas de VecEnv.observation, en memoria compartida."""
+        return self._observation
+
+    @property
+    def rewards(self) -> np.ndarray:
+        return self._arrays["rewards"]
+
+    @property
+    def terminated(self) -> np.ndarray:
+        return self._arrays["terminated"]
+
+    @property
+    def truncated(self) -> np.ndarray:
+        return self._arrays["truncated"]
+
+    @property
+    def episode_score(self) -> np.ndarray:
+        """Puntaje de la última partida terminada en cada entorno."""
+        return self._arrays["episode_score"]
+
+    @property
+    def episode_lines(self) -> np.ndarray:
+        """Líneas de la última partida terminada en cada entorno."""
+        return self._arrays["episode_lines"]
+
+    def __enter__(self) -> "RolloutWorkers":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # --- CICLO ---
+    def reset(self) -> dict[str, np.ndarray]:
+        """Reinicia todas las partidas. Devuelve la observación (vistas del bloque compartido)."""
+        self._broadcast(_RESET)
+        return self.observation
+
+    def step(self, actions: np.ndarray | None = None) -> tuple[dict[str, np.ndarray], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Avanza un paso en todas las partidas.
+
+        Args:
+            actions: Índice de acción por partida. None usa lo que ya esté escrito en `actions`
+                (para que el learner escriba la política directamente en memoria compartida).
+
+        Returns:
+            tuple: (observación, recompensas, terminated, truncated), vistas del bloque compartido
+            que se sobrescriben en el próximo paso.
+        """
+        if actions is not None:
+            self.actions[:] = actions
+        self._broadcast(_STEP)
+        return self.observation, self.rewards, self.terminated, self.truncated
+
+    def close(self) -> None:
+        """Detiene los workers y libera el bloque compartido. No se puede volver a usar."""
+        if self._closed:
+            return
+        self._closed = True
+        for pipe in self._pipes:
+            try:
+                pipe.send_bytes(_STOP)
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=1.0)
+            if process.is_alive():
+                process.terminate()
+        for pipe in self._pipes:
+            pipe.close()
+
+        self._arrays, self._observation = {}, {}
+        self._shm.unlink()
+        try:
+            self._shm.close()
+        except BufferError:
+            pass   # quedan vistas en uso fuera de la clase; el mapeo se libera cuando se suelten
+
+    # --- HELPERS ---
+    def _broadcast(self, command: bytes) -> None:
+        """Envía un comando a todos los workers y espera que terminen."""
+        if self._closed:
+            raise RuntimeError("RolloutWorkers: los workers ya se cerraron.")
+        for pipe in self._pipes:
+            pipe.send_bytes(command)
+        self._wait()
+
+    def _wait(self) -> None:
+        """Espera la respuesta de cada worker; si alguno falló, cierra todo y propaga el error."""
+        for index, pipe in enumerate(self._pipes):
+            try:
+                reply = pipe.recv_bytes()
+            except EOFError:
+                reply = "el proceso terminó inesperadamente".encode()
+            if reply != _OK:
+                self.close()
+                raise RuntimeError(f"RolloutWorkers: falló el worker {index}:\n{reply.decode(errors='replace')}")
+
+
+def _layout(specs: dict[str, tuple[tuple[int, ...], type]]) -> tuple[dict[str, tuple], int]:
+    """Ubica cada buffer en el bloque compartido: {nombre: (offset, forma, dtype)} y tamaño total."""
+    layout, offset = {}, 0
+    for key, (shape, dtype) in specs.items():
+        layout[key] = (offset, shape, np.dtype(dtype).str)
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        offset += -(-nbytes // _ALIGN) * _ALIGN
+    return layout, max(offset, 1)
+
+
+def _views(shm: shared_memory.SharedMemory, layout: dict[str, tuple]) -> dict[str, np.ndarray]:
+    """Vistas NumPy de cada buffer del bloque compartido."""
+    return {key: np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+            for key, (offset, shape, dtype) in layout.items()}
+
+
+def _worker_main(pipe: "Connection", shm_name: str, layout: dict[str, tuple], part: slice,
+                 env_args: tuple, seed: int | None) -> None:
+    """Bucle de un worker: corre su tramo de partidas sobre las filas del bloque compartido."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        arrays = {key: view[part] for key, view in _views(shm, layout).items()}
+        actions = arrays.pop("actions")
+        session_config, ruleset, action_space, preview, reward, fall_every, max_episode_steps, shapes, engine = env_args
+        env = VecEnv(session_config, ruleset, part.stop - part.start, action_space, preview, reward,
+                     fall_every, max_episode_steps, shapes, seed, buffers=arrays, engine=engine)
+        pipe.send_bytes(_OK)
+
+        while (command := pipe.recv_bytes()) != _STOP:
+            if command == _STEP:
+                env.step(actions)
+            elif command == _RESET:
+                env.reset()
+            pipe.send_bytes(_OK)
+    except EOFError:
+        pass
+    except BaseException:
+        try:
+            pipe.send_bytes(traceback.format_exc().encode())
+        except (BrokenPipeError, OSError):
+            pass
+    finally:
+        # Suelta las vistas antes de cerrar el mmap
+        arrays = actions = env = None
+        shm.close()
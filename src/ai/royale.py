@@ -0,0 +1,454 @@
+import queue
+import threading
+import time
+import multiprocessing as mp
+import numpy as np
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, TYPE_CHECKING
+from src.constants import ROWS, COLS
+from src.core.batch_simulator import BatchSimulator
+from src.core.piece_shapes import build_piece_shapes
+from src.core.types import PieceShape
+from src.core.versus import attack_lines, cancel_garbage, take_garbage
+from src.ai.evaluator import BoardEvaluator, EvalWeights
+from src.ai.priority import lower_priority
+from src.ai.self_play import greedy_drops
+
+if TYPE_CHECKING:
+    from src.core.gameboard_controller import GameBoardController
+    from src.core.types import PieceShapeType
+    from src.config.gameplay import GameplayConfigType, GameplayRulesetType
+
+# Índice del jugador humano como origen o destino de un ataque (los rivales son 0..N-1)
+PLAYER = -1
+
+# Mensajes hacia el worker
+_ADVANCE = "advance"
+_ATTACK  = "attack"
+_OUT     = "out"
+_STOP    = "stop"
+
+
+@dataclass
+class RoyaleStats:
+    """
+    Instrumentación de RoyaleField.
+
+    Attributes:
+        pieces:    Piezas colocadas por los rivales.
+        batches:   Pasos del BatchSimulator (cada uno coloca las piezas de todos los rivales que tocaban).
+        sent:      Líneas de ataque enviadas por los rivales (después de cancelar).
+        cancelled: Líneas de basura canceladas por los rivales.
+        inserted:  Filas de basura insertadas en los tableros rivales.
+        seconds:   Segundos de CPU de advance.
+    """
+    pieces:    int   = 0
+    batches:   int   = 0
+    sent:      int   = 0
+    cancelled: int   = 0
+    inserted:  int   = 0
+    seconds:   float = 0.0
+
+
+class RoyaleField:
+    """
+    Los rivales de un battle royale: N partidas jugadas por bots en un BatchSimulator.
+
+    Cada rival coloca piezas a su propio ritmo (entre `pace` piezas por segundo, fijo por
+    rival). En cada advance se juntan los rivales a los que les toca colocar y se resuelven en
+    un solo paso del simulador: las jugadas se eligen en lote con greedy_drops y una sola
+    evaluación por tipo de pieza, como en el self-play.
+
+    Las líneas eliminadas se convierten en ataque con attack_lines (en lote solo hay jugadas
+    normales) y siguen las reglas de VersusMatch: primero cancelan la basura propia y el resto
+    va a un rival vivo elegido al azar, que puede ser el jugador (PLAYER). La basura del
+    jugador no vive acá: advance la devuelve y quien maneja su partida la encola y la cancela.
+    El último en atacar a un rival se lleva el KO cuando ese rival pierde.
+
+    `versions` cuenta los cambios de cada tablero (pieza bloqueada, basura o derrota), para que
+    la vista redibuje una miniatura solo cuando su tablero cambió.
+    """
+    def __init__(self,
+                 session_config: "GameplayConfigType",
+                 ruleset: "GameplayRulesetType",
+                 opponents: int = 98,
+                 seed: int | None = None,
+                 weights: EvalWeights | None = None,
+                 pieces: "PieceShapeType | None" = None,
+                 pace: tuple[float, float] = (0.5, 2.0),
+                 garbage_cap: int = 8) -> None:
+        """
+        Args:
+            session_config: Configuración de gameplay.
+            ruleset: Ruleset de las partidas.
+            opponents: Cantidad de rivales.
+            seed: Semilla de las bolsas, los ritmos, los objetivos y los huecos.
+            weights: Pesos de la evaluación de los bots (los de EvalWeights por defecto).
+            pieces: Formas de las piezas. Si no se indica se construyen desde PIECE_DEFINITIONS.
+            pace: Piezas por segundo mínima y máxima de los rivales.
+            garbage_cap: Filas de basura que pueden entrar como máximo con cada pieza.
+
+        Raises:
+            ValueError: Si algún parámetro está fuera de rango.
+        """
+        if opponents <= 0 or not 0 < pace[0] <= pace[1] or garbage_cap <= 0:
+            raise ValueError(f"RoyaleField: parámetros inválidos (opponents={opponents}, pace={pace}, "
+                             f"garbage_cap={garbage_cap}).")
+        self._shapes    = pieces if pieces is not None else build_piece_shapes()
+        self._sim       = BatchSimulator(session_config, ruleset, opponents, self._shapes, seed=seed)
+        self._evaluator = BoardEvaluator(weights)
+        self._rng       = np.random.default_rng(seed)
+        self.opponents   = opponents
+        self.garbage_cap = garbage_cap
+        self.stats       = RoyaleStats()
+
+        # Segundos por pieza de cada rival; el reloj inicial al azar evita que todos coloquen juntos
+        self._interval = 1.0 / self._rng.uniform(pace[0], pace[1], opponents)
+        self._timer    = self._rng.uniform(0.0, 1.0, opponents) * self._interval
+        self._rots     = np.zeros(opponents, dtype=np.int64)
+        self._cols     = np.zeros(opponents, dtype=np.int64)
+
+        self._queues: list[list[list[int]]] = [[] for _ in range(opponents)]
+        self._last_attacker = np.full(opponents, PLAYER - 1, dtype=np.int64)   # nadie
+        self._dead = np.zeros(opponents, dtype=bool)
+        self._player_alive = True
+
+        self.versions   = np.zeros(opponents, dtype=np.int64)
+        self.kos        = np.zeros(opponents, dtype=np.int64)
+        self.player_kos = 0
+        self._sim.start()
+
+    @property
+    def boards(self) -> np.ndarray:
+        """Tableros de los rivales, (N, ROWS, COLS) uint8."""
+        return self._sim.boards
+
+    @property
+    def dead(self) -> np.ndarray:
+        """Si cada rival ya perdió, (N,) bool."""
+        return self._dead
+
+    @property
+    def alive(self) -> int:
+        """Rivales que siguen en juego."""
+        return self.opponents - int(self._dead.sum())
+
+    # --- CICLO ---
+    def advance(self, dt: float) -> list[tuple[int, int]]:
+        """
+        Avanza `dt` segundos: coloca en un solo lote las piezas de los rivales a los que les toca.
+
+        Args:
+            dt: Segundos transcurridos. Cada rival coloca como máximo una pieza por llamada.
+
+        Returns:
+            list[tuple[int, int]]: Ataques (filas, hueco) dirigidos al jugador.
+        """
+        started = time.perf_counter()
+        sim = self._sim
+        alive = ~sim.game_over
+        self._timer[alive] += dt
+        due = np.flatnonzero(alive & (self._timer >= self._interval))
+        outgoing: list[tuple[int, int]] = []
+        if not due.size:
+            self.stats.seconds += time.perf_counter() - started
+            return outgoing
+        self._timer[due] = np.minimum(self._timer[due] - self._interval[due], self._interval[due])
+
+        back_to_back = sim.back_to_back[due].copy()
+        greedy_drops(sim, self._evaluator, self._shapes, due, self._rots, self._cols)
+        sim.step(self._rots, self._cols, games=due)
+        self.versions[due] += 1
+        self.stats.pieces += due.size
+        self.stats.batches += 1
+
+        lines = sim.last_lines[due]
+        for bot in due[lines == 0]:
+            self._insert(int(bot))
+        for index in np.flatnonzero(lines):
+            bot, cleared = int(due[index]), int(lines[index])
+            if sim.game_over[bot]:
+                continue
+            attack = attack_lines(cleared, "normal", cleared == 4 and bool(back_to_back[index]),
+                                  int(sim.combo_count[bot]), not sim.boards[bot].any())
+            cancelled = cancel_garbage(self._queues[bot], attack)
+            self.stats.cancelled += cancelled
+            self._send(bot, attack - cancelled, outgoing)
+
+        self._collect_kos()
+        self.stats.seconds += time.perf_counter() - started
+        return outgoing
+
+    def attack(self, lines: int) -> int | None:
+        """
+        Envía un ataque del jugador (ya descontada su basura cancelada) a un rival vivo al azar.
+
+        Returns:
+            int | None: Rival atacado, o None si no queda ninguno.
+        """
+        if lines <= 0:
+            return None
+        return self._send(PLAYER, lines, [])
+
+    def player_out(self) -> int:
+        """
+        Registra la derrota del jugador: deja de ser objetivo de los ataques.
+
+        Returns:
+            int: Puesto del jugador (1 + rivales vivos).
+        """
+        self._player_alive = False
+        return self.alive + 1
+
+    # --- HELPERS ---
+    def _insert(self, bot: int) -> None:
+        """Inserta hasta garbage_cap filas de la basura pendiente del rival."""
+        chunks = take_garbage(self._queues[bot], self.garbage_cap)
+        if not chunks:
+            return
+        # Un tramo por ataque, cada uno con su hueco, en el orden en que llegaron
+        counts, holes = zip(*chunks)
+        self._sim.insert_garbage(np.full(len(chunks), bot, dtype=np.int64), counts, holes)
+        self.stats.inserted += sum(counts)
+
+    def _send(self, attacker: int, lines: int, outgoing: list[tuple[int, int]]) -> int | None:
+        """Encola `lines` líneas en un objetivo vivo al azar distinto del atacante."""
+        if lines <= 0:
+            return None
+        candidates = np.flatnonzero(~self._sim.game_over)
+        if attacker != PLAYER:
+            candidates = candidates[candidates != attacker]
+        count = candidates.size + (self._player_alive and attacker != PLAYER)
+        if not count:
+            return None
+        choice = int(self._rng.integers(count))
+        hole = int(self._rng.integers(self._sim.cols))
+        if attacker != PLAYER:
+            self.stats.sent += lines
+        if choice == candidates.size:
+            outgoing.append((lines, hole))
+            return PLAYER
+        target = int(candidates[choice])
+        self._queues[target].append([lines, hole])
+        self._last_attacker[target] = attacker
+        return target
+
+    def _collect_kos(self) -> None:
+        """Acredita el KO de cada rival que acaba de perder a su último atacante."""
+        fallen = np.flatnonzero(self._sim.game_over & ~self._dead)
+        for bot in fallen:
+            attacker = int(self._last_attacker[bot])
+            if attacker == PLAYER:
+                self.player_kos += 1
+            elif attacker >= 0:
+                self.kos[attacker] += 1
+            self._queues[bot].clear()
+        self._dead[fallen] = True
+        self.versions[fallen] += 1
+
+
+class RoyaleWorker:
+    """
+    RoyaleField en segundo plano, fuera del hilo de render.
+
+    El hilo del juego solo envía mensajes (advance con el dt de cada frame, los ataques del
+    jugador y su derrota) y recoge sin bloquear los que llegan, así que el costo por frame no
+    depende de la cantidad de rivales. El worker junta el tiempo recibido y avanza el campo de
+    a lotes de `batch` segundos: los rivales se simulan en el mismo tiempo de juego que el
+    jugador, y una pausa del juego también los detiene.
+
+    Los tableros se publican en `boards`, `versions` y `dead`, en memoria compartida cuando el
+    worker es un proceso. Cada tablero se escribe entre dos incrementos de su versión (impar
+    mientras se escribe), y read_board descarta una lectura que se cruzó con una escritura.
+
+    Como SearchService, el worker es un proceso con fork donde existe y un hilo donde no.
+    """
+    def __init__(self,
+                 session_config: "GameplayConfigType",
+                 ruleset: "GameplayRulesetType",
+                 opponents: int = 98,
+                 seed: int | None = None,
+                 pieces: "PieceShapeType | None" = None,
+                 batch: float = 0.05,
+                 process: bool | None = None) -> None:
+        """
+        Args:
+            session_config, ruleset, opponents, seed: Los de RoyaleField.
+            pieces: Formas de las piezas. Si no se indica se construyen desde PIECE_DEFINITIONS.
+            batch: Segundos de juego que se juntan antes de avanzar el campo.
+            process: Si el worker es un proceso. None elige proceso solo si hay fork.
+
+        Raises:
+            ValueError: Si algún parámetro está fuera de rango.
+        """
+        if opponents <= 0 or batch <= 0:
+            raise ValueError(f"RoyaleWorker: parámetros inválidos (opponents={opponents}, batch={batch}).")
+        if process is None:
+            process = "fork" in mp.get_all_start_methods()
+        # Solo los datos lógicos: las surfaces de pygame no viajan al worker
+        shapes = None if pieces is None else {
+            name: {key: data[key] for key in PieceShape.__required_keys__} for name, data in pieces.items()
+        }
+
+        self.opponents = opponents
+        self.alive = opponents
+        self.player_kos = 0
+        self._shm: shared_memory.SharedMemory | None = None
+        boards_size = opponents * ROWS * COLS
+        if process:
+            self._shm = shared_memory.SharedMemory(create=True, size=boards_size + opponents * 9)
+            buffer = self._shm.buf
+        else:
+            buffer = bytearray(boards_size + opponents * 9)
+        self.versions = np.ndarray((opponents,), np.int64, buffer, 0)
+        self.boards   = np.ndarray((opponents, ROWS, COLS), np.uint8, buffer, opponents * 8)
+        self.dead     = np.ndarray((opponents,), bool, buffer, opponents * 8 + boards_size)
+        self.versions[:] = 0
+        self.boards[:] = 0
+        self.dead[:] = False
+
+        args = (session_config, ruleset, opponents, seed, shapes, batch)
+        if process:
+            context = mp.get_context("fork" if "fork" in mp.get_all_start_methods() else "spawn")
+            self._commands: Any = context.Queue()
+            self._events: Any   = context.Queue()
+            self._worker: Any   = context.Process(target=_process_main, name="RoyaleWorker", daemon=True,
+                                                  args=(self._commands, self._events, self._shm.name, *args))
+        else:
+            self._commands = queue.Queue()
+            self._events   = queue.Queue()
+            self._worker   = threading.Thread(target=_royale_loop, name="RoyaleWorker", daemon=True,
+                                              args=(self._commands, self._events,
+                                                    (self.versions, self.boards, self.dead), *args))
+        self._worker.start()
+
+    @classmethod
+    def for_controller(cls, controller: "GameBoardController", session_config: "GameplayConfigType",
+                       ruleset: "GameplayRulesetType", opponents: int = 98, seed: int | None = None,
+                       process: bool | None = None) -> "RoyaleWorker":
+        """Crea los rivales con las mismas piezas que la partida del jugador."""
+        return cls(session_config, ruleset, opponents, seed, controller.pieces, process=process)
+
+    def advance(self, dt: float) -> None:
+        """Avisa al worker que pasaron `dt` segundos de juego (no espera)."""
+        self._commands.put((_ADVANCE, dt))
+
+    def attack(self, lines: int) -> None:
+        """Envía un ataque del jugador a un rival al azar (ver RoyaleField.attack)."""
+        if lines > 0:
+            self._commands.put((_ATTACK, lines))
+
+    def player_out(self) -> int:
+        """
+        Registra la derrota del jugador.
+
+        Returns:
+            int: Puesto del jugador según los rivales vivos publicados hasta ahora.
+        """
+        self.poll()
+        self._commands.put((_OUT, 0))
+        return self.alive + 1
+
+    def poll(self) -> list[tuple[int, int]]:
+        """
+        Recoge sin bloquear lo que publicó el worker.
+
+        Returns:
+            list[tuple[int, int]]: Ataques (filas, hueco) dirigidos al jugador desde la última llamada.
+        """
+        garbage: list[tuple[int, int]] = []
+        while True:
+            try:
+                attacks, self.alive, self.player_kos = self._events.get_nowait()
+            except queue.Empty:
+                return garbage
+            garbage.extend(attacks)
+
+    def read_board(self, index: int, out: np.ndarray) -> int:
+        """
+        Copia el tablero de un rival sin cruzarse con una escritura del worker.
+
+        Returns:
+            int: La versión copiada, o -1 si el worker lo estaba escribiendo (reintentar después).
+        """
+        version = int(self.versions[index])
+        if version & 1:
+            return -1
+        out[:] = self.boards[index]
+        return version if int(self.versions[index]) == version else -1
+
+    def close(self) -> None:
+        """Detiene el worker y libera la memoria compartida. El worker no se puede volver a usar."""
+        if self._worker.is_alive():
+            self._commands.put((_STOP, 0))
+            self._worker.join(timeout=1.0)
+            if isinstance(self._worker, mp.process.BaseProcess) and self._worker.is_alive():
+                self._worker.terminate()
+        if self._shm is not None:
+            # Las vistas se sueltan antes de cerrar el bloque
+            del self.versions, self.boards, self.dead
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+def _process_main(commands: Any, events: Any, shm_name: str, session_config: "GameplayConfigType",
+                  ruleset: "GameplayRulesetType", opponents: int, *args: Any) -> None:
+    """Punto de entrada del worker como proceso: baja su prioridad y abre la memoria compartida."""
+    # Como en SearchService: los rivales usan solo la CPU que el frame deja libre (SCHED_IDLE en
+    # Linux); a 60 FPS el render deja libre mucho más de lo que necesitan
+    lower_priority()
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        boards_size = opponents * ROWS * COLS
+        arrays = (np.ndarray((opponents,), np.int64, shm.buf, 0),
+                  np.ndarray((opponents, ROWS, COLS), np.uint8, shm.buf, opponents * 8),
+                  np.ndarray((opponents,), bool, shm.buf, opponents * 8 + boards_size))
+        _royale_loop(commands, events, arrays, session_config, ruleset, opponents, *args)
+        del arrays
+    finally:
+        shm.close()
+
+
+def _royale_loop(commands: Any, events: Any, arrays: tuple[np.ndarray, np.ndarray, np.ndarray],
+                 session_config: "GameplayConfigType", ruleset: "GameplayRulesetType", opponents: int,
+                 seed: int | None, pieces: "PieceShapeType | None", batch: float) -> None:
+    """Bucle del worker: acumula el tiempo recibido y avanza el campo de a lotes hasta recibir _STOP."""
+    versions, boards, dead = arrays
+    field = RoyaleField(session_config, ruleset, opponents, seed, pieces=pieces)
+    published = np.full(opponents, -1, dtype=np.int64)
+    _publish(field, versions, boards, dead, published)
+
+    pending = 0.0
+    alive, kos = field.alive, field.player_kos
+    while True:
+        kind, value = commands.get()
+        if kind == _STOP:
+            return
+        if kind == _ADVANCE:
+            pending += value
+        elif kind == _ATTACK:
+            field.attack(value)
+        elif kind == _OUT:
+            field.player_out()
+        if pending < batch:
+            continue
+
+        attacks = field.advance(pending)
+        pending = 0.0
+        _publish(field, versions, boards, dead, published)
+        if attacks or field.alive != alive or field.player_kos != kos:
+            alive, kos = field.alive, field.player_kos
+            events.put((attacks, alive, kos))
+
+
+def _publish(field: RoyaleField, versions: np.ndarray, boards: np.ndarray, dead: np.ndarray,
+             published: np.ndarray) -> None:
+    """Copia los tableros que cambiaron desde la última publicación, con la versión impar mientras se escriben."""
+    for index in np.flatnonzero(field.versions != published):
+        versions[index] += 1
+        boards[index] = field.boards[index]
+        dead[index] = field.dead[index]
+        versions[index] += 1
+    published[:] = field.versions
@@ -0,0 +1,325 @@
+import queue
+import threading
+import time
+import multiprocessing as mp
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Any, TYPE_CHECKING
+from src.core.action import Action
+from src.core.board import Board
+from src.core.types import PieceShape
+from src.ai.evaluator import EvalWeights
+from src.ai.heuristic_bot import HeuristicBot
+from src.ai.priority import lower_priority
+
+if TYPE_CHECKING:
+    from src.core.gameboard_controller import GameBoardController
+    from src.core.types import PieceShapeType
+
+
+# Mensajes de control hacia el worker (además de los SearchRequest)
+_CANCEL = "cancel"
+_STOP   = "stop"
+
+
+@dataclass(frozen=True)
+class SearchRequest:
+    """Estado de la partida que el worker tiene que resolver."""
+    request_id: int
+    matrix:     np.ndarray
+    current:    str
+    hold:       str | None
+    preview:    tuple[str, ...]
+    can_hold:   bool
+    start:      tuple[int, int, int] | None
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """
+    Mejor jugada encontrada hasta una profundidad.
+
+    Attributes:
+        request_id: Pedido al que responde.
+        depth:      Jugadas miradas, contando la actual.
+        actions:    Inputs de la jugada, terminando en HARD_DROP.
+        score:      Valor de la jugada según la búsqueda.
+        elapsed:    Segundos desde que el worker tomó el pedido hasta este resultado.
+        final:      Si es la última profundidad que se va a buscar para el pedido.
+    """
+    request_id: int
+    depth:      int
+    actions:    tuple[Action, ...]
+    score:      float
+    elapsed:    float
+    final:      bool
+
+
+@dataclass
+class SearchStats:
+    """
+    Instrumentación de SearchService.
+
+    Attributes:
+        requests:   Pedidos enviados.
+        cancelled:  Pedidos reemplazados o cancelados antes de su última profundidad.
+        results:    Resultados recibidos del pedido vigente.
+        depths:     Cantidad de pedidos por profundidad alcanzada al cerrarlos.
+        worst_call: Peor tiempo (segundos) de submit/poll en el hilo del juego.
+        worst_first: Peor latencia (segundos) del worker hasta el primer resultado de un pedido.
+        fallbacks:  Pedidos resueltos en el hilo del juego porque el worker había terminado.
+    """
+    requests:    int   = 0
+    cancelled:   int   = 0
+    results:     int   = 0
+    fallbacks:   int   = 0
+    depths:      dict[int, int] = field(default_factory=dict)
+    worst_call:  float = 0.0
+    worst_first: float = 0.0
+
+
+class SearchService:
+    """
+    Búsqueda de jugadas en segundo plano, con resultados progresivos (anytime).
+
+    Un worker recibe el estado de la partida y corre HeuristicBot con profundidad creciente
+    (1, 2, ... hasta las piezas conocidas o `max_depth`), publicando la mejor jugada al terminar
+    cada profundidad. Entre profundidades revisa si llegó un pedido nuevo: si la pieza se bloqueó
+    o se usó el hold, el pedido viejo se abandona sin terminar.
+
+    El hilo del juego nunca espera: submit encola el pedido y poll solo vacía los resultados
+    que ya llegaron, así que su costo por frame es constante y queda registrado en `stats`.
+
+    Por defecto el worker es un proceso (con fork, para no volver a importar el módulo principal
+    del juego) con la menor prioridad del sistema, para que en una máquina de un solo núcleo
+    nunca le quite tiempo a un frame; donde fork no existe se usa un hilo, que comparte el GIL
+    con el juego.
+
+    Si el worker termina (se cayó o el sistema lo mató), poll resuelve el pedido vigente en el
+    hilo del juego con una búsqueda de profundidad 1, como el respaldo de ExternalBot cuando
+    el bot externo no responde.
+    """
+    def __init__(self,
+                 weights: EvalWeights | None = None,
+                 pieces: "PieceShapeType | None" = None,
+                 wall_kicks: bool = True,
+                 beam: int = 10,
+                 max_depth: int | None = None,
+                 process: bool | None = None) -> None:
+        """
+        Args:
+            weights: Pesos de la evaluación (los de EvalWeights por defecto).
+            pieces: Formas de las piezas. Si no se indica se construyen desde PIECE_DEFINITIONS.
+            wall_kicks: Si las rotaciones aplican wall kicks (como el ruleset activo).
+            beam: Tableros que pasan de cada jugada a la siguiente.
+            max_depth: Profundidad máxima; None para buscar hasta la última pieza del preview.
+            process: Si el worker es un proceso. None elige proceso solo si hay fork.
+
+        Raises:
+            ValueError: Si max_depth no es positivo.
+        """
+        if max_depth is not None and max_depth <= 0:
+            raise ValueError(f"SearchService: profundidad inválida ({max_depth}). Debe ser mayor que cero.")
+        if process is None:
+            process = "fork" in mp.get_all_start_methods()
+
+        weights = weights if weights is not None else EvalWeights()
+        # Solo los datos lógicos: las surfaces de pygame no viajan al worker
+        shapes = None if pieces is None else {
+            name: {key: data[key] for key in PieceShape.__required_keys__} for name, data in pieces.items()
+        }
+        args = (weights.as_array(), shapes, wall_kicks, beam, max_depth)
+        self._fallback_args = (weights, shapes, wall_kicks, beam)
+
+        if process:
+            context = mp.get_context("fork" if "fork" in mp.get_all_start_methods() else "spawn")
+            self._requests: Any = context.Queue()
+            self._results: Any  = context.Queue()
+            self._worker: Any   = context.Process(target=_process_main, args=(self._requests, self._results, *args),
+                                                  name="SearchService", daemon=True)
+        else:
+            self._requests = queue.Queue()
+            self._results  = queue.Queue()
+            self._worker   = threading.Thread(target=_search_loop, args=(self._requests, self._results, *args),
+                                              name="SearchService", daemon=True)
+        self._worker.start()
+
+        self.stats = SearchStats()
+        self._next_id = 0
+        self._current: int | None = None
+        self._request: SearchRequest | None = None
+        self._latest: SearchResult | None = None
+        self._fallback: HeuristicBot | None = None
+        self._boards: dict[tuple[int, int], Board] = {}
+
+    @classmethod
+    def for_controller(cls, controller: "GameBoardController", weights: EvalWeights | None = None,
+                       max_depth: int | None = None, process: bool | None = None) -> "SearchService":
+        """Crea un servicio con las mismas piezas y wall kicks que el controlador."""
+        return cls(weights, controller.pieces, controller.mechanics.wall_kicks,
+                   max_depth=max_depth, process=process)
+
+    @property
+    def latest(self) -> SearchResult | None:
+        """Último resultado recibido del pedido vigente (sin revisar la cola)."""
+        return self._latest
+
+    def submit(self, controller: "GameBoardController") -> int:
+        """
+        Pide una jugada para la pieza activa del controlador, reemplazando el pedido anterior.
+
+        Returns:
+            int: Identificador del pedido.
+        """
+        started = time.perf_counter()
+        piece = controller.piece
+        hold = controller.hold_piece
+        self._close_request()
+
+        self._next_id += 1
+        self._current = self._next_id
+        self._request = SearchRequest(
+            self._current, controller.board.matrix.copy(), piece.name, hold.name if hold else None,
+            tuple(controller.preview), controller.can_hold, (piece.row, piece.col, piece.rot),
+        )
+        self._requests.put(self._request)
+        self.stats.requests += 1
+        self._track(started)
+        return self._current
+
+    def poll(self) -> SearchResult | None:
+        """
+        Recoge sin bloquear los resultados que llegaron.
+
+        Returns:
+            SearchResult | None: El mejor resultado del pedido vigente hasta ahora, o None si todavía
+            no hay ninguno (o no hay pedido).
+        """
+        started = time.perf_counter()
+        while True:
+            try:
+                result: SearchResult = self._results.get_nowait()
+            except queue.Empty:
+                break
+            # Los resultados de pedidos reemplazados se descartan
+            if result.request_id != self._current:
+                continue
+            if self._latest is None:
+                self.stats.worst_first = max(self.stats.worst_first, result.elapsed)
+            self._latest = result
+            self.stats.results += 1
+        if self._current is not None and self._latest is None and not self._worker.is_alive():
+            self._latest = self._search_here(self._request)
+        self._track(started)
+        return self._latest
+
+    def cancel(self) -> None:
+        """Abandona el pedido vigente; el worker queda libre en cuanto termina la profundidad en curso."""
+        if self._current is None:
+            return
+        self._close_request()
+        self._requests.put(_CANCEL)
+
+    def close(self) -> None:
+        """Detiene el worker. El servicio no se puede volver a usar."""
+        if not self._worker.is_alive():
+            return
+        self._close_request()
+        self._requests.put(_STOP)
+        self._worker.join(timeout=1.0)
+        if isinstance(self._worker, mp.process.BaseProcess) and self._worker.is_alive():
+            self._worker.terminate()
+
+    # --- HELPERS ---
+    def _close_request(self) -> None:
+        """Registra la profundidad alcanzada por el pedido vigente y lo da por terminado."""
+        if self._current is None:
+            return
+        self.poll()
+        latest = self._latest
+        depth = latest.depth if latest is not None else 0
+        self.stats.depths[depth] = self.stats.depths.get(depth, 0) + 1
+        if latest is None or not latest.final:
+            self.stats.cancelled += 1
+        self._current = None
+        self._request = None
+        self._latest = None
+
+    def _search_here(self, request: SearchRequest) -> SearchResult:
+        """Resuelve el pedido en este hilo con profundidad 1 (el worker ya no responde)."""
+        if self._fallback is None:
+            weights, shapes, wall_kicks, beam = self._fallback_args
+            self._fallback = HeuristicBot(weights, shapes, wall_kicks, beam=beam)
+        results: queue.Queue = queue.Queue()
+        _search(self._fallback, self._boards, request, queue.Queue(), results, 1)
+        self.stats.fallbacks += 1
+        return results.get_nowait()
+
+    def _track(self, started: float) -> None:
+        self.stats.worst_call = max(self.stats.worst_call, time.perf_counter() - started)
+
+
+def _process_main(*args: Any) -> None:
+    """Punto de entrada del worker como proceso: baja su prioridad y atiende pedidos."""
+    lower_priority()
+    _search_loop(*args)
+
+
+def _search_loop(requests: Any, results: Any, weights: np.ndarray, pieces: "PieceShapeType | None",
+                 wall_kicks: bool, beam: int, max_depth: int | None) -> None:
+    """Bucle del worker: atiende pedidos hasta recibir _STOP."""
+    bot = HeuristicBot(EvalWeights.from_array(weights), pieces, wall_kicks, beam=beam)
+    boards: dict[tuple[int, int], Board] = {}
+
+    message = requests.get()
+    while not (isinstance(message, str) and message == _STOP):
+        if isinstance(message, SearchRequest):
+            message = _search(bot, boards, message, requests, results, max_depth)
+        if message is None or isinstance(message, str) and message == _CANCEL:
+            message = requests.get()
+
+
+def _search(bot: HeuristicBot, boards: dict[tuple[int, int], Board], request: SearchRequest,
+            requests: Any, results: Any, max_depth: int | None) -> Any:
+    """
+    Profundización iterativa de un pedido.
+
+    Returns:
+        El mensaje que interrumpió la búsqueda, o None si se completaron todas las profundidades.
+    """
+    started = time.perf_counter()
+    shape = request.matrix.shape
+    if shape not in boards:
+        boards[shape] = Board(*shape, animated=False)
+    board = boards[shape]
+    board.set_matrix(request.matrix)
+
+    last = len(request.preview) + 1
+    if max_depth is not None:
+        last = min(last, max_depth)
+    for depth in range(1, last + 1):
+        plan = bot.choose(board, request.current, request.hold, list(request.preview),
+                          request.can_hold, request.start, depth=depth)
+        # Sin posiciones alcanzables la pieza igual se suelta, como en BotInput
+        actions = tuple(plan.actions) if plan is not None else (Action.HARD_DROP,)
+        score = plan.score if plan is not None else -np.inf
+        results.put(SearchResult(request.request_id, depth, actions, score,
+                                 time.perf_counter() - started, depth == last))
+
+        message = _latest_message(requests)
+        if message is not None:
+            return message
+    return None
+
+
+def _latest_message(requests: Any) -> Any:
+    """Vacía la cola de pedidos sin bloquear y devuelve el mensaje más reciente (_STOP tiene prioridad)."""
+    message = None
+    while True:
+        try:
+            received = requests.get_nowait()
+        except queue.Empty:
+            return message
+        if isinstance(received, str) and received == _STOP:
+            return received
+        message = received
@@ -0,0 +1,79 @@
+import numpy as np
+from typing import TYPE_CHECKING
+from src.constants import PIECE_DEFINITIONS
+from src.core.batch_simulator import BatchSimulator
+from src.core.piece_bag import PieceBag
+from src.core.piece_shapes import build_piece_shapes
+from src.ai.evaluator import BoardEvaluator, EvalWeights, drop_all
+
+if TYPE_CHECKING:
+    from src.core.types import PieceShapeType
+    from src.config.gameplay import GameplayConfigType, GameplayRulesetType
+
+
+def play_games(weights: EvalWeights, seeds: "list[int] | np.ndarray", session_config: "GameplayConfigType",
+               ruleset: "GameplayRulesetType", max_pieces: int = 500,
+               pieces: "PieceShapeType | None" = None) -> np.ndarray:
+    """
+    Juega una partida sin render por semilla con una política de una jugada y devuelve sus líneas.
+
+    Todas las partidas avanzan juntas en un BatchSimulator: en cada paso, las partidas que tienen
+    la misma pieza activa se resuelven con una sola llamada a drop_all y una sola evaluación.
+    La partida i usa un PieceBag con la semilla seeds[i], así que dos juegos de pesos evaluados
+    con las mismas semillas ven exactamente las mismas piezas.
+
+    Args:
+        weights: Pesos de la evaluación.
+        seeds: Semilla de la bolsa de cada partida.
+        session_config: Configuración de gameplay.
+        ruleset: Ruleset de las partidas.
+        max_pieces: Piezas por partida como máximo (las que no pierden antes se cortan ahí).
+        pieces: Formas de las piezas. Si no se indica se construyen desde PIECE_DEFINITIONS.
+
+    Returns:
+        np.ndarray: Líneas eliminadas en cada partida.
+    """
+    shapes = pieces if pieces is not None else build_piece_shapes()
+    bag_size = session_config["general"]["bag_size"]
+    bags = [PieceBag(PIECE_DEFINITIONS, bag_size, seed=int(seed)) for seed in seeds]
+    sim = BatchSimulator(session_config, ruleset, len(bags), shapes, bags)
+    evaluator = BoardEvaluator(weights)
+
+    sim.start()
+    rots  = np.zeros(sim.num_games, dtype=np.int64)
+    targets = np.zeros(sim.num_games, dtype=np.int64)
+    for _ in range(max_pieces):
+        alive = np.flatnonzero(~sim.game_over)
+        if not alive.size:
+            break
+        greedy_drops(sim, evaluator, shapes, alive, rots, targets)
+        sim.step(rots, targets)
+    return sim.lines_total.copy()
+
+
+def greedy_drops(sim: BatchSimulator, evaluator: BoardEvaluator, shapes: "PieceShapeType",
+                 games: np.ndarray, rots: np.ndarray, cols: np.ndarray) -> None:
+    """
+    Elige la mejor caída de una jugada para la pieza activa de cada partida indicada.
+
+    Las partidas que tienen la misma pieza activa se resuelven con una sola llamada a drop_all
+    y una sola evaluación.
+
+    Args:
+        sim: Simulador con las partidas.
+        evaluator: Evaluación de los tableros resultantes.
+        shapes: Formas de las piezas del simulador.
+        games: Índices de las partidas a resolver.
+        rots, cols: Arreglos de una posición por partida donde se escribe la jugada elegida
+            (los argumentos de BatchSimulator.step).
+    """
+    _, rows, width = sim.boards.shape
+    active = sim.piece[games]
+    for piece_id in np.unique(active):
+        group = games[active == piece_id]
+        results, lines, valid, moves = drop_all(sim.boards[group], shapes[sim.piece_names[piece_id]])
+        scores = evaluator.evaluate(results.reshape(-1, rows, width), lines.reshape(-1)).reshape(valid.shape)
+        # Sin caídas válidas argmax elige la primera y la partida termina al bloquear
+        best = np.where(valid, scores, -np.inf).argmax(axis=1)
+        chosen = np.array(moves)[best]
+        rots[group], cols[group] = chosen[:, 0], chosen[:, 1]
@@ -0,0 +1,245 @@
+"""
+Entrenamiento de los pesos de BoardEvaluator por autojuego.
+
+Uso:
+    python -m src.ai.trainer --optimizer cmaes --generations 50 --workers 32
+    python -m src.ai.trainer --resume          # retoma desde el checkpoint
+"""
+import os
+import json
+import math
+import time
+import argparse
+import multiprocessing as mp
+import numpy as np
+from pathlib import Path
+from typing import Any, Callable, Iterator, TYPE_CHECKING
+from src.core.piece_shapes import build_piece_shapes
+from src.ai.evaluator import EvalWeights, FEATURES
+from src.ai.optimizers import WeightOptimizer, create_optimizer
+from src.ai.self_play import play_games
+
+if TYPE_CHECKING:
+    from multiprocessing.pool import Pool
+    from src.config.gameplay import GameplayConfigType
+
+
+# Rutas por defecto, relativas a la raíz del proyecto (sin pasar por src.util, que importa pygame)
+PROJECT_ROOT       = Path(__file__).resolve().parents[2]
+GAMEPLAY_CONFIG    = PROJECT_ROOT / "config" / "gameplay.json"
+DEFAULT_CHECKPOINT = PROJECT_ROOT / "training" / "checkpoint.json"
+
+# Estado de cada proceso del pool, cargado una sola vez por el initializer
+_worker_context: dict[str, Any] = {}
+
+
+class Trainer:
+    """
+    Ajusta EvalWeights con un WeightOptimizer jugando partidas sin render en un pool de procesos.
+
+    Cada generación sortea `games` semillas de PieceBag a partir de (seed, generación): todos los
+    candidatos de la generación juegan exactamente las mismas secuencias de piezas, así que sus
+    fitness se comparan sin ruido de sorteo. El fitness es el promedio de líneas por partida.
+
+    La evaluación se reparte en tareas (candidato, grupo de semillas) del tamaño justo para dar
+    varias tareas por proceso; cada tarea corre sus partidas en lote con play_games y devuelve
+    solo las líneas por partida como int32. Al terminar cada generación se guarda un checkpoint
+    JSON con el estado completo del optimizador, desde el que se puede retomar.
+    """
+    # Tareas por proceso en cada generación, para repartir bien aunque la población sea chica
+    TASKS_PER_WORKER = 4
+
+    def __init__(self,
+                 optimizer: WeightOptimizer,
+                 session_config: "GameplayConfigType",
+                 ruleset_name: str = "guideline",
+                 games: int = 16,
+                 max_pieces: int = 500,
+                 workers: int | None = None,
+                 seed: int = 0,
+                 checkpoint: Path | None = DEFAULT_CHECKPOINT) -> None:
+        """
+        Args:
+            optimizer: Optimizador de los pesos (ver create_optimizer).
+            session_config: Configuración de gameplay.
+            ruleset_name: Ruleset de las partidas de evaluación.
+            games: Partidas por candidato y generación.
+            max_pieces: Piezas por partida como máximo.
+            workers: Procesos del pool (todos los núcleos por defecto).
+            seed: Semilla de las secuencias de piezas.
+            checkpoint: Archivo del checkpoint; None para no guardar.
+
+        Raises:
+            ValueError: Si el ruleset no existe o el optimizador no tiene un peso por característica.
+        """
+        if ruleset_name not in session_config["rulesets"]:
+            raise ValueError(f"Trainer: ruleset '{ruleset_name}' no reconocido.")
+        if optimizer.dimension != len(FEATURES):
+            raise ValueError(f"Trainer: el optimizador tiene {optimizer.dimension} pesos, se esperaban {len(FEATURES)}.")
+        self.optimizer    = optimizer
+        self.config       = session_config
+        self.ruleset_name = ruleset_name
+        self.games        = games
+        self.max_pieces   = max_pieces
+        self.workers      = workers or os.cpu_count() or 1
+        self.seed         = seed
+        self.checkpoint   = checkpoint
+
+        self.history: list[dict[str, Any]] = []
+        self.best_weights: EvalWeights | None = None
+        self.best_fitness = -math.inf
+
+    @classmethod
+    def resume(cls, path: Path, session_config: "GameplayConfigType", workers: int | None = None) -> "Trainer":
+        """
+        Retoma un entrenamiento desde su checkpoint, con los mismos parámetros con los que empezó.
+
+        Raises:
+            FileNotFoundError: Si el checkpoint no existe.
+        """
+        with Path(path).open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        settings = data["settings"]
+        optimizer = create_optimizer(settings["optimizer"], len(FEATURES), settings["population"])
+        optimizer.set_state(data["optimizer"])
+
+        trainer = cls(optimizer, session_config, settings["ruleset"], settings["games"], settings["max_pieces"],
+                      workers, settings["seed"], Path(path))
+        trainer.history = data["history"]
+        if data["best"] is not None:
+            trainer.best_weights = EvalWeights.from_array(data["best"]["weights"])
+            trainer.best_fitness = data["best"]["fitness"]
+        return trainer
+
+    def seeds_for(self, generation: int) -> np.ndarray:
+        """Semillas de PieceBag de una generación (las mismas para todos sus candidatos)."""
+        return np.random.default_rng([self.seed, generation]).integers(0, 2 ** 62, self.games)
+
+    def run(self, generations: int, log: Callable[[str], None] = print) -> EvalWeights:
+        """
+        Corre `generations` generaciones más, guardando el checkpoint al final de cada una.
+
+        Returns:
+            EvalWeights: La mejor estimación de los pesos del optimizador.
+        """
+        context = mp.get_context("fork" if "fork" in mp.get_all_start_methods() else "spawn")
+        init_args = (self.config, self.config["rulesets"][self.ruleset_name], self.max_pieces)
+        with context.Pool(self.workers, initializer=_init_worker, initargs=init_args) as pool:
+            for _ in range(generations):
+                generation = self.optimizer.generation
+                started = time.perf_counter()
+                candidates = self.optimizer.ask()
+                fitness = self.evaluate(pool, candidates, self.seeds_for(generation))
+                self.optimizer.tell(candidates, fitness)
+                elapsed = time.perf_counter() - started
+
+                leader = int(np.argmax(fitness))
+                if fitness[leader] > self.best_fitness:
+                    self.best_fitness = float(fitness[leader])
+                    self.best_weights = EvalWeights.from_array(candidates[leader])
+                self.history.append({
+                    "generation": generation,
+                    "best":       float(fitness[leader]),
+                    "mean":       float(fitness.mean()),
+                    "seconds":    elapsed,
+                })
+                if self.checkpoint is not None:
+                    self.save(self.checkpoint)
+
+                played = len(candidates) * self.games
+                log(f"gen {generation:>4}  mejor {fitness[leader]:8.1f}  media {fitness.mean():8.1f}  "
+                    f"{played / elapsed:7.1f} partidas/s")
+        return EvalWeights.from_array(self.optimizer.best())
+
+    def evaluate(self, pool: "Pool", candidates: np.ndarray, seeds: np.ndarray) -> np.ndarray:
+        """Devuelve el fitness de cada candidato, jugando todas sus partidas en el pool."""
+        lines = np.zeros((len(candidates), len(seeds)), dtype=np.int64)
+        for index, offset, result in pool.imap_unordered(_play_task, self._tasks(candidates, seeds)):
+            values = np.frombuffer(result, dtype=np.int32)
+            lines[index, offset:offset + len(values)] = values
+        return lines.mean(axis=1)
+
+    def save(self, path: Path) -> None:
+        """Guarda el checkpoint de forma atómica (archivo temporal y reemplazo)."""
+        data = {
+            "settings": {
+                "optimizer":  self.optimizer.name,
+                "population": self.optimizer.population,
+                "ruleset":    self.ruleset_name,
+                "games":      self.games,
+                "max_pieces": self.max_pieces,
+                "seed":       self.seed,
+            },
+            "optimizer": self.optimizer.get_state(),
+            "history":   self.history,
+            "best": None if self.best_weights is None else {
+                "weights": self.best_weights.as_array().tolist(),
+                "fitness": self.best_fitness,
+            },
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_suffix(path.suffix + ".tmp")
+        with temp.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(temp, path)
+
+    # --- HELPERS ---
+    def _tasks(self, candidates: np.ndarray, seeds: np.ndarray) -> Iterator[tuple]:
+        """Divide la evaluación en tareas (candidato, desde, pesos, semillas)."""
+        wanted = self.workers * self.TASKS_PER_WORKER
+        groups = max(1, min(len(seeds), math.ceil(wanted / len(candidates))))
+        size = math.ceil(len(seeds) / groups)
+        for index, weights in enumerate(candidates):
+            for offset in range(0, len(seeds), size):
+                yield index, offset, weights.tolist(), seeds[offset:offset + size].tolist()
+
+
+def _init_worker(session_config: "GameplayConfigType", ruleset: dict, max_pieces: int) -> None:
+    """Prepara el contexto de un proceso del pool: configuración y formas de las piezas."""
+    _worker_context.update(config=session_config, ruleset=ruleset, max_pieces=max_pieces,
+                           pieces=build_piece_shapes())
+
+
+def _play_task(task: tuple[int, int, list[float], list[int]]) -> tuple[int, int, bytes]:
+    """Juega las partidas de una tarea y devuelve (candidato, desde, líneas por partida en int32)."""
+    index, offset, weights, seeds = task
+    lines = play_games(EvalWeights.from_array(weights), seeds, _worker_context["config"],
+                       _worker_context["ruleset"], _worker_context["max_pieces"], _worker_context["pieces"])
+    return index, offset, lines.astype(np.int32).tobytes()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.ai.trainer", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--optimizer", default="cmaes", help="ga o cmaes")
+    parser.add_argument("--generations", type=int, default=50)
+    parser.add_argument("--population", type=int, default=16)
+    parser.add_argument("--games", type=int, default=16, help="partidas por candidato y generación")
+    parser.add_argument("--max-pieces", type=int, default=500)
+    parser.add_argument("--ruleset", default="guideline")
+    parser.add_argument("--workers", type=int, default=None, help="procesos del pool (todos los núcleos por defecto)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--checkpoint", type=Path, default=DEFAULT_CHECKPOINT)
+    parser.add_argument("--resume", action="store_true", help="retoma desde --checkpoint")
+    args = parser.parse_args(argv)
+
+    with GAMEPLAY_CONFIG.open("r", encoding="utf-8") as f:
+        config = json.load(f)
+
+    if args.resume:
+        trainer = Trainer.resume(args.checkpoint, config, args.workers)
+        print(f"Retomando desde la generación {trainer.optimizer.generation} ({args.checkpoint})")
+    else:
+        optimizer = create_optimizer(args.optimizer, len(FEATURES), args.population, args.seed,
+                                     initial=EvalWeights().as_array())
+        trainer = Trainer(optimizer, config, args.ruleset, args.games, args.max_pieces,
+                          args.workers, args.seed, args.checkpoint)
+
+    weights = trainer.run(args.generations)
+    print(f"\nPesos: {weights}")
+    if trainer.best_weights is not None:
+        print(f"Mejor candidato evaluado ({trainer.best_fitness:.1f} líneas): {trainer.best_weights}")
+
+
+if __name__ == "__main__":
+    main()
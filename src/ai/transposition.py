@@ -0,0 +1,212 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import NamedTuple
+
+
+# Políticas de reemplazo cuando el slot de una clave ya está ocupado por otra
+REPLACEMENT_POLICIES = ("depth", "always")
+
+
+class TTEntry(NamedTuple):
+    """Entrada encontrada en la tabla."""
+    depth: int
+    value: float
+    move:  int
+
+
+@dataclass
+class TTStats:
+    """
+    Contadores de uso de TranspositionTable.
+
+    Attributes:
+        probes:    Consultas.
+        hits:      Consultas con la clave presente y profundidad suficiente.
+        shallow:   Consultas con la clave presente pero buscada a menos profundidad.
+        stores:    Entradas escritas (nuevas, actualizadas o reemplazos).
+        replaced:  Escrituras que pisaron la entrada de otra clave.
+        rejected:  Escrituras descartadas por la política de reemplazo.
+    """
+    probes:   int = 0
+    hits:     int = 0
+    shallow:  int = 0
+    stores:   int = 0
+    replaced: int = 0
+    rejected: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.probes if self.probes else 0.0
+
+
+class TranspositionTable:
+    """
+    Tabla de transposición acotada, indexada por hash de Zobrist.
+
+    Cada clave ocupa el slot `key & (size - 1)`; se guarda la clave completa para descartar
+    colisiones de índice. Las entradas viven en arreglos NumPy paralelos, así que la memoria
+    es fija desde la construcción (ver memory_bytes) y no crece durante la búsqueda.
+
+    Políticas de reemplazo cuando el slot tiene otra clave:
+        - "depth":  depth-preferred; solo se reemplaza una entrada de igual o menor profundidad,
+          o una de una búsqueda anterior (ver new_search).
+        - "always": la entrada nueva siempre pisa a la anterior.
+    """
+    # Bytes por entrada: clave (8), valor (8), jugada (4), profundidad (2) y edad (1)
+    ENTRY_BYTES = 23
+
+    def __init__(self, size: int = 1 << 16, policy: str = "depth") -> None:
+        """
+        Args:
+            size: Cantidad de entradas; se redondea hacia arriba a una potencia de dos.
+            policy: Política de reemplazo ("depth" o "always").
+
+        Raises:
+            ValueError: Si el tamaño no es positivo o la política no existe.
+        """
+        if size <= 0:
+            raise ValueError(f"TranspositionTable: tamaño inválido ({size}). Debe ser mayor que cero.")
+        if policy not in REPLACEMENT_POLICIES:
+            raise ValueError(f"TranspositionTable: política '{policy}' no reconocida ({', '.join(REPLACEMENT_POLICIES)}).")
+
+        size = 1 << (size - 1).bit_length()
+        self.size   = size
+        self.policy = policy
+        self._mask  = size - 1
+
+        self._keys   = np.zeros(size, dtype=np.uint64)
+        self._values = np.zeros(size, dtype=np.float64)
+        self._moves  = np.zeros(size, dtype=np.int32)
+        self._depths = np.full(size, -1, dtype=np.int16)   # -1 = slot vacío
+        self._ages   = np.zeros(size, dtype=np.uint8)
+        self._age    = 0
+        self.stats   = TTStats()
+
+    @classmethod
+    def with_memory(cls, megabytes: float, policy: str = "depth") -> "TranspositionTable":
+        """Crea la tabla más grande (potencia de dos) que entra en `megabytes`."""
+        entries = max(1, int(megabytes * (1 << 20) // cls.ENTRY_BYTES))
+        return cls(1 << (entries.bit_length() - 1), policy)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Memoria ocupada por las entradas."""
+        return sum(a.nbytes for a in (self._keys, self._values, self._moves, self._depths, self._ages))
+
+    @property
+    def filled(self) -> int:
+        """Slots ocupados."""
+        return int(np.count_nonzero(self._depths >= 0))
+
+    @property
+    def fill_rate(self) -> float:
+        return self.filled / self.size
+
+    def probe(self, key: int, depth: int = 0) -> TTEntry | None:
+        """
+        Busca una clave.
+
+        Args:
+            key: Hash de Zobrist del estado.
+            depth: Profundidad mínima que debe tener la entrada para servir.
+
+        Returns:
+            TTEntry | None: La entrada, o None si no está o se buscó a menos profundidad.
+        """
+        self.stats.probes += 1
+        slot = key & self._mask
+        stored = int(self._depths[slot])
+        if stored < 0 or int(self._keys[slot]) != key:
+            return None
+        if stored < depth:
+            self.stats.shallow += 1
+            return None
+        self.stats.hits += 1
+        return TTEntry(stored, float(self._values[slot]), int(self._moves[slot]))
+
+    def store(self, key: int, depth: int, value: float, move: int = -1) -> bool:
+        """
+        Guarda el resultado de buscar un estado.
+
+        Args:
+            key: Hash de Zobrist del estado.
+            depth: Profundidad con la que se buscó.
+            value: Valor encontrado.
+            move: Mejor jugada codificada como entero (-1 si no aplica).
+
+        Returns:
+            bool: False si la política de reemplazo conservó la entrada anterior.
+        """
+        slot = key & self._mask
+        stored = int(self._depths[slot])
+        other = stored >= 0 and int(self._keys[slot]) != key
+        if (other and self.policy == "depth" and stored > depth and self._ages[slot] == self._age):
+            self.stats.rejected += 1
+            return False
+
+        self.stats.stores += 1
+        if other:
+            self.stats.replaced += 1
+        self._keys[slot]   = key
+        self._values[slot] = value
+        self._moves[slot]  = move
+        self._depths[slot] = depth
+        self._ages[slot]   = self._age
+        return True
+
+    def probe_many(self, keys: np.ndarray, depth: int = 0) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Versión en lote de probe, para claves uint64.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: (encontradas, valores); los valores de las claves no
+            encontradas no tienen sentido.
+        """
+        slots = (keys & np.uint64(self._mask)).astype(np.int64)
+        stored = self._depths[slots]
+        present = (stored >= 0) & (self._keys[slots] == keys)
+        found = present & (stored >= depth)
+        self.stats.probes  += len(keys)
+        self.stats.hits    += int(np.count_nonzero(found))
+        self.stats.shallow += int(np.count_nonzero(present & ~found))
+        return found, self._values[slots]
+
+    def store_many(self, keys: np.ndarray, depth: int, values: np.ndarray) -> None:
+        """
+        Versión en lote de store, para claves uint64 distintas entre sí.
+
+        Si dos claves caen en el mismo slot queda la última.
+        """
+        slots = (keys & np.uint64(self._mask)).astype(np.int64)
+        stored = self._depths[slots]
+        other = (stored >= 0) & (self._keys[slots] != keys)
+        keep = np.ones(len(keys), dtype=bool)
+        if self.policy == "depth":
+            keep = ~(other & (stored > depth) & (self._ages[slots] == self._age))
+
+        written = int(np.count_nonzero(keep))
+        self.stats.rejected += len(keys) - written
+        self.stats.stores   += written
+        self.stats.replaced += int(np.count_nonzero(other & keep))
+        slots = slots[keep]
+        self._keys[slots]   = keys[keep]
+        self._values[slots] = values[keep]
+        self._moves[slots]  = -1
+        self._depths[slots] = depth
+        self._ages[slots]   = self._age
+
+    def new_search(self) -> None:
+        """
+        Marca el comienzo de otra búsqueda: las entradas anteriores siguen sirviendo, pero con
+        la política "depth" ya se pueden reemplazar aunque sean más profundas.
+        """
+        self._age = (self._age + 1) % 256
+
+    def clear(self) -> None:
+        """Vacía la tabla y reinicia los contadores."""
+        self._depths[:] = -1
+        self._age = 0
+        self.stats = TTStats()
+
+    def __len__(self) -> int:
+        return self.filled
@@ -1,3 +1,3 @@
-from src.config.gameplay.general_types import GameplayConfigType, GameplayGeneralType, GameplayRulesetType, GameplayScoreType
+from src.config.gameplay.general_types import GameplayConfigType, GameplayGeneralType, GameplayNetworkType, GameplayRulesetType, GameplayScoreType
 from src.config.gameplay.lock_types import GameplayLockType, AutoLockType, FixedLockType, ResettableLockType
 from src.config.gameplay.gravity_types import GameplayGravityType, FixedGravityType, ForLevelsGravityType, ExponentialGravityType
\ No newline at end of file
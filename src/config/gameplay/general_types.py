@@ -7,6 +7,16 @@ class GameplayGeneralType(TypedDict):
     lines_per_level: int
     bag_size: int
     preview_count: int
+    board_backend: str
+    bot_command: list[str] | None   # bot externo del modo demo (ver ExternalBot); None usa HeuristicBot
+
+class GameplayNetworkType(TypedDict):
+    player: int         # 0 o 1, distinto en cada peer
+    bind_port: int
+    peer_host: str
+    peer_port: int
+    input_delay: int
+    seed: int           # igual en ambos peers
 
 class GameplayRulesetType(TypedDict):
     display_name: str
@@ -27,6 +37,7 @@ class GameplayScoreType(TypedDict):
 
 class GameplayConfigType(TypedDict):
     general: GameplayGeneralType
+    network: GameplayNetworkType
     rulesets: dict[str, GameplayRulesetType]  # Porque puede haber múltiples reglas
     score: GameplayScoreType
     gravity_types: GameplayGravityType
@@ -1 +1 @@
-from src.constants.tetris_values import PIECE_DEFINITIONS, NUM_TO_PIECE, BLOCK_W, BLOCK_H, BLOCK_SIZE, BLOCK_PW, BLOCK_PH, BLOCK_PADDING, ROWS, COLS, BOARD_W, BOARD_H, BOARD_SIZE, BOARD_X, BOARD_Y, BOARD_POS, SCREEN_W, SCREEN_H, SCREEN_SIZE, SCREEN_CENTER_W, SCREEN_CENTER_H, SCREEN_CENTER, WALL_KICKS, WALL_KICKS_I, WALL_KICKS_OTHERS, MAX_RECORDS, PIECE_SPAWN_OFFSET, HOLD_X, HOLD_Y
\ No newline at end of file
+from src.constants.tetris_values import PIECE_DEFINITIONS, NUM_TO_PIECE, GARBAGE_BLOCK, BLOCK_W, BLOCK_H, BLOCK_SIZE, BLOCK_PW, BLOCK_PH, BLOCK_PADDING, ROWS, COLS, BOARD_W, BOARD_H, BOARD_SIZE, BOARD_X, BOARD_Y, BOARD_POS, SCREEN_W, SCREEN_H, SCREEN_SIZE, SCREEN_CENTER_W, SCREEN_CENTER_H, SCREEN_CENTER, WALL_KICKS, WALL_KICKS_I, WALL_KICKS_OTHERS, MAX_RECORDS, PIECE_SPAWN_OFFSET, HOLD_X, HOLD_Y
\ No newline at end of file
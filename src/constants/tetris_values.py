@@ -93,6 +93,9 @@ NUM_TO_PIECE = {
     7: "O",
 }
 
+# Valor de las celdas de basura del modo versus (no corresponde a ninguna pieza)
+GARBAGE_BLOCK = 8
+
 # Wall Kicks para J, L, S, T, Z (3x3)
 WALL_KICKS_OTHERS = {
     (0, 1): [(0, 0), (-1, 0), (-1, +1), (0, -2), (-1, -2)],  # 0->R
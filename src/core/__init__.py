@@ -1,22 +1,52 @@
-from src.core.types import PieceData, BlockSurfaces, PieceSurfaces, PiecesPreviewType, BoardType, PieceDataType
-from src.core.board import Board
+from src.core.types import PieceData, BlockSurfaces, PieceSurfaces, PieceDataType, PieceShape, PieceShapeType, PieceBagState
+from src.core.action import Action
+from src.core.board import Board, BoardSnapshot
+from src.core.bitboard import BitBoard
+from src.core.board_factory import create_board
 from src.core.piece import Piece
 from src.core.piece_bag import PieceBag
 from src.core.piece_mechanics import PieceMechanics
+from src.core.piece_shapes import build_piece_shapes
 from src.core.score import Score
-from src.core.gameboard_controller import GameBoardController
+from src.core.gameboard_controller import GameSnapshot, GameBoardController
+from src.core.batch_simulator import BatchSimulator
+from src.core.placement_finder import Placement, PlacementFinder
+from src.core.versus import attack_lines, cancel_garbage, take_garbage, VersusStats, VersusMatch
+from src.core.zobrist import mix64, name_id, zobrist_key, cell_keys, hash_matrix, hash_boards, state_hash
 
 __all__ = [
     "PieceData",
     "BlockSurfaces",
     "PieceSurfaces",
-    "PiecesPreviewType",
-    "BoardType",
     "PieceDataType",
+    "PieceShape",
+    "PieceShapeType",
+    "PieceBagState",
+    "Action",
     "Board",
+    "BoardSnapshot",
+    "BitBoard",
+    "create_board",
     "Piece",
     "PieceBag",
     "PieceMechanics",
+    "build_piece_shapes",
     "Score",
+    "GameSnapshot",
     "GameBoardController",
-]
\ No newline at end of file
+    "BatchSimulator",
+    "Placement",
+    "PlacementFinder",
+    "attack_lines",
+    "cancel_garbage",
+    "take_garbage",
+    "VersusStats",
+    "VersusMatch",
+    "mix64",
+    "name_id",
+    "zobrist_key",
+    "cell_keys",
+    "hash_matrix",
+    "hash_boards",
+    "state_hash",
+]
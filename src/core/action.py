@@ -0,0 +1,16 @@
+from enum import IntEnum
+
+
+class Action(IntEnum):
+    """
+    Acciones de input que acepta GameBoardController.
+
+    Los valores son estables: se guardan tal cual en los replays.
+    """
+    MOVE_LEFT    = 0
+    MOVE_RIGHT   = 1
+    SOFT_DROP    = 2
+    ROTATE_RIGHT = 3
+    ROTATE_LEFT  = 4
+    HARD_DROP    = 5
+    HOLD         = 6
@@ -0,0 +1,546 @@
+import numpy as np
+from typing import TYPE_CHECKING
+from src.constants import PIECE_DEFINITIONS, ROWS, COLS, PIECE_SPAWN_OFFSET, WALL_KICKS, GARBAGE_BLOCK
+from src.core.action import Action
+from src.core.piece_bag import PieceBag
+from src.core.piece_shapes import build_piece_shapes
+from src.core.strategy import create_gravity, create_lock
+
+if TYPE_CHECKING:
+    from src.core.types import PieceShapeType
+    from src.config.gameplay import GameplayRulesetType, GameplayConfigType
+
+
+class BatchSimulator:
+    """
+    Simula N partidas independientes a la vez con operaciones vectorizadas de NumPy.
+
+    Cada paso coloca una pieza por partida. La acción (rot, col) se aplica exactamente como
+    lo haría un jugador sobre GameBoardController: `rot` rotaciones horarias con los wall
+    kicks del ruleset, desplazamientos de una columna hacia `col` hasta llegar o chocar,
+    y hard drop. Bloqueo, detección de filas completas, compactación y puntaje se
+    resuelven en lote, con las mismas reglas que Board, PieceMechanics y Score.
+
+    Con `press` las partidas avanzan de a una tecla (Action) sobre la pieza activa, cuya
+    posición queda en `rot`, `row` y `col`; `step` y `press` se pueden alternar. Como en
+    GameBoardController, una T que se bloquea con una rotación como última acción se puntúa
+    como T-spin o mini T-spin según Board.detect_t_spin (con hard drop la jugada es normal).
+
+    El estado vive en arreglos paralelos: tableros (N, ROWS, COLS) uint8, pieza activa,
+    hold, cola de próximas piezas (llenada desde un PieceBag por partida) y puntajes.
+    """
+    QUEUE_SIZE = 64
+
+    # Tipos de jugada al bloquear (los move_type de Score)
+    MOVE_NORMAL, MOVE_T_SPIN, MOVE_MINI_T_SPIN = 0, 1, 2
+    _FRONT_CORNERS = np.array([[0, 1], [1, 3], [2, 3], [0, 2]])
+
+    def __init__(self,
+                 session_config: "GameplayConfigType",
+                 ruleset: "GameplayRulesetType",
+                 num_games: int,
+                 pieces: "PieceShapeType | None" = None,
+                 bags: list[PieceBag] | None = None,
+                 seed: int | None = None) -> None:
+        """
+        Args:
+            session_config: Configuración de gameplay.
+            ruleset: Ruleset activo (hold y wall kicks).
+            num_games: Cantidad de partidas simultáneas.
+            pieces: Formas de las piezas. Si no se indica se construyen desde PIECE_DEFINITIONS.
+            bags: Un PieceBag por partida. Si no se indica se crea uno nuevo por partida.
+            seed: Semilla base de las bolsas creadas; la partida i usa seed + i.
+        """
+        if num_games <= 0:
+            raise ValueError(f"BatchSimulator: cantidad de partidas inválida ({num_games}).")
+        if bags is not None and len(bags) != num_games:
+            raise ValueError(f"BatchSimulator: se esperaban {num_games} bolsas, se recibieron {len(bags)}.")
+
+        # Se validan las estrategias igual que en GameBoardController; al colocar piezas con
+        # hard drop no transcurre tiempo, por lo que gravedad y lock no alteran el resultado.
+        self._gravity = create_gravity(ruleset, session_config)
+        self._lock    = create_lock(ruleset, session_config)
+        # Sin lock delay (lock "auto") la pieza se bloquea apenas queda apoyada, también con press
+        self._instant_lock = self._lock.delay <= 0
+
+        self._config       = session_config
+        self._hold_enabled = ruleset.get("hold", False)
+        self._wall_kicks   = ruleset.get("wall_kicks", False)
+        self.num_games     = num_games
+        self.rows          = ROWS
+        self.cols          = COLS
+
+        shapes = pieces if pieces is not None else build_piece_shapes()
+        self.piece_names: list[str] = list(shapes)
+        self._build_tables(shapes)
+
+        bag_size = session_config["general"]["bag_size"]
+        if bags is None:
+            bags = [PieceBag(PIECE_DEFINITIONS, bag_size, seed=None if seed is None else seed + i)
+                    for i in range(num_games)]
+        self._bags = bags
+        self._name_to_id = {name: i for i, name in enumerate(self.piece_names)}
+
+        n = num_games
+        self.boards    = np.zeros((n, ROWS, COLS), dtype=np.uint8)
+        self.piece     = np.zeros(n, dtype=np.int8)
+        self.hold      = np.full(n, -1, dtype=np.int8)
+        self.can_hold  = np.zeros(n, dtype=bool)
+        self.game_over = np.zeros(n, dtype=bool)
+
+        # Posición de la pieza activa (la usa press; step coloca siempre desde el spawn)
+        self.rot   = np.zeros(n, dtype=np.int64)
+        self.row   = np.full(n, PIECE_SPAWN_OFFSET, dtype=np.int64)
+        self.col   = np.zeros(n, dtype=np.int64)
+        self._soft = np.zeros(n, dtype=np.int64)
+        # Si la última acción aplicada fue una rotación (para detectar T-spins, como el controlador)
+        self._rotated = np.zeros(n, dtype=bool)
+
+        self._queue = np.zeros((n, self.QUEUE_SIZE), dtype=np.int8)
+        self._head  = np.full(n, self.QUEUE_SIZE, dtype=np.int64)
+
+        # Puntaje (mismos campos que Score)
+        self.score           = np.zeros(n, dtype=np.int64)
+        self.level           = np.full(n, session_config["general"]["starting_level"], dtype=np.int64)
+        self.lines_total     = np.zeros(n, dtype=np.int64)
+        self.tetrises        = np.zeros(n, dtype=np.int64)
+        self.combo_count     = np.zeros(n, dtype=np.int64)
+        self.back_to_back    = np.zeros(n, dtype=bool)
+        self.last_lines      = np.zeros(n, dtype=np.int64)
+        self.last_score_gain = np.zeros(n, dtype=np.int64)
+
+        self._all = np.arange(n)
+        self._refill(self._all)
+
+    # --- CICLO ---
+    def start(self) -> None:
+        """Genera la primera pieza de cada partida."""
+        self._spawn(self._all)
+
+    def reset(self, games: np.ndarray | None = None) -> None:
+        """
+        Reinicia las partidas indicadas (todas por defecto) y genera su primera pieza.
+
+        La cola de piezas no se descarta: la partida reiniciada continúa la secuencia de su bolsa.
+
+        Args:
+            games: Índices de las partidas a reiniciar.
+        """
+        games = self._all if games is None else np.asarray(games, dtype=np.int64)
+        self.boards[games] = 0
+        self.hold[games] = -1
+        self.game_over[games] = False
+        self.score[games] = 0
+        self.level[games] = self._config["general"]["starting_level"]
+        self.lines_total[games] = 0
+        self.tetrises[games] = 0
+        self.combo_count[games] = 0
+        self.back_to_back[games] = False
+        self._rotated[games] = False
+        self._spawn(games)
+
+    def step(self, rots: np.ndarray, cols: np.ndarray, hold: np.ndarray | None = None,
+             games: np.ndarray | None = None) -> np.ndarray:
+        """
+        Coloca una pieza en cada partida activa.
+
+        Args:
+            rots: Rotaciones horarias a aplicar desde el spawn (0-3), una por partida.
+            cols: Columna objetivo (Piece.col, origen de la matriz de la pieza), una por partida.
+            hold: Si se usa el hold antes de colocar, uno por partida (opcional).
+            games: Índices (ordenados) de las partidas que colocan pieza; el resto no avanza.
+                Todas por defecto.
+
+        Returns:
+            np.ndarray: Líneas eliminadas por partida en este paso (0 en partidas terminadas).
+        """
+        self.last_lines[:] = 0
+        self.last_score_gain[:] = 0
+
+        if games is None:
+            alive = np.flatnonzero(~self.game_over)
+        else:
+            games = np.asarray(games, dtype=np.int64)
+            alive = games[~self.game_over[games]]
+        if alive.size == 0:
+            return self.last_lines.copy()
+
+        if hold is not None and self._hold_enabled:
+            self._apply_hold(alive[np.asarray(hold, dtype=bool)[alive] & self.can_hold[alive]])
+
+        rots = np.asarray(rots, dtype=np.int64)[alive]
+        targets = np.asarray(cols, dtype=np.int64)[alive]
+        pieces = self.piece[alive].astype(np.int64)
+
+        rot = np.zeros(alive.size, dtype=np.int64)
+        row = np.full(alive.size, PIECE_SPAWN_OFFSET, dtype=np.int64)
+        col = self._spawn_col[pieces].copy()
+
+        self._rotate(alive, pieces, rots, rot, row, col)
+        self._shift(alive, pieces, targets, rot, row, col)
+        ghost = self._drop_rows(alive, pieces, rot, row, col)
+
+        self._lock_pieces(alive, pieces, rot, ghost, col)
+        lines = self._clear_lines(alive)
+        # Los puntos de soft drop que dejó press con esta pieza se suman al bloquear, como en press
+        self._update_score(alive, lines, np.maximum(0, ghost - np.maximum(row, 0)), self._soft[alive])
+
+        self._rotated[alive] = False
+        self._spawn(alive)
+        return self.last_lines.copy()
+
+    def press(self, keys: np.ndarray, fall: np.ndarray | None = None) -> np.ndarray:
+        """
+        Aplica una tecla por partida activa sobre la pieza activa, como GameBoardController.perform.
+
+        En la simulación por teclas no transcurre tiempo, así que el lock delay se reemplaza por
+        bloquear la pieza cuando SOFT_DROP o la caída por gravedad no pueden bajarla; sin lock
+        delay se bloquea apenas queda apoyada. Los puntos
+        de soft drop se acumulan y se suman al bloquear, como en Score.
+
+        Args:
+            keys: Valor de Action por partida; cualquier otro valor no mueve la pieza.
+            fall: Si la pieza baja además una fila por gravedad después de la tecla, uno por partida.
+
+        Returns:
+            np.ndarray: Líneas eliminadas por partida en este paso (0 si no se bloqueó ninguna pieza).
+        """
+        self.last_lines[:] = 0
+        self.last_score_gain[:] = 0
+
+        alive = np.flatnonzero(~self.game_over)
+        if alive.size == 0:
+            return self.last_lines.copy()
+        keys = np.asarray(keys, dtype=np.int64)[alive]
+
+        if self._hold_enabled:
+            self._apply_hold(alive[(keys == Action.HOLD) & self.can_hold[alive]])
+
+        for key, dc in ((Action.MOVE_LEFT, -1), (Action.MOVE_RIGHT, 1)):
+            games = alive[keys == key]
+            if games.size:
+                pieces = self.piece[games].astype(np.int64)
+                ok = self._valid(games, pieces, self.rot[games], self.row[games], self.col[games] + dc)
+                self.col[games[ok]] += dc
+                self._rotated[games[ok]] = False
+
+        for key, direction in ((Action.ROTATE_RIGHT, 1), (Action.ROTATE_LEFT, -1)):
+            games = alive[keys == key]
+            if games.size:
+                rot, row, col = self.rot[games], self.row[games], self.col[games]
+                self._rotate(games, self.piece[games].astype(np.int64), np.ones(games.size, dtype=np.int64),
+                             rot, row, col, direction)
+                self._rotated[games[rot != self.rot[games]]] = True
+                self.rot[games], self.row[games], self.col[games] = rot, row, col
+
+        lock = keys == Action.HARD_DROP
+        hard = np.zeros(alive.size, dtype=np.int64)
+        if lock.any():
+            games = alive[lock]
+            ghost = self._drop_rows(games, self.piece[games].astype(np.int64),
+                                    self.rot[games], self.row[games], self.col[games])
+            hard[lock] = np.maximum(0, ghost - np.maximum(self.row[games], 0))
+            self.row[games] = ghost
+            self._rotated[games] = False
+
+        soft = keys == Action.SOFT_DROP
+        lock |= self._fall(alive, soft & ~lock)
+        self._soft[alive[soft & ~lock]] += 1
+        self._rotated[alive[soft & ~lock]] = False
+        if fall is not None:
+            lock |= self._fall(alive, np.asarray(fall, dtype=bool)[alive] & ~lock)
+        if self._instant_lock:
+            resting = alive[~lock]
+            lock[~lock] = ~self._valid(resting, self.piece[resting].astype(np.int64),
+                                      self.rot[resting], self.row[resting] + 1, self.col[resting])
+
+        games = alive[lock]
+        if games.size:
+            pieces = self.piece[games].astype(np.int64)
+            moves = self._detect_t_spin(games, pieces)
+            self._lock_pieces(games, pieces, self.rot[games], self.row[games], self.col[games])
+            lines = self._clear_lines(games)
+            self._update_score(games, lines, hard[lock], self._soft[games], moves)
+            self._rotated[games] = False
+            self._spawn(games)
+        return self.last_lines.copy()
+
+    def insert_garbage(self, games: np.ndarray, counts: np.ndarray, holes: np.ndarray) -> np.ndarray:
+        """
+        Sube el contenido de los tableros indicados y agrega filas de basura abajo (ver Board.insert_garbage).
+
+        Las filas se desplazan dentro del mismo arreglo de tableros. Las partidas en las que algún
+        bloque sale por arriba, o cuya pieza activa queda superpuesta con el tablero, terminan.
+
+        Args:
+            games: Índices de las partidas.
+            counts: Filas de basura de cada una.
+            holes: Columna vacía de las filas de basura de cada una.
+
+        Returns:
+            np.ndarray: Por partida indicada, si algún bloque salió por arriba del tablero.
+        """
+        games = np.asarray(games, dtype=np.int64)
+        overflow = np.zeros(games.size, dtype=bool)
+        for index, (game, count, hole) in enumerate(zip(games, counts, holes)):
+            count = min(int(count), self.rows)
+            if count <= 0 or self.game_over[game]:
+                continue
+            board = self.boards[game]
+            overflow[index] = board[:count].any()
+            board[:self.rows - count] = board[count:]
+            board[self.rows - count:] = GARBAGE_BLOCK
+            board[self.rows - count:, hole] = 0
+        self.game_over[games[overflow]] = True
+
+        alive = games[~self.game_over[games]]
+        if alive.size:
+            blocked = ~self._valid(alive, self.piece[alive].astype(np.int64),
+                                   self.rot[alive], self.row[alive], self.col[alive])
+            self.game_over[alive[blocked]] = True
+        return overflow
+
+    def preview(self, count: int) -> np.ndarray:
+        """Devuelve (N, count) con los ids de las próximas piezas de cada partida."""
+        if count > self.QUEUE_SIZE // 2:
+            raise ValueError(f"BatchSimulator: preview demasiado grande ({count}).")
+        self._refill(np.flatnonzero(self._head > self.QUEUE_SIZE - count))
+        return self._queue[self._all[:, None], self._head[:, None] + np.arange(count)]
+
+    def active_cells(self) -> tuple[np.ndarray, np.ndarray]:
+        """Devuelve (filas, columnas), cada una (N, 4), de los bloques de la pieza activa de cada partida."""
+        pieces = self.piece.astype(np.int64)
+        return (self.row[:, None] + self._dr[pieces, self.rot],
+                self.col[:, None] + self._dc[pieces, self.rot])
+
+    # --- HELPERS ---
+    def _build_tables(self, shapes: "PieceShapeType") -> None:
+        """Precalcula celdas, kicks y spawn por pieza para indexar en lote."""
+        num = len(self.piece_names)
+        self._dr = np.zeros((num, 4, 4), dtype=np.int64)
+        self._dc = np.zeros((num, 4, 4), dtype=np.int64)
+        self._type = np.zeros(num, dtype=np.uint8)
+        self._t_piece = self.piece_names.index("T") if "T" in self.piece_names else -1
+        self._spawn_col = np.zeros(num, dtype=np.int64)
+        self._can_rotate = np.zeros(num, dtype=bool)
+        # Índice 0: rot -> rot + 1 (horario); índice 1: rot -> rot - 1 (antihorario)
+        self._kick_dx = np.zeros((num, 2, 4, 5), dtype=np.int64)
+        self._kick_dy = np.zeros((num, 2, 4, 5), dtype=np.int64)
+        self._num_kicks = 5 if self._wall_kicks else 1
+
+        for i, name in enumerate(self.piece_names):
+            shape = shapes[name]
+            for rot, cells in enumerate(shape["offsets"]):
+                if len(cells) != 4:
+                    raise ValueError(f"BatchSimulator: la pieza '{name}' no es un tetromino.")
+                self._dr[i, rot] = [dr for dr, _ in cells]
+                self._dc[i, rot] = [dc for _, dc in cells]
+            self._type[i] = shape["type"]
+            self._spawn_col[i] = (COLS - shape["matrices"][0].shape[1]) // 2
+            self._can_rotate[i] = name != "O"
+
+            table = WALL_KICKS["I"] if name == "I" else WALL_KICKS["OTHERS"]
+            for d, direction in enumerate((1, -1)):
+                for rot in range(4):
+                    kicks = table.get((rot, (rot + direction) % 4), [(0, 0)])
+                    kicks = (kicks + [kicks[-1]] * 5)[:5]
+                    self._kick_dx[i, d, rot] = [dx for dx, _ in kicks]
+                    self._kick_dy[i, d, rot] = [dy for _, dy in kicks]
+
+    def _valid(self, games: np.ndarray, pieces: np.ndarray, rots: np.ndarray,
+               rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """Equivalente vectorizado de Board.is_valid_move."""
+        r = rows[:, None] + self._dr[pieces, rots]
+        c = cols[:, None] + self._dc[pieces, rots]
+        inside = (c >= 0) & (c < self.cols) & (r < self.rows)
+        occupied = self.boards[games[:, None], np.clip(r, 0, self.rows - 1), np.clip(c, 0, self.cols - 1)] != 0
+        return np.all(inside & ~(occupied & (r >= 0)), axis=1)
+
+    def _rotate(self, games, pieces, targets, rot, row, col, direction: int = 1) -> None:
+        """Aplica rotaciones (horarias o antihorarias) con wall kicks como PieceMechanics.try_rotate."""
+        d = 0 if direction == 1 else 1
+        for step in range(int(targets.max(initial=0))):
+            pending = np.flatnonzero((targets > step) & self._can_rotate[pieces])
+            if pending.size == 0:
+                break
+            new_rot = (rot[pending] + direction) % 4
+            for k in range(self._num_kicks):
+                dx = self._kick_dx[pieces[pending], d, rot[pending], k]
+                dy = self._kick_dy[pieces[pending], d, rot[pending], k]
+                ok = self._valid(games[pending], pieces[pending], new_rot, row[pending] - dy, col[pending] + dx)
+                moved = pending[ok]
+                rot[moved] = new_rot[ok]
+                row[moved] -= dy[ok]
+                col[moved] += dx[ok]
+                pending, new_rot = pending[~ok], new_rot[~ok]
+                if pending.size == 0:
+                    break
+
+    def _shift(self, games, pieces, targets, rot, row, col) -> None:
+        """Desplaza una columna por vez hacia el objetivo hasta llegar o chocar."""
+        active = np.flatnonzero(col != targets)
+        while active.size:
+            direction = np.sign(targets[active] - col[active])
+            ok = self._valid(games[active], pieces[active], rot[active], row[active], col[active] + direction)
+            active = active[ok]
+            col[active] += direction[ok]
+            active = active[col[active] != targets[active]]
+
+    def _fall(self, alive: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """Baja una fila la pieza de las partidas alive[mask]; devuelve la máscara de las que quedaron apoyadas."""
+        blocked = np.zeros(alive.size, dtype=bool)
+        if not mask.any():
+            return blocked
+        games = alive[mask]
+        ok = self._valid(games, self.piece[games].astype(np.int64), self.rot[games], self.row[games] + 1, self.col[games])
+        self.row[games[ok]] += 1
+        blocked[np.flatnonzero(mask)[~ok]] = True
+        return blocked
+
+    def _drop_rows(self, games, pieces, rot, row, col) -> np.ndarray:
+        """Fila fantasma: primera celda ocupada bajo cada bloque de la pieza."""
+        dr = self._dr[pieces, rot]
+        cells_r = row[:, None] + dr
+        cells_c = col[:, None] + self._dc[pieces, rot]
+        # (n, 4, ROWS): ocupación de la columna de cada bloque
+        columns = self.boards.transpose(0, 2, 1)[games[:, None], cells_c] != 0
+        below = columns & (np.arange(self.rows) > cells_r[:, :, None])
+        first = np.where(below.any(axis=2), below.argmax(axis=2), self.rows)
+        return (first - 1 - dr).min(axis=1)
+
+    def _lock_pieces(self, games, pieces, rot, row, col) -> None:
+        """Equivalente vectorizado de Board.lock_piece."""
+        r = row[:, None] + self._dr[pieces, rot]
+        c = col[:, None] + self._dc[pieces, rot]
+        inside = r >= 0
+        g = np.broadcast_to(games[:, None], r.shape)
+        color = np.broadcast_to(self._type[pieces][:, None], r.shape)
+        self.boards[g[inside], r[inside], c[inside]] = color[inside]
+
+    def _clear_lines(self, games: np.ndarray) -> np.ndarray:
+        """Detecta filas completas y compacta los tableros afectados en lote."""
+        full = np.all(self.boards[games] != 0, axis=2)
+        lines = full.sum(axis=1)
+
+        touched = np.flatnonzero(lines)
+        if touched.size:
+            sub_games = games[touched]
+            # Orden estable: primero las filas completas (quedarán vacías) y luego el resto
+            order = np.argsort(~full[touched], axis=1, kind="stable")
+            compacted = np.take_along_axis(self.boards[sub_games], order[:, :, None], axis=1)
+            compacted[np.arange(self.rows) < lines[touched][:, None]] = 0
+            self.boards[sub_games] = compacted
+        return lines
+
+    def _detect_t_spin(self, games: np.ndarray, pieces: np.ndarray) -> np.ndarray:
+        """
+        Tipo de jugada de cada pieza a bloquear, antes de bloquearla: MOVE_NORMAL, MOVE_T_SPIN o
+        MOVE_MINI_T_SPIN, con la regla de las 3 esquinas de Board.detect_t_spin.
+        """
+        moves = np.full(games.size, self.MOVE_NORMAL, dtype=np.int64)
+        candidates = np.flatnonzero((pieces == self._t_piece) & self._rotated[games])
+        if candidates.size == 0:
+            return moves
+        sub = games[candidates]
+        # Esquinas del centro de la T en orden TL, TR, BL, BR; fuera del tablero cuentan como ocupadas
+        r = self.row[sub][:, None] + 1 + np.array([-1, -1, 1, 1])
+        c = self.col[sub][:, None] + 1 + np.array([-1, 1, -1, 1])
+        inside = (r >= 0) & (r < self.rows) & (c >= 0) & (c < self.cols)
+        cells = self.boards[sub[:, None], np.clip(r, 0, self.rows - 1), np.clip(c, 0, self.cols - 1)]
+        occupied = ~inside | (cells != 0)
+
+        # Esquinas frontales según la rotación: 0 → TL, TR; 1 → TR, BR; 2 → BL, BR; 3 → TL, BL
+        front = self._FRONT_CORNERS[self.rot[sub] % 4]
+        both_front = np.take_along_axis(occupied, front, axis=1).all(axis=1)
+        count = occupied.sum(axis=1)
+        moves[candidates] = np.where(count >= 3, np.where(both_front, self.MOVE_T_SPIN, self.MOVE_MINI_T_SPIN),
+                                     np.where((count == 2) & both_front, self.MOVE_MINI_T_SPIN, self.MOVE_NORMAL))
+        return moves
+
+    def _update_score(self, games: np.ndarray, lines: np.ndarray, hard_drop: np.ndarray,
+                      soft_drop: np.ndarray | None = None, moves: np.ndarray | None = None) -> None:
+        """Aplica las reglas de Score.update (hard drop, soft drop, T-spins y back-to-back)."""
+        score_cfg = self._config["score"]
+        level = self.level[games]
+        moves = np.full(games.size, self.MOVE_NORMAL, dtype=np.int64) if moves is None else moves
+
+        gain = score_cfg["hard_drop"] * hard_drop
+        if soft_drop is not None:
+            gain = gain + score_cfg["soft_drop"] * soft_drop
+        # Puntos por líneas: una fila por tipo de jugada (normal, t_spin, mini_t_spin)
+        table = np.zeros((3, 5), dtype=np.int64)
+        for move, key in enumerate(("normal", "t_spin", "mini_t_spin")):
+            for lines_key, points in score_cfg[key].items():
+                if int(lines_key) < 5:
+                    table[move, int(lines_key)] = points
+        gain = gain + table[moves, np.minimum(lines, 4)] * level * (lines > 0)
+
+        cleared = lines > 0
+        tetris = lines == 4
+        difficult = tetris | (moves != self.MOVE_NORMAL)
+        b2b = self.back_to_back[games]
+        boosted = cleared & difficult & b2b
+        gain = np.where(boosted, (gain * score_cfg["back_to_back_multiplier"]).astype(np.int64), gain)
+
+        combo = self.combo_count[games]
+        gain = gain + np.where(cleared & (combo > 0), score_cfg["combo_bonus"] * combo * level, 0)
+
+        lines_total = self.lines_total[games] + lines
+        self.lines_total[games] = lines_total
+        self.tetrises[games] += tetris
+        self.combo_count[games] = np.where(cleared, combo + 1, 0)
+        self.back_to_back[games] = cleared & difficult
+        self.level[games] = np.where(
+            cleared, lines_total // self._config["general"]["lines_per_level"] + 1, level)
+
+        self.score[games] += gain
+        self.last_lines[games] = lines
+        self.last_score_gain[games] = gain
+
+    def _apply_hold(self, games: np.ndarray) -> None:
+        """Equivalente en lote de GameBoardController.hold."""
+        if games.size == 0:
+            return
+        current = self.piece[games].copy()
+        held = self.hold[games]
+        empty = held < 0
+        if empty.any():
+            self.piece[games[empty]] = self._pop(games[empty])
+        self.piece[games[~empty]] = held[~empty]
+        self.hold[games] = current
+        self.can_hold[games] = False
+        self._place_at_spawn(games)
+
+    def _spawn(self, games: np.ndarray) -> None:
+        """Genera la siguiente pieza y marca game over si no puede bajar ni una fila."""
+        self.piece[games] = self._pop(games)
+        pieces = self.piece[games].astype(np.int64)
+        blocked = ~self._valid(games, pieces, np.zeros(games.size, dtype=np.int64),
+                               np.full(games.size, PIECE_SPAWN_OFFSET + 1), self._spawn_col[pieces])
+        self.game_over[games[blocked]] = True
+        self.can_hold[games] = True
+        self._soft[games] = 0
+        self._place_at_spawn(games)
+
+    def _place_at_spawn(self, games: np.ndarray) -> None:
+        """Ubica la pieza activa en el spawn (el soft drop acumulado se conserva al usar el hold, como en Score)."""
+        self.rot[games] = 0
+        self.row[games] = PIECE_SPAWN_OFFSET
+        self.col[games] = self._spawn_col[self.piece[games].astype(np.int64)]
+
+    def _pop(self, games: np.ndarray) -> np.ndarray:
+        """Extrae la próxima pieza de la cola de cada partida indicada."""
+        self._refill(games[self._head[games] >= self.QUEUE_SIZE // 2])
+        ids = self._queue[games, self._head[games]]
+        self._head[games] += 1
+        return ids
+
+    def _refill(self, games: np.ndarray) -> None:
+        """Descarta las piezas consumidas y completa la cola desde el PieceBag de cada partida."""
+        for g in games:
+            head = self._head[g]
+            remaining = self.QUEUE_SIZE - head
+            self._queue[g, :remaining] = self._queue[g, head:]
+            bag = self._bags[g]
+            self._queue[g, remaining:] = [self._name_to_id[bag.get_next_piece()] for _ in range(head)]
+            self._head[g] = 0
@@ -0,0 +1,153 @@
+import numpy as np
+from typing import TYPE_CHECKING
+from src.core.board import Board
+
+if TYPE_CHECKING:
+    from src.core.piece import Piece
+
+class BitBoard(Board):
+    """
+    Backend del tablero basado en máscaras de bits por fila.
+
+    Usa las máscaras de ocupación que Board ya mantiene para el hash (bit c = columna c):
+    las colisiones se resuelven con un AND por fila de la pieza y una fila está completa
+    cuando su máscara vale `_full`. Al bloquear se actualiza cada fila de una vez y solo se
+    marcan las filas que quedaron completas, así que clear_lines no revisa las demás.
+
+    `matrix` se conserva como plano de colores (uint8) para el dibujado y la API existente;
+    al eliminar filas se mueve como bytes, sin pasar por NumPy.
+    """
+    def __init__(self, rows: int, cols: int, animated: bool = True) -> None:
+        super().__init__(rows, cols, animated)
+        self.matrix = np.zeros((self.rows, self.cols), dtype=np.uint8)
+        self._cells = self.matrix.data.cast("B")
+
+        # Máscara de una fila completa
+        self._full: int = (1 << cols) - 1
+
+    def lock_piece(self, piece: "Piece") -> None:
+        """
+        Bloquea la pieza fila por fila: la máscara, el contador y el hash de cada fila se
+        actualizan con una operación, y las celdas solo se recorren para el color (escrito como
+        byte de `matrix`) y la superficie.
+
+        En las filas tocadas solo se anotan las que quedaron completas (ver _find_fullrows).
+        """
+        masks, row_fill, table = self._row_masks, self._row_fill, self._row_table
+        rows, full, col = self.rows, self._full, piece.col
+        zobrist = self._zobrist
+        for dr, mask in piece.row_masks:
+            r = piece.row + dr
+            if 0 <= r < rows:
+                old = masks[r]
+                new = old | ((mask << col if col >= 0 else mask >> -col) & full)
+                masks[r] = new
+                row_fill[r] = new.bit_count()
+                zobrist ^= table[r][old] ^ table[r][new]
+                if new == full:
+                    self._touched_rows.add(r)
+        self._zobrist = zobrist
+
+        cells, surface, cols, value = self._cells, self._surface, self.cols, piece.type
+        for r, c in piece.get_cells():
+            if 0 <= r < rows and 0 <= c < cols:
+                cells[r * cols + c] = value
+                if r < surface[c]:
+                    surface[c] = r
+        self._version += 1
+
+    def is_valid_move(self, piece: "Piece", row: int | None = None, col: int | None = None) -> bool:
+        """
+        Verifica colisiones con un AND por cada fila ocupada de la pieza.
+
+        Args:
+            piece: Instancia de la pieza a validar.
+            row: Posición de la pieza en las filas del tablero.
+            col: Posición de la pieza en las columnas del tablero.
+
+        Returns:
+            bool: True si la posición está libre, False si está ocupada o fuera de límites.
+        """
+        baserow = piece.row if row is None else row
+        basecol = piece.col if col is None else col
+
+        _, bottom, left, right = piece.bounds
+        if baserow + bottom >= self.rows or basecol + left < 0 or basecol + right >= self.cols:
+            return False
+
+        # Dentro de los bordes, desplazar a la derecha una columna negativa no pierde bloques
+        masks = self._row_masks
+        for dr, mask in piece.row_masks:
+            r = baserow + dr
+            if r >= 0 and masks[r] & (mask << basecol if basecol >= 0 else mask >> -basecol):
+                return False
+        return True
+
+    def is_empty(self, check_rows: int = 3) -> bool:
+        """Verifica si las últimas `check_rows` filas del tablero están vacías."""
+        return not any(self._row_masks[-check_rows:])
+
+    # --- HELPERS ---
+    def _is_corner_occupied(self, r: int, c: int) -> bool:
+        """Retorna True si la celda está fuera del tablero o tiene un bloque."""
+        if r < 0 or r >= self.rows or c < 0 or c >= self.cols:
+            return True
+        return bool(self._row_masks[r] >> c & 1)
+
+    def _find_fullrows(self) -> list[int]:
+        """
+        Encuentra las filas completas comparando su máscara con `_full`.
+
+        lock_piece solo anota las filas que completó; tras set_matrix o insert_garbage
+        pueden quedar anotadas otras, por eso igual se compara cada una.
+
+        Returns:
+            list[int]: Los índices de las filas completas, de arriba hacia abajo.
+        """
+        touched = self._touched_rows
+        if not touched:
+            return []
+        masks, full = self._row_masks, self._full
+        fullrows = sorted(r for r in touched if masks[r] == full)
+        self._touched_rows = set()
+        return fullrows
+
+    def _remove_filled_lines(self, fullrows: "list[int] | np.ndarray") -> None:
+        """
+        Elimina las filas llenas como Board, pero mueve los bloques de filas como bytes
+        de `matrix` (una copia de memoria por bloque) en lugar de slices de NumPy.
+
+        Args:
+            fullrows: Las filas que deben ser eliminadas.
+        """
+        removed = {int(r) for r in fullrows}
+        if not removed:
+            return
+
+        cells    = self._cells
+        cols     = self.cols
+        row_fill = self._row_fill
+        masks    = self._row_masks
+        top      = min(self._surface)
+
+        below = self.rows
+        shift = 0
+        for r in sorted(removed, reverse=True):
+            if r + 1 < below and shift:
+                cells[(r + 1 + shift) * cols:(below + shift) * cols] = cells[(r + 1) * cols:below * cols]
+                row_fill[r + 1 + shift:below + shift] = row_fill[r + 1:below]
+                masks[r + 1 + shift:below + shift] = masks[r + 1:below]
+            below = r
+            shift += 1
+        if top < below:
+            cells[(top + shift) * cols:(below + shift) * cols] = cells[top * cols:below * cols]
+            row_fill[top + shift:below + shift] = row_fill[top:below]
+            masks[top + shift:below + shift] = masks[top:below]
+
+        cells[top * cols:(top + shift) * cols] = bytes(shift * cols)
+        row_fill[top:top + shift] = [0] * shift
+        masks[top:top + shift] = [0] * shift
+
+        self._zobrist = self._rows_hash(top, self.rows)
+        self._shift_surface(removed)
+        self._version += 1
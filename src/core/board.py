@@ -1,11 +1,34 @@
-import pygame
 import numpy as np
-from typing import TYPE_CHECKING
-from src.constants import NUM_TO_PIECE
+from typing import Any, NamedTuple, TYPE_CHECKING
+from src.constants import GARBAGE_BLOCK
+from src.core.zobrist import cell_key_rows, row_key_table
 
 if TYPE_CHECKING:
-    from piece import Piece
-    from src.core.types import PieceDataType
+    from src.core.piece import Piece
+
+
+class BoardSnapshot(NamedTuple):
+    """Estado inmutable de un Board (ver Board.snapshot)."""
+    cells:      bytes             # matrix.tobytes()
+    row_fill:   tuple[int, ...]
+    surface:    tuple[int, ...]
+    touched:    frozenset[int]    # filas tocadas desde la última búsqueda de filas completas
+    row_masks:  tuple[int, ...]
+    zobrist:    int
+    anim_rows:  tuple[int, ...]
+    anim_step:  int
+    anim_timer: float
+    extra:      tuple[Any, ...]   # estado propio del backend (ver _extra_state)
+
+    def compact(self) -> "BoardSnapshot":
+        """
+        Versión sin los datos derivados de las celdas (contadores, hashes y estado del backend).
+
+        Ocupa mucho menos al serializarse (los keyframes de los replays); Board.restore recalcula
+        lo que falta desde las celdas, así que restaurar cuesta lo mismo que set_matrix.
+        """
+        return self._replace(row_fill=(), surface=(), row_masks=(), zobrist=0, extra=())
+
 
 class Board:
     """
@@ -14,31 +37,39 @@ class Board:
     Es responsable de mantener la matriz de bloques fijos, controlar 
     el movimiento y rotación de la pieza activa mediante validaciones de 
     colisión y procesar la eliminación de líneas completas.
+
+    No depende de pygame: el dibujado vive en src.render.BoardView.
     """
     ANIM_STEP_DURATION = 0.08
-    def __init__(self, rows: int, cols: int, surface: pygame.Surface, 
-                 cell_width: int, cell_height: int,
-                 pos_x: int, pos_y: int) -> None:
+    def __init__(self, rows: int, cols: int, animated: bool = True) -> None:
         """
         Inicializa el tablero del juego.
 
         Args:
-            surface: Imagen del tablero.
-            block_surface: Bloque individual de cada pieza.
+            rows: Cantidad de filas.
+            cols: Cantidad de columnas.
+            animated: Si es False las filas completas se eliminan en el mismo clear_lines,
+                sin animación (útil para simulaciones sin render).
         """
         self.rows = rows
         self.cols = cols
         self.matrix: np.ndarray = np.zeros((self.rows, self.cols), dtype=int)
+        self.animated = animated
 
-        self._surface = surface
-        self._width: int = self._surface.get_width()
-        self._height: int = self._surface.get_height()
-        self._rect: pygame.Rect = self._surface.get_rect()
-        self._rect.topleft = (pos_x, pos_y)
+        # Contadores incrementales: celdas ocupadas por fila y fila superior ocupada por columna
+        self._row_fill: list[int]     = [0] * rows
+        self._surface:  list[int]     = [rows] * cols
+        self._touched_rows: set[int]  = set()
 
-        self.cell_width = cell_width
-        self.cell_height = cell_height
+        # Cambia con cada modificación visible de los bloques fijos (ver version)
+        self._version: int = 0
 
+        # Hash de Zobrist de la ocupación (ver zobrist). Cada fila guarda su máscara de ocupación
+        # y su clave sale de una tabla por (fila, máscara), así que rehacer filas no recorre celdas
+        self._cell_keys = cell_key_rows(rows, cols)
+        self._row_table = row_key_table(rows, cols)
+        self._row_masks: list[int] = [0] * rows
+        self._zobrist:   int       = 0
 
         # Animación de eliminación de líneas
         self._anim_rows:  list[int] = []
@@ -51,7 +82,91 @@ class Board:
     def is_animating(self) -> bool:
         """True mientras haya una animación de eliminación de filas en curso."""
         return bool(self._anim_rows)
+
+    @property
+    def anim_rows(self) -> set[int]:
+        """Filas que se están eliminando en la animación actual."""
+        return self._anim_set
+
+    @property
+    def anim_step(self) -> int:
+        """Paso actual de la animación (celdas borradas desde el centro hacia cada lado)."""
+        return self._anim_step
     
+    @property
+    def version(self) -> int:
+        """
+        Contador que cambia cada vez que cambian los bloques fijos o el paso de la animación.
+
+        Las vistas lo comparan con el último valor dibujado para saber si deben redibujar.
+        """
+        return self._version
+
+    @property
+    def zobrist(self) -> int:
+        """
+        Hash de Zobrist de las celdas ocupadas (el color no cuenta), igual a zobrist.hash_matrix.
+
+        Se actualiza de forma incremental en lock_piece y al eliminar filas.
+        """
+        return self._zobrist
+
+    @property
+    def row_fill(self) -> tuple[int, ...]:
+        """Cantidad de celdas ocupadas en cada fila."""
+        return tuple(self._row_fill)
+
+    @property
+    def surface(self) -> tuple[int, ...]:
+        """Fila del bloque más alto de cada columna (rows si la columna está vacía)."""
+        return tuple(self._surface)
+
+    @property
+    def column_heights(self) -> tuple[int, ...]:
+        """Altura de cada columna medida desde el fondo hasta su bloque más alto."""
+        return tuple(self.rows - top for top in self._surface)
+
+    @property
+    def row_bits(self) -> list[int]:
+        """Máscaras de ocupación por fila (bit c = columna c ocupada)."""
+        return list(self._row_masks)
+
+    def snapshot(self) -> BoardSnapshot:
+        """Captura el estado del tablero (bloques, contadores, hash y animación) sin copiar objetos."""
+        return BoardSnapshot(self.matrix.tobytes(), tuple(self._row_fill), tuple(self._surface),
+                             frozenset(self._touched_rows), tuple(self._row_masks), self._zobrist,
+                             tuple(self._anim_rows), self._anim_step, self._anim_timer, self._extra_state())
+
+    def restore(self, snapshot: BoardSnapshot) -> None:
+        """
+        Vuelve al estado capturado con snapshot.
+
+        La matriz se sobrescribe en su lugar (las referencias externas siguen válidas) y
+        `version` avanza, para que las vistas redibujen. Con un snapshot compacto (ver
+        BoardSnapshot.compact) los contadores y hashes se recalculan desde las celdas.
+
+        Raises:
+            ValueError: Si el snapshot es de un tablero de otro tamaño o backend.
+        """
+        if len(snapshot.cells) != self.matrix.nbytes:
+            raise ValueError(f"Board: el snapshot no corresponde a este tablero "
+                             f"({len(snapshot.cells)} bytes, se esperaban {self.matrix.nbytes}).")
+        self.matrix.data.cast("B")[:] = snapshot.cells
+        if snapshot.row_masks:
+            self._row_fill  = list(snapshot.row_fill)
+            self._surface   = list(snapshot.surface)
+            self._row_masks = list(snapshot.row_masks)
+            self._zobrist   = snapshot.zobrist
+            self._restore_extra(snapshot.extra)
+        else:
+            self._rebuild_counters()
+        self._touched_rows = set(snapshot.touched)
+        self._anim_rows    = list(snapshot.anim_rows)
+        self._anim_set     = set(snapshot.anim_rows)
+        self._anim_step    = snapshot.anim_step
+        self._anim_timer   = snapshot.anim_timer
+        self._version     += 1
+
     def update(self, dt: float) -> None:
         """
         Avanza la animación activa.
@@ -66,41 +181,36 @@ class Board:
         if self._anim_timer >= self.ANIM_STEP_DURATION:
             self._anim_timer -= self.ANIM_STEP_DURATION
             self._anim_step  += 1
+            self._version    += 1
 
             if self._anim_step >= self._anim_total:
-                self.__remove_filled_lines(np.array(self._anim_rows))
+                self._remove_filled_lines(self._anim_rows)
                 self._anim_rows  = []
                 self._anim_set   = set()
                 self._anim_step  = 0
                 self._anim_timer = 0.0
 
-    def draw(self, surface: pygame.Surface, pieces: "PieceDataType") -> None:
-        """Dibuja el fondo del tablero, los bloques estáticos y la pieza activa."""
-        # Dibuja la Board
-        surface.blit(self._surface, self._rect)
-        center = self.cols // 2
-
-        for (row,col), block in np.ndenumerate(self.matrix):
-            if not block:
-                continue
-            if (self._anim_rows
-                    and row in self._anim_set
-                    and center - self._anim_step <= col <= center + self._anim_step - 1):
-                continue
-
-            bx = self._rect.x + col * self.cell_width
-            by = self._rect.y + row * self.cell_height
-            surface.blit(pieces[NUM_TO_PIECE[block]]["block"]["placed"], (bx, by))
-
     def lock_piece(self, piece: "Piece") -> None:
         """
         Bloquea la pieza actual en el tablero, marcando las celdas que ocupa como ocupadas 
         (con valor 1) en la matriz. Después de bloquearla, la pieza activa se elimina.
         """
+        matrix, masks, surface = self.matrix, self._row_masks, self._surface
+        rows, cols, value = self.rows, self.cols, piece.type
+        zobrist = self._zobrist
         for r, c in piece.get_cells():
             # Verifica que la celda esté dentro del tablero
-            if 0 <= r < self.rows and 0 <= c < self.cols: 
-                self.matrix[r, c] = piece.type
+            if 0 <= r < rows and 0 <= c < cols:
+                if not masks[r] >> c & 1:
+                    self._row_fill[r] += 1
+                    masks[r] |= 1 << c
+                    zobrist ^= self._cell_keys[r][c]
+                matrix[r, c] = value
+                if r < surface[c]:
+                    surface[c] = r
+                self._touched_rows.add(r)
+        self._zobrist = zobrist
+        self._version += 1
 
     def clear_lines(self) -> int:
         """
@@ -112,18 +222,86 @@ class Board:
         Returns:
             int: Cantidad de líneas detectadas (0 si no hay ninguna).
         """
-        fullrows = self.__find_fullrows()
+        fullrows = self._find_fullrows()
 
         if len(fullrows) == 0:
             return 0
 
-        self._anim_rows  = list(fullrows)
-        self._anim_set   = set(fullrows)
+        if not self.animated:
+            self._remove_filled_lines(fullrows)
+            return len(fullrows)
+
+        self._anim_rows  = [int(r) for r in fullrows]
+        self._anim_set   = set(self._anim_rows)
         self._anim_step  = 0
         self._anim_timer = 0.0
+        self._version   += 1
 
         return len(fullrows)
     
+    def insert_garbage(self, count: int, hole: int, block: int = GARBAGE_BLOCK) -> bool:
+        """
+        Sube el contenido del tablero `count` filas y agrega filas de basura abajo.
+
+        Como en _remove_filled_lines, las filas se copian una por una dentro de la misma
+        matriz: no se reserva un arreglo nuevo. Los contadores, el hash y la superficie se
+        corrigen solo en las filas que se movieron.
+
+        Args:
+            count: Filas de basura a insertar.
+            hole: Columna vacía de las filas de basura.
+            block: Valor de las celdas de basura.
+
+        Returns:
+            bool: True si algún bloque salió por arriba del tablero (la partida está perdida).
+
+        Raises:
+            ValueError: Si la columna del hueco está fuera del tablero.
+            RuntimeError: Si hay una animación de eliminación de filas en curso.
+        """
+        if not 0 <= hole < self.cols:
+            raise ValueError(f"Board: columna de hueco inválida ({hole}). Debe estar entre 0 y {self.cols - 1}.")
+        if self._anim_rows:
+            raise RuntimeError("Board: no se puede insertar basura durante la animación de eliminación de filas.")
+        count = min(count, self.rows)
+        if count <= 0:
+            return False
+
+        matrix   = self.matrix
+        row_fill = self._row_fill
+        masks    = self._row_masks
+        rows     = self.rows
+        top      = min(self._surface)
+        first    = max(top - count, 0)   # por encima solo hay filas vacías que siguen vacías
+        old_hash = self._rows_hash(first, rows)
+
+        for r in range(first, rows - count):
+            matrix[r] = matrix[r + count]
+            row_fill[r] = row_fill[r + count]
+            masks[r] = masks[r + count]
+        matrix[rows - count:] = block
+        matrix[rows - count:, hole] = 0
+        garbage = ((1 << self.cols) - 1) & ~(1 << hole)
+        for r in range(rows - count, rows):
+            row_fill[r] = self.cols - 1
+            masks[r] = garbage
+
+        surface = self._surface
+        for c in range(self.cols):
+            if surface[c] < rows:
+                surface[c] -= count
+            elif c != hole:
+                surface[c] = rows - count
+            if surface[c] < 0:
+                # Los bloques más altos de la columna salieron del tablero
+                occupied = np.flatnonzero(matrix[:, c])
+                surface[c] = int(occupied[0]) if len(occupied) else rows
+
+        self._touched_rows = {r - count for r in self._touched_rows if r >= count}
+        self._zobrist ^= old_hash ^ self._rows_hash(first, rows)
+        self._version += 1
+        return top < count
+
     def is_valid_move(self, piece: "Piece", row: int | None = None, col: int | None = None) -> bool:
         """
         Verifica si la pieza colisiona con los bordes o bloques existentes.
@@ -137,11 +315,66 @@ class Board:
             bool: True si la posición está libre, False si no está ocupada o fuera de límites.
 
         """
-        for r, c in piece.get_cells(row, col):
-            if r >= self.rows or (c < 0 or c >= self.cols) or (r >= 0  and self.matrix[r, c]):
+        baserow = piece.row if row is None else row
+        basecol = piece.col if col is None else col
+
+        # Descarta por bounding box antes de revisar celda por celda
+        _, bottom, left, right = piece.bounds
+        if baserow + bottom >= self.rows or basecol + left < 0 or basecol + right >= self.cols:
+            return False
+
+        matrix = self.matrix
+        for dr, dc in piece.offsets:
+            r = baserow + dr
+            if r >= 0 and matrix[r, basecol + dc]:
                 return False
         return True
+
+    def drop_row(self, piece: "Piece", row: int | None = None, col: int | None = None) -> int:
+        """
+        Calcula la fila donde quedaría la pieza al caer desde (row, col).
+
+        Si cada columna de la pieza está por encima de la superficie, la caída sale directo
+        de la altura de las columnas; si la pieza está bajo un saliente se recorre fila a fila.
+
+        Args:
+            piece: Instancia de la pieza a soltar.
+            row: Fila de partida (la de la pieza por defecto).
+            col: Columna de la pieza (la de la pieza por defecto).
+
+        Returns:
+            int: Fila final de la pieza.
+        """
+        baserow = piece.row if row is None else row
+        basecol = piece.col if col is None else col
+
+        surface = self._surface
+        landing = self.rows
+        for dc, bottom in piece.column_bottoms:
+            c = basecol + dc
+            if not 0 <= c < self.cols or baserow + bottom >= surface[c]:
+                break
+            top = surface[c]
+            landing = min(landing, top - 1 - bottom)
+        else:
+            return landing
+
+        floor_row = self.rows - 1 - piece.bounds[1]
+        while baserow < floor_row and self.is_valid_move(piece, baserow + 1, basecol):
+            baserow += 1
+        return baserow
     
+    def set_matrix(self, matrix: np.ndarray) -> None:
+        """
+        Reemplaza el contenido del tablero por la matriz indicada.
+
+        Args:
+            matrix: Matriz (rows, cols) con el tipo de pieza de cada celda (0 = vacía).
+        """
+        self.matrix[:, :] = matrix
+        self._rebuild_counters()
+        self._version += 1
+
     def is_empty(self, check_rows: int = 3) -> bool:
         """Verifica si las últimas `check_rows` filas del tablero están vacías.
 
@@ -189,50 +422,119 @@ class Board:
 
     
     # --- HELPERS ---
+    def _extra_state(self) -> tuple[Any, ...]:
+        """Estado adicional del backend que debe entrar en el snapshot."""
+        return ()
+
+    def _restore_extra(self, extra: tuple[Any, ...]) -> None:
+        """Restaura el estado devuelto por _extra_state."""
+        pass
+
     def _is_corner_occupied(self, r: int, c: int) -> bool:
         """Retorna True si la celda está fuera del tablero o tiene un bloque."""
         if r < 0 or r >= self.rows or c < 0 or c >= self.cols:
             return True
         return bool(self.matrix[r, c])
     
-    def get_pixels_of_cell(self, row: int, col: int) -> tuple[int, int]:
+    def _rebuild_counters(self) -> None:
+        """Recalcula los contadores por fila y columna desde la matrix."""
+        occupied = self.matrix != 0
+        self._row_fill = [int(n) for n in occupied.sum(axis=1)]
+        self._surface = [int(r) if occupied[r, c] else self.rows
+                         for c, r in enumerate(occupied.argmax(axis=0))]
+        self._touched_rows = set(range(self.rows))
+        weights = 1 << np.arange(self.cols)
+        self._row_masks = [int(bits) for bits in occupied @ weights]
+        self._zobrist = self._rows_hash(0, self.rows)
+
+    def _find_fullrows(self) -> list[int]:
         """
-        Convierte una posición de celda del tablero (row, col) en coordenadas
-        absolutas en píxeles para dibujar la pieza en pantalla.
-
-        La conversión toma como origen la esquina superior izquierda del tablero
-        y aplica el tamaño de cada celda.
-
-        Args:
-            row: Fila de la celda dentro del tablero.
-            col: Columna de la celda dentro del tablero.
+        Encuentra las filas llenas entre las tocadas desde la última búsqueda.
 
-        Returns:
-            Tuple[int, int]: Coordenadas (x, y) en píxeles dentro de la ventana.
-        """
-        return ((self._rect.x + col * self.cell_width), (self._rect.y + row * self.cell_height))
-    
-    def __find_fullrows(self) -> np.ndarray:
-        """
-        Encuentra las filas llenas en el tablero (todas las celdas tienen un valor diferente de 0).
+        Solo una fila alcanzada por un bloqueo puede haberse completado, por lo que
+        basta con revisar su contador de celdas ocupadas.
 
         Returns:
-            np.ndarray: Un arreglo con los índices de las filas completas.
+            list[int]: Los índices de las filas completas, de arriba hacia abajo.
         """
-        # Verifica si todas las celdas en cada fila son diferentes de 0
-        fullrows = np.where(np.all(self.matrix != 0, axis=1))[0]
+        fullrows = sorted(r for r in self._touched_rows if self._row_fill[r] == self.cols)
+        self._touched_rows = set()
         return fullrows
     
-    def __remove_filled_lines(self, fullrows: np.ndarray) -> None:
+    def _remove_filled_lines(self, fullrows: "list[int] | np.ndarray") -> None:
         """
-        Elimina las filas llenas de la matriz y las desplaza hacia abajo.
+        Elimina las filas llenas compactando la matriz en su lugar.
+
+        Las filas que sobreviven entre dos filas eliminadas forman un bloque contiguo que baja
+        tantas filas como eliminadas haya debajo; cada bloque se copia con una sola asignación,
+        de abajo hacia arriba, y las filas que quedan libres arriba se ponen en cero. No se
+        reemplaza el arreglo: `matrix` sigue siendo el mismo objeto, así que las referencias
+        externas siguen válidas.
 
         Args:
             fullrows: Las filas que deben ser eliminadas.
         """
-        # Elimina las filas completas de la matriz
-        self.matrix = np.delete(self.matrix, fullrows, axis=0)
+        removed = {int(r) for r in fullrows}
+        if not removed:
+            return
 
-        # Añade filas vacías (llenas de ceros) en la parte superior del tablero
-        new_emptyrows = np.zeros((len(fullrows), self.cols), dtype=int) # Crea las filas vacias
-        self.matrix = np.vstack((new_emptyrows, self.matrix)) # Las anexa a la matrix
\ No newline at end of file
+        matrix   = self.matrix
+        row_fill = self._row_fill
+        masks    = self._row_masks
+        top      = min(self._surface) # por encima de la superficie solo hay filas vacías
+
+        # Bloques de filas sobrevivientes, del de más abajo al de más arriba
+        below = self.rows
+        shift = 0
+        for r in sorted(removed, reverse=True):
+            if r + 1 < below and shift:
+                matrix[r + 1 + shift:below + shift] = matrix[r + 1:below]
+                row_fill[r + 1 + shift:below + shift] = row_fill[r + 1:below]
+                masks[r + 1 + shift:below + shift] = masks[r + 1:below]
+            below = r
+            shift += 1
+        if top < below:
+            matrix[top + shift:below + shift] = matrix[top:below]
+            row_fill[top + shift:below + shift] = row_fill[top:below]
+            masks[top + shift:below + shift] = masks[top:below]
+
+        matrix[top:top + shift] = 0
+        row_fill[top:top + shift] = [0] * shift
+        masks[top:top + shift] = [0] * shift
+
+        # Por encima de la superficie las filas están vacías (clave 0): el hash sale de las filas restantes
+        self._zobrist = self._rows_hash(top, self.rows)
+        self._shift_surface(removed)
+        self._version += 1
+
+    def _rows_hash(self, start: int, stop: int) -> int:
+        """
+        XOR de las claves de las filas [start, stop) según su máscara de ocupación.
+
+        Quien mueve filas corrige el hash con el XOR de este valor antes y después: una
+        búsqueda en la tabla por fila, sin recorrer celdas.
+        """
+        table, masks = self._row_table, self._row_masks
+        value = 0
+        for r in range(start, stop):
+            value ^= table[r][masks[r]]
+        return value
+
+    def _shift_surface(self, removed: set[int]) -> None:
+        """
+        Actualiza la superficie de cada columna tras eliminar las filas indicadas.
+
+        Toda fila completa ocupa todas las columnas, así que la superficie de cada columna
+        está en o por encima de la primera fila eliminada: si está por encima solo baja
+        len(removed) filas; si era una fila eliminada se busca el siguiente bloque.
+        """
+        count = len(removed)
+        masks = self._row_masks
+        for c, top in enumerate(self._surface):
+            if top in removed:
+                r = top
+                while r < self.rows and not masks[r] >> c & 1:
+                    r += 1
+                self._surface[c] = r
+            elif top < self.rows:
+                self._surface[c] = top + count
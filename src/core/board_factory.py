@@ -0,0 +1,30 @@
+from typing import Type, TYPE_CHECKING
+from src.core.board import Board
+from src.core.bitboard import BitBoard
+
+if TYPE_CHECKING:
+    from src.config.gameplay import GameplayConfigType
+
+# General config key
+BOARD_KEY = "board_backend"
+DEFAULT_BOARD = "matrix"
+
+# Backend map
+BOARD_MAP: "dict[str, Type[Board]]" = {
+    "matrix": Board,
+    "bitboard": BitBoard,
+}
+
+# Factory API
+def create_board(config: "GameplayConfigType", rows: int, cols: int, animated: bool = True) -> Board:
+    """Crea el tablero con el backend indicado en config["general"]["board_backend"]."""
+    b_type = config["general"].get(BOARD_KEY, DEFAULT_BOARD)
+    _validate_board(b_type)
+
+    board_class = BOARD_MAP[b_type]
+    return board_class(rows, cols, animated)
+
+# --- HELPERS ----
+def _validate_board(b_type: str) -> None:
+    if b_type not in BOARD_MAP:
+        raise ValueError(f"Board Factory: Backend '{b_type}' no está registrado en BOARD_MAP")
@@ -1,53 +1,168 @@
-from pygame import Surface
-from typing import TYPE_CHECKING
-from src.constants import PIECE_DEFINITIONS, ROWS, COLS, BLOCK_W, BLOCK_H, PIECE_SPAWN_OFFSET, HOLD_X, HOLD_Y
+from typing import NamedTuple, TYPE_CHECKING
+from src.constants import PIECE_DEFINITIONS, ROWS, COLS, PIECE_SPAWN_OFFSET
+from src.core.action import Action
 from src.core.piece_bag import PieceBag
-from src.core.board import Board
+from src.core.board import BoardSnapshot
+from src.core.board_factory import create_board
 from src.core.piece import Piece
+from src.core.piece_shapes import build_piece_shapes
 from src.core.score import Score
-from src.core.pieces_preview import PiecesPreview
 from src.core.piece_mechanics import PieceMechanics
 from src.core.strategy import create_gravity, create_lock
+from src.core.zobrist import state_hash
 from datetime import date
 
 if TYPE_CHECKING:
-    from src.core.types import BoardType, PiecesPreviewType, PieceDataType
+    from src.core.board import Board
+    from src.core.types import PieceShapeType
     from src.config.gameplay import GameplayRulesetType, GameplayConfigType
-    from pygame.font import Font
     from src.database import RawRecord
 
+class GameSnapshot(NamedTuple):
+    """
+    Estado completo e inmutable de una partida (ver GameBoardController.snapshot).
+
+    Solo contiene tuplas, bytes y escalares: se puede guardar, comparar y enviar sin copias.
+    """
+    board:       BoardSnapshot
+    piece:       tuple[str, int, int, int, int, int, int, bool] | None  # name, row, col, rot, ghost y active
+    hold:        str | None
+    bag:         tuple[int, int, tuple[str, ...]]
+    score:       tuple[int, ...]
+    mechanics:   tuple[float, bool, tuple[float, int]]
+    preview:     tuple[str, ...]
+    game_over:   bool
+    rotated:     bool   # si la última acción fue una rotación (T-spin)
+    just_locked: bool
+    locked:      int
+
+    def compact(self) -> "GameSnapshot":
+        """El mismo estado con el tablero compacto (ver BoardSnapshot.compact); restore lo acepta igual."""
+        return self._replace(board=self.board.compact())
+
+
 class GameBoardController:
     """
     Facade del tablero de juego.
 
-    Coordina Board, Piece, PieceBag, Score, PiecesPreview y PieceMechanics.
-    Es la única interfaz que PlayState conoce.
+    Coordina Board, Piece, PieceBag, Score y PieceMechanics sin depender de pygame,
+    por lo que puede simular partidas sin render. El dibujado lo hace src.render.GameBoardView.
     """
 
     def __init__(self,
                  session_config: "GameplayConfigType",
                  ruleset: "GameplayRulesetType",
-                 pieces: "PieceDataType",
-                 board: "BoardType",
-                 preview: "PiecesPreviewType") -> None:
-
-        self._data          = pieces
+                 pieces: "PieceShapeType | None" = None,
+                 *,
+                 animate_clears: bool = True,
+                 seed: int | None = None) -> None:
+        """
+        Args:
+            session_config: Configuración de gameplay.
+            ruleset: Ruleset activo (gravedad, lock, hold, wall kicks).
+            pieces: Formas de las piezas. Si no se indica se construyen desde PIECE_DEFINITIONS.
+            animate_clears: Si es False las líneas se eliminan al instante (simulación sin render).
+            seed: Semilla de la bolsa de piezas. Si es None se elige una al azar.
+        """
+        self._data          = pieces if pieces is not None else build_piece_shapes()
         self._game_over     = False
         self._hold_enabled  = ruleset.get("hold", False)
         self._piece:         Piece | None = None
         self._hold_piece:    Piece | None = None
         self._last_action_was_rotation: bool = False
         self._piece_just_locked = False
+        self._pieces_locked = 0
 
         gravity     = create_gravity(ruleset, session_config)
         lock        = create_lock(ruleset, session_config)
         wall_kicks  = ruleset.get("wall_kicks", False)
 
         self._score     = Score(session_config)
-        self._bag       = PieceBag(PIECE_DEFINITIONS, session_config["general"]["bag_size"])
-        self._board     = Board(ROWS, COLS, board["surface"], BLOCK_W, BLOCK_H, board["pos_x"], board["pos_y"])
-        self._preview   = PiecesPreview(data=pieces, bag=self._bag, preview=preview)
+        self._bag       = PieceBag(PIECE_DEFINITIONS, session_config["general"]["bag_size"], seed=seed)
+        self._board     = create_board(session_config, ROWS, COLS, animated=animate_clears)
+        self._preview_count = session_config["general"]["preview_count"]
+        self._preview:  list[str] = []
         self._mechanics = PieceMechanics(gravity, lock, self._board, wall_kicks=wall_kicks)
+        self._update_preview()
+
+    @property
+    def board(self) -> "Board":
+        """Tablero de la partida (solo lectura para vistas y consumidores externos)."""
+        return self._board
+
+    @property
+    def piece(self) -> Piece | None:
+        """Pieza activa, o None si aún no se ha generado ninguna."""
+        return self._piece
+
+    @property
+    def seed(self) -> int:
+        """Semilla de la bolsa de piezas; reproduce la secuencia de la partida."""
+        return self._bag.seed
+
+    @property
+    def hold_piece(self) -> Piece | None:
+        """Pieza guardada en el hold."""
+        return self._hold_piece
+
+    @property
+    def hold_enabled(self) -> bool:
+        """True si el ruleset tiene hold."""
+        return self._hold_enabled
+
+    @property
+    def can_hold(self) -> bool:
+        """True si el ruleset permite hold y todavía no se usó con la pieza activa."""
+        return self._hold_enabled and self._mechanics.can_hold
+
+    @property
+    def pieces(self) -> "PieceShapeType":
+        """Formas de las piezas de la partida."""
+        return self._data
+
+    @property
+    def preview(self) -> list[str]:
+        """Nombres de las próximas piezas, actualizados en cada spawn y hold."""
+        return self._preview
+
+    def upcoming(self, count: int) -> list[str]:
+        """Nombres de las próximas `count` piezas de la bolsa (pueden ser más que las del preview)."""
+        return self._bag.peek_next(count)
+
+    @property
+    def bag_lot(self) -> dict[str, int]:
+        """Composición de cada lote de la bolsa."""
+        return self._bag.lot
+
+    def bag_remaining(self, after: int) -> dict[str, int]:
+        """Piezas que quedan por salir del lote en curso después de las próximas `after` (ver PieceBag.remaining)."""
+        return self._bag.remaining(after)
+
+    @property
+    def state_hash(self) -> int:
+        """
+        Hash de Zobrist del estado de juego: tablero, pieza activa, hold y posición en la bolsa.
+
+        Dos controladores con el mismo hash tienen (salvo colisión) las mismas opciones de juego
+        desde aquí; el puntaje y el nivel no forman parte del hash.
+        """
+        piece = self._piece
+        active = (piece.name, piece.rot, piece.row, piece.col) if piece is not None else None
+        hold = self._hold_piece.name if self._hold_piece is not None else None
+        return state_hash(self._board.zobrist, active, hold, self.can_hold, self._bag.drawn)
+
+    @property
+    def pieces_locked(self) -> int:
+        """Piezas bloqueadas en la partida; sirve para detectar bloqueos sin consumir consume_lock_event."""
+        return self._pieces_locked
+
+    @property
+    def score(self) -> Score:
+        return self._score
+
+    @property
+    def mechanics(self) -> PieceMechanics:
+        return self._mechanics
 
     @property
     def last_score_gained(self) -> int:
@@ -113,30 +228,48 @@ class GameBoardController:
         if self._mechanics.update(dt, self._score.level, self._piece):
             self._resolve_lock()
 
-    def draw(self, surface: Surface, pieces: "PieceDataType") -> None:
+    # --- SNAPSHOTS ---
+    def snapshot(self) -> GameSnapshot:
         """
-        Dibuja todos los elementos visuales del tablero.
+        Captura el estado completo de la partida: tablero, pieza activa, hold, bolsa, puntaje,
+        timers de caída y lock y animación de líneas.
 
-        Orden: tablero -> preview -> hold -> ghost -> pieza activa.
+        Cada componente entrega tuplas de sus propios campos, sin deepcopy ni pickle, así que
+        capturar y restaurar cuestan unos pocos microsegundos (base de undo, rollback y búsqueda).
         """
-        self._board.draw(surface, pieces)
-
-        for surf, x, y in self._preview.get():
-            surface.blit(surf, (x, y))
-
-        if self._hold_piece is not None:
-            hold_surface = self._data[self._hold_piece.name]["surfaces"]["normal"]
-            rect = hold_surface.get_rect(center=(HOLD_X, HOLD_Y))
-
-            surface.blit(hold_surface, rect)
-
-        if self._piece is not None and not self._piece.is_locked():
-            pos_normal = self._board.get_pixels_of_cell(self._piece.row, self._piece.col)
-            pos_ghost  = self._board.get_pixels_of_cell(self._piece.ghost_row, self._piece.ghost_col)
-            self._piece.draw_ghost(surface, pos_ghost)
-            self._piece.draw_normal(surface, pos_normal)
-
+        piece = self._piece
+        active = None if piece is None else (piece.name, piece.row, piece.col, piece.rot,
+                                             piece.ghost_row, piece.ghost_col, piece.ghost_rot, piece.active)
+        return GameSnapshot(self._board.snapshot(), active,
+                            None if self._hold_piece is None else self._hold_piece.name,
+                            self._bag.snapshot(), self._score.snapshot(), self._mechanics.snapshot(),
+                            tuple(self._preview), self._game_over, self._last_action_was_rotation,
+                            self._piece_just_locked, self._pieces_locked)
+
+    def restore(self, snapshot: GameSnapshot) -> None:
+        """
+        Vuelve al estado capturado con snapshot, de esta partida o de otra con la misma configuración.
 
+        La pieza activa y la del hold se recrean; el tablero se sobrescribe en su lugar.
+        """
+        self._board.restore(snapshot.board)
+        if snapshot.piece is None:
+            self._piece = None
+        else:
+            name, row, col, rot, ghost_row, ghost_col, ghost_rot, active = snapshot.piece
+            piece = Piece(name, self._data[name], row, col, rot)
+            piece.ghost_row, piece.ghost_col, piece.ghost_rot, piece.active = ghost_row, ghost_col, ghost_rot, active
+            self._piece = piece
+        hold = snapshot.hold
+        self._hold_piece = None if hold is None else Piece(hold, self._data[hold])
+        self._bag.restore(snapshot.bag)
+        self._score.restore(snapshot.score)
+        self._mechanics.restore(snapshot.mechanics)
+        self._preview = list(snapshot.preview)
+        self._game_over = snapshot.game_over
+        self._last_action_was_rotation = snapshot.rotated
+        self._piece_just_locked = snapshot.just_locked
+        self._pieces_locked = snapshot.locked
 
     # --- INPUT ---
     def move_left(self) -> bool:
@@ -185,14 +318,17 @@ class GameBoardController:
             return True
         return False
 
-    def hard_drop(self) -> None:
+    def hard_drop(self) -> bool:
         if self._piece is None or self._piece.is_locked():
-            return
+            return False
+        # Asegura un ghost actualizado si la pieza se movió en este mismo frame
+        self._mechanics.calculate_ghost(self._piece)
         self._score.hard_drop = max(0, self._piece.ghost_row - max(self._piece.row, 0))
         self._piece.row = self._piece.ghost_row
         self._piece.col = self._piece.ghost_col
         self._last_action_was_rotation = False
         self._resolve_lock()
+        return True
 
     def hold(self) -> bool:
         if not self._hold_enabled or self._piece is None or self._piece.is_locked():
@@ -208,10 +344,43 @@ class GameBoardController:
             self._piece = Piece(incoming_name, self._data[incoming_name])
             self._piece.center(self._board.cols, spawn_offset=PIECE_SPAWN_OFFSET)
             self._mechanics.reset()
-            self._preview.generate()
+            self._update_preview()
             self._mechanics.calculate_ghost(self._piece)
         return True
 
+    def receive_garbage(self, count: int, hole: int) -> bool:
+        """
+        Inserta `count` filas de basura con el hueco en la columna `hole` (ver Board.insert_garbage).
+
+        Si la pieza activa queda superpuesta con el tablero sube hasta quedar libre. Si algún
+        bloque sale por arriba la partida termina.
+
+        Returns:
+            bool: True si se insertó la basura (no hay game over previo ni animación en curso).
+        """
+        if self._game_over or self._board.is_animating or count <= 0:
+            return False
+        if self._board.insert_garbage(count, hole):
+            self._game_over = True
+        piece = self._piece
+        if piece is not None and not piece.is_locked():
+            while not self._board.is_valid_move(piece) and piece.row > -self._board.rows:
+                piece.row -= 1
+            self._mechanics.calculate_ghost(piece)
+        return True
+
+    def perform(self, action: Action) -> bool:
+        """
+        Despacha una acción de input al método correspondiente.
+
+        Args:
+            action: Acción a aplicar.
+
+        Returns:
+            True si la acción tuvo efecto sobre la pieza.
+        """
+        return self._ACTIONS[action](self)
+
     def consume_lock_event(self) -> bool:
         """Retorna True si una pieza se bloqueó este frame y resetea el flag."""
         if self._piece_just_locked:
@@ -226,12 +395,6 @@ class GameBoardController:
     def is_game_over(self) -> bool:
         return self._game_over
 
-    def debug_draw(self, surface: "Surface", font: "Font") -> None:
-        """Delega el debug draw al Score con las métricas internas del controller."""
-        fall = (self._mechanics.get_fall_delay(self._score.level), self._mechanics.fall_timer)
-        lock = (self._mechanics.lock_delay, self._mechanics.lock_timer)
-        self._score.debug_draw(surface, font, fall, lock)
-
 
 
     # --- HELPERS INTERNOS ---
@@ -256,7 +419,7 @@ class GameBoardController:
         self._mechanics.reset()
         if enable_hold:
             self._mechanics.enable_hold()
-        self._preview.generate()
+        self._update_preview()
         self._mechanics.calculate_ghost(self._piece)
 
     def _resolve_lock(self) -> None:
@@ -270,4 +433,20 @@ class GameBoardController:
         self._score.update(lines, move_type)
         self._last_action_was_rotation = False
         self._mechanics.reset()
-        self._piece_just_locked = True
\ No newline at end of file
+        self._piece_just_locked = True
+        self._pieces_locked += 1
+
+    def _update_preview(self) -> None:
+        """Actualiza los nombres de las próximas piezas."""
+        self._preview = self._bag.peek_next(self._preview_count)
+
+    # Tabla de despacho de perform (las acciones de input en el orden de Action)
+    _ACTIONS = {
+        Action.MOVE_LEFT:    move_left,
+        Action.MOVE_RIGHT:   move_right,
+        Action.SOFT_DROP:    soft_drop,
+        Action.ROTATE_RIGHT: rotate_right,
+        Action.ROTATE_LEFT:  rotate_left,
+        Action.HARD_DROP:    hard_drop,
+        Action.HOLD:         hold,
+    }
@@ -1,21 +1,23 @@
-import pygame
 import numpy as np
-from src.constants import BLOCK_W, BLOCK_H, WALL_KICKS
-from src.core.types import PieceData
+from typing import TYPE_CHECKING
+from src.constants import WALL_KICKS
+
+if TYPE_CHECKING:
+    from src.core.types import PieceShape
 
 class Piece:
     """
     Representa un tetromino individual en el juego.
 
     Esta clase gestiona el estado dinámico de una pieza, incluyendo su posición 
-    en la cuadrícula, su rotación actual y su representación visual.
+    en la cuadrícula y su rotación actual. La representación visual vive en src.render.PieceView.
     """
-    def __init__(self, name: str, data: "PieceData", row: int = 0, col: int = 0, rot: int = 0) -> None:
+    def __init__(self, name: str, data: "PieceShape", row: int = 0, col: int = 0, rot: int = 0) -> None:
         """
         Inicializa una pieza activa del juego.
         Args:
             name: Identificador de la pieza ('O', 'T', 'J'...).
-            data: Datos estáticos de la pieza (matrices y superficies).
+            data: Datos estáticos de la pieza (matrices y tablas de celdas por rotación).
             row: Fila inicial de la pieza en el tablero.
             col: Columna inicial de la pieza en el tablero.
             rot: Indice de la rotación actual.
@@ -38,6 +40,26 @@ class Piece:
     def matrix(self) -> np.ndarray:
         """Devuelve la matriz correspondiente a la rotación actual de la pieza."""
         return self._data["matrices"][self.rot]
+
+    @property
+    def offsets(self) -> tuple[tuple[int, int], ...]:
+        """Celdas ocupadas (dr, dc) de la rotación actual, relativas a (row, col)."""
+        return self._data["offsets"][self.rot]
+
+    @property
+    def bounds(self) -> tuple[int, int, int, int]:
+        """Extremos (min_dr, max_dr, min_dc, max_dc) de la rotación actual."""
+        return self._data["bounds"][self.rot]
+
+    @property
+    def row_masks(self) -> tuple[tuple[int, int], ...]:
+        """Filas ocupadas de la rotación actual como (dr, máscara de columnas)."""
+        return self._data["row_masks"][self.rot]
+
+    @property
+    def column_bottoms(self) -> tuple[tuple[int, int], ...]:
+        """Celda más baja de cada columna de la rotación actual como (dc, max_dr)."""
+        return self._data["column_bottoms"][self.rot]
     
     def is_locked(self) -> bool:
         """Retorna verdadero si la pieza ya está bloqueada en el tablero"""
@@ -51,14 +73,6 @@ class Piece:
         """Cambia el estado de la pieza a activada"""
         self.active = True
     
-    def draw_normal(self, surface: pygame.Surface, position_in_board: tuple[int, int]) -> None:
-        """Dibuja la pieza normal usando su surface de bloque normal."""
-        self._draw_blocks(surface, position_in_board, self._data["block"]["normal"])
-
-    def draw_ghost(self, surface: pygame.Surface, position_in_board: tuple[int, int]) -> None:
-        """Dibuja la pieza fantasma usando su surface de bloque ghost."""
-        self._draw_blocks(surface, position_in_board, self._data["block"]["ghost"])
-
     def move(self, dr: int, dc: int):
         """
         Modifica la posición de la pieza desplazandola en filas y columnas.
@@ -104,12 +118,7 @@ class Piece:
         """
         baserow = self.row if row is None else row
         basecol = self.col if col is None else col
-
-        cells: list[tuple[int, int]] = []
-        for (r,c), block in np.ndenumerate(self.matrix):
-            if block: 
-                cells.append((baserow + r, basecol + c))
-        return cells
+        return [(baserow + dr, basecol + dc) for dr, dc in self._data["offsets"][self.rot]]
     
     def get_wall_kicks(self, old_rot: int, new_rot: int):
         """
@@ -137,17 +146,3 @@ class Piece:
             return [(0, 0)]
 
         return table.get((old_rot % 4, new_rot % 4), [(0, 0)])
-
-    
-    # --- HELPERS ---
-    def _draw_blocks(self, surface: pygame.Surface, position_in_board: tuple[int, int], block_surface: pygame.Surface) -> None:
-        """
-        Método interno que dibuja los bloques de la pieza usando la surface indicada.
-        """
-        pos_x, pos_y = position_in_board
-        for (r, c), block in np.ndenumerate(self.matrix):
-            if not block:
-                continue
-            dx = pos_x + c * BLOCK_W
-            dy = pos_y + r * BLOCK_H
-            surface.blit(block_surface, (dx, dy))
\ No newline at end of file
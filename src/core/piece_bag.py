@@ -1,30 +1,87 @@
 import random
+from collections import deque
+from itertools import chain, islice, count as count_from
+from typing import Iterator, TYPE_CHECKING
+from src.core.zobrist import mix64
+
+if TYPE_CHECKING:
+    from src.core.types import PieceBagState
+
+# Constantes de SplitMix64 para derivar números pseudoaleatorios de (seed, lote)
+_MASK64  = (1 << 64) - 1
+_GOLDEN  = 0x9E3779B97F4A7C15
 
 class PieceBag:
     """
     Gestiona la generación de piezas utilizando un sistema de bolsa (Bag System).
 
-    Garantiza una distribución equitativa de los tetrominos, evitando rachas 
-    largas de la misma pieza o la ausencia prolongada de una específica. 
-    
-    Funciona llenando una 'bolsa' con un set completo de piezas, barajándolas y 
+    Garantiza una distribución equitativa de los tetrominos, evitando rachas
+    largas de la misma pieza o la ausencia prolongada de una específica.
+
+    Funciona llenando una 'bolsa' con un set completo de piezas, barajándolas y
     entregándolas una a una.
+
+    Cada lote se baraja (Fisher-Yates) con números SplitMix64 derivados de (seed, índice del lote),
+    por lo que la secuencia completa depende solo de la semilla, es idéntica en cualquier plataforma
+    y el estado cabe en (seed, bag_index, queue).
     """
-    def __init__(self, pieces: dict, multiplier: int) -> None:
+    def __init__(self, pieces: dict, multiplier: int, seed: int | None = None) -> None:
         """
         Inicializa la bolsa de piezas del juego.
 
         Args:
+           pieces (dict): Definiciones de piezas; se usan sus llaves como nombres.
            multiplier (int): Cantidad de veces que se agrega el set completo piezas a la bolsa antes de mezclar.
+           seed (int | None): Semilla de la secuencia. Si es None se elige una al azar (ver `seed`).
         """
         # Extrae las llaves del diccionario de PIECE_DEFINITIONS ("O", "T", etc.)
         self.available_pieces: list[str] = list(pieces.keys())
         self.__valid_multiplier(multiplier)
         self.multiplier = multiplier
-        
-        self.queue: list[str] = []
+
+        self.__valid_seed(seed)
+        self._seed: int = random.getrandbits(63) if seed is None else seed
+        self._bag_index: int = 0
+
+        self.queue: deque[str] = deque()
         self.__fill_bag()
 
+    @property
+    def seed(self) -> int:
+        """Semilla de la secuencia; con ella se reproduce la partida completa."""
+        return self._seed
+
+    @property
+    def drawn(self) -> int:
+        """Cantidad de piezas entregadas desde el inicio de la secuencia (posición en la bolsa)."""
+        return self._bag_index * len(self.available_pieces) * self.multiplier - len(self.queue)
+
+    @property
+    def lot(self) -> dict[str, int]:
+        """Composición de cada lote: cuántas veces aparece cada pieza."""
+        return {name: self.multiplier for name in self.available_pieces}
+
+    def remaining(self, after: int = 0) -> dict[str, int]:
+        """
+        Piezas que todavía pueden salir del lote en curso, una vez entregadas las próximas `after`.
+
+        Solo descuenta las piezas del lote que ya salieron o que están entre las `after` visibles,
+        así que no revela el orden de las que faltan. Si el lote se completa justo ahí, devuelve
+        la composición de un lote nuevo.
+
+        Args:
+            after: Próximas piezas que se consideran ya entregadas (p. ej. las del preview).
+
+        Returns:
+            dict[str, int]: Cantidad restante de cada pieza (las agotadas valen 0).
+        """
+        size = len(self.available_pieces) * self.multiplier
+        index, offset = divmod(self.drawn + after, size)
+        counts = self.lot
+        for name in self.__build_lot(index)[:offset]:
+            counts[name] -= 1
+        return counts
+
     def get_next_piece(self) -> str:
         """
         Extrae y devuelve el identificador de la siguiente pieza en la cola.
@@ -34,8 +91,8 @@ class PieceBag:
             str: El nombre de la pieza (p. ej., 'I', 'J', 'O').
         """
         if not self.queue: self.__fill_bag()
-        return self.queue.pop(0)
-    
+        return self.queue.popleft()
+
     def peek_next(self, count: int) -> list[str]:
         """
         Permite previsualizar las próximas piezas sin sacarlas de la cola.
@@ -48,14 +105,72 @@ class PieceBag:
         while len(self.queue) < count:
             self.__fill_bag()
 
-        return self.queue[:count]
-    
+        return list(islice(self.queue, count))
+
+    def stream(self, count: int | None = None) -> Iterator[str]:
+        """
+        Itera la secuencia de piezas a partir del estado actual sin consumir la bolsa.
+
+        Los lotes se generan bajo demanda y se encadenan en C, por lo que sirve para producir
+        millones de piezas para análisis. La secuencia es la misma que devolverían llamadas
+        sucesivas a get_next_piece.
+
+        Args:
+            count: Cantidad de piezas a generar. Si es None el iterador no termina.
+        """
+        lots = map(self.__build_lot, count_from(self._bag_index))
+        pieces = chain(list(self.queue), chain.from_iterable(lots))
+        return pieces if count is None else islice(pieces, count)
+
+    def get_state(self) -> "PieceBagState":
+        """Devuelve el estado de la bolsa (semilla, lotes generados y cola pendiente)."""
+        return {"seed": self._seed, "bag_index": self._bag_index, "queue": list(self.queue)}
+
+    def set_state(self, state: "PieceBagState") -> None:
+        """
+        Restaura un estado obtenido con get_state.
+
+        Raises:
+            ValueError: Si la cola contiene piezas que la bolsa no conoce.
+        """
+        unknown = set(state["queue"]) - set(self.available_pieces)
+        if unknown:
+            raise ValueError(f"PieceBag: piezas desconocidas en el estado ({', '.join(sorted(unknown))}).")
+        self.__valid_seed(state["seed"])
+        self._seed = state["seed"]
+        self._bag_index = state["bag_index"]
+        self.queue = deque(state["queue"])
+
+    def snapshot(self) -> tuple[int, int, tuple[str, ...]]:
+        """Versión inmutable y sin validación de get_state, para capturas frecuentes (ver restore)."""
+        return self._seed, self._bag_index, tuple(self.queue)
+
+    def restore(self, snapshot: tuple[int, int, tuple[str, ...]]) -> None:
+        """Restaura un estado obtenido con snapshot de esta misma bolsa."""
+        self._seed, self._bag_index, queue = snapshot
+        self.queue = deque(queue)
+
     # --- HELPERS ---
     def __fill_bag(self) -> None:
-        """Genera un nuevo lote de piezas, lo baraja y lo añade a la cola."""
+        """Genera el siguiente lote de piezas y lo añade a la cola."""
+        self.queue.extend(self.__build_lot(self._bag_index)) # Agrega las piezas a la bolsa
+        self._bag_index += 1
+
+    def __build_lot(self, index: int) -> list[str]:
+        """Genera el lote número `index`, barajado con el RNG derivado de (seed, index)."""
         new_batch = self.available_pieces * self.multiplier
-        random.shuffle(new_batch) # Baraja las piezas
-        self.queue.extend(new_batch) # Agrega las piezas a la bolsa
+        # Estado único por (seed, lote): cualquier lote se reproduce sin generar los anteriores
+        state = (self._seed * _GOLDEN + index) & _MASK64
+        rand, span = 0, 0
+        for i in range(len(new_batch) - 1, 0, -1): # Baraja las piezas
+            # Un número de 64 bits alcanza para varios índices; se renueva al quedar menos de 32 bits
+            if span < (1 << 32):
+                state = (state + _GOLDEN) & _MASK64
+                rand, span = mix64(state), 1 << 64
+            rand, j = divmod(rand, i + 1)
+            span //= i + 1
+            new_batch[i], new_batch[j] = new_batch[j], new_batch[i]
+        return new_batch
 
     def __valid_multiplier(self, multiplier: int) -> None:
         if multiplier <= 0:
@@ -63,6 +178,10 @@ class PieceBag:
                 f"PieceBag: multiplicador inválido ({multiplier}). "
                 "Debe ser un entero positivo mayor que cero."
             )
-            
+
+    def __valid_seed(self, seed: int | None) -> None:
+        if seed is not None and (not isinstance(seed, int) or seed < 0):
+            raise ValueError(f"PieceBag: semilla inválida ({seed}). Debe ser un entero no negativo.")
+
     def __str__(self) -> str:
-        return f"A la bolsa de piezas le quedan {len(self.queue)} piezas, y la proxima pieza es {self.queue[0] if self.queue else 'None'}."
\ No newline at end of file
+        return f"A la bolsa de piezas le quedan {len(self.queue)} piezas, y la proxima pieza es {self.queue[0] if self.queue else 'None'}."
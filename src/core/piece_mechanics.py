@@ -42,6 +42,25 @@ class PieceMechanics:
     def fall_timer(self) -> float:
         return self._fall_timer
 
+    @property
+    def wall_kicks(self) -> bool:
+        """Si las rotaciones aplican wall kicks."""
+        return self._wall_kicks
+
+    @property
+    def can_hold(self) -> bool:
+        """True si el hold está disponible para la pieza actual."""
+        return self._can_hold
+
+    def snapshot(self) -> tuple[float, bool, tuple[float, int]]:
+        """Captura los timers de caída y lock y el estado del hold (ver restore)."""
+        return self._fall_timer, self._can_hold, self._lock.snapshot()
+
+    def restore(self, snapshot: tuple[float, bool, tuple[float, int]]) -> None:
+        """Restaura el estado capturado con snapshot."""
+        self._fall_timer, self._can_hold, lock = snapshot
+        self._lock.restore(lock)
+
     def get_fall_delay(self, level: int) -> float:
         """Retorna el delay de caída según el nivel actual."""
         return self._gravity.get_fall_delay(level)
@@ -83,11 +102,7 @@ class PieceMechanics:
         if piece.col == piece.ghost_col and piece.rot == piece.ghost_rot and piece.row == piece.ghost_row:
             return
 
-        row = piece.row
-        while self._board.is_valid_move(piece, row + 1, piece.col):
-            row += 1
-
-        piece.ghost_row = row
+        piece.ghost_row = self._board.drop_row(piece)
         piece.ghost_col = piece.col
         piece.ghost_rot = piece.rot
 
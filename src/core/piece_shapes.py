@@ -0,0 +1,88 @@
+import numpy as np
+from typing import Any, TYPE_CHECKING
+from src.constants import PIECE_DEFINITIONS
+
+if TYPE_CHECKING:
+    from src.core.types import PieceShape, PieceShapeType, PieceOffsets, PieceBounds, PieceRowMasks, PieceColumnBottoms
+
+
+def build_piece_shape(base_matrix: np.ndarray, type: int) -> "PieceShape":
+    """
+    Genera los datos lógicos de una pieza: rotaciones, celdas ocupadas, bounding box,
+    máscaras de bits por fila y celda inferior por columna de cada rotación.
+
+    Args:
+        base_matrix: Matriz base de la pieza.
+        type: Entero que identifica el color de la pieza en el tablero.
+    """
+    matrices = generate_rotations(base_matrix)
+    offsets = generate_offsets(matrices)
+    return {
+        "matrices": matrices,
+        "offsets": offsets,
+        "bounds": generate_bounds(offsets),
+        "row_masks": generate_row_masks(offsets),
+        "column_bottoms": generate_column_bottoms(offsets),
+        "type": type,
+    }
+
+
+def build_piece_shapes(definitions: dict[str, dict[str, Any]] = PIECE_DEFINITIONS) -> "PieceShapeType":
+    """
+    Construye las formas de todas las piezas sin surfaces, para simulaciones sin render.
+
+    El tipo de cada pieza es su columna en el spritesheet, igual que al cargar los recursos.
+    """
+    return {name: build_piece_shape(info["matrix"], info["spritesheet_col"])
+            for name, info in definitions.items()}
+
+
+def generate_rotations(matrix: np.ndarray) -> list[np.ndarray]:
+    """Genera las cuatro rotaciones (0°, 90°, 180°, 270°) de la matriz."""
+    rotations = [matrix]
+    for _ in range(3):
+        matrix = np.rot90(matrix, k=-1)
+        rotations.append(matrix)
+    return rotations
+
+
+def generate_offsets(matrices: list[np.ndarray]) -> "PieceOffsets":
+    """Genera las tuplas inmutables de celdas ocupadas (dr, dc) de cada rotación."""
+    return tuple(
+        tuple((int(r), int(c)) for r, c in zip(*np.nonzero(matrix)))
+        for matrix in matrices
+    )
+
+
+def generate_bounds(offsets: "PieceOffsets") -> "PieceBounds":
+    """Calcula los extremos (min_dr, max_dr, min_dc, max_dc) de cada rotación."""
+    bounds = []
+    for cells in offsets:
+        if not cells:
+            raise ValueError("Piece Shapes: La matriz de la pieza no tiene celdas ocupadas.")
+        rows = [dr for dr, _ in cells]
+        cols = [dc for _, dc in cells]
+        bounds.append((min(rows), max(rows), min(cols), max(cols)))
+    return tuple(bounds)
+
+
+def generate_row_masks(offsets: "PieceOffsets") -> "PieceRowMasks":
+    """Agrupa las celdas de cada rotación en máscaras de bits por fila (bit dc = columna dc)."""
+    masks = []
+    for cells in offsets:
+        rows: dict[int, int] = {}
+        for dr, dc in cells:
+            rows[dr] = rows.get(dr, 0) | (1 << dc)
+        masks.append(tuple(sorted(rows.items())))
+    return tuple(masks)
+
+
+def generate_column_bottoms(offsets: "PieceOffsets") -> "PieceColumnBottoms":
+    """Calcula la celda más baja (dc, max_dr) de cada columna ocupada en cada rotación."""
+    bottoms = []
+    for cells in offsets:
+        cols: dict[int, int] = {}
+        for dr, dc in cells:
+            cols[dc] = max(cols.get(dc, dr), dr)
+        bottoms.append(tuple(sorted(cols.items())))
+    return tuple(bottoms)
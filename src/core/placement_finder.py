@@ -0,0 +1,271 @@
+import numpy as np
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING
+from src.constants import WALL_KICKS, PIECE_SPAWN_OFFSET
+from src.core.action import Action
+from src.core.piece_shapes import build_piece_shapes
+
+if TYPE_CHECKING:
+    from src.core.board import Board
+    from src.core.types import PieceShape, PieceShapeType
+
+
+# Action por valor, para reconstruir las secuencias sin pasar por el constructor del enum
+_ACTIONS = tuple(Action)
+
+
+@dataclass
+class Placement:
+    """
+    Posición final alcanzable de una pieza y la secuencia de inputs más corta para llegar.
+
+    La secuencia se reconstruye recién al pedir `actions`, así que enumerar posiciones
+    para evaluarlas no paga el costo de armar todas las secuencias.
+
+    Attributes:
+        name: Nombre de la pieza.
+        rot:  Rotación final.
+        row:  Fila final.
+        col:  Columna final.
+    """
+    name: str
+    rot:  int
+    row:  int
+    col:  int
+    # Rastro del BFS: (estado desde el que se suelta, padres, acción que llevó a cada estado)
+    _trail: tuple[int, list[int], bytearray] = field(repr=False, compare=False)
+
+    @cached_property
+    def actions(self) -> tuple[Action, ...]:
+        """Inputs desde el spawn (o el estado inicial indicado), terminando en HARD_DROP."""
+        s, parent, action = self._trail
+        actions = [Action.HARD_DROP]
+        while parent[s] != s:
+            actions.append(_ACTIONS[action[s]])
+            s = parent[s]
+        actions.reverse()
+        return tuple(actions)
+
+
+class PlacementFinder:
+    """
+    Enumera las posiciones finales alcanzables de una pieza sobre un tablero.
+
+    Hace un BFS sobre los estados (rot, row, col) con los mismos movimientos que el jugador:
+    mover a los lados, bajar una fila (soft drop) y rotar aplicando el primer wall kick válido,
+    igual que PieceMechanics.try_move / try_rotate. Cada estado alcanzado se suelta con
+    HARD_DROP; como el BFS avanza por cantidad de inputs, la primera vez que se llega a
+    una posición final se tiene su secuencia más corta.
+
+    Las colisiones se resuelven con un bitset de filas válidas por (rotación, columna),
+    calculado una vez por búsqueda a partir de la ocupación de cada columna del tablero.
+    Las posiciones que ocupan las mismas celdas con otra rotación (S, Z, I) se reportan una vez.
+
+    Por encima de la pila (zona libre) la validez no depende de la fila, así que mover o rotar
+    después de un soft drop equivale a hacerlo antes: esos estados solo siguen bajando.
+    """
+    # Filas por encima del tablero que se consideran (las celdas con fila < 0 son libres)
+    ROW_MARGIN = 8
+    # Columnas extra a cada lado para que los kicks nunca salgan de la tabla de estados
+    COL_MARGIN = 6
+
+    def __init__(self, pieces: "PieceShapeType | None" = None, wall_kicks: bool = True) -> None:
+        """
+        Args:
+            pieces: Formas de las piezas. Si no se indica se construyen desde PIECE_DEFINITIONS.
+            wall_kicks: Si las rotaciones aplican wall kicks (como el ruleset activo).
+        """
+        self._data       = pieces if pieces is not None else build_piece_shapes()
+        self._wall_kicks = wall_kicks
+        self._cache: dict[tuple[str, int], tuple[list, list]] = {}
+
+    def find(self, board: "Board", name: str, row: int | None = None, col: int | None = None,
+             rot: int = 0) -> list[Placement]:
+        """
+        Devuelve todas las posiciones finales alcanzables de la pieza.
+
+        Args:
+            board: Tablero sobre el que se busca.
+            name: Nombre de la pieza.
+            row: Fila inicial (la de spawn por defecto).
+            col: Columna inicial (centrada como en el spawn por defecto).
+            rot: Rotación inicial.
+
+        Returns:
+            list[Placement]: Las posiciones en el orden en que se encontraron (secuencias más cortas primero).
+            Vacía si la pieza no cabe en el estado inicial.
+
+        Raises:
+            KeyError: Si la pieza no existe.
+        """
+        shape = self._data[name]
+        if row is None:
+            row = PIECE_SPAWN_OFFSET
+        if col is None:
+            col = (board.cols - shape["matrices"][0].shape[1]) // 2
+
+        rotations = len(shape["offsets"])
+        height    = board.rows + self.ROW_MARGIN
+        width     = board.cols + 2 * self.COL_MARGIN
+        fit, free = self._fit_table(board, shape, width)
+        # Un estado que bajó dentro de la zona libre solo sigue bajando (kicks de hasta 2 filas)
+        free_top, free_bottom = 3, free - 3
+
+        start_rc = rot * width + col + self.COL_MARGIN
+        start_ri = row + self.ROW_MARGIN
+        if not 0 <= start_ri < height or not fit[start_rc] >> start_ri & 1:
+            return []
+
+        turns, shapes = self._tables(name, shape, width)
+
+        parent = [-1] * (rotations * width * height)
+        action = bytearray(len(parent))
+        start  = start_rc * height + start_ri
+        parent[start] = start
+
+        # BFS por capas: layers[d] son los estados a d inputs del inicial
+        found: set[int] = set()
+        landing: list[tuple[int, int]] = []
+        layers: list[list[int]] = [[start]]
+        depth = 0
+        while any(layers[depth:]):
+            if depth + 1 == len(layers):
+                layers.append([])
+            following = layers[depth + 1]
+
+            for s in layers[depth]:
+                rc, ri = divmod(s, height)
+                run = fit[rc] >> ri
+
+                # Hard drop: la posición final es el final de la racha de filas válidas desde ri
+                drop = ri + ((~run & (run + 1)).bit_length() - 2)
+                shape_id, top, left = shapes[rc]
+                key = (shape_id * height + drop + top) * width + left
+                if key not in found:
+                    found.add(key)
+                    landing.append((s, s - ri + drop))
+
+                # Soft drop: en la zona libre se baja de corrido hasta salir de ella
+                if run & 2 and parent[s + 1] < 0:
+                    t, k = s + 1, 1
+                    parent[t] = s
+                    action[t] = Action.SOFT_DROP
+                    while free_top <= ri + k < free_bottom and run >> (k + 1) & 1 and parent[t + 1] < 0:
+                        parent[t + 1] = t
+                        action[t + 1] = Action.SOFT_DROP
+                        t, k = t + 1, k + 1
+                    if not free_top <= ri + k < free_bottom:
+                        while len(layers) <= depth + k:
+                            layers.append([])
+                        layers[depth + k].append(t)
+
+                # Movimientos laterales
+                if fit[rc - 1] >> ri & 1:
+                    t = s - height
+                    if parent[t] < 0:
+                        parent[t] = s
+                        action[t] = Action.MOVE_LEFT
+                        following.append(t)
+                if fit[rc + 1] >> ri & 1:
+                    t = s + height
+                    if parent[t] < 0:
+                        parent[t] = s
+                        action[t] = Action.MOVE_RIGHT
+                        following.append(t)
+
+                # Rotaciones: se aplica el primer kick válido, como en try_rotate
+                for code, kicks in turns[rc]:
+                    for dc, dr in kicks:
+                        nri = ri + dr
+                        if 0 <= nri < height and fit[rc + dc] >> nri & 1:
+                            t = s + dc * height + dr
+                            if parent[t] < 0:
+                                parent[t] = s
+                                action[t] = code
+                                following.append(t)
+                            break
+            depth += 1
+
+        return [self._placement(name, source, final, parent, action, width, height)
+                for source, final in landing]
+
+    # --- HELPERS ---
+    def _fit_table(self, board: "Board", shape: "PieceShape", width: int) -> tuple[list[int], int]:
+        """
+        Calcula, para cada (rotación, columna), el bitset de filas donde la pieza cabe.
+
+        El bit (row + ROW_MARGIN) indica que la pieza en (row, col) no sale del tablero
+        ni choca con bloques; las filas negativas solo se limitan por el margen.
+
+        Returns:
+            tuple[list[int], int]: Los bitsets y el primer índice de fila donde alguna
+            rotación choca con la pila o el piso (por encima solo limitan las paredes).
+        """
+        weights = np.left_shift(1, np.arange(board.rows, dtype=np.int64) + self.ROW_MARGIN)
+        columns = [int(bits) for bits in (board.matrix != 0).T.astype(np.int64) @ weights]
+
+        fit  = []
+        free = board.rows + self.ROW_MARGIN
+        for cells, (_, bottom, left, right) in zip(shape["offsets"], shape["bounds"]):
+            floor = board.rows - bottom + self.ROW_MARGIN
+            free  = min(free, floor)
+            for c in range(-self.COL_MARGIN, board.cols + self.COL_MARGIN):
+                if c + left < 0 or c + right >= board.cols:
+                    fit.append(0)
+                    continue
+                blocked = 0
+                for dr, dc in cells:
+                    blocked |= columns[c + dc] >> dr
+                if blocked:
+                    free = min(free, (blocked & -blocked).bit_length() - 1)
+                fit.append(((1 << floor) - 1) & ~blocked)
+        return fit, free
+
+    def _tables(self, name: str, shape: "PieceShape", width: int) -> tuple[list, list]:
+        """
+        Devuelve (y cachea) las tablas por índice (rotación, columna) de la pieza.
+
+        Returns:
+            tuple[list, list]: Los giros posibles como (acción, kicks) y la llave de forma
+            (id de forma, min_dr, min_dc + columna) de cada índice. Cada kick es
+            (salto de índice, salto de fila): el cambio de rotación va incluido en el salto.
+            Dos posiciones ocupan las mismas celdas si tienen el mismo id de forma y la
+            misma esquina (row + min_dr, col + min_dc).
+        """
+        cache_key = (name, width)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
+        rotations = len(shape["offsets"])
+        if name == "O":
+            table = {}
+        else:
+            table = WALL_KICKS["I"] if name == "I" else WALL_KICKS["OTHERS"]
+
+        turns, shapes, ids = [], [], {}
+        for rot, (cells, (top, _, left, _)) in enumerate(zip(shape["offsets"], shape["bounds"])):
+            options = []
+            for code, direction in ((Action.ROTATE_RIGHT, 1), (Action.ROTATE_LEFT, -1)):
+                if name == "O":
+                    break
+                new_rot = (rot + direction) % rotations
+                kicks = table.get((rot % 4, new_rot % 4), [(0, 0)]) if self._wall_kicks else [(0, 0)]
+                # Los kicks SRS son (x, y) con y positivo hacia arriba, como en try_rotate
+                options.append((code, [((new_rot - rot) * width + dx, -dy) for dx, dy in kicks]))
+
+            normalized = tuple(sorted((dr - top, dc - left) for dr, dc in cells))
+            shape_id = ids.setdefault(normalized, len(ids))
+            for index in range(width):
+                turns.append(options)
+                shapes.append((shape_id, top, left + index))
+
+        self._cache[cache_key] = (turns, shapes)
+        return turns, shapes
+
+    def _placement(self, name: str, source: int, final: int, parent: list[int], action: bytearray,
+                   width: int, height: int) -> Placement:
+        """Arma la Placement de la posición final `final`, alcanzada al soltar desde `source`."""
+        rc, ri = divmod(final, height)
+        rot, ci = divmod(rc, width)
+        return Placement(name, rot, ri - self.ROW_MARGIN, ci - self.COL_MARGIN, (source, parent, action))
@@ -1,5 +1,4 @@
 from typing import TYPE_CHECKING
-import pygame
 
 if TYPE_CHECKING:
     from src.config import GameplayConfigType
@@ -31,12 +30,32 @@ class Score:
 
         self._lines_cleared = 0
 
+        # Tipo de la última jugada y si cobró el bonus de back-to-back (para el ataque en versus)
+        self.last_move_type: str = "normal"
+        self.last_back_to_back: bool = False
+
+    def snapshot(self) -> tuple[int, ...]:
+        """Captura los contadores del puntaje en una tupla (ver restore)."""
+        return (self.current_score, self.aux_score, self.combo_count, self.back_to_back_active, self.level,
+                self.lines_cleared_total, self.tetrises, self.soft_drop, self.prev_soft_drop,
+                self.hard_drop, self.prev_hard_drop, self._lines_cleared, self.last_move_type,
+                self.last_back_to_back)
+
+    def restore(self, snapshot: tuple[int, ...]) -> None:
+        """Restaura los contadores capturados con snapshot."""
+        (self.current_score, self.aux_score, self.combo_count, self.back_to_back_active, self.level,
+         self.lines_cleared_total, self.tetrises, self.soft_drop, self.prev_soft_drop,
+         self.hard_drop, self.prev_hard_drop, self._lines_cleared, self.last_move_type,
+         self.last_back_to_back) = snapshot
+
     def update(self, lines_cleared: int, move_type: str) -> None:
         self.prev_soft_drop = self.soft_drop
         self.prev_hard_drop = self.hard_drop
         self.aux_score = 0
 
         self._lines_cleared = lines_cleared
+        self.last_move_type = move_type
+        self.last_back_to_back = False
 
         if self.soft_drop > 0: self.apply_soft_drop(self.soft_drop)
         if self.hard_drop > 0: self.apply_hard_drop(self.hard_drop)
@@ -70,6 +89,7 @@ class Score:
         is_difficult = (lines_cleared == 4) or (move_type in ("t_spin", "mini_t_spin"))
 
         if is_difficult and self.back_to_back_active:
+            self.last_back_to_back = True
             self.aux_score = int(self.aux_score * self.config["score"]["back_to_back_multiplier"])
 
         # Activa el flag si fue difícil, lo resetea si fue clear normal
@@ -117,28 +137,3 @@ class Score:
     def level_up(self) -> None:
         """Actualiza el nivel según las líneas eliminadas."""
         self.level = self.lines_cleared_total // self.config["general"]["lines_per_level"] + 1
-
-    def debug_draw(self, surface: pygame.Surface, font: pygame.font.Font,
-                   fall: tuple[float, float], lock: tuple[float, float],
-                   pos_x: int = 10, pos_y: int = 10, line_height: int = 25) -> None:
-        debug_texts = [
-            "ACTUAL SCORE:",
-            f"Current Score: {self.current_score}",
-            f"Aux Score: {self.aux_score}",
-            f"Combo Count: {self.combo_count}",
-            f"Back-to-Back: {self.back_to_back_active}",
-            f"Level: {self.level}",
-            f"Lines Cleared Total: {self.lines_cleared_total}",
-            f"Fall Delay: {fall[0]:.3f}",
-            f"Fall Timer: {fall[1]:.3f}",
-            f"Lock Delay: {lock[0]:.3f}",
-            f"Lock Timer: {lock[1]:.3f}",
-            "", "", "CHANGES:",
-            f"Previous Soft Drop: {self.prev_soft_drop} x{self.config['score']['soft_drop']} ({self.prev_soft_drop * self.config['score']['soft_drop']})",
-            f"Previous Hard Drop: {self.prev_hard_drop} x{self.config['score']['hard_drop']} ({self.prev_hard_drop * self.config['score']['hard_drop']})",
-            f"Previous Lines Cleared: {self._lines_cleared}"
-        ]
-
-        for i, text in enumerate(debug_texts):
-            rendered = font.render(text, True, (255, 255, 255))
-            surface.blit(rendered, (pos_x, pos_y + i * line_height))
\ No newline at end of file
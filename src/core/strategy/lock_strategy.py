@@ -8,6 +8,7 @@ class LockStrategy(ABC):
     def __init__(self, name: str, lock_config: dict[str, Any]):
         self.delay: float = lock_config.get("lock_delay", 0.8)
         self.timer: float = 0.0
+        self._moves: int = 0
         self._name: str = name
         self._lock_config = lock_config
 
@@ -21,6 +22,14 @@ class LockStrategy(ABC):
         self.timer = 0.0
         self._moves = 0
     
+    def snapshot(self) -> tuple[float, int]:
+        """Estado del temporizador (timer, movimientos desde el último reinicio)."""
+        return self.timer, self._moves
+
+    def restore(self, snapshot: tuple[float, int]) -> None:
+        """Restaura el estado devuelto por snapshot."""
+        self.timer, self._moves = snapshot
+
     @abstractmethod
     def update(self, dt: float, is_colliding: bool) -> None:
         """Actualiza el temporizador según la estrategia"""
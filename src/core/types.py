@@ -1,33 +1,46 @@
-from pygame import Surface
 from numpy import ndarray
-from typing import TypedDict
-         
+from typing import TypedDict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pygame import Surface
+
 class PieceSurfaces(TypedDict):
-    normal: Surface
-    placed: Surface
-    ghost: Surface
+    normal: "Surface"
+    placed: "Surface"
+    ghost: "Surface"
 
 class BlockSurfaces(TypedDict):
-    normal: Surface
-    placed: Surface
-    ghost: Surface
+    normal: "Surface"
+    placed: "Surface"
+    ghost: "Surface"
+
+# Celdas ocupadas (dr, dc) relativas a la esquina superior izquierda de la matriz, por rotación
+PieceOffsets = tuple[tuple[tuple[int, int], ...], ...]
+# Extremos (min_dr, max_dr, min_dc, max_dc) de las celdas ocupadas, por rotación
+PieceBounds = tuple[tuple[int, int, int, int], ...]
+# Filas ocupadas como máscaras de bits (dr, máscara) con bit dc = columna dc, por rotación
+PieceRowMasks = tuple[tuple[tuple[int, int], ...], ...]
+# Celda más baja (dc, max_dr) de cada columna ocupada, por rotación
+PieceColumnBottoms = tuple[tuple[tuple[int, int], ...], ...]
 
-class PieceData(TypedDict):
+class PieceShape(TypedDict):
+    """Datos lógicos de una pieza, suficientes para simular sin render."""
     matrices: list[ndarray] # List de matrices con sus rotaciones correspondientes
+    offsets: PieceOffsets # Tablas precalculadas de celdas ocupadas por rotación
+    bounds: PieceBounds # Bounding box de las celdas ocupadas por rotación
+    row_masks: PieceRowMasks # Máscaras de bits por fila, por rotación
+    column_bottoms: PieceColumnBottoms # Celda más baja de cada columna, por rotación
+    type: int # Int que identifica el color de la pieza para dibujar la Board
+
+class PieceData(PieceShape):
     surfaces: PieceSurfaces # Dic de Surfaces de la pieza en sus diferentes estados
     block: BlockSurfaces # Dic de Surface del bloque que forma la pieza en sus diferentes estados
-    type: int # Int que identifica el color de la pieza para dibujar la Board
 
+PieceShapeType = dict[str, PieceShape]
 PieceDataType = dict[str, PieceData]
 
-class BoardType(TypedDict):
-    surface: Surface
-    pos_x: int
-    pos_y: int
-
-class PiecesPreviewType(TypedDict):
-    pos_x: int
-    pos_y: int
-    max_width: int
-    preview_count: int
-    margin: int
\ No newline at end of file
+class PieceBagState(TypedDict):
+    """Estado serializable de un PieceBag."""
+    seed: int # Semilla de la secuencia
+    bag_index: int # Cantidad de lotes ya generados
+    queue: list[str] # Piezas pendientes en la cola
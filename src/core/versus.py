@@ -0,0 +1,238 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from src.core.zobrist import mix64
+
+if TYPE_CHECKING:
+    from src.core.gameboard_controller import GameBoardController
+
+# Líneas de ataque por tipo de jugada y líneas eliminadas (tabla guideline)
+ATTACK_TABLE: dict[str, dict[int, int]] = {
+    "normal":      {1: 0, 2: 1, 3: 2, 4: 4},
+    "t_spin":      {1: 2, 2: 4, 3: 6},
+    "mini_t_spin": {1: 0, 2: 1},
+}
+
+# Ataque extra por combo: el índice 0 es el segundo clear seguido (el último valor se repite)
+COMBO_TABLE: tuple[int, ...] = (0, 1, 1, 2, 2, 3, 3, 4, 4, 4, 5)
+
+BACK_TO_BACK_BONUS = 1
+PERFECT_CLEAR_BONUS = 10
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+
+
+def attack_lines(lines: int, move_type: str = "normal", back_to_back: bool = False,
+                 combo: int = 0, perfect_clear: bool = False) -> int:
+    """
+    Líneas de ataque de un bloqueo.
+
+    Args:
+        lines: Líneas eliminadas.
+        move_type: Tipo de jugada ("normal", "t_spin" o "mini_t_spin", como en Score).
+        back_to_back: Si la jugada cobró el bonus de back-to-back.
+        combo: Clears seguidos contando este (Score.combo_count después del bloqueo).
+        perfect_clear: Si el tablero quedó vacío.
+    """
+    if not lines:
+        return 0
+    attack = ATTACK_TABLE.get(move_type, ATTACK_TABLE["normal"]).get(lines, 0)
+    if back_to_back:
+        attack += BACK_TO_BACK_BONUS
+    if combo > 1:
+        attack += COMBO_TABLE[min(combo - 2, len(COMBO_TABLE) - 1)]
+    if perfect_clear:
+        attack += PERFECT_CLEAR_BONUS
+    return attack
+
+
+def cancel_garbage(queue: list[list[int]], attack: int) -> int:
+    """
+    Descuenta el ataque de una cola de basura pendiente ([filas, hueco], la más antigua primero).
+
+    Returns:
+        int: Líneas canceladas.
+    """
+    cancelled = 0
+    while queue and cancelled < attack:
+        used = min(queue[0][0], attack - cancelled)
+        queue[0][0] -= used
+        cancelled += used
+        if not queue[0][0]:
+            queue.pop(0)
+    return cancelled
+
+
+def take_garbage(queue: list[list[int]], budget: int) -> list[tuple[int, int]]:
+    """
+    Saca de la cola hasta `budget` filas de basura para insertar.
+
+    Returns:
+        list[tuple[int, int]]: Tramos (filas, hueco) en el orden en que se insertan.
+    """
+    chunks = []
+    while queue and budget > 0:
+        count = min(queue[0][0], budget)
+        chunks.append((count, queue[0][1]))
+        budget -= count
+        queue[0][0] -= count
+        if not queue[0][0]:
+            queue.pop(0)
+    return chunks
+
+
+@dataclass
+class VersusStats:
+    """
+    Líneas de ataque de cada jugador en un VersusMatch.
+
+    Attributes:
+        sent:      Líneas enviadas a los rivales (después de cancelar la basura propia).
+        cancelled: Líneas de basura propia canceladas con ataque.
+        received:  Filas de basura insertadas en el tablero.
+    """
+    sent:      list[int] = field(default_factory=list)
+    cancelled: list[int] = field(default_factory=list)
+    received:  list[int] = field(default_factory=list)
+
+
+class VersusMatch:
+    """
+    Conecta dos o más GameBoardController con intercambio de basura.
+
+    Después de cada frame (update, o exchange si las partidas se actualizan por fuera) se
+    revisa qué jugadores bloquearon una pieza. Las líneas eliminadas, T-spins, combos,
+    back-to-back y perfect clears calculados por Score se convierten en líneas de ataque
+    (ATTACK_TABLE, COMBO_TABLE); el ataque primero cancela la basura pendiente del atacante y
+    el resto se encola al rival elegido (el siguiente jugador vivo, por turnos). La basura
+    encolada entra por abajo del tablero, con Board.insert_garbage, cuando su dueño bloquea
+    una pieza sin eliminar líneas, como máximo `garbage_cap` filas por pieza.
+
+    El hueco de cada ataque se elige con SplitMix64 a partir de (seed, contador), y todo el
+    estado entra en snapshot, así que la partida es determinista y se puede usar con rollback.
+    """
+    def __init__(self, players: list["GameBoardController"], seed: int = 0, garbage_cap: int = 8) -> None:
+        """
+        Args:
+            players: Partidas del versus (dos o más), ya creadas.
+            seed: Semilla de las columnas de los huecos.
+            garbage_cap: Filas de basura que pueden entrar como máximo con cada pieza.
+
+        Raises:
+            ValueError: Si hay menos de dos jugadores o garbage_cap no es positivo.
+        """
+        if len(players) < 2 or garbage_cap <= 0:
+            raise ValueError(f"VersusMatch: parámetros inválidos (jugadores={len(players)}, "
+                             f"garbage_cap={garbage_cap}). Se necesitan al menos 2 jugadores.")
+        self.players     = players
+        self.seed        = seed
+        self.garbage_cap = garbage_cap
+        self.stats       = VersusStats([0] * len(players), [0] * len(players), [0] * len(players))
+
+        # Basura pendiente de cada jugador: [filas, columna del hueco], la más antigua primero
+        self._queues: list[list[list[int]]] = [[] for _ in players]
+        self._seen    = [player.pieces_locked for player in players]
+        self._targets = [(index + 1) % len(players) for index in range(len(players))]
+        self._holes   = 0
+
+    @property
+    def alive(self) -> list[int]:
+        """Índices de los jugadores que siguen en juego."""
+        return [index for index, player in enumerate(self.players) if not player.is_game_over()]
+
+    @property
+    def winner(self) -> int | None:
+        """Índice del último jugador en pie, o None si el versus sigue (o todos perdieron)."""
+        alive = self.alive
+        return alive[0] if len(alive) == 1 else None
+
+    def is_over(self) -> bool:
+        return len(self.alive) <= 1
+
+    def incoming(self, index: int) -> int:
+        """Filas de basura pendientes del jugador `index`."""
+        return sum(count for count, _ in self._queues[index])
+
+    # --- CICLO ---
+    def update(self, dt: float) -> None:
+        """Avanza todas las partidas un frame y resuelve el intercambio de basura."""
+        for player in self.players:
+            player.update(dt)
+        self.exchange()
+
+    def exchange(self) -> None:
+        """Convierte los bloqueos de este frame en ataque, cancelaciones y basura insertada."""
+        for index, player in enumerate(self.players):
+            if player.pieces_locked == self._seen[index]:
+                continue
+            self._seen[index] = player.pieces_locked
+            if player.is_game_over():
+                continue
+
+            lines = player.last_lines_cleared
+            if not lines:
+                self._insert(index)
+                continue
+
+            attack = self.attack_of(player)
+            attack -= self._cancel(index, attack)
+            if attack > 0:
+                target = self._next_target(index)
+                if target is not None:
+                    self._queues[target].append([attack, self._next_hole(player.board.cols)])
+                    self.stats.sent[index] += attack
+
+    def snapshot(self) -> tuple:
+        """Estado del intercambio (colas, bloqueos vistos, turnos y contador de huecos); no incluye las partidas."""
+        queues = tuple(tuple((count, hole) for count, hole in queue) for queue in self._queues)
+        stats = (tuple(self.stats.sent), tuple(self.stats.cancelled), tuple(self.stats.received))
+        return queues, tuple(self._seen), tuple(self._targets), self._holes, stats
+
+    def restore(self, snapshot: tuple) -> None:
+        """Restaura el estado devuelto por snapshot."""
+        queues, seen, targets, self._holes, (sent, cancelled, received) = snapshot
+        self._queues  = [[[count, hole] for count, hole in queue] for queue in queues]
+        self._seen    = list(seen)
+        self._targets = list(targets)
+        self.stats    = VersusStats(list(sent), list(cancelled), list(received))
+
+    @staticmethod
+    def attack_of(player: "GameBoardController") -> int:
+        """Líneas de ataque del último bloqueo del jugador."""
+        score = player.score
+        # Perfect clear: todas las celdas ocupadas están en las filas que se eliminan
+        cols = player.board.cols
+        perfect = all(filled in (0, cols) for filled in player.board.row_fill)
+        return attack_lines(player.last_lines_cleared, score.last_move_type, score.last_back_to_back,
+                            score.combo_count, perfect)
+
+    # --- HELPERS ---
+    def _cancel(self, index: int, attack: int) -> int:
+        """Descuenta el ataque de la basura pendiente del jugador. Devuelve las líneas canceladas."""
+        cancelled = cancel_garbage(self._queues[index], attack)
+        self.stats.cancelled[index] += cancelled
+        return cancelled
+
+    def _insert(self, index: int) -> None:
+        """Inserta hasta garbage_cap filas de la basura pendiente del jugador."""
+        player = self.players[index]
+        for count, hole in take_garbage(self._queues[index], self.garbage_cap):
+            if not player.receive_garbage(count, hole):
+                return
+            self.stats.received[index] += count
+
+    def _next_target(self, index: int) -> int | None:
+        """Próximo rival vivo del jugador, por turnos."""
+        count = len(self.players)
+        target = self._targets[index]
+        for _ in range(count):
+            if target != index and not self.players[target].is_game_over():
+                self._targets[index] = (target + 1) % count
+                return target
+            target = (target + 1) % count
+        return None
+
+    def _next_hole(self, cols: int) -> int:
+        """Columna del hueco del próximo ataque (SplitMix64 de (seed, contador))."""
+        self._holes += 1
+        return mix64((self.seed + self._holes * _GOLDEN) & _MASK64) % cols
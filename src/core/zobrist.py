@@ -0,0 +1,117 @@
+import numpy as np
+from functools import lru_cache
+
+# Claves fijas: el mismo estado tiene el mismo hash en cualquier proceso y plataforma
+# (a diferencia de hash(), que cambia entre ejecuciones para str)
+ZOBRIST_SEED = 0x7E7215_2B0B_5EED
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+
+# Tipos de clave, para que una celda y una pieza con los mismos números no coincidan
+_CELL, _PIECE, _HOLD, _BAG = range(4)
+
+
+def mix64(x: int) -> int:
+    """Finalizador de SplitMix64: dispersa los bits de un entero de 64 bits (también para PieceBag y VersusMatch)."""
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+def name_id(name: str) -> int:
+    """Entero estable del nombre de una pieza, igual en cualquier proceso (para usarlo en las claves)."""
+    return int.from_bytes(name.encode(), "little")
+
+
+def zobrist_key(*parts: int) -> int:
+    """
+    Deriva una clave de 64 bits de una tupla de enteros (SplitMix64 encadenado).
+
+    Las claves de piezas, hold y bolsa se calculan al vuelo con esta función; las de celdas
+    se tabulan con cell_keys porque se usan en cada bloqueo.
+    """
+    state = ZOBRIST_SEED
+    for part in parts:
+        state = mix64((state ^ (part & _MASK64)) * _GOLDEN & _MASK64)
+    return state
+
+
+@lru_cache(maxsize=None)
+def cell_keys(rows: int, cols: int) -> np.ndarray:
+    """Claves (rows, cols) uint64 de cada celda ocupada, compartidas por todos los tableros del tamaño."""
+    keys = np.array([[zobrist_key(_CELL, r, c) for c in range(cols)] for r in range(rows)], dtype=np.uint64)
+    keys.flags.writeable = False
+    return keys
+
+
+@lru_cache(maxsize=None)
+def cell_key_rows(rows: int, cols: int) -> tuple[tuple[int, ...], ...]:
+    """Las mismas claves de cell_keys como enteros de Python, para actualizar hashes celda por celda."""
+    return tuple(tuple(int(k) for k in row) for row in cell_keys(rows, cols))
+
+
+@lru_cache(maxsize=None)
+def row_key_table(rows: int, cols: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Clave de cada fila según su máscara de ocupación: table[r][mask] (bit c = columna c).
+
+    Es el XOR de las claves de cell_keys de las celdas de la máscara, tabulado para las
+    2**cols máscaras posibles de cada fila (1024 con el tablero de 10 columnas).
+    """
+    keys = cell_keys(rows, cols)
+    table = np.zeros((rows, 1 << cols), dtype=np.uint64)
+    for c in range(cols):
+        table[:, 1 << c:2 << c] = table[:, :1 << c] ^ keys[:, c:c + 1]
+    return tuple(tuple(row) for row in table.tolist())
+
+
+def hash_matrix(matrix: np.ndarray) -> int:
+    """Hash de Zobrist de la ocupación de un tablero (rows, cols); el color de las celdas no cuenta."""
+    rows, cols = matrix.shape
+    return int(np.bitwise_xor.reduce(cell_keys(rows, cols)[matrix != 0]))
+
+
+def hash_boards(boards: np.ndarray) -> np.ndarray:
+    """
+    Hash de Zobrist de un lote de tableros (N, rows, cols), en una sola pasada.
+
+    Returns:
+        np.ndarray: Un hash uint64 por tablero, igual a hash_matrix de cada uno.
+    """
+    _, rows, cols = boards.shape
+    keys = np.where(boards != 0, cell_keys(rows, cols), np.uint64(0))
+    return np.bitwise_xor.reduce(keys.reshape(len(boards), rows * cols), axis=1)
+
+
+def piece_key(name: str, rot: int, row: int, col: int) -> int:
+    """Clave de la pieza activa en una posición."""
+    return zobrist_key(_PIECE, name_id(name), rot, row, col)
+
+
+def hold_key(name: str | None, can_hold: bool) -> int:
+    """Clave del hold (vacío o con una pieza) y de si todavía se puede usar."""
+    return zobrist_key(_HOLD, name_id(name) if name is not None else 0, int(can_hold))
+
+
+def bag_key(position: int) -> int:
+    """Clave de la posición en la secuencia de piezas (cuántas se sacaron de la bolsa)."""
+    return zobrist_key(_BAG, position)
+
+
+def state_hash(board_hash: int, piece: tuple[str, int, int, int] | None, hold: str | None,
+               can_hold: bool, bag_position: int) -> int:
+    """
+    Hash del estado completo de una búsqueda: tablero, pieza activa, hold y posición en la bolsa.
+
+    Args:
+        board_hash: Hash de la ocupación (Board.zobrist o hash_matrix).
+        piece: Pieza activa como (nombre, rot, row, col), o None.
+        hold: Pieza en el hold, o None.
+        can_hold: Si el hold está disponible.
+        bag_position: Piezas sacadas de la bolsa (ver PieceBag.drawn).
+    """
+    value = board_hash ^ hold_key(hold, can_hold) ^ bag_key(bag_position)
+    if piece is not None:
+        value ^= piece_key(*piece)
+    return value
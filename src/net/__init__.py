@@ -0,0 +1,16 @@
+from src.net.protocol import MAX_FRAMES, InputPacket, encode_packet, decode_packet
+from src.net.transport import Transport, UdpTransport, LossyTransport
+from src.net.rollback import FRAME, RollbackStats, RollbackSession
+
+__all__ = [
+    "MAX_FRAMES",
+    "InputPacket",
+    "encode_packet",
+    "decode_packet",
+    "Transport",
+    "UdpTransport",
+    "LossyTransport",
+    "FRAME",
+    "RollbackStats",
+    "RollbackSession",
+]
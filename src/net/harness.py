@@ -0,0 +1,174 @@
+"""
+Prueba del versus con rollback sobre localhost, con latencia y pérdida simuladas.
+
+Corre los dos peers en el mismo proceso, cada uno con su RollbackSession y su UdpTransport
+en 127.0.0.1 envuelto en un LossyTransport. Los inputs salen de un guion pseudoaleatorio por
+jugador (movimientos, rotaciones y caídas) y el tiempo avanza con un reloj simulado de un
+frame por iteración, así que la prueba corre más rápido que en tiempo real sin cambiar la
+latencia medida en frames. Al final se espera a que ambos peers confirmen todos los frames y
+se comparan los estados: con un rollback correcto las cuatro partidas coinciden. Con
+--versus las partidas intercambian basura (VersusMatch) y también se comparan los versus.
+
+Uso:
+    python -m src.net.harness --latency 50 --jitter 10 --loss 0.05 --delay 2
+"""
+import argparse
+import json
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from src.core.action import Action
+from src.core.gameboard_controller import GameBoardController
+from src.core.versus import VersusMatch
+from src.net.rollback import FRAME, RollbackSession, RollbackStats
+from src.net.transport import LossyTransport, UdpTransport
+
+if TYPE_CHECKING:
+    from src.config.gameplay import GameplayConfigType, GameplayRulesetType
+
+# Configuración por defecto, sin pasar por src.util (que importa pygame)
+GAMEPLAY_CONFIG = Path(__file__).resolve().parents[2] / "config" / "gameplay.json"
+
+# Acciones del guion con su peso: sobre todo movimientos, alguna rotación y pocas caídas
+_SCRIPT = (
+    (Action.MOVE_LEFT, 6), (Action.MOVE_RIGHT, 6), (Action.ROTATE_RIGHT, 4), (Action.ROTATE_LEFT, 2),
+    (Action.SOFT_DROP, 3), (Action.HARD_DROP, 2), (Action.HOLD, 1),
+)
+
+
+@dataclass
+class MatchResult:
+    """
+    Resultado de run_match.
+
+    Attributes:
+        frames:  Frames simulados por cada peer.
+        ticks:   Iteraciones del reloj simulado (más que frames si hubo esperas).
+        in_sync: Si los dos peers terminaron con los mismos estados en ambas partidas.
+        stats:   Estadísticas de rollback de cada peer.
+        dropped: Paquetes descartados por la pérdida simulada, por peer.
+    """
+    frames:  int
+    ticks:   int
+    in_sync: bool
+    stats:   tuple[RollbackStats, RollbackStats]
+    dropped: tuple[int, int]
+
+
+class ScriptedInput:
+    """Acciones pseudoaleatorias reproducibles, para jugar sin teclado."""
+
+    def __init__(self, seed: int, rate: float = 0.25) -> None:
+        """
+        Args:
+            seed: Semilla del guion.
+            rate: Probabilidad de pulsar una acción en cada frame.
+        """
+        self._rng = random.Random(seed)
+        self._rate = rate
+        self._actions, self._weights = zip(*_SCRIPT)
+
+    def poll(self) -> list[Action]:
+        """Acciones de este frame (ninguna o una)."""
+        if self._rng.random() >= self._rate:
+            return []
+        return self._rng.choices(self._actions, self._weights)
+
+
+class _Clock:
+    """Reloj simulado que avanza un frame por tick."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def run_match(session_config: "GameplayConfigType", ruleset: "GameplayRulesetType", frames: int = 1800,
+              latency: float = 0.05, jitter: float = 0.0, loss: float = 0.0, input_delay: int = 2,
+              max_rollback: int = 8, seed: int = 0, versus: bool = False) -> MatchResult:
+    """
+    Juega `frames` frames entre dos peers en localhost.
+
+    Args:
+        session_config: Configuración de gameplay.
+        ruleset: Ruleset de ambas partidas.
+        frames: Frames a simular en cada peer.
+        latency, jitter, loss: Condiciones de la red en cada sentido (ver LossyTransport).
+        input_delay, max_rollback: Los de RollbackSession.
+        seed: Semilla de las bolsas, de los guiones y de la red.
+        versus: Si las partidas intercambian basura.
+
+    Returns:
+        MatchResult: Estadísticas de cada peer y si terminaron sincronizados.
+    """
+    clock = _Clock()
+    sockets = [UdpTransport(("127.0.0.1", 0)), UdpTransport(("127.0.0.1", 0))]
+    sockets[0].connect(sockets[1].address)
+    sockets[1].connect(sockets[0].address)
+
+    peers: list[RollbackSession] = []
+    for index in (0, 1):
+        players = [GameBoardController(session_config, ruleset, seed=seed * 2 + p) for p in (0, 1)]
+        for player in players:
+            player.start()
+        transport = LossyTransport(sockets[index], latency, jitter, loss, seed=seed * 2 + index, clock=clock)
+        match = VersusMatch(players, seed) if versus else None
+        peers.append(RollbackSession(players, index, transport, input_delay, max_rollback, match=match))
+    scripts = [ScriptedInput(seed * 2 + index) for index in (0, 1)]
+
+    ticks = 0
+    try:
+        while any(peer.frame < frames for peer in peers):
+            for peer, script in zip(peers, scripts):
+                if peer.frame < frames:
+                    peer.advance(script.poll())
+                else:
+                    peer.poll()
+            ticks += 1
+            clock.now += FRAME
+
+        # Espera a que cada peer reciba todos los inputs del otro
+        while any(peer.confirmed_frame < frames for peer in peers):
+            for peer in peers:
+                peer.poll()
+            clock.now += FRAME
+
+        in_sync = all(a.snapshot() == b.snapshot() for a, b in zip(peers[0].players, peers[1].players))
+        if versus:
+            in_sync = in_sync and peers[0].match.snapshot() == peers[1].match.snapshot()
+        return MatchResult(frames, ticks, in_sync, (peers[0].stats, peers[1].stats),
+                           tuple(peer.transport.dropped for peer in peers))
+    finally:
+        for peer in peers:
+            peer.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.net.harness", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=1800, help="Frames a simular (1800 = 30 s)")
+    parser.add_argument("--latency", type=float, default=50.0, help="Latencia de ida en ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Jitter máximo en ms")
+    parser.add_argument("--loss", type=float, default=0.0, help="Probabilidad de pérdida de cada paquete")
+    parser.add_argument("--delay", type=int, default=2, help="Input delay en frames")
+    parser.add_argument("--rollback", type=int, default=8, help="Rollback máximo en frames")
+    parser.add_argument("--ruleset", default="guideline")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--versus", action="store_true", help="Intercambiar basura entre las partidas")
+    args = parser.parse_args(argv)
+
+    with GAMEPLAY_CONFIG.open("r", encoding="utf-8") as f:
+        config = json.load(f)
+    result = run_match(config, config["rulesets"][args.ruleset], args.frames, args.latency / 1e3,
+                       args.jitter / 1e3, args.loss, args.delay, args.rollback, args.seed, args.versus)
+    print(f"frames={result.frames} ticks={result.ticks} sincronizados={'sí' if result.in_sync else 'NO'}")
+    for index, (stats, dropped) in enumerate(zip(result.stats, result.dropped)):
+        print(f"peer {index}: rollbacks={stats.rollbacks} profundidad media={stats.mean_depth:.1f} "
+              f"máx={stats.max_depth} costo medio={stats.mean_cost * 1e3:.2f} ms máx={stats.max_cost * 1e3:.2f} ms "
+              f"esperas={stats.stalls} perdidos={dropped}")
+
+
+if __name__ == "__main__":
+    main()
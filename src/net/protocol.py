@@ -0,0 +1,74 @@
+"""
+Formato de los paquetes UDP del modo versus con rollback.
+
+Cada paquete lleva, además del encabezado, las acciones del remitente para un tramo
+contiguo de frames. Se reenvían todos los frames que el otro peer todavía no confirmó, así
+que perder un paquete no pierde inputs: el siguiente los vuelve a llevar.
+
+    encabezado: MAGIC (2 bytes), VERSION (1), next_expected (uint32), frame (uint32),
+                start (uint32), count (uint16)
+    por frame:  varint(n) y n bytes con los valores de Action, en el orden en que se despacharon
+
+`next_expected` es el primer frame del otro peer que el remitente todavía no recibió (todos
+los anteriores están confirmados) y `frame` es el frame que el remitente está simulando,
+para que cada peer sepa cuán adelantado va respecto del otro.
+"""
+import struct
+from typing import NamedTuple
+from src.core.action import Action
+from src.replay.codec import read_varint, write_varint
+
+MAGIC   = b"TV"
+VERSION = 1
+
+# Frames de inputs que entran como máximo en un paquete
+MAX_FRAMES = 64
+
+_HEADER = struct.Struct("<2sBIIIH")
+
+
+class InputPacket(NamedTuple):
+    """Contenido de un paquete de inputs."""
+    next_expected: int
+    frame:         int
+    start:         int
+    inputs:        tuple[tuple[Action, ...], ...]   # acciones de los frames start, start + 1, ...
+
+
+def encode_packet(packet: InputPacket) -> bytes:
+    """
+    Serializa un paquete.
+
+    Raises:
+        ValueError: Si lleva más de MAX_FRAMES frames.
+    """
+    if len(packet.inputs) > MAX_FRAMES:
+        raise ValueError(f"Protocol: demasiados frames en un paquete ({len(packet.inputs)} > {MAX_FRAMES}).")
+    out = bytearray(_HEADER.pack(MAGIC, VERSION, packet.next_expected, packet.frame, packet.start, len(packet.inputs)))
+    for actions in packet.inputs:
+        write_varint(out, len(actions))
+        out.extend(actions)
+    return bytes(out)
+
+
+def decode_packet(data: bytes) -> InputPacket:
+    """
+    Reconstruye un paquete serializado con encode_packet.
+
+    Raises:
+        ValueError: Si los datos no son un paquete de esta versión o están truncados.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Protocol: paquete truncado.")
+    magic, version, next_expected, frame, start, count = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Protocol: paquete inválido (magic={magic!r}, versión={version}).")
+
+    pos, inputs = _HEADER.size, []
+    for _ in range(count):
+        size, pos = read_varint(data, pos)
+        if pos + size > len(data):
+            raise ValueError("Protocol: paquete truncado.")
+        inputs.append(tuple(Action(code) for code in data[pos:pos + size]))
+        pos += size
+    return InputPacket(next_expected, frame, start, tuple(inputs))
@@ -0,0 +1,292 @@
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from src.net.protocol import MAX_FRAMES, InputPacket, decode_packet, encode_packet
+
+if TYPE_CHECKING:
+    from src.core.action import Action
+    from src.core.gameboard_controller import GameBoardController, GameSnapshot
+    from src.core.versus import VersusMatch
+    from src.net.transport import Transport
+
+# Duración fija de un frame de la simulación en red: ambos peers deben avanzar igual
+FRAME = 1 / 60
+
+
+@dataclass
+class RollbackStats:
+    """
+    Instrumentación de una RollbackSession.
+
+    Attributes:
+        frames:       Frames simulados (sin contar las re-simulaciones).
+        rollbacks:    Veces que se volvió a un snapshot.
+        resimulated:  Frames re-simulados en total.
+        mispredicted: Frames del peer remoto cuya predicción resultó incorrecta.
+        stalls:       Llamadas a advance que esperaron al peer en lugar de avanzar.
+        sent:         Paquetes enviados.
+        received:     Paquetes recibidos válidos.
+        invalid:      Datagramas descartados por no ser paquetes válidos.
+        depth:        Frames re-simulados en cada frame avanzado (0 si no hubo rollback).
+        cost:         Segundos de re-simulación en cada frame avanzado.
+    """
+    frames:       int = 0
+    rollbacks:    int = 0
+    resimulated:  int = 0
+    mispredicted: int = 0
+    stalls:       int = 0
+    sent:         int = 0
+    received:     int = 0
+    invalid:      int = 0
+    depth:        list[int]   = field(default_factory=list)
+    cost:         list[float] = field(default_factory=list)
+
+    @property
+    def max_depth(self) -> int:
+        return max(self.depth, default=0)
+
+    @property
+    def mean_depth(self) -> float:
+        """Profundidad media de los rollbacks (los frames sin rollback no cuentan)."""
+        return self.resimulated / self.rollbacks if self.rollbacks else 0.0
+
+    @property
+    def max_cost(self) -> float:
+        return max(self.cost, default=0.0)
+
+    @property
+    def mean_cost(self) -> float:
+        """Segundos medios de re-simulación por rollback."""
+        return sum(self.cost) / self.rollbacks if self.rollbacks else 0.0
+
+
+class RollbackSession:
+    """
+    Versus de dos jugadores en red con rollback: solo viajan los inputs.
+
+    Cada peer simula las dos partidas (la propia y la del rival) con GameBoardControllers
+    creados con la misma configuración y semillas en ambos lados, a frames fijos de FRAME
+    segundos. Las acciones locales se aplican `input_delay` frames después de tomarse y se
+    envían por UDP con redundancia (ver protocol). Las del rival se predicen (sin acciones:
+    los inputs son pulsaciones, repetir la última movería la pieza de más) hasta que llegan.
+
+    Antes de simular cada frame se guarda un snapshot de las dos partidas. Si llega un input
+    remoto distinto de lo que se predijo para un frame ya simulado, se restaura el snapshot de
+    ese frame y se re-simulan los frames intermedios con los inputs correctos, todo dentro de
+    la misma llamada a advance. Si el rival queda más de `max_rollback` frames atrás, advance
+    espera (no avanza) para que el rollback nunca tenga que ir más lejos.
+
+    Con `match` las partidas intercambian basura: el VersusMatch resuelve el intercambio al
+    final de cada frame simulado y su estado entra en los snapshots, así que el rollback
+    también deshace y rehace los ataques.
+
+    `stats` registra la profundidad y el costo de re-simulación de cada frame, para elegir el
+    input_delay según la latencia de la red.
+    """
+    def __init__(self,
+                 players: list["GameBoardController"],
+                 local: int,
+                 transport: "Transport",
+                 input_delay: int = 2,
+                 max_rollback: int = 8,
+                 frame_dt: float = FRAME,
+                 match: "VersusMatch | None" = None) -> None:
+        """
+        Args:
+            players: Las dos partidas, en el mismo orden en ambos peers, ya iniciadas (start).
+            local: Índice de la partida que controla este peer.
+            transport: Canal con el otro peer.
+            input_delay: Frames entre que se toma una acción local y se aplica.
+            max_rollback: Frames que puede adelantarse la simulación a los inputs remotos confirmados.
+            frame_dt: Duración de cada frame de la simulación (igual en ambos peers).
+            match: Versus entre las dos partidas, con la misma semilla en ambos peers (opcional).
+
+        Raises:
+            ValueError: Si no hay dos jugadores o algún parámetro está fuera de rango.
+        """
+        if len(players) != 2 or local not in (0, 1):
+            raise ValueError(f"RollbackSession: se esperaban 2 jugadores y local 0 o 1 "
+                             f"(jugadores={len(players)}, local={local}).")
+        if input_delay < 0 or max_rollback < 1:
+            raise ValueError(f"RollbackSession: parámetros inválidos (input_delay={input_delay}, "
+                             f"max_rollback={max_rollback}).")
+        self.players      = players
+        self.local        = local
+        self.remote       = 1 - local
+        self.transport    = transport
+        self.input_delay  = input_delay
+        self.max_rollback = max_rollback
+        self.frame_dt     = frame_dt
+        self.match        = match
+        self.frame        = 0
+        self.stats        = RollbackStats()
+
+        # Inputs confirmados por jugador y frame; los del rival pueden llegar desordenados
+        self._inputs: list[dict[int, tuple["Action", ...]]] = [{}, {}]
+        self._predicted: dict[int, tuple["Action", ...]] = {}
+        self._snapshots: dict[int, tuple[tuple["GameSnapshot", ...], tuple | None]] = {}
+        self._pending: list["Action"] = []   # acciones locales tomadas durante una espera
+
+        self._local_next   = 0      # primer frame local sin input registrado
+        self._remote_next  = 0      # primer frame remoto sin confirmar (los anteriores llegaron todos)
+        self._remote_ack   = 0      # primer frame local que el rival todavía no confirmó
+        self._remote_frame = 0      # último frame que el rival informó estar simulando
+        self._rollback_to: int | None = None
+        self._frame_depth  = 0
+        self._frame_cost   = 0.0
+
+    @property
+    def confirmed_frame(self) -> int:
+        """Frames ya simulados con todos los inputs reales: su estado es definitivo en ambos peers."""
+        return min(self._remote_next, self.frame)
+
+    @property
+    def frame_advantage(self) -> int:
+        """Cuántos frames va este peer por delante del rival (negativo si va atrás)."""
+        return self.frame - self._remote_frame
+
+    # --- CICLO ---
+    def advance(self, actions: "list[Action]") -> bool:
+        """
+        Registra las acciones locales de este frame y avanza la simulación un frame.
+
+        Args:
+            actions: Acciones tomadas en este frame, en orden; se aplican input_delay frames después.
+
+        Returns:
+            bool: False si se esperó al rival sin avanzar (las acciones pasan al próximo frame).
+        """
+        self._pending.extend(actions)
+        self._receive()
+        if self.frame - self._remote_next >= self.max_rollback:
+            self.stats.stalls += 1
+            self._send()
+            return False
+
+        self._record_local(tuple(self._pending))
+        self._pending.clear()
+        self._send()
+
+        self._snapshots[self.frame] = self._snapshot()
+        self._simulate(self.frame)
+        self.frame += 1
+
+        self.stats.frames += 1
+        self.stats.depth.append(self._frame_depth)
+        self.stats.cost.append(self._frame_cost)
+        self._frame_depth, self._frame_cost = 0, 0.0
+        self._prune()
+        return True
+
+    def poll(self) -> None:
+        """
+        Procesa los paquetes recibidos y hace el rollback que haga falta, sin avanzar.
+
+        Sirve también para esperar al rival en pausas o al final de la partida.
+        """
+        self._receive()
+        self._send()
+
+    def close(self) -> None:
+        self.transport.close()
+
+    # --- HELPERS ---
+    def _receive(self) -> None:
+        """Lee los paquetes pendientes y hace el rollback si alguno contradice una predicción."""
+        for data in self.transport.receive():
+            try:
+                packet = decode_packet(data)
+            except ValueError:
+                self.stats.invalid += 1
+                continue
+            self.stats.received += 1
+            self._apply_packet(packet)
+
+        if self._rollback_to is not None:
+            self._rollback(self._rollback_to)
+            self._rollback_to = None
+
+    def _record_local(self, actions: "tuple[Action, ...]") -> None:
+        """Registra las acciones para el frame frame + input_delay; los frames previos quedan sin acciones."""
+        target = self.frame + self.input_delay
+        inputs = self._inputs[self.local]
+        while self._local_next < target:
+            inputs[self._local_next] = ()
+            self._local_next += 1
+        inputs[target] = actions
+        self._local_next = target + 1
+
+    def _apply_packet(self, packet: InputPacket) -> None:
+        """Guarda los inputs remotos nuevos y marca el rollback si contradicen una predicción."""
+        self._remote_ack = max(self._remote_ack, packet.next_expected)
+        self._remote_frame = max(self._remote_frame, packet.frame)
+
+        inputs = self._inputs[self.remote]
+        for offset, actions in enumerate(packet.inputs):
+            frame = packet.start + offset
+            if frame < self._remote_next or frame in inputs:
+                continue
+            inputs[frame] = actions
+            if frame < self.frame and self._predicted.pop(frame, ()) != actions:
+                self.stats.mispredicted += 1
+                self._rollback_to = frame if self._rollback_to is None else min(self._rollback_to, frame)
+
+        while self._remote_next in inputs:
+            self._predicted.pop(self._remote_next, None)
+            self._remote_next += 1
+
+    def _rollback(self, start: int) -> None:
+        """Vuelve al snapshot del frame `start` y re-simula hasta el frame actual."""
+        began = time.perf_counter()
+        snapshots, match = self._snapshots[start]
+        for player, snapshot in zip(self.players, snapshots):
+            player.restore(snapshot)
+        if self.match is not None:
+            self.match.restore(match)
+        for frame in range(start, self.frame):
+            if frame > start:
+                self._snapshots[frame] = self._snapshot()
+            self._simulate(frame)
+
+        depth = self.frame - start
+        self.stats.rollbacks += 1
+        self.stats.resimulated += depth
+        # Se atribuye al próximo frame que avance (el primero que la vista verá con la corrección)
+        self._frame_depth = max(self._frame_depth, depth)
+        self._frame_cost += time.perf_counter() - began
+
+    def _simulate(self, frame: int) -> None:
+        """Aplica los inputs del frame (reales o predichos) a cada partida y la avanza un frame."""
+        for index, player in enumerate(self.players):
+            actions = self._inputs[index].get(frame)
+            if actions is None:
+                actions = self._predicted[frame] = ()
+            for action in actions:
+                player.perform(action)
+            player.update(self.frame_dt)
+        if self.match is not None:
+            self.match.exchange()
+
+    def _snapshot(self) -> tuple[tuple["GameSnapshot", ...], tuple | None]:
+        match = self.match.snapshot() if self.match is not None else None
+        return tuple(player.snapshot() for player in self.players), match
+
+    def _send(self) -> None:
+        """Envía los inputs locales que el rival todavía no confirmó (como máximo MAX_FRAMES)."""
+        start = self._remote_ack
+        end = min(self._local_next, start + MAX_FRAMES)
+        inputs = self._inputs[self.local]
+        packet = InputPacket(self._remote_next, self.frame, start, tuple(inputs[f] for f in range(start, end)))
+        self.transport.send(encode_packet(packet))
+        self.stats.sent += 1
+
+    def _prune(self) -> None:
+        """Descarta snapshots e inputs de frames a los que ya no se puede volver."""
+        floor = self.confirmed_frame
+        for frame in [f for f in self._snapshots if f < floor]:
+            del self._snapshots[frame]
+        for frame in [f for f in self._inputs[self.remote] if f < floor]:
+            del self._inputs[self.remote][frame]
+        local_floor = min(floor, self._remote_ack)
+        for frame in [f for f in self._inputs[self.local] if f < local_floor]:
+            del self._inputs[self.local][frame]
@@ -0,0 +1,146 @@
+import heapq
+import random
+import socket
+import time
+from abc import ABC, abstractmethod
+from typing import Callable
+
+
+class Transport(ABC):
+    """Canal de datagramas entre dos peers (lo que RollbackSession necesita de la red)."""
+
+    @abstractmethod
+    def send(self, data: bytes) -> None:
+        """Envía un datagrama al peer, sin esperar."""
+        pass
+
+    @abstractmethod
+    def receive(self) -> list[bytes]:
+        """Datagramas recibidos desde la última llamada, sin bloquear."""
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+
+class UdpTransport(Transport):
+    """
+    Socket UDP no bloqueante conectado a un único peer.
+
+    receive() vacía el buffer del socket sin esperar, así que se puede llamar una vez por
+    frame desde el bucle del juego. Los datagramas que llegan de otra dirección se descartan.
+    """
+    # Tamaño máximo de un datagrama leído
+    MAX_DATAGRAM = 2048
+
+    def __init__(self, bind: tuple[str, int] = ("0.0.0.0", 0), peer: tuple[str, int] | None = None) -> None:
+        """
+        Args:
+            bind: Dirección local (puerto 0 para que el sistema elija uno, ver address).
+            peer: Dirección del otro peer; se puede indicar después con connect.
+        """
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind(bind)
+        self._socket.setblocking(False)
+        self._peer: tuple[str, int] | None = None
+        if peer is not None:
+            self.connect(peer)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Dirección local (host, puerto)."""
+        return self._socket.getsockname()
+
+    def connect(self, peer: tuple[str, int]) -> None:
+        """Fija la dirección del otro peer."""
+        self._peer = (socket.gethostbyname(peer[0]), peer[1])
+
+    def send(self, data: bytes) -> None:
+        """
+        Envía un datagrama al peer. Si el buffer del sistema está lleno se descarta, como en la red.
+
+        Raises:
+            RuntimeError: Si todavía no se indicó el peer.
+        """
+        if self._peer is None:
+            raise RuntimeError("UdpTransport: no hay peer conectado.")
+        try:
+            self._socket.sendto(data, self._peer)
+        except (BlockingIOError, ConnectionRefusedError):
+            pass
+
+    def receive(self) -> list[bytes]:
+        """Datagramas recibidos del peer desde la última llamada, sin bloquear."""
+        packets = []
+        while True:
+            try:
+                data, sender = self._socket.recvfrom(self.MAX_DATAGRAM)
+            except (BlockingIOError, ConnectionResetError, ConnectionRefusedError):
+                return packets
+            if sender == self._peer:
+                packets.append(data)
+
+    def close(self) -> None:
+        self._socket.close()
+
+
+class LossyTransport(Transport):
+    """
+    Envoltorio de otro Transport que simula latencia, jitter y pérdida en los envíos.
+
+    Cada datagrama se descarta con probabilidad `loss` o se retiene hasta now + latency +
+    uniform(0, jitter) antes de pasarlo al transporte real; con jitter los paquetes pueden
+    llegar desordenados. Los datagramas retenidos se liberan en cada send y receive, así que
+    basta con que el juego llame a receive una vez por frame. Sirve para probar el rollback
+    sobre localhost con las condiciones de una LAN cargada.
+    """
+    def __init__(self, inner: Transport, latency: float = 0.0, jitter: float = 0.0,
+                 loss: float = 0.0, seed: int | None = None,
+                 clock: Callable[[], float] = time.perf_counter) -> None:
+        """
+        Args:
+            inner: Transporte real (por ejemplo un UdpTransport en 127.0.0.1).
+            latency: Retraso fijo de cada envío, en segundos (solo ida).
+            jitter: Retraso adicional máximo, uniforme, en segundos.
+            loss: Probabilidad de descartar cada datagrama (0 a 1).
+            seed: Semilla del generador de pérdidas y jitter.
+            clock: Reloj en segundos (uno simulado permite correr la prueba más rápido que en tiempo real).
+
+        Raises:
+            ValueError: Si algún parámetro está fuera de rango.
+        """
+        if latency < 0 or jitter < 0 or not 0 <= loss < 1:
+            raise ValueError(f"LossyTransport: parámetros inválidos (latency={latency}, jitter={jitter}, loss={loss}).")
+        self.inner   = inner
+        self.latency = latency
+        self.jitter  = jitter
+        self.loss    = loss
+        self._rng    = random.Random(seed)
+        self._clock  = clock
+        self._queue: list[tuple[float, int, bytes]] = []
+        self._sent   = 0
+        self.dropped = 0
+
+    def send(self, data: bytes) -> None:
+        self._flush()
+        if self._rng.random() < self.loss:
+            self.dropped += 1
+            return
+        due = self._clock() + self.latency + self._rng.uniform(0.0, self.jitter)
+        heapq.heappush(self._queue, (due, self._sent, data))
+        self._sent += 1
+
+    def receive(self) -> list[bytes]:
+        self._flush()
+        return self.inner.receive()
+
+    def close(self) -> None:
+        self.inner.close()
+
+    # --- HELPERS ---
+    def _flush(self) -> None:
+        """Pasa al transporte real los datagramas cuyo retraso ya se cumplió."""
+        now = self._clock()
+        while self._queue and self._queue[0][0] <= now:
+            self.inner.send(heapq.heappop(self._queue)[2])
@@ -0,0 +1,20 @@
+from src.render.types import BoardType, PiecesPreviewType
+from src.render.render_batch import RenderBatch
+from src.render.board_view import BoardView
+from src.render.piece_view import PieceView
+from src.render.pieces_preview import PiecesPreview
+from src.render.gameboard_view import GameBoardView
+from src.render.royale_view import RoyaleView
+from src.render.rival_view import RivalView
+
+__all__ = [
+    "BoardType",
+    "PiecesPreviewType",
+    "RenderBatch",
+    "BoardView",
+    "PieceView",
+    "PiecesPreview",
+    "GameBoardView",
+    "RoyaleView",
+    "RivalView",
+]
@@ -0,0 +1,122 @@
+import pygame
+import numpy as np
+from typing import TYPE_CHECKING
+from src.constants import GARBAGE_BLOCK, NUM_TO_PIECE
+from src.render.render_batch import RenderBatch
+
+if TYPE_CHECKING:
+    from src.core.board import Board
+    from src.core.types import PieceDataType
+
+
+class BoardView:
+    """
+    Vista del tablero: dibuja el fondo y los bloques fijos de un Board.
+
+    Los bloques fijos se componen en una capa cacheada junto con el fondo. La capa solo se
+    actualiza cuando cambia Board.version (bloqueo, remoción de filas o paso de animación) y,
+    en ese caso, solo se redibujan las filas que cambiaron; el resto de los frames el tablero
+    se dibuja con un único blit.
+    """
+    CLEAR = (0, 0, 0, 0)
+
+    def __init__(self, surface: pygame.Surface, cell_width: int, cell_height: int,
+                 pos_x: int, pos_y: int) -> None:
+        """
+        Args:
+            surface: Imagen del tablero.
+            cell_width: Ancho de cada celda en píxeles.
+            cell_height: Alto de cada celda en píxeles.
+            pos_x: Posición horizontal del tablero en pantalla.
+            pos_y: Posición vertical del tablero en pantalla.
+        """
+        self._surface = surface
+        self._rect: pygame.Rect = self._surface.get_rect()
+        self._rect.topleft = (pos_x, pos_y)
+
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+
+        # Capa cacheada: fondo + bloques fijos tal como se dibujaron la última vez
+        self._layer: pygame.Surface = self._surface.copy()
+        self._drawn_board: "Board | None" = None
+        self._drawn_version: int = -1
+        self._drawn_matrix: np.ndarray | None = None
+        self._drawn_anim: set[int] = set()
+        self._batch = RenderBatch()
+
+    def draw(self, surface: "pygame.Surface | RenderBatch", board: "Board", pieces: "PieceDataType") -> None:
+        """
+        Dibuja el fondo del tablero y los bloques estáticos, respetando la animación de líneas.
+
+        Args:
+            surface: Surface destino o RenderBatch de la capa donde se dibuja.
+            board: Tablero a dibujar.
+            pieces: Datos de las piezas con sus surfaces.
+        """
+        if board is not self._drawn_board or board.version != self._drawn_version:
+            self._refresh_layer(board, pieces)
+        surface.blit(self._layer, self._rect)
+
+    def get_pixels_of_cell(self, row: int, col: int) -> tuple[int, int]:
+        """
+        Convierte una posición de celda del tablero (row, col) en coordenadas
+        absolutas en píxeles para dibujar la pieza en pantalla.
+
+        La conversión toma como origen la esquina superior izquierda del tablero
+        y aplica el tamaño de cada celda.
+
+        Args:
+            row: Fila de la celda dentro del tablero.
+            col: Columna de la celda dentro del tablero.
+
+        Returns:
+            Tuple[int, int]: Coordenadas (x, y) en píxeles dentro de la ventana.
+        """
+        return ((self._rect.x + col * self.cell_width), (self._rect.y + row * self.cell_height))
+
+    # --- HELPERS ---
+    def _refresh_layer(self, board: "Board", pieces: "PieceDataType") -> None:
+        """Redibuja en la capa las filas que cambiaron desde el último dibujado."""
+        matrix = board.matrix
+        if board is not self._drawn_board or self._drawn_matrix is None or self._drawn_matrix.shape != matrix.shape:
+            dirty = set(range(board.rows))
+            self._drawn_matrix = matrix.copy()
+        else:
+            dirty = {int(r) for r in np.flatnonzero((matrix != self._drawn_matrix).any(axis=1))}
+            self._drawn_matrix[:, :] = matrix
+
+        # Las filas animadas (actuales y anteriores) cambian aunque la matriz no cambie
+        anim_rows = board.anim_rows
+        dirty |= anim_rows | self._drawn_anim
+
+        for row in sorted(dirty):
+            self._draw_row(board, pieces, row)
+        self._batch.flush(self._layer)
+
+        self._drawn_board   = board
+        self._drawn_version = board.version
+        self._drawn_anim    = set(anim_rows)
+
+    def _draw_row(self, board: "Board", pieces: "PieceDataType", row: int) -> None:
+        """Restaura el fondo de la fila y encola sus bloques fijos en el batch de la capa."""
+        y = row * self.cell_height
+        area = pygame.Rect(0, y, self._layer.get_width(), self.cell_height)
+        self._layer.fill(self.CLEAR, area)
+        # La capa quedó transparente: sumar los canales copia el fondo sin mezclarlo
+        self._layer.blit(self._surface, area, area, special_flags=pygame.BLEND_RGBA_ADD)
+
+        center = board.cols // 2
+        anim_step = board.anim_step
+        animating = row in board.anim_rows
+
+        for col in np.flatnonzero(board.matrix[row]):
+            if animating and center - anim_step <= col <= center + anim_step - 1:
+                continue
+            block = board.matrix[row, col]
+            if block == GARBAGE_BLOCK:
+                # La basura no tiene sprite propio: se dibuja con el bloque fantasma
+                sprite = pieces[NUM_TO_PIECE[1]]["block"]["ghost"]
+            else:
+                sprite = pieces[NUM_TO_PIECE[block]]["block"]["placed"]
+            self._batch.blit(sprite, (col * self.cell_width, y))
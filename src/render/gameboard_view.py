@@ -0,0 +1,106 @@
+import pygame
+from typing import TYPE_CHECKING
+from src.constants import BLOCK_W, BLOCK_H, HOLD_X, HOLD_Y
+from src.render.board_view import BoardView
+from src.render.piece_view import PieceView
+from src.render.pieces_preview import PiecesPreview
+from src.render.render_batch import RenderBatch
+
+if TYPE_CHECKING:
+    from src.core.gameboard_controller import GameBoardController
+    from src.core.types import PieceDataType
+    from src.render.types import BoardType, PiecesPreviewType
+
+
+class GameBoardView:
+    """
+    Vista del GameBoardController.
+
+    Dibuja el tablero, la preview, el hold, el ghost y la pieza activa leyendo el estado
+    del controller; no modifica la lógica del juego.
+    """
+    def __init__(self,
+                 controller: "GameBoardController",
+                 pieces: "PieceDataType",
+                 board: "BoardType",
+                 preview: "PiecesPreviewType") -> None:
+        """
+        Args:
+            controller: Partida a dibujar.
+            pieces: Datos de las piezas con sus surfaces.
+            board: Imagen y posición del tablero.
+            preview: Posición y disposición de la vista previa.
+        """
+        self._controller = controller
+        self._data = pieces
+        self._board = BoardView(board["surface"], BLOCK_W, BLOCK_H, board["pos_x"], board["pos_y"])
+        self._piece = PieceView(pieces)
+        self._preview = PiecesPreview(pieces, preview=preview)
+        self._batch = RenderBatch()
+
+    @property
+    def board_view(self) -> BoardView:
+        return self._board
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """
+        Dibuja todos los elementos visuales del tablero.
+
+        Orden: tablero -> preview -> hold -> ghost -> pieza activa. Todo se acumula en un
+        RenderBatch y se envía a la surface con un único Surface.blits.
+        """
+        self._draw_layer(self._batch)
+        self._batch.flush(surface)
+
+    def debug_draw(self, surface: pygame.Surface, font: pygame.font.Font,
+                   pos_x: int = 10, pos_y: int = 10, line_height: int = 25) -> None:
+        """Dibuja las métricas internas del Score y de las mecánicas."""
+        score = self._controller.score
+        mechanics = self._controller.mechanics
+        config = score.config["score"]
+
+        debug_texts = [
+            "ACTUAL SCORE:",
+            f"Current Score: {score.current_score}",
+            f"Aux Score: {score.aux_score}",
+            f"Combo Count: {score.combo_count}",
+            f"Back-to-Back: {score.back_to_back_active}",
+            f"Level: {score.level}",
+            f"Lines Cleared Total: {score.lines_cleared_total}",
+            f"Fall Delay: {mechanics.get_fall_delay(score.level):.3f}",
+            f"Fall Timer: {mechanics.fall_timer:.3f}",
+            f"Lock Delay: {mechanics.lock_delay:.3f}",
+            f"Lock Timer: {mechanics.lock_timer:.3f}",
+            "", "", "CHANGES:",
+            f"Previous Soft Drop: {score.prev_soft_drop} x{config['soft_drop']} ({score.prev_soft_drop * config['soft_drop']})",
+            f"Previous Hard Drop: {score.prev_hard_drop} x{config['hard_drop']} ({score.prev_hard_drop * config['hard_drop']})",
+            f"Previous Lines Cleared: {self._controller.last_lines_cleared}"
+        ]
+
+        for i, text in enumerate(debug_texts):
+            rendered = font.render(text, True, (255, 255, 255))
+            surface.blit(rendered, (pos_x, pos_y + i * line_height))
+
+    # --- HELPERS ---
+    def _draw_layer(self, surface: "pygame.Surface | RenderBatch") -> None:
+        """Dibuja (o encola) los elementos del tablero en el orden de draw."""
+        controller = self._controller
+        self._board.draw(surface, controller.board, self._data)
+
+        self._preview.generate(controller.preview)
+        for surf, x, y in self._preview.get():
+            surface.blit(surf, (x, y))
+
+        hold_piece = controller.hold_piece
+        if hold_piece is not None:
+            hold_surface = self._data[hold_piece.name]["surfaces"]["normal"]
+            rect = hold_surface.get_rect(center=(HOLD_X, HOLD_Y))
+
+            surface.blit(hold_surface, rect)
+
+        piece = controller.piece
+        if piece is not None and not piece.is_locked():
+            pos_normal = self._board.get_pixels_of_cell(piece.row, piece.col)
+            pos_ghost  = self._board.get_pixels_of_cell(piece.ghost_row, piece.ghost_col)
+            self._piece.draw_ghost(surface, piece, pos_ghost)
+            self._piece.draw_normal(surface, piece, pos_normal)
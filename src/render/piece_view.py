@@ -0,0 +1,35 @@
+import pygame
+from typing import TYPE_CHECKING
+from src.constants import BLOCK_W, BLOCK_H
+
+if TYPE_CHECKING:
+    from src.core.piece import Piece
+    from src.render.render_batch import RenderBatch
+    from src.core.types import PieceDataType
+
+
+class PieceView:
+    """Dibuja piezas lógicas (Piece) usando las surfaces de bloque de la biblioteca de piezas."""
+    def __init__(self, pieces: "PieceDataType") -> None:
+        """
+        Args:
+            pieces: Datos de las piezas con sus surfaces.
+        """
+        self._pieces = pieces
+
+    def draw_normal(self, surface: "pygame.Surface | RenderBatch", piece: "Piece", position_in_board: tuple[int, int]) -> None:
+        """Dibuja la pieza normal usando su surface de bloque normal."""
+        self._draw_blocks(surface, piece, position_in_board, self._pieces[piece.name]["block"]["normal"])
+
+    def draw_ghost(self, surface: "pygame.Surface | RenderBatch", piece: "Piece", position_in_board: tuple[int, int]) -> None:
+        """Dibuja la pieza fantasma usando su surface de bloque ghost."""
+        self._draw_blocks(surface, piece, position_in_board, self._pieces[piece.name]["block"]["ghost"])
+
+    # --- HELPERS ---
+    @staticmethod
+    def _draw_blocks(surface: "pygame.Surface | RenderBatch", piece: "Piece", position_in_board: tuple[int, int],
+                     block_surface: pygame.Surface) -> None:
+        """Dibuja los bloques de la pieza usando la surface indicada."""
+        pos_x, pos_y = position_in_board
+        for r, c in piece.offsets:
+            surface.blit(block_surface, (pos_x + c * BLOCK_W, pos_y + r * BLOCK_H))
@@ -1,22 +1,20 @@
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from src.core.piece_bag import PieceBag
-    from src.core.types import PieceDataType, PiecesPreviewType
+    from src.core.types import PieceDataType
+    from src.render.types import PiecesPreviewType
     from pygame import Surface
 
 class PiecesPreview:
-    def __init__(self, data: "PieceDataType", bag: "PieceBag", *, preview: "PiecesPreviewType"):
+    def __init__(self, data: "PieceDataType", *, preview: "PiecesPreviewType"):
         """
         args:
         - data: dict[str, PieceData] con info de piezas y sus surfaces
-        - bag: instancia de PieceBag
         - preview: PiecePreviewConfig con la info: pos_x, pos_y: coordenadas donde se dibuja la primera pieza,
             max_width: ancho máximo de la zona de preview (para centrar las piezas horizontalmente), margin: espacio
             vertical entre piezas y preview_count: cuántas piezas mostrar
         """
         self._data = data
-        self._bag = bag
         self._pos_x = preview["pos_x"]
         self._pos_y = preview["pos_y"]
         self._max_width = preview["max_width"]
@@ -28,26 +26,32 @@ class PiecesPreview:
 
         # Lista de tuplas (surface, x, y)
         self._preview_list: "list[tuple[Surface, int, int]]" = []
+        # Nombres con los que se generó la lista actual
+        self._names: list[str] | None = None
         # Cuantas Piezas mostrar
         self.count = preview["preview_count"]
-        # Generar la vista previa inicial
-        self.generate()
 
-    def generate(self):
-        """Genera la lista inicial de previews"""
-        piece_names = self._bag.peek_next(self.count)  # Obtén las primeras preview_count piezas
+    def generate(self, piece_names: list[str]) -> None:
+        """
+        Genera la lista de previews a partir de los nombres de las próximas piezas.
+
+        Solo recalcula la disposición si la lista de nombres cambió.
+        """
+        if piece_names is self._names:
+            return
+        self._names = piece_names
         self._preview_list = []
         y = self._pos_y # Posición vertical inicial
         # Calcular la altura de cada pieza dinámicamente
-        for name in piece_names:
+        for name in piece_names[:self.count]:
             surface = self._data[name]["surfaces"]["normal"]
             x = self._x_cache[name]
 
             # Añadir la pieza con la posición correcta
             self._preview_list.append((surface, x, y))
             # Acumular altura para la siguiente pieza
-            y += surface.get_height() + self._margin 
-            
+            y += surface.get_height() + self._margin
+
     def get(self) -> "list[tuple[Surface, int, int]]":
         """Devuelve la lista de previsualización (surface, x, y)"""
         return self._preview_list
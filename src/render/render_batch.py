@@ -0,0 +1,37 @@
+import pygame
+
+
+class RenderBatch:
+    """
+    Acumula blits de una capa y los envía juntos con Surface.blits.
+
+    Expone un `blit` con la misma firma que pygame.Surface, así que las vistas y los
+    elementos de UI que solo hacen blits pueden recibirlo en lugar de la surface destino.
+    El orden de dibujado se conserva: los comandos se envían en el orden en que llegaron.
+    """
+    def __init__(self) -> None:
+        self._commands: list[tuple] = []
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def blit(self, source: pygame.Surface, dest, area=None, special_flags: int = 0) -> None:
+        """
+        Registra un blit para el próximo flush.
+
+        Args:
+            source: Surface a dibujar.
+            dest: Posición (x, y) o Rect destino.
+            area: Porción de source a dibujar (opcional).
+            special_flags: Flags de mezcla de pygame (opcional).
+        """
+        if area is None and not special_flags:
+            self._commands.append((source, dest))
+        else:
+            self._commands.append((source, dest, area, special_flags))
+
+    def flush(self, target: pygame.Surface) -> None:
+        """Dibuja todos los comandos acumulados sobre target con una sola llamada y los descarta."""
+        if self._commands:
+            target.blits(self._commands, doreturn=False)
+            self._commands.clear()
@@ -0,0 +1,66 @@
+import pygame
+import numpy as np
+from typing import TYPE_CHECKING
+from src.constants import GARBAGE_BLOCK, NUM_TO_PIECE, ROWS, COLS
+
+if TYPE_CHECKING:
+    from src.core.gameboard_controller import GameBoardController
+    from src.core.types import PieceDataType
+
+
+class RivalView:
+    """
+    Tablero reducido del rival de un versus, con su pieza activa.
+
+    Pinta el tablero de una vez como RoyaleView: convierte los valores de las celdas a
+    colores con una paleta y los amplía con NumPy. Con `cell` chico entra al costado del
+    tablero propio sin tapar el hold ni la preview.
+    """
+    BORDER    = (90, 90, 110)
+    EMPTY     = (36, 36, 48)
+    GARBAGE   = (120, 120, 120)
+    DEAD_TINT = (70, 70, 70)
+
+    def __init__(self, controller: "GameBoardController", pieces: "PieceDataType", pos: tuple[int, int],
+                 cell: int = 12) -> None:
+        """
+        Args:
+            controller: Partida del rival.
+            pieces: Datos de las piezas con sus surfaces (de sus bloques sale la paleta).
+            pos: Esquina superior izquierda del tablero en pantalla.
+            cell: Lado de cada celda, en píxeles.
+        """
+        self._controller = controller
+        self._pos = pos
+        self.cell = cell
+        self._surface = pygame.Surface((COLS * cell, ROWS * cell))
+        self._cells = np.zeros((ROWS, COLS), dtype=np.uint8)
+
+        self._palette = np.zeros((max(GARBAGE_BLOCK, *NUM_TO_PIECE) + 1, 3), dtype=np.uint8)
+        self._palette[0] = self.EMPTY
+        for value, name in NUM_TO_PIECE.items():
+            self._palette[value] = pygame.transform.average_color(pieces[name]["block"]["placed"])[:3]
+        self._palette[GARBAGE_BLOCK] = self.GARBAGE
+        self._values = {name: value for value, name in NUM_TO_PIECE.items()}
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return self._surface.get_rect(topleft=self._pos)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Dibuja el tablero del rival con su pieza activa (oscurecido si perdió)."""
+        controller = self._controller
+        self._cells[:] = controller.board.matrix
+        piece = controller.piece
+        if piece is not None and not controller.is_game_over():
+            value = self._values[piece.name]
+            for row, col in piece.get_cells():
+                if 0 <= row < ROWS and 0 <= col < COLS:
+                    self._cells[row, col] = value
+
+        pixels = self._palette[self._cells.T].repeat(self.cell, axis=0).repeat(self.cell, axis=1)
+        pygame.surfarray.blit_array(self._surface, pixels)
+        if controller.is_game_over():
+            self._surface.fill(self.DEAD_TINT, special_flags=pygame.BLEND_RGB_MULT)
+        surface.blit(self._surface, self._pos)
+        pygame.draw.rect(surface, self.BORDER, self.rect.inflate(4, 4), 2)
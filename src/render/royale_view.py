@@ -0,0 +1,109 @@
+import pygame
+import numpy as np
+from typing import TYPE_CHECKING
+from src.constants import GARBAGE_BLOCK, NUM_TO_PIECE, ROWS, COLS
+
+if TYPE_CHECKING:
+    from src.ai.royale import RoyaleWorker
+    from src.core.types import PieceDataType
+
+
+class RoyaleView:
+    """
+    Miniaturas de los tableros rivales de un battle royale.
+
+    Cada área de la pantalla tiene una capa opaca con su tanda de miniaturas. Una miniatura
+    solo se redibuja cuando cambia la versión publicada de su tablero (el rival bloqueó una
+    pieza, recibió basura o perdió): el tablero se pinta de una vez convirtiendo sus valores a
+    colores con una paleta y ampliándolo con NumPy. El resto de los frames cada área se dibuja
+    con un único blit, sin importar la cantidad de rivales.
+    """
+    BACKGROUND = (16, 16, 24)
+    EMPTY      = (36, 36, 48)
+    GARBAGE    = (120, 120, 120)
+    DEAD_TINT  = (70, 70, 70)
+    KO_COLOR   = (200, 40, 40)
+    GAP        = 4
+
+    def __init__(self, pieces: "PieceDataType", opponents: int, areas: list[pygame.Rect], cell: int = 3) -> None:
+        """
+        Args:
+            pieces: Datos de las piezas con sus surfaces (de sus bloques sale la paleta).
+            opponents: Cantidad de miniaturas, repartidas en partes iguales entre las áreas.
+            areas: Zonas de la pantalla donde se ubican las miniaturas.
+            cell: Lado de cada celda de una miniatura, en píxeles.
+
+        Raises:
+            ValueError: Si las miniaturas no entran en las áreas.
+        """
+        self.cell   = cell
+        self._size  = (COLS * cell, ROWS * cell)
+        self._areas = areas
+        self._layers = [pygame.Surface(area.size) for area in areas]
+        for layer in self._layers:
+            layer.fill(self.BACKGROUND)
+
+        # Paleta: un color por valor de celda (el promedio del bloque de cada pieza)
+        self._palette = np.zeros((max(GARBAGE_BLOCK, *NUM_TO_PIECE) + 1, 3), dtype=np.uint8)
+        self._palette[0] = self.EMPTY
+        for value, name in NUM_TO_PIECE.items():
+            self._palette[value] = pygame.transform.average_color(pieces[name]["block"]["placed"])[:3]
+        self._palette[GARBAGE_BLOCK] = self.GARBAGE
+
+        self._slots = self._layout(opponents)
+        self._thumb = pygame.Surface(self._size)
+        self._scratch = np.zeros((ROWS, COLS), dtype=np.uint8)
+        self._drawn = np.full(opponents, -1, dtype=np.int64)
+        self.redrawn = 0   # miniaturas redibujadas en el último draw
+
+    def draw(self, surface: pygame.Surface, field: "RoyaleWorker") -> None:
+        """
+        Redibuja las miniaturas cuyo tablero cambió y dibuja las áreas.
+
+        Args:
+            surface: Surface destino.
+            field: Rivales, con sus tableros publicados.
+        """
+        self.redrawn = 0
+        for index in np.flatnonzero(field.versions != self._drawn):
+            version = field.read_board(int(index), self._scratch)
+            # Si el worker lo estaba escribiendo se reintenta en el próximo frame
+            if version >= 0:
+                self._draw_thumbnail(int(index), bool(field.dead[index]))
+                self._drawn[index] = version
+                self.redrawn += 1
+        for layer, area in zip(self._layers, self._areas):
+            surface.blit(layer, area)
+
+    # --- HELPERS ---
+    def _layout(self, opponents: int) -> list[tuple[int, int, int]]:
+        """Ubica cada miniatura en una grilla dentro de su área: (capa, x, y)."""
+        width, height = self._size
+        per_area = -(-opponents // len(self._areas))
+        slots = []
+        for layer, area in enumerate(self._areas):
+            columns = max(1, (area.width + self.GAP) // (width + self.GAP))
+            count = min(per_area, opponents - len(slots))
+            rows = -(-count // columns)
+            if rows * (height + self.GAP) - self.GAP > area.height:
+                raise ValueError(f"RoyaleView: {count} miniaturas de {width}x{height} no entran en {area.size}.")
+            # Grilla centrada en el área
+            left = (area.width - (columns * (width + self.GAP) - self.GAP)) // 2
+            top = (area.height - (rows * (height + self.GAP) - self.GAP)) // 2
+            for slot in range(count):
+                row, column = divmod(slot, columns)
+                slots.append((layer, left + column * (width + self.GAP), top + row * (height + self.GAP)))
+        return slots
+
+    def _draw_thumbnail(self, index: int, dead: bool) -> None:
+        """Pinta el tablero copiado en _scratch en la miniatura `index`."""
+        pixels = self._palette[self._scratch.T]
+        pixels = pixels.repeat(self.cell, axis=0).repeat(self.cell, axis=1)
+        pygame.surfarray.blit_array(self._thumb, pixels)
+        if dead:
+            width, height = self._size
+            self._thumb.fill(self.DEAD_TINT, special_flags=pygame.BLEND_RGB_MULT)
+            pygame.draw.line(self._thumb, self.KO_COLOR, (0, 0), (width - 1, height - 1), 2)
+            pygame.draw.line(self._thumb, self.KO_COLOR, (width - 1, 0), (0, height - 1), 2)
+        layer, x, y = self._slots[index]
+        self._layers[layer].blit(self._thumb, (x, y))
@@ -0,0 +1,14 @@
+from pygame import Surface
+from typing import TypedDict
+
+class BoardType(TypedDict):
+    surface: Surface
+    pos_x: int
+    pos_y: int
+
+class PiecesPreviewType(TypedDict):
+    pos_x: int
+    pos_y: int
+    max_width: int
+    preview_count: int
+    margin: int
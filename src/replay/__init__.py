@@ -0,0 +1,11 @@
+from src.replay.replay import Keyframe, Replay, config_crc
+from src.replay.recorder import ReplayRecorder
+from src.replay.player import ReplayPlayer
+
+__all__ = [
+    "Replay",
+    "Keyframe",
+    "config_crc",
+    "ReplayRecorder",
+    "ReplayPlayer",
+]
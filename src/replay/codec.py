@@ -0,0 +1,136 @@
+"""
+Codificación de enteros de tamaño variable usada por el formato de replays.
+
+Los enteros no negativos se guardan como varint (7 bits por byte, el bit alto indica que
+sigue otro byte) y los que pueden ser negativos pasan antes por zigzag (0, -1, 1, -2 ... → 0, 1, 2, 3 ...).
+
+write_value/read_value guardan valores anidados (los snapshots de la partida) con un byte de
+tipo por valor: los enteros como varint con zigzag, los float como double de 8 bytes (exactos)
+y tuplas, frozensets, bytes y str con su largo delante.
+"""
+import struct
+
+# Byte de tipo de cada valor en write_value
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _BYTES, _TUPLE, _FROZENSET = range(9)
+_DOUBLE = struct.Struct("<d")
+
+
+def zigzag(value: int) -> int:
+    """Convierte un entero con signo en uno sin signo, con valores pequeños para |value| pequeño."""
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def unzigzag(value: int) -> int:
+    """Inversa de zigzag."""
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def write_varint(out: bytearray, value: int) -> None:
+    """
+    Agrega `value` a `out` como varint.
+
+    Raises:
+        ValueError: Si value es negativo.
+    """
+    if value < 0:
+        raise ValueError(f"Codec: varint negativo ({value}). Usa zigzag para enteros con signo.")
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """
+    Lee un varint de `data` desde `pos`.
+
+    Returns:
+        tuple[int, int]: El valor leído y la posición siguiente.
+
+    Raises:
+        ValueError: Si los datos terminan a mitad del varint.
+    """
+    value, shift = 0, 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("Codec: datos truncados al leer un varint.")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def write_value(out: bytearray, value: object) -> None:
+    """
+    Agrega `value` a `out` con su tipo (ver read_value).
+
+    Raises:
+        TypeError: Si value (o algo dentro de él) no es None, bool, int, float, str, bytes, tuple o frozenset.
+    """
+    if value is None:
+        out.append(_NONE)
+    elif isinstance(value, bool):
+        out.append(_TRUE if value else _FALSE)
+    elif isinstance(value, int):
+        out.append(_INT)
+        write_varint(out, zigzag(value))
+    elif isinstance(value, float):
+        out.append(_FLOAT)
+        out += _DOUBLE.pack(value)
+    elif isinstance(value, (str, bytes)):
+        data = value.encode("utf-8") if isinstance(value, str) else value
+        out.append(_STR if isinstance(value, str) else _BYTES)
+        write_varint(out, len(data))
+        out += data
+    elif isinstance(value, (tuple, frozenset)):
+        # Los frozenset se ordenan para que el mismo estado siempre dé los mismos bytes
+        items = value if isinstance(value, tuple) else sorted(value)
+        out.append(_TUPLE if isinstance(value, tuple) else _FROZENSET)
+        write_varint(out, len(items))
+        for item in items:
+            write_value(out, item)
+    else:
+        raise TypeError(f"Codec: tipo no soportado ({type(value).__name__}).")
+
+
+def read_value(data: bytes, pos: int) -> tuple[object, int]:
+    """
+    Lee un valor escrito con write_value. Las tuplas se devuelven como tuplas simples.
+
+    Returns:
+        tuple[object, int]: El valor leído y la posición siguiente.
+
+    Raises:
+        ValueError: Si los datos están truncados o el tipo es desconocido.
+    """
+    if pos >= len(data):
+        raise ValueError("Codec: datos truncados al leer un valor.")
+    tag = data[pos]
+    pos += 1
+    if tag == _NONE:
+        return None, pos
+    if tag in (_FALSE, _TRUE):
+        return tag == _TRUE, pos
+    if tag == _INT:
+        value, pos = read_varint(data, pos)
+        return unzigzag(value), pos
+    if tag == _FLOAT:
+        if pos + _DOUBLE.size > len(data):
+            raise ValueError("Codec: datos truncados al leer un float.")
+        return _DOUBLE.unpack_from(data, pos)[0], pos + _DOUBLE.size
+    if tag in (_STR, _BYTES):
+        size, pos = read_varint(data, pos)
+        raw = bytes(data[pos:pos + size])
+        if len(raw) != size:
+            raise ValueError("Codec: datos truncados al leer un texto.")
+        return (raw.decode("utf-8") if tag == _STR else raw), pos + size
+    if tag in (_TUPLE, _FROZENSET):
+        size, pos = read_varint(data, pos)
+        items = []
+        for _ in range(size):
+            item, pos = read_value(data, pos)
+            items.append(item)
+        return (tuple(items) if tag == _TUPLE else frozenset(items)), pos
+    raise ValueError(f"Codec: tipo de valor desconocido ({tag}).")
@@ -0,0 +1,185 @@
+import time
+from typing import Iterator, TYPE_CHECKING
+from src.core.action import Action
+from src.core.gameboard_controller import GameBoardController
+from src.replay.replay import Keyframe, Replay, config_crc, TICK
+
+if TYPE_CHECKING:
+    from src.core.types import PieceShapeType
+    from src.config.gameplay import GameplayConfigType
+    from src.database import RawRecord
+
+
+class ReplayPlayer:
+    """
+    Reproduce un Replay sobre un GameBoardController nuevo.
+
+    Cada frame despacha sus acciones y luego llama a update con el dt grabado, en el mismo
+    orden que PlayState (handle_input antes de update). El controlador usa la semilla del
+    replay, así que el resultado es idéntico a la partida original.
+
+    step() avanza un frame, advance() avanza según el tiempo real transcurrido (para una vista)
+    y run() reproduce todo, a velocidad real o tan rápido como sea posible.
+
+    seek() y seek_time() saltan a cualquier punto, hacia adelante o hacia atrás: restauran el
+    último keyframe anterior al destino y re-simulan solo los frames que faltan. Sin keyframes
+    (replays de la versión 1) se re-simula desde el inicio.
+    """
+    def __init__(self, replay: Replay, session_config: "GameplayConfigType",
+                 pieces: "PieceShapeType | None" = None) -> None:
+        """
+        Args:
+            replay: Replay a reproducir.
+            session_config: Configuración de gameplay; debe ser la misma con la que se grabó.
+            pieces: Formas de las piezas (las de PIECE_DEFINITIONS por defecto).
+
+        Raises:
+            ValueError: Si el ruleset no existe o la configuración no coincide con la grabada.
+        """
+        ruleset = session_config["rulesets"].get(replay.ruleset_name)
+        if ruleset is None:
+            raise ValueError(f"ReplayPlayer: ruleset desconocido ({replay.ruleset_name}).")
+        if config_crc(session_config) != replay.config_crc:
+            raise ValueError("ReplayPlayer: la configuración de gameplay no coincide con la del replay.")
+
+        self.replay  = replay
+        self.session = GameBoardController(session_config, ruleset, pieces, seed=replay.seed)
+        self._frames: Iterator[tuple[int, list[Action]]] = replay.iter_frames()
+        self._frame   = 0
+        self._elapsed = 0   # ticks reproducidos
+        self._pending = 0.0
+        self._next: tuple[int, list[Action]] | None = next(self._frames, None)
+        self.session.start()
+        self._origin = self.session.snapshot()
+        self.resimulated = 0   # frames re-simulados por el último seek
+
+    @property
+    def frame(self) -> int:
+        """Cantidad de frames reproducidos."""
+        return self._frame
+
+    @property
+    def time(self) -> float:
+        """Segundos de partida reproducidos."""
+        return self._elapsed * TICK
+
+    @property
+    def finished(self) -> bool:
+        """True cuando ya se reprodujeron todos los frames."""
+        return self._next is None
+
+    def step(self) -> bool:
+        """
+        Reproduce el siguiente frame.
+
+        Returns:
+            bool: False si no quedaban frames.
+        """
+        if self._next is None:
+            return False
+        ticks, actions = self._next
+        for action in actions:
+            self.session.perform(action)
+        self.session.update(ticks * TICK)
+
+        self._frame += 1
+        self._elapsed += ticks
+        self._next = next(self._frames, None)
+        return True
+
+    def seek(self, frame: int) -> int:
+        """
+        Salta al estado con `frame` frames reproducidos.
+
+        Si el destino está adelante y no hay un keyframe entre medio, sigue desde el frame
+        actual en lugar de restaurar.
+
+        Args:
+            frame: Frame destino; se limita al rango del replay.
+
+        Returns:
+            int: Cantidad de frames re-simulados.
+        """
+        frame = max(0, min(frame, self.replay.frame_count))
+        keyframe = self.replay.keyframe_before(frame)
+        if not (keyframe.frame if keyframe else 0) <= self._frame <= frame:
+            self._rewind(keyframe)
+        played = 0
+        while self._frame < frame and self.step():
+            played += 1
+        self._pending = 0.0
+        self.resimulated = played
+        return played
+
+    def seek_time(self, seconds: float) -> int:
+        """
+        Salta al último frame que termina en `seconds` de partida o antes (ver seek).
+
+        Returns:
+            int: Cantidad de frames re-simulados.
+        """
+        target = round(max(0.0, seconds) / TICK)
+        keyframe = self.replay.keyframe_before_time(seconds)
+        if not (keyframe.elapsed if keyframe else 0) <= self._elapsed <= target:
+            self._rewind(keyframe)
+        played = 0
+        while self._next is not None and self._elapsed + self._next[0] <= target:
+            self.step()
+            played += 1
+        self._pending = 0.0
+        self.resimulated = played
+        return played
+
+    def advance(self, elapsed: float) -> int:
+        """
+        Reproduce los frames que caben en el tiempo real transcurrido.
+
+        Args:
+            elapsed: Segundos transcurridos desde la última llamada.
+
+        Returns:
+            int: Cantidad de frames reproducidos.
+        """
+        self._pending += elapsed
+        played = 0
+        while self._next is not None and self._next[0] * TICK <= self._pending:
+            self._pending -= self._next[0] * TICK
+            self.step()
+            played += 1
+        return played
+
+    def run(self, realtime: bool = False) -> "RawRecord":
+        """
+        Reproduce el replay completo.
+
+        Args:
+            realtime: Si es True respeta los dt grabados; si no, reproduce lo más rápido posible.
+
+        Returns:
+            RawRecord: Stats finales de la partida reproducida.
+        """
+        if not realtime:
+            while self.step():
+                pass
+            return self.session.final_stats
+
+        last = time.perf_counter()
+        while not self.finished:
+            now = time.perf_counter()
+            self.advance(now - last)
+            last = now
+            if not self.finished:
+                time.sleep(max(0.0, self._next[0] * TICK - self._pending))
+        return self.session.final_stats
+
+    # --- HELPERS ---
+    def _rewind(self, keyframe: Keyframe | None) -> None:
+        """Vuelve al estado del keyframe (al inicio de la partida si es None)."""
+        if keyframe is None:
+            self.session.restore(self._origin)
+            self._frame, self._elapsed = 0, 0
+        else:
+            self.session.restore(keyframe.snapshot())
+            self._frame, self._elapsed = keyframe.frame, keyframe.elapsed
+        self._frames = self.replay.iter_frames(keyframe)
+        self._next = next(self._frames, None)
@@ -0,0 +1,116 @@
+from typing import TYPE_CHECKING
+from src.core.action import Action
+from src.replay.codec import write_varint, zigzag
+from src.replay.replay import (Keyframe, Replay, config_crc, encode_snapshot,
+                               ACTION_BITS, ACTION_LIMIT, KEYFRAME_INTERVAL, TICK)
+
+if TYPE_CHECKING:
+    from src.core.gameboard_controller import GameBoardController
+    from src.config.gameplay import GameplayConfigType
+    from src.database import RawRecord
+
+
+class ReplayRecorder:
+    """
+    Graba una partida como log de acciones por frame.
+
+    Por cada frame se llama a record() con cada acción despachada al controlador y luego a
+    advance() con el dt del frame. advance() redondea el dt a ticks enteros y devuelve el dt
+    redondeado: el juego debe avanzar con ese valor para que la reproducción sea exacta.
+    El error de redondeo se arrastra al frame siguiente, así que el reloj del juego no deriva.
+
+    Al final de cada frame (después del update del controlador) se llama a capture(), que
+    guarda un keyframe cada `keyframe_interval` piezas para poder saltar dentro del replay.
+    """
+    def __init__(self, seed: int, ruleset_name: str, session_config: "GameplayConfigType",
+                 keyframe_interval: int = KEYFRAME_INTERVAL) -> None:
+        """
+        Args:
+            seed: Semilla de la PieceBag de la partida.
+            ruleset_name: Nombre del ruleset activo.
+            session_config: Configuración de gameplay de la partida.
+            keyframe_interval: Piezas bloqueadas entre keyframes (0 para no grabarlos).
+        """
+        self._seed         = seed
+        self._ruleset_name = ruleset_name
+        self._config_crc   = config_crc(session_config)
+
+        self._frames      = bytearray()
+        self._frame_count = 0
+        self._actions: list[Action] = []
+        self._last_ticks  = 0
+        self._carry       = 0.0
+        self._elapsed     = 0
+
+        self._keyframe_interval = keyframe_interval
+        self._next_keyframe     = keyframe_interval
+        self._keyframes: list[Keyframe] = []
+
+    @property
+    def frame_count(self) -> int:
+        """Cantidad de frames grabados."""
+        return self._frame_count
+
+    def record(self, action: Action) -> None:
+        """Registra una acción despachada en el frame actual."""
+        self._actions.append(action)
+
+    def advance(self, dt: float) -> float:
+        """
+        Cierra el frame actual con su dt.
+
+        Args:
+            dt: Tiempo transcurrido del frame en segundos.
+
+        Returns:
+            float: dt redondeado a ticks, el que debe recibir el juego.
+        """
+        exact = dt / TICK + self._carry
+        ticks = max(0, round(exact))
+        self._carry = exact - ticks
+
+        count = len(self._actions)
+        write_varint(self._frames, (zigzag(ticks - self._last_ticks) << ACTION_BITS) | min(count, ACTION_LIMIT))
+        if count >= ACTION_LIMIT:
+            write_varint(self._frames, count - ACTION_LIMIT)
+        self._frames.extend(self._actions)
+
+        self._actions.clear()
+        self._last_ticks = ticks
+        self._elapsed += ticks
+        self._frame_count += 1
+        return ticks * TICK
+
+    def capture(self, session: "GameBoardController") -> None:
+        """
+        Guarda un keyframe si desde el anterior se bloquearon `keyframe_interval` piezas.
+
+        Args:
+            session: Controlador de la partida, ya actualizado con el frame cerrado por advance.
+        """
+        if not self._keyframe_interval or session.pieces_locked < self._next_keyframe:
+            return
+        self._next_keyframe = session.pieces_locked + self._keyframe_interval
+        self._keyframes.append(Keyframe(self._frame_count, len(self._frames), self._last_ticks,
+                                        self._elapsed, session.pieces_locked, encode_snapshot(session.snapshot())))
+
+    def finish(self, stats: "RawRecord | None" = None) -> Replay:
+        """
+        Devuelve el replay grabado hasta ahora.
+
+        Args:
+            stats: Stats finales de la partida (score, lines, level) para el encabezado.
+        """
+        stats = stats or {}
+        return Replay(
+            seed         = self._seed,
+            ruleset_name = self._ruleset_name,
+            config_crc   = self._config_crc,
+            frame_count  = self._frame_count,
+            frames       = bytes(self._frames),
+            score        = stats.get("score", 0),
+            lines        = stats.get("lines", 0),
+            level        = stats.get("level", 0),
+            keyframe_interval = self._keyframe_interval,
+            keyframes    = tuple(self._keyframes),
+        )
@@ -0,0 +1,266 @@
+import bisect
+import json
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, NamedTuple, TYPE_CHECKING
+from src.core.action import Action
+from src.core.board import BoardSnapshot
+from src.core.gameboard_controller import GameSnapshot
+from src.replay.codec import read_value, read_varint, unzigzag, write_value, write_varint
+
+if TYPE_CHECKING:
+    from src.config.gameplay import GameplayConfigType
+
+# Formato binario: MAGIC + versión + flags, seguido del cuerpo (comprimido con zlib si FLAG_ZLIB).
+# La versión 2 agrega los keyframes al final del cuerpo; la 1 se sigue pudiendo leer.
+MAGIC     = b"TRPL"
+VERSION   = 2
+FLAG_ZLIB = 0x01
+
+# Piezas bloqueadas entre keyframes por defecto (ver ReplayRecorder)
+KEYFRAME_INTERVAL = 20
+
+# Posición de la tabla de keyframes, en los últimos bytes del cuerpo
+_INDEX_OFFSET = struct.Struct("<I")
+
+# Duración de un tick del reloj del replay en segundos (los dt se guardan en ticks enteros)
+TICK = 0.001
+
+# Bits del encabezado de cada frame reservados para la cantidad de acciones
+ACTION_BITS  = 3
+ACTION_LIMIT = (1 << ACTION_BITS) - 1
+
+
+def config_crc(session_config: "GameplayConfigType") -> int:
+    """CRC32 de la configuración de gameplay; detecta replays grabados con otras reglas."""
+    return zlib.crc32(json.dumps(session_config, sort_keys=True).encode("utf-8"))
+
+
+def encode_snapshot(snapshot: GameSnapshot) -> bytes:
+    """Codifica el estado de una partida con el tablero compacto (ver GameSnapshot.compact)."""
+    out = bytearray()
+    write_value(out, tuple(snapshot.compact()))
+    return bytes(out)
+
+
+def decode_snapshot(data: bytes) -> GameSnapshot:
+    """
+    Inversa de encode_snapshot; el resultado se restaura con GameBoardController.restore.
+
+    Raises:
+        ValueError: Si los datos no son un snapshot codificado.
+    """
+    values, _ = read_value(data, 0)
+    if not isinstance(values, tuple) or len(values) != len(GameSnapshot._fields):
+        raise ValueError("Replay: el keyframe no contiene un estado de partida válido.")
+    return GameSnapshot(BoardSnapshot(*values[0]), *values[1:])
+
+
+class Keyframe(NamedTuple):
+    """
+    Estado de la partida al terminar un frame, guardado dentro del replay.
+
+    También guarda dónde sigue el log de frames, así que la reproducción puede continuar
+    desde el keyframe sin decodificar nada de lo anterior (ver ReplayPlayer.seek).
+    """
+    frame:   int     # frames reproducidos hasta el keyframe
+    pos:     int     # byte del log de frames donde empieza el siguiente
+    ticks:   int     # dt del último frame en ticks (base del delta del siguiente)
+    elapsed: int     # ticks transcurridos desde el inicio de la partida
+    pieces:  int     # piezas bloqueadas hasta el keyframe
+    state:   bytes   # GameSnapshot codificado con encode_snapshot
+
+    @property
+    def time(self) -> float:
+        """Segundos de partida hasta el keyframe."""
+        return self.elapsed * TICK
+
+    def snapshot(self) -> GameSnapshot:
+        """Decodifica el estado guardado."""
+        return decode_snapshot(self.state)
+
+
+@dataclass
+class Replay:
+    """
+    Partida grabada: semilla de la bolsa, ruleset y el log de acciones por frame.
+
+    `frames` guarda cada frame (dt + acciones despachadas antes del update) en forma compacta:
+        varint((zigzag(dt - dt_anterior) << 3) | min(n, 7)), varint(n - 7) si n >= 7,
+        y un byte por acción (valor de Action).
+    Los dt están en ticks de TICK segundos.
+
+    Cada `keyframe_interval` piezas se guarda además un Keyframe con el estado completo de la
+    partida. Se serializan después del log de frames, seguidos de la tabla de keyframes
+    (frame, posición en el log, ticks y tamaño del estado de cada uno) y de la posición de esa
+    tabla en los últimos 4 bytes. Un replay de la versión 1 se carga sin keyframes.
+
+    Attributes:
+        seed:         Semilla de la PieceBag de la partida.
+        ruleset_name: Nombre del ruleset en la configuración de gameplay.
+        config_crc:   CRC32 de la configuración de gameplay (ver config_crc).
+        frame_count:  Cantidad de frames grabados.
+        frames:       Frames codificados.
+        score:        Puntaje final.
+        lines:        Líneas eliminadas al finalizar.
+        level:        Nivel al finalizar.
+        keyframe_interval: Piezas entre keyframes (0 si no se grabaron).
+        keyframes:    Keyframes en orden de frame.
+    """
+    seed:         int
+    ruleset_name: str
+    config_crc:   int
+    frame_count:  int
+    frames:       bytes
+    score:        int = 0
+    lines:        int = 0
+    level:        int = 0
+    keyframe_interval: int = 0
+    keyframes:    tuple[Keyframe, ...] = ()
+
+    @property
+    def duration(self) -> float:
+        """Duración de la partida en segundos."""
+        return sum(ticks for ticks, _ in self.iter_frames()) * TICK
+
+    def iter_frames(self, start: Keyframe | None = None) -> Iterator[tuple[int, list[Action]]]:
+        """
+        Decodifica los frames en orden.
+
+        Args:
+            start: Keyframe desde el que empezar (los frames anteriores no se decodifican).
+
+        Yields:
+            tuple[int, list[Action]]: dt del frame en ticks y las acciones despachadas en él.
+        """
+        data, pos, ticks, first = self.frames, 0, 0, 0
+        if start is not None:
+            pos, ticks, first = start.pos, start.ticks, start.frame
+        for _ in range(first, self.frame_count):
+            head, pos = read_varint(data, pos)
+            count = head & ACTION_LIMIT
+            if count == ACTION_LIMIT:
+                extra, pos = read_varint(data, pos)
+                count += extra
+            ticks += unzigzag(head >> ACTION_BITS)
+            yield ticks, [Action(code) for code in data[pos:pos + count]]
+            pos += count
+
+    def keyframe_before(self, frame: int) -> Keyframe | None:
+        """Último keyframe en `frame` o antes (None si no hay ninguno)."""
+        index = bisect.bisect_right(self.keyframes, frame, key=lambda keyframe: keyframe.frame)
+        return self.keyframes[index - 1] if index else None
+
+    def keyframe_before_time(self, seconds: float) -> Keyframe | None:
+        """Último keyframe en `seconds` de partida o antes (None si no hay ninguno)."""
+        ticks = round(seconds / TICK)
+        index = bisect.bisect_right(self.keyframes, ticks, key=lambda keyframe: keyframe.elapsed)
+        return self.keyframes[index - 1] if index else None
+
+    def to_bytes(self, compress: bool = True) -> bytes:
+        """Serializa el replay; con compress=True el cuerpo se comprime con zlib."""
+        name = self.ruleset_name.encode("utf-8")
+        body = bytearray()
+        for value in (self.seed, len(name)):
+            write_varint(body, value)
+        body += name
+        for value in (self.config_crc, self.score, self.lines, self.level, self.frame_count, len(self.frames)):
+            write_varint(body, value)
+        body += self.frames
+        self._write_keyframes(body)
+
+        flags = FLAG_ZLIB if compress else 0
+        payload = zlib.compress(bytes(body), 9) if compress else bytes(body)
+        return MAGIC + bytes((VERSION, flags)) + payload
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        """
+        Reconstruye un replay serializado con to_bytes.
+
+        Raises:
+            ValueError: Si los datos no son un replay o su versión no está soportada.
+        """
+        if data[:len(MAGIC)] != MAGIC or len(data) < len(MAGIC) + 2:
+            raise ValueError("Replay: los datos no son un replay válido.")
+        version, flags = data[len(MAGIC)], data[len(MAGIC) + 1]
+        if version not in (1, VERSION):
+            raise ValueError(f"Replay: versión {version} no soportada (se esperaba 1 a {VERSION}).")
+
+        body = data[len(MAGIC) + 2:]
+        if flags & FLAG_ZLIB:
+            body = zlib.decompress(body)
+
+        seed, pos = read_varint(body, 0)
+        size, pos = read_varint(body, pos)
+        name = body[pos:pos + size].decode("utf-8")
+        pos += size
+        values = []
+        for _ in range(6):
+            value, pos = read_varint(body, pos)
+            values.append(value)
+        crc, score, lines, level, frame_count, size = values
+        frames = bytes(body[pos:pos + size])
+        if len(frames) != size:
+            raise ValueError("Replay: datos truncados en el log de frames.")
+        replay = cls(seed, name, crc, frame_count, frames, score, lines, level)
+        if version >= 2:
+            replay._read_keyframes(body, pos + size)
+        return replay
+
+    def save(self, path: "str | Path", compress: bool = True) -> None:
+        """Guarda el replay en `path`."""
+        Path(path).write_bytes(self.to_bytes(compress))
+
+    @classmethod
+    def load(cls, path: "str | Path") -> "Replay":
+        """Carga un replay guardado con save."""
+        return cls.from_bytes(Path(path).read_bytes())
+
+    # --- HELPERS ---
+    def _write_keyframes(self, body: bytearray) -> None:
+        """Agrega los estados de los keyframes, su tabla y la posición de la tabla."""
+        for keyframe in self.keyframes:
+            body += keyframe.state
+        index = len(body)
+        write_varint(body, self.keyframe_interval)
+        write_varint(body, len(self.keyframes))
+        # Los campos crecientes van como diferencia con el keyframe anterior
+        last = Keyframe(0, 0, 0, 0, 0, b"")
+        for keyframe in self.keyframes:
+            for value in (keyframe.frame - last.frame, keyframe.pos - last.pos, keyframe.ticks,
+                          keyframe.elapsed - last.elapsed, keyframe.pieces - last.pieces, len(keyframe.state)):
+                write_varint(body, value)
+            last = keyframe
+        body += _INDEX_OFFSET.pack(index)
+
+    def _read_keyframes(self, body: bytes, start: int) -> None:
+        """
+        Lee la sección de keyframes escrita por _write_keyframes desde `start`.
+
+        Raises:
+            ValueError: Si la sección está truncada.
+        """
+        if len(body) < start + _INDEX_OFFSET.size:
+            raise ValueError("Replay: datos truncados en la tabla de keyframes.")
+        pos = _INDEX_OFFSET.unpack_from(body, len(body) - _INDEX_OFFSET.size)[0]
+        self.keyframe_interval, pos = read_varint(body, pos)
+        count, pos = read_varint(body, pos)
+
+        keyframes, offset = [], start
+        frame = data_pos = elapsed = pieces = 0
+        for _ in range(count):
+            values = []
+            for _ in range(6):
+                value, pos = read_varint(body, pos)
+                values.append(value)
+            frame, data_pos, elapsed, pieces = (frame + values[0], data_pos + values[1],
+                                                elapsed + values[3], pieces + values[4])
+            state = bytes(body[offset:offset + values[5]])
+            if len(state) != values[5]:
+                raise ValueError("Replay: datos truncados en los keyframes.")
+            keyframes.append(Keyframe(frame, data_pos, values[2], elapsed, pieces, state))
+            offset += values[5]
+        self.keyframes = tuple(keyframes)
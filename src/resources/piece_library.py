@@ -1,6 +1,7 @@
 import pygame
 import numpy as np
 from typing import TYPE_CHECKING
+from src.core.piece_shapes import build_piece_shape
 
 if TYPE_CHECKING:
     from src.core.types import PieceData, PieceDataType, PieceSurfaces, BlockSurfaces
@@ -21,6 +22,9 @@ class PieceLibrary:
         """
         Registra una nueva pieza en la biblioteca, generando sus rotaciones y surfaces.
 
+        También precalcula, por rotación, las celdas ocupadas, su bounding box y las
+        máscaras de bits por fila, para que las validaciones de colisión no recorran matrices.
+
         Args:
             name: Nombre identificador de la pieza.
             base_matrix: Matriz base de la pieza para generar rotaciones.
@@ -31,7 +35,7 @@ class PieceLibrary:
         """
         self._assert_valid_register(name)
 
-        matrices = self._generate_rotations(base_matrix)
+        shape = build_piece_shape(base_matrix, type)
 
         surfaces: "PieceSurfaces" = {
                 "normal": self._build_piece(base_matrix, blocks["normal"]),
@@ -39,7 +43,7 @@ class PieceLibrary:
                 "ghost": self._build_piece(base_matrix, blocks["ghost"]),
             }
 
-        self._pieces[name] = { "matrices": matrices, "surfaces": surfaces, "block": blocks, "type": type}
+        self._pieces[name] = {**shape, "surfaces": surfaces, "block": blocks}
 
     def get_piece(self, name: str) -> "PieceData":
         """Devuelve los datos completos de la pieza."""
@@ -60,14 +64,6 @@ class PieceLibrary:
 
 
     # --- HELPERS ---
-    def _generate_rotations(self, matrix) -> list[np.ndarray]:
-        """Genera las cuatro rotaciones (0°, 90°, 180°, 270°) de la matriz."""
-        rotations = [matrix]
-        for _ in range(3):
-            matrix = np.rot90(matrix, k= -1)
-            rotations.append(matrix)
-        return rotations
-
     @staticmethod
     def _build_piece(piece_matrix: np.ndarray, block_image: pygame.Surface) -> pygame.Surface:
         """
@@ -1,6 +1,9 @@
 from src.states.menu_state import MenuState
 from src.states.countdown_state import CountdownState
 from src.states.play_state import PlayState
+from src.states.royale_state import RoyaleState
+from src.states.replay_state import ReplayState
+from src.states.versus_net_state import VersusNetState
 from src.states.pause_state import PauseState
 from src.states.game_over_state import GameOverState
 from src.states.state_manager import StateManager
@@ -8,6 +11,9 @@ from src.states.types import StateID, OverlayType
 
 __all__ = [
     "PlayState",
+    "RoyaleState",
+    "ReplayState",
+    "VersusNetState",
     "MenuState",
     "CountdownState",
     "GameOverState",
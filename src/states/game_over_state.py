@@ -11,16 +11,26 @@ if TYPE_CHECKING:
     from src.database import RulesetName, RawRecord
 
 class GameOverState(GameState):
-    """Estado de Game Over que se superpone al perder la partida."""
-    def __init__(self, game: "Game", ruleset_name: "RulesetName", stats: "RawRecord"):
+    """
+    Estado de Game Over que se superpone al perder la partida.
+
+    Los modos derivados de PlayState indican su título, el estado de "reintentar" y si la
+    partida entra en los records del ruleset.
+    """
+    def __init__(self, game: "Game", ruleset_name: "RulesetName", stats: "RawRecord",
+                 title: str = "GAME OVER", retry: StateID = StateID.PLAY, save_record: bool = True):
         super().__init__(game)
         self.ruleset_name = ruleset_name
         self.stats = stats
+        self.title_text = title
+        self.retry = retry
+        self.save_record = save_record
 
         self._build_ui()
     
     def on_enter(self) -> None:
-        self._try_save_record()
+        if self.save_record:
+            self._try_save_record()
         self.game.audio.stop_music()
         path = self.game.resources.get_music_path("HighScore")
         self.game.audio.play_sfx("GameOver")
@@ -63,7 +73,7 @@ class GameOverState(GameState):
             ("SALIR", self._on_exit)
         ]
 
-        self.title = UILabel("game_title", SCREEN_CENTER_W, 160, "GAME OVER", font_title, (255, 0, 0))
+        self.title = UILabel("game_title", SCREEN_CENTER_W, 160, self.title_text, font_title, (255, 0, 0))
         self.score_text = UILabel("final_score", SCREEN_CENTER_W, 280, f"Puntuación final: {self.stats["score"]}", font_score)
         
         self.menu = UIMenu("game_over_menu", SCREEN_CENTER_W, 400,
@@ -90,7 +100,7 @@ class GameOverState(GameState):
         config = self.game.gameplay_config.data
         ruleset = config["rulesets"][self.ruleset_name]
         self.game.state.clear()
-        self.game.state.change(StateID.PLAY, session_data=config, ruleset=ruleset, ruleset_name=self.ruleset_name)
+        self.game.state.change(self.retry, session_data=config, ruleset=ruleset, ruleset_name=self.ruleset_name)
 
     
     def _on_menu(self):
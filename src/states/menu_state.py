@@ -10,11 +10,21 @@ from src.ui import UIManager, UIMenu
 if TYPE_CHECKING:
     from src.core.game import Game
 
+# Segundos sin input en el menú antes de arrancar la demo (attract mode)
+ATTRACT_DELAY = 30.0
+ATTRACT_RULESET = "guideline"
+
+# Ruleset del battle royale (con hold, como el de los rivales)
+ROYALE_RULESET = "guideline"
+# Ruleset del versus en LAN (igual en ambos peers)
+VERSUS_RULESET = "guideline"
+
 class MenuState(GameState):
     def __init__(self, game: "Game") -> None:
         super().__init__(game)
 
         self._title = self.game.resources.get_image("Title")
+        self._idle_timer = 0.0
 
         self._build_ui()
         
@@ -28,6 +38,11 @@ class MenuState(GameState):
     def update(self, dt: float) -> None:
         self.ui.update(dt)
 
+        self._idle_timer += dt
+        if self._idle_timer >= ATTRACT_DELAY:
+            self._idle_timer = 0.0
+            self._on_attract()
+
     def render(self, surface: pygame.Surface) -> None:
         surface.blit(self.game.background, (0, 0))
 
@@ -35,6 +50,9 @@ class MenuState(GameState):
         self.ui.render(surface)
 
     def handle_input(self, events: list[pygame.event.Event]) -> None:
+        if any(event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN) for event in events):
+            self._idle_timer = 0.0
+
         if self.menu.is_confirming:
             return
 
@@ -58,11 +76,14 @@ class MenuState(GameState):
         return False
     
     def _build_ui(self) -> None:
-        font_menu = self.game.resources.get_font("Estandar", 48)
+        font_menu = self.game.resources.get_font("Estandar", 35)
 
         options_list =[
             ("JUGAR", self._on_play),
+            ("BATTLE ROYALE", self._on_royale),
+            ("VERSUS LAN", self._on_versus),
             ("RECORDS", self._on_records),
+            ("REPLAYS", self._on_replays),
             ("OPCIONES", self._on_config),
             ("SALIR", self._on_exit)
         ]
@@ -81,12 +102,35 @@ class MenuState(GameState):
     def _on_play(self):
         self.game.state.change(StateID.RULESET_SELECT)
     
+    def _on_royale(self):
+        """Arranca un battle royale contra los bots."""
+        config = self.game.gameplay_config.data
+        self.game.state.change(StateID.ROYALE, session_data=config, ruleset=config["rulesets"][ROYALE_RULESET],
+                               ruleset_name=ROYALE_RULESET)
+
+    def _on_versus(self):
+        """Arranca un versus en LAN contra el peer de config["network"]."""
+        config = self.game.gameplay_config.data
+        self.game.state.change(StateID.VERSUS_NET, session_data=config, ruleset=config["rulesets"][VERSUS_RULESET],
+                               ruleset_name=VERSUS_RULESET)
+
     def _on_config(self):
         self.game.state.change(StateID.OPTIONS)
 
     def _on_records(self):
         self.game.state.change(StateID.RECORDS)
+
+    def _on_replays(self):
+        """Abre el visor con el último replay guardado."""
+        self.game.state.change(StateID.REPLAY)
     
+    def _on_attract(self):
+        """Arranca una partida de demostración jugada por el bot (el externo de general.bot_command, si hay)."""
+        config = self.game.gameplay_config.data
+        self.game.state.change(StateID.PLAY, session_data=config, ruleset=config["rulesets"][ATTRACT_RULESET],
+                               ruleset_name=ATTRACT_RULESET, autoplay=True,
+                               bot_command=config["general"].get("bot_command"))
+
     def _on_exit(self):
         """Detiene y cierra la ventana del juego."""
         self.game.stop()
\ No newline at end of file
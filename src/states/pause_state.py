@@ -11,9 +11,10 @@ if TYPE_CHECKING:
 
 class PauseState(GameState):
     """Estado de pausa que se superpone al juego."""
-    def __init__(self, game: "Game", ruleset_name: "RulesetName"):
+    def __init__(self, game: "Game", ruleset_name: "RulesetName", retry: StateID = StateID.PLAY):
         super().__init__(game)
         self.ruleset_name = ruleset_name
+        self.retry = retry
 
         self._build_ui()
     
@@ -92,7 +93,7 @@ class PauseState(GameState):
         config = self.game.gameplay_config.data
         ruleset = config["rulesets"][self.ruleset_name]
         self.game.state.clear()
-        self.game.state.change(StateID.PLAY, session_data=config, ruleset=ruleset, ruleset_name=self.ruleset_name)
+        self.game.state.change(self.retry, session_data=config, ruleset=ruleset, ruleset_name=self.ruleset_name)
 
     def _on_options(self):
         """Abre el menú de opciones (si existe)."""
@@ -1,30 +1,57 @@
 import pygame
+from datetime import datetime
 from typing import TYPE_CHECKING
 from src.states.game_state import GameState
-from src.core import GameBoardController
+from src.core import Action, GameBoardController
+from src.ai import BotInput, ExternalBot, SearchService
+from src.replay import ReplayRecorder
+from src.render import GameBoardView
 from src.constants import BOARD_X, BOARD_Y, SCREEN_H, SCREEN_W
 from src.states.types import StateID, OverlayType
-from src.util import ScreenShake, ShakeDirection, get_hint_key
+from src.util import FrameBudget, ScreenShake, ShakeDirection, get_hint_key
+from src.util.paths import REPLAYS_ROOT
 from src.ui import UIFloatingLabel, UILabel, UIManager, UIHintBar
 
 if TYPE_CHECKING:
     from src.core.game import Game
-    from src.core.types import PieceDataType, BoardType, PiecesPreviewType
+    from src.core.types import PieceDataType
+    from src.render.types import BoardType, PiecesPreviewType
     from src.config.gameplay import GameplayConfigType, GameplayRulesetType
     from src.database import RulesetName
 
 
 class PlayState(GameState):
+    """
+    Partida en curso.
+
+    Con autoplay=True la partida la juega HeuristicBot (modo demo): no hay cuenta regresiva,
+    cualquier tecla vuelve al menú y al perder también se vuelve al menú, sin guardar replay.
+    La búsqueda del bot corre en un SearchService para que ningún frame espere por ella; con
+    `bot_command` juega en su lugar un bot externo (ver ExternalBot).
+
+    `frame_budget` registra el tiempo de update + render de cada frame contra los 16 ms.
+    """
+    # Estado al que vuelven "reintentar" y "reiniciar" (los modos derivados lo reemplazan)
+    STATE_ID = StateID.PLAY
+
     def __init__(self, game: "Game", session_data: "GameplayConfigType",
-                 ruleset: "GameplayRulesetType", ruleset_name: "RulesetName"):
+                 ruleset: "GameplayRulesetType", ruleset_name: "RulesetName", autoplay: bool = False,
+                 bot_command: list[str] | None = None):
         super().__init__(game)
         self._started = False
         self._game_over_triggered = False
         self.session_config = session_data
         self.ruleset = ruleset
         self.ruleset_name = ruleset_name
+        self.autoplay = autoplay
+        self.bot_command = bot_command
+        self._bot: BotInput | None = None
+        self._search: SearchService | ExternalBot | None = None
+        self.frame_budget = FrameBudget()
         self.pieces: "PieceDataType"
         self.session: GameBoardController
+        self.view: GameBoardView
+        self._recorder: ReplayRecorder
         self._shake = ScreenShake(intensity=4, duration=0.2)
         self._temp_surface = pygame.Surface(game.surface.get_size())
 
@@ -49,10 +76,9 @@ class PlayState(GameState):
             "preview_count": self.session_config["general"]["preview_count"],
         }
 
-        self.session = GameBoardController(
-            self.session_config, self.ruleset,
-            self.pieces, board_config, preview_config
-        )
+        self.session = GameBoardController(self.session_config, self.ruleset, self.pieces)
+        self._recorder = ReplayRecorder(self.session.seed, self.ruleset_name, self.session_config)
+        self.view = GameBoardView(self.session, self.pieces, board_config, preview_config)
 
         center_x = board_config["pos_x"] + 135
         center_y = board_config["pos_y"] + 300
@@ -65,52 +91,78 @@ class PlayState(GameState):
         )
         self.ui.add_element(self._floating_score)
 
+        if self.autoplay:
+            if self.bot_command:
+                self._search = ExternalBot.for_controller(self.session, self.bot_command)
+            else:
+                self._search = SearchService.for_controller(self.session)
+            self._bot = BotInput(self.session, service=self._search)
+            self._start_game()
+            return
+
         self.game.state.change(StateID.COUNTDOWN, playstate=self)
 
     def on_exit(self) -> None:
-        pass
+        if self._search is not None:
+            self._search.close()
 
     def handle_input(self, events: list[pygame.event.Event]) -> None:
         if not self._started or self.session.is_game_over():
             return
 
+        if self._bot is not None:
+            # En modo demo cualquier tecla o click devuelve al menú
+            if any(event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN) for event in events):
+                self.game.state.change(StateID.MENU)
+            return
+
         if self.game.input.is_action_pressed("ui", "pause") or self.game.input.is_action_pressed("ui","back"):
-            self.game.state.change(StateID.PAUSE, ruleset_name=self.ruleset_name)
+            self.game.state.change(StateID.PAUSE, ruleset_name=self.ruleset_name, retry=self.STATE_ID)
             return
 
         if self.game.input.is_action_pressed("play", "move_left"):
-            if self.session.move_left():
+            if self._perform(Action.MOVE_LEFT):
                 self.game.audio.play_sfx("MovePiece")
 
         if self.game.input.is_action_pressed("play", "move_right"):
-            if self.session.move_right():
+            if self._perform(Action.MOVE_RIGHT):
                 self.game.audio.play_sfx("MovePiece")
 
         if self.game.input.is_action_pressed("play", "move_down"):
-            if self.session.soft_drop():
+            if self._perform(Action.SOFT_DROP):
                 self.game.audio.play_sfx("MovePiece")
 
         if self.game.input.is_action_pressed("play", "rotate_right"):
-            if self.session.rotate_right():
+            if self._perform(Action.ROTATE_RIGHT):
                 self.game.audio.play_sfx("RotatePiece")
 
         if self.game.input.is_action_pressed("play", "rotate_left"):
-            if self.session.rotate_left():
+            if self._perform(Action.ROTATE_LEFT):
                 self.game.audio.play_sfx("RotatePiece")
 
         if self.game.input.is_action_pressed("play", "hard_drop"):
-            self.session.hard_drop()
+            self._perform(Action.HARD_DROP)
             #self.game.audio.play_sfx("LockPiece")
 
         if self.game.input.is_action_pressed("play", "hold") and self.ruleset_name == "guideline":
-            if self.session.hold():
+            if self._perform(Action.HOLD):
                 self.game.audio.play_sfx("RotatePiece")
 
     def update(self, dt: float) -> None:
         if not self._started:
             return
+        self.frame_budget.begin()
 
+        if self._bot is not None:
+            for action in self._bot.poll(dt):
+                if not self._perform(action):
+                    self._bot.reject()
+                    break
+
+        # El juego avanza con el dt redondeado del replay para que la reproducción sea exacta
+        dt = self._recorder.advance(dt)
         self.session.update(dt)
+        self._recorder.capture(self.session)
         self._floating_score.update(dt)
 
         self.val_score.set_text(str(self.session.current_score))
@@ -139,11 +191,7 @@ class PlayState(GameState):
         if self.session.is_game_over() and not self._game_over_triggered:
             self.game.audio.stop_music()
             self._game_over_triggered = True
-            self.game.state.change(
-                StateID.GAME_OVER,
-                ruleset_name = self.ruleset_name,
-                stats        = self.session.final_stats,
-            )
+            self._on_game_over()
 
     def render(self, surface: pygame.Surface) -> None:
         target = self._temp_surface if self._shake.is_active else surface
@@ -151,13 +199,15 @@ class PlayState(GameState):
         target.blit(self.game.background, (0, 0))
         target.blit(self._board, (BOARD_X, BOARD_Y))
 
-        self.session.draw(target, self.pieces)
+        self.view.draw(target)
+        self._render_extras(target)
 
         self.ui.render(target)
 
         if self._shake.is_active:
             surface.fill((0, 0, 0))
             surface.blit(target, self._shake.offset)
+        self.frame_budget.end()
 
     def _start_game(self) -> None:
         path = self.game.resources.get_music_path("GameplayMusic")
@@ -166,6 +216,35 @@ class PlayState(GameState):
         self._started = True
         self.session.start()
 
+    def _on_game_over(self) -> None:
+        """Termina la partida: guarda el replay y pasa a GAME_OVER (o vuelve al menú en modo demo)."""
+        if self._bot is not None:
+            self.game.state.change(StateID.MENU)
+            return
+        self._save_replay()
+        self.game.state.change(
+            StateID.GAME_OVER,
+            ruleset_name = self.ruleset_name,
+            stats        = self.session.final_stats,
+            retry        = self.STATE_ID,
+        )
+
+    def _render_extras(self, surface: pygame.Surface) -> None:
+        """Dibujo adicional de los modos derivados, sobre el tablero y debajo de la UI."""
+        pass
+
+    def _perform(self, action: Action) -> bool:
+        """Graba la acción en el replay y la despacha al controlador."""
+        self._recorder.record(action)
+        return self.session.perform(action)
+
+    def _save_replay(self) -> None:
+        """Guarda el replay de la partida terminada en REPLAYS_ROOT."""
+        replay = self._recorder.finish(self.session.final_stats)
+        REPLAYS_ROOT.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        replay.save(REPLAYS_ROOT / f"{self.ruleset_name}_{stamp}.trpl")
+
     def _build_ui(self) -> None:
         self.ui = UIManager()
         
@@ -0,0 +1,214 @@
+import pygame
+from pathlib import Path
+from typing import TYPE_CHECKING
+from src.states.game_state import GameState
+from src.states.types import StateID, OverlayType
+from src.replay import Replay, ReplayPlayer
+from src.render import GameBoardView
+from src.constants import BOARD_X, BOARD_Y, SCREEN_H, SCREEN_W
+from src.util import get_hint_key
+from src.util.paths import REPLAYS_ROOT
+from src.ui import UILabel, UIManager, UIHintBar
+
+if TYPE_CHECKING:
+    from src.core.game import Game
+    from src.render.types import BoardType, PiecesPreviewType
+
+# Velocidades de reproducción disponibles (arriba / abajo las recorren)
+SPEEDS = (1, 2, 4, 8)
+# Segundos que salta cada izquierda / derecha durante la reproducción
+SEEK_STEP = 5.0
+
+BAR       = pygame.Rect(BOARD_X, BOARD_Y + 620, 595, 10)
+BAR_BG    = (60, 60, 60)
+BAR_FILL  = (130, 59, 188)
+BAR_KEY   = (200, 200, 200)
+
+
+class ReplayState(GameState):
+    """
+    Visor de replays.
+
+    Abre el replay indicado (el último guardado en REPLAYS_ROOT por defecto) y lo reproduce con
+    un ReplayPlayer. Controles: pausa / seleccionar alterna pausa; arriba / abajo cambian la
+    velocidad (avance rápido hasta x8); izquierda / derecha saltan SEEK_STEP segundos, o un
+    frame en pausa; con el mouse se arrastra la barra de progreso (scrub).
+
+    Los saltos restauran el keyframe más cercano del replay y re-simulan desde ahí (ver
+    ReplayPlayer.seek), así que llegar a cualquier punto de una partida larga es inmediato.
+    """
+    def __init__(self, game: "Game", path: Path | None = None) -> None:
+        """
+        Args:
+            game: Juego.
+            path: Replay a abrir. Por defecto el más reciente de REPLAYS_ROOT.
+        """
+        super().__init__(game)
+        self.path = path if path is not None else self._latest()
+        self.player: ReplayPlayer | None = None
+        self.view: GameBoardView
+        self._duration = 0.0
+        self._speed = 0          # índice en SPEEDS
+        self._paused = False
+        self._dragging = False
+        self._error = ""
+
+        self._build_ui()
+
+    def on_enter(self) -> None:
+        self._board = self.game.resources.get_image("Board")
+        if self.path is None:
+            self._error = "Sin replays todavía."
+            return
+        pieces = self.game.resources.get_pieces()
+        config = self.game.gameplay_config.data
+        try:
+            replay = Replay.load(self.path)
+            self.player = ReplayPlayer(replay, config, pieces)
+        except (OSError, ValueError) as error:
+            self._error = str(error)
+            return
+        self._duration = replay.duration
+
+        board_config: "BoardType" = {
+            "surface": pygame.Surface((270, 600), pygame.SRCALPHA),
+            "pos_x":   BOARD_X + 163,
+            "pos_y":   BOARD_Y,
+        }
+        preview_config: "PiecesPreviewType" = {
+            "pos_x":         BOARD_X + 480,
+            "pos_y":         BOARD_Y + 90,
+            "max_width":     80,
+            "margin":        8,
+            "preview_count": config["general"]["preview_count"],
+        }
+        self.view = GameBoardView(self.player.session, pieces, board_config, preview_config)
+
+    def on_exit(self) -> None:
+        pass
+
+    def handle_input(self, events: list[pygame.event.Event]) -> None:
+        inp = self.game.input
+        if inp.is_action_pressed("ui", "back"):
+            self.game.state.change(StateID.MENU)
+            return
+        if self.player is None:
+            return
+
+        if inp.is_action_pressed("ui", "pause") or inp.is_action_pressed("ui", "select"):
+            self._paused = not self._paused
+        if inp.is_action_pressed("ui", "up"):
+            self._speed = min(self._speed + 1, len(SPEEDS) - 1)
+        if inp.is_action_pressed("ui", "down"):
+            self._speed = max(self._speed - 1, 0)
+
+        # En pausa izquierda / derecha avanzan de a un frame; reproduciendo saltan SEEK_STEP
+        step = inp.is_action_pressed("ui", "right") - inp.is_action_pressed("ui", "left")
+        if step and self._paused:
+            self.player.seek(self.player.frame + step)
+        elif step:
+            self.player.seek_time(self.player.time + step * SEEK_STEP)
+
+        if inp.is_mouse_pressed_in_rect("left", BAR.inflate(0, 16)):
+            self._dragging = True
+        elif not inp.is_mouse_held("left", 0):
+            self._dragging = False
+        if self._dragging:
+            x = min(max(inp.mouse_pos[0], BAR.left), BAR.right)
+            self.player.seek_time((x - BAR.left) / BAR.width * self._duration)
+
+    def update(self, dt: float) -> None:
+        self.ui.update(dt)
+        if self.player is None:
+            return
+        if not self._paused and not self._dragging:
+            self.player.advance(dt * SPEEDS[self._speed])
+
+        session = self.player.session
+        self.val_score.set_text(str(session.current_score))
+        self.val_level.set_text(str(session.current_level))
+        self.val_lines.set_text(str(session.total_lines_cleared))
+        state = "PAUSA" if self._paused else f"x{SPEEDS[self._speed]}"
+        self.val_status.set_text(f"{self._clock(self.player.time)} / {self._clock(self._duration)}   {state}")
+
+    def render(self, surface: pygame.Surface) -> None:
+        surface.blit(self.game.background, (0, 0))
+        surface.blit(self._board, (BOARD_X, BOARD_Y))
+        if self.player is not None:
+            self.view.draw(surface)
+            self._draw_bar(surface)
+        else:
+            self.val_status.set_text(self._error)
+        self.ui.render(surface)
+
+    @property
+    def overlay_type(self) -> OverlayType:
+        return OverlayType.NONE
+
+    @property
+    def is_transient(self) -> bool:
+        return False
+
+    # --- HELPERS ---
+    @staticmethod
+    def _latest() -> Path | None:
+        """Replay más reciente de REPLAYS_ROOT, o None si no hay ninguno."""
+        replays = sorted(REPLAYS_ROOT.glob("*.trpl"), key=lambda path: path.stat().st_mtime) if REPLAYS_ROOT.exists() else []
+        return replays[-1] if replays else None
+
+    @staticmethod
+    def _clock(seconds: float) -> str:
+        minutes, seconds = divmod(int(seconds), 60)
+        return f"{minutes:02d}:{seconds:02d}"
+
+    def _draw_bar(self, surface: pygame.Surface) -> None:
+        """Barra de progreso con una marca por keyframe."""
+        pygame.draw.rect(surface, BAR_BG, BAR)
+        if self._duration > 0:
+            fill = BAR.copy()
+            fill.width = int(BAR.width * min(self.player.time / self._duration, 1.0))
+            pygame.draw.rect(surface, BAR_FILL, fill)
+            for keyframe in self.player.replay.keyframes:
+                x = BAR.left + int(BAR.width * keyframe.time / self._duration)
+                pygame.draw.line(surface, BAR_KEY, (x, BAR.bottom), (x, BAR.bottom + 3))
+
+    def _build_ui(self) -> None:
+        self.ui = UIManager()
+
+        font_title = self.game.resources.get_font("Estandar", 30)
+        font_value = self.game.resources.get_font("Estandar", 30)
+        font_hint = self.game.resources.get_font("Estandar", 25)
+
+        stats_x = BOARD_X + 10
+        base_y = BOARD_Y + 340
+        spacing = 90
+
+        self.ui.add_element(UILabel("lbl_score_txt", stats_x, base_y, "SCORE", font_title, (180, 180, 180), center=False))
+        self.val_score = UILabel("val_score", stats_x, base_y + 30, "0", font_value, (255, 255, 255), center=False)
+        self.ui.add_element(self.val_score)
+
+        self.ui.add_element(UILabel("lbl_lvl_txt", stats_x, base_y + spacing, "LEVEL", font_title, (180, 180, 180), center=False))
+        self.val_level = UILabel("val_lvl", stats_x, base_y + spacing + 30, "1", font_value, (255, 255, 255), center=False)
+        self.ui.add_element(self.val_level)
+
+        self.ui.add_element(UILabel("lbl_lines_txt", stats_x, base_y + spacing * 2, "LINES", font_title, (180, 180, 180), center=False))
+        self.val_lines = UILabel("val_lines", stats_x, base_y + spacing * 2 + 30, "0", font_value, (255, 255, 255), center=False)
+        self.ui.add_element(self.val_lines)
+
+        self.val_status = UILabel("val_status", 20, 20, "", font_value, (255, 255, 255), center=False)
+        self.ui.add_element(self.val_status)
+
+        ctrl = self.game.controls_config
+        self.ui.add_element(
+            UIHintBar(
+                "replay_hints",
+                font_hint,
+                [
+                    (get_hint_key(ctrl, "pause"), "Pausa"),
+                    (f"{get_hint_key(ctrl, 'left')} / {get_hint_key(ctrl, 'right')}", "Saltar / Frame"),
+                    (f"{get_hint_key(ctrl, 'up')} / {get_hint_key(ctrl, 'down')}", "Velocidad"),
+                    (get_hint_key(ctrl, "back"), "Volver"),
+                ],
+                midbottom=(SCREEN_W // 2, SCREEN_H - 5),
+            )
+        )
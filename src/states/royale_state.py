@@ -0,0 +1,119 @@
+import pygame
+from typing import TYPE_CHECKING
+from src.states.play_state import PlayState
+from src.core import VersusMatch, cancel_garbage, take_garbage
+from src.ai import RoyaleWorker
+from src.render import RoyaleView
+from src.constants import BOARD_X, BOARD_Y, BOARD_H, ROWS, SCREEN_W
+from src.states.types import StateID
+from src.ui import UILabel
+
+if TYPE_CHECKING:
+    from src.core.game import Game
+    from src.config.gameplay import GameplayConfigType, GameplayRulesetType
+    from src.database import RulesetName
+
+# Rivales del battle royale (99 jugadores contando al humano)
+OPPONENTS = 98
+# Filas de basura que pueden entrar como máximo con cada pieza
+GARBAGE_CAP = 8
+# Ancho del panel del tablero (imagen "Board") y posición del tablero de celdas dentro de él
+PANEL_W  = 595
+CELLS_X  = BOARD_X + 163
+METER_W  = 6
+METER_COLOR = (220, 40, 40)
+
+
+class RoyaleState(PlayState):
+    """
+    Battle royale: el jugador contra 98 bots.
+
+    Los rivales corren en un RoyaleWorker, fuera del hilo de render: cada frame solo se le
+    envía el dt y se recogen los ataques que llegaron. Sus tableros se dibujan como
+    miniaturas a ambos lados del tablero con RoyaleView, que redibuja una miniatura solo
+    cuando su tablero cambió.
+
+    La basura dirigida al jugador se encola acá con las reglas de VersusMatch: el ataque del
+    jugador primero la cancela y el resto se envía a un rival al azar; la que queda entra al
+    bloquear una pieza sin eliminar líneas. La partida no guarda replay (la basura recibida no
+    está en el replay) ni entra en los records del ruleset.
+    """
+    STATE_ID = StateID.ROYALE
+
+    def __init__(self, game: "Game", session_data: "GameplayConfigType",
+                 ruleset: "GameplayRulesetType", ruleset_name: "RulesetName"):
+        super().__init__(game, session_data, ruleset, ruleset_name)
+        self._field: RoyaleWorker | None = None
+        self._royale_view: RoyaleView
+        self._incoming: list[list[int]] = []   # [filas, hueco], la más antigua primero
+        self._seen = 0
+
+    def on_enter(self) -> None:
+        super().on_enter()
+        self._field = RoyaleWorker.for_controller(self.session, self.session_config, self.ruleset,
+                                                  OPPONENTS, seed=self.session.seed)
+        side = BOARD_X - 8
+        areas = [pygame.Rect(4, BOARD_Y, side, BOARD_H), pygame.Rect(BOARD_X + PANEL_W + 4, BOARD_Y, side, BOARD_H)]
+        self._royale_view = RoyaleView(self.pieces, OPPONENTS, areas)
+
+    def on_exit(self) -> None:
+        super().on_exit()
+        if self._field is not None:
+            self._field.close()
+
+    def update(self, dt: float) -> None:
+        super().update(dt)
+        if not self._started or self._game_over_triggered:
+            return
+
+        for count, hole in self._field.poll():
+            self._incoming.append([count, hole])
+        if self.session.pieces_locked != self._seen:
+            self._seen = self.session.pieces_locked
+            self._exchange()
+        self._field.advance(dt)
+
+        self.val_royale.set_text(f"RIVALES {self._field.alive}   KOs {self._field.player_kos}")
+        if self._field.alive == 0 and not self.session.is_game_over():
+            self._game_over_triggered = True
+            self.game.audio.stop_music()
+            self._finish("VICTORIA")
+
+    # --- HELPERS ---
+    def _exchange(self) -> None:
+        """Resuelve el último bloqueo del jugador: ataque, cancelación o basura recibida."""
+        if not self.session.last_lines_cleared:
+            for count, hole in take_garbage(self._incoming, GARBAGE_CAP):
+                self.session.receive_garbage(count, hole)
+            return
+        attack = VersusMatch.attack_of(self.session)
+        self._field.attack(attack - cancel_garbage(self._incoming, attack))
+
+    def _on_game_over(self) -> None:
+        placement = self._field.player_out()
+        self._finish(f"PUESTO {placement}")
+
+    def _finish(self, title: str) -> None:
+        self.game.state.change(
+            StateID.GAME_OVER,
+            ruleset_name = self.ruleset_name,
+            stats        = self.session.final_stats,
+            title        = title,
+            retry        = self.STATE_ID,
+            save_record  = False,
+        )
+
+    def _render_extras(self, surface: pygame.Surface) -> None:
+        """Miniaturas de los rivales y medidor de basura pendiente junto al tablero."""
+        self._royale_view.draw(surface, self._field)
+        pending = min(sum(count for count, _ in self._incoming), ROWS)
+        if pending:
+            height = BOARD_H * pending // ROWS
+            surface.fill(METER_COLOR, (CELLS_X - METER_W - 2, BOARD_Y + BOARD_H - height, METER_W, height))
+
+    def _build_ui(self) -> None:
+        super()._build_ui()
+        font = self.game.resources.get_font("Estandar", 30)
+        self.val_royale = UILabel("val_royale", SCREEN_W // 2, BOARD_Y // 2, f"RIVALES {OPPONENTS}   KOs 0",
+                                  font, (255, 255, 255))
+        self.ui.add_element(self.val_royale)
@@ -4,6 +4,9 @@ from src.states.menu_state import MenuState
 from src.states.ruleset_select_state import RulesetSelectState
 from src.states.countdown_state import CountdownState
 from src.states.play_state import PlayState
+from src.states.royale_state import RoyaleState
+from src.states.replay_state import ReplayState
+from src.states.versus_net_state import VersusNetState
 from src.states.pause_state import PauseState
 from src.states.game_over_state import GameOverState
 from src.states.options_state import OptionsState
@@ -33,7 +36,10 @@ class StateManager:
             StateID.GAME_OVER: GameOverState,
             StateID.OPTIONS: OptionsState,
             StateID.KEYBIND_EDITOR: KeybindEditorState,
-            StateID.RECORDS: RecordsState
+            StateID.RECORDS: RecordsState,
+            StateID.ROYALE: RoyaleState,
+            StateID.REPLAY: ReplayState,
+            StateID.VERSUS_NET: VersusNetState
         }
 
     @property
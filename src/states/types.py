@@ -10,6 +10,9 @@ class StateID(Enum):
     OPTIONS = auto()
     KEYBIND_EDITOR = auto()
     RECORDS = auto()
+    ROYALE = auto()
+    REPLAY = auto()
+    VERSUS_NET = auto()
     # Más estados
 
 # ENUM DE OVERLAYS PARA LOS ESTADOS DEL JUEGO
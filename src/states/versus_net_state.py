@@ -0,0 +1,237 @@
+import pygame
+from typing import TYPE_CHECKING
+from src.states.game_state import GameState
+from src.states.types import StateID, OverlayType
+from src.core import Action, GameBoardController, VersusMatch
+from src.net import FRAME, RollbackSession, UdpTransport
+from src.render import GameBoardView, RivalView
+from src.constants import BOARD_X, BOARD_Y, SCREEN_H, SCREEN_W
+from src.util import get_hint_key
+from src.ui import UILabel, UIManager, UIHintBar
+
+if TYPE_CHECKING:
+    from src.core.game import Game
+    from src.core.types import PieceDataType
+    from src.render.types import BoardType, PiecesPreviewType
+    from src.config.gameplay import GameplayConfigType, GameplayRulesetType
+    from src.database import RulesetName
+
+# Acciones de "play" que se envían al rival, en el orden en que se leen
+PLAY_ACTIONS = (
+    ("move_left",    Action.MOVE_LEFT),
+    ("move_right",   Action.MOVE_RIGHT),
+    ("move_down",    Action.SOFT_DROP),
+    ("rotate_right", Action.ROTATE_RIGHT),
+    ("rotate_left",  Action.ROTATE_LEFT),
+    ("hard_drop",    Action.HARD_DROP),
+    ("hold",         Action.HOLD),
+)
+# Frames que se pueden recuperar de una vez si un frame de render tardó (evita la espiral)
+MAX_CATCHUP = 4
+# Ventaja en frames sobre el rival a partir de la cual se cede un frame para sincronizar relojes
+SYNC_ADVANTAGE = 2
+# Posición del tablero reducido del rival (a la derecha del panel del tablero propio)
+RIVAL_POS = (BOARD_X + 595 + 40, BOARD_Y + 60)
+
+
+class VersusNetState(GameState):
+    """
+    Versus de dos jugadores en LAN con rollback.
+
+    Ambos peers crean las dos partidas con la misma semilla (config["network"]["seed"]) y se
+    conectan por UDP a la dirección del otro (bind_port, peer_host, peer_port); "player" indica
+    qué partida controla cada uno y debe ser distinto en los dos lados. Las acciones del
+    teclado se leen en handle_input y se entregan a RollbackSession.advance, que avanza la
+    simulación a frames fijos de FRAME segundos: el dt del juego se acumula en update y cada
+    FRAME acumulado es un advance. Si este peer va SYNC_ADVANTAGE frames por delante del
+    rival cede un frame, para que ninguno de los dos espere.
+
+    Cuando alguien pierde la simulación se detiene en ese frame (los dos peers se detienen en el
+    mismo) y el resultado se muestra cuando el frame ya está confirmado; si un input tardío lo
+    desmiente, el rollback deshace la derrota y la partida sigue. Hasta salir se siguen
+    procesando paquetes para que el rival también lo confirme.
+    La partida no guarda replay ni entra en los records.
+    """
+    def __init__(self, game: "Game", session_data: "GameplayConfigType",
+                 ruleset: "GameplayRulesetType", ruleset_name: "RulesetName") -> None:
+        super().__init__(game)
+        self.session_config = session_data
+        self.ruleset = ruleset
+        self.ruleset_name = ruleset_name
+        self.network = session_data["network"]
+        self.session: RollbackSession | None = None
+        self.players: list[GameBoardController]
+        self.view: GameBoardView
+        self._rival: RivalView
+        self._actions: list[Action] = []
+        self._clock = 0.0
+        self._waiting = False
+        self._yielded = False
+        self._result = ""
+        self._error = ""
+
+        self._build_ui()
+
+    def on_enter(self) -> None:
+        self.pieces: "PieceDataType" = self.game.resources.get_pieces()
+        self._board = self.game.resources.get_image("Board")
+        network = self.network
+        local = network["player"]
+        peer = (network["peer_host"], network["peer_port"])
+        self.val_peer.set_text(f"JUGADOR {local + 1}   RIVAL {peer[0]}:{peer[1]}")
+
+        seed = network["seed"]
+        self.players = [GameBoardController(self.session_config, self.ruleset, self.pieces, seed=seed * 2 + index)
+                        for index in (0, 1)]
+        for player in self.players:
+            player.start()
+        try:
+            transport = UdpTransport(("0.0.0.0", network["bind_port"]), peer)
+            self.session = RollbackSession(self.players, local, transport, network["input_delay"],
+                                           match=VersusMatch(self.players, seed))
+        except (OSError, ValueError) as error:
+            self._error = str(error)
+            return
+
+        board_config: "BoardType" = {
+            "surface": pygame.Surface((270, 600), pygame.SRCALPHA),
+            "pos_x":   BOARD_X + 163,
+            "pos_y":   BOARD_Y,
+        }
+        preview_config: "PiecesPreviewType" = {
+            "pos_x":         BOARD_X + 480,
+            "pos_y":         BOARD_Y + 90,
+            "max_width":     80,
+            "margin":        8,
+            "preview_count": self.session_config["general"]["preview_count"],
+        }
+        self.view = GameBoardView(self.players[local], self.pieces, board_config, preview_config)
+        self._rival = RivalView(self.players[1 - local], self.pieces, RIVAL_POS)
+
+        path = self.game.resources.get_music_path("GameplayMusic")
+        self.game.audio.play_music(path)
+
+    def on_exit(self) -> None:
+        self.game.audio.stop_music()
+        if self.session is not None:
+            self.session.close()
+
+    def handle_input(self, events: list[pygame.event.Event]) -> None:
+        if self.game.input.is_action_pressed("ui", "back"):
+            self.game.state.change(StateID.MENU)
+            return
+        if self.session is None or self._result or self._over():
+            return
+
+        # Sin pausa: el rival sigue jugando. Hold solo si el ruleset lo tiene.
+        for name, action in PLAY_ACTIONS:
+            if self.game.input.is_action_pressed("play", name) and (action != Action.HOLD or self.ruleset["hold"]):
+                self._actions.append(action)
+
+        session = self.session
+        while self._clock >= FRAME:
+            self._clock -= FRAME
+            # Cede como máximo uno de cada dos frames, así el peer adelantado nunca se detiene
+            if session.frame_advantage >= SYNC_ADVANTAGE and not self._yielded:
+                session.poll()
+                self._yielded = True
+                continue
+            self._yielded = False
+            self._waiting = not session.advance(self._actions)
+            self._actions = []      # si esperó, RollbackSession ya las guardó para el próximo frame
+            if self._waiting:
+                self._clock = 0.0
+                break
+
+    def update(self, dt: float) -> None:
+        self.ui.update(dt)
+        if self.session is None:
+            return
+        if self._result:
+            self.session.poll()
+            return
+        self._clock = min(self._clock + dt, FRAME * MAX_CATCHUP)
+        if self._over():
+            # Alguien perdió: se espera sin avanzar a que el rival confirme (o desmienta) ese frame
+            self.session.poll()
+
+        local = self.players[self.session.local]
+        self.val_score.set_text(str(local.current_score))
+        self.val_level.set_text(str(local.current_level))
+        self.val_lines.set_text(str(local.total_lines_cleared))
+        stats = self.session.stats
+        status = "ESPERANDO AL RIVAL" if self._waiting else f"FRAME {self.session.frame}"
+        self.val_status.set_text(f"{status}   ROLLBACKS {stats.rollbacks}   VENTAJA {self.session.frame_advantage:+d}")
+
+        if local.consume_lock_event():
+            self.game.audio.play_sfx("LockPiece")
+
+        # El resultado solo es definitivo cuando ambos peers confirmaron el frame
+        if self._over() and self.session.confirmed_frame == self.session.frame:
+            self._result = "DERROTA" if local.is_game_over() else "VICTORIA"
+            self.val_status.set_text(self._result)
+            self.game.audio.stop_music()
+            self.game.audio.play_sfx("GameOver")
+
+    def render(self, surface: pygame.Surface) -> None:
+        surface.blit(self.game.background, (0, 0))
+        surface.blit(self._board, (BOARD_X, BOARD_Y))
+        if self.session is not None:
+            self.view.draw(surface)
+            self._rival.draw(surface)
+        else:
+            self.val_status.set_text(f"Sin conexión: {self._error}")
+        self.ui.render(surface)
+
+    @property
+    def overlay_type(self) -> OverlayType:
+        return OverlayType.NONE
+
+    @property
+    def is_transient(self) -> bool:
+        return False
+
+    # --- HELPERS ---
+    def _over(self) -> bool:
+        """Si alguna de las dos partidas terminó en el frame simulado (puede ser una predicción)."""
+        return any(player.is_game_over() for player in self.players)
+
+    def _build_ui(self) -> None:
+        self.ui = UIManager()
+
+        font_title = self.game.resources.get_font("Estandar", 30)
+        font_value = self.game.resources.get_font("Estandar", 30)
+        font_hint = self.game.resources.get_font("Estandar", 25)
+
+        stats_x = BOARD_X + 10
+        base_y = BOARD_Y + 340
+        spacing = 90
+
+        self.ui.add_element(UILabel("lbl_score_txt", stats_x, base_y, "SCORE", font_title, (180, 180, 180), center=False))
+        self.val_score = UILabel("val_score", stats_x, base_y + 30, "0", font_value, (255, 255, 255), center=False)
+        self.ui.add_element(self.val_score)
+
+        self.ui.add_element(UILabel("lbl_lvl_txt", stats_x, base_y + spacing, "LEVEL", font_title, (180, 180, 180), center=False))
+        self.val_level = UILabel("val_lvl", stats_x, base_y + spacing + 30, "1", font_value, (255, 255, 255), center=False)
+        self.ui.add_element(self.val_level)
+
+        self.ui.add_element(UILabel("lbl_lines_txt", stats_x, base_y + spacing * 2, "LINES", font_title, (180, 180, 180), center=False))
+        self.val_lines = UILabel("val_lines", stats_x, base_y + spacing * 2 + 30, "0", font_value, (255, 255, 255), center=False)
+        self.ui.add_element(self.val_lines)
+
+        self.val_status = UILabel("val_status", 20, 20, "CONECTANDO", font_value, (255, 255, 255), center=False)
+        self.ui.add_element(self.val_status)
+        self.val_peer = UILabel("val_peer", 20, 50, "", font_hint, (180, 180, 180), center=False)
+        self.ui.add_element(self.val_peer)
+
+        ctrl = self.game.controls_config
+        self.ui.add_element(
+            UIHintBar(
+                "versus_hints",
+                font_hint,
+                [
+                    (get_hint_key(ctrl, "back"), "Salir"),
+                ],
+                midbottom=(SCREEN_W // 2, SCREEN_H - 5),
+            )
+        )
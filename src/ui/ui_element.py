@@ -101,7 +101,12 @@ class UIElement(ABC):
     # --- MÉTODOS ABSTRACTOS ---
     @abstractmethod
     def render(self, surface: pygame.Surface) -> None:
-        """Renderiza el elemento en la superficie destino."""
+        """
+        Renderiza el elemento en la superficie destino.
+
+        UIManager pasa un RenderBatch en lugar de la surface, por lo que las implementaciones
+        solo deben usar `surface.blit`.
+        """
         pass
 
     @abstractmethod
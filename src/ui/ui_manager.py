@@ -1,10 +1,12 @@
 from src.ui import UIElement
+from src.render.render_batch import RenderBatch
 
 class UIManager:
     """Clase que se encarga de administrar todas las elementos de la UI disponibles."""
     def __init__(self) -> None:
         """Inicializa la lista de elementos de la UI."""
         self.elements: list[UIElement] = []
+        self._batch = RenderBatch()
 
     def add_element(self, element: UIElement) -> None:
         """Agrega elementos de la UI a la lista siempre y cuando sean instancias de UIElement."""
@@ -25,10 +27,16 @@ class UIManager:
             element.visible = visible
 
     def render(self, surface) -> None:
-        """Dibuja solo los elementos visibles."""
+        """
+        Dibuja solo los elementos visibles.
+
+        Los elementos renderizan sobre un RenderBatch que se envía a la surface con un
+        único Surface.blits, en el mismo orden en que se agregaron.
+        """
         for element in self.elements:
             if element.visible:
-                element.render(surface)
+                element.render(self._batch)
+        self._batch.flush(surface)
 
     def update(self, dt: float) -> None:
         """Actualiza solo los elementos habilitados."""
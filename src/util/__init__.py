@@ -1,6 +1,7 @@
 from src.util.conversors import str_to_pygame_key, pygame_key_to_str, get_hint_key
 from src.util.paths import get_asset, get_path
 from src.util.screen_shake import ScreenShake, ShakeDirection
+from src.util.frame_budget import FrameBudget
 
 __all__ = [
     "str_to_pygame_key",
@@ -0,0 +1,49 @@
+import time
+
+
+class FrameBudget:
+    """
+    Mide el tiempo de trabajo de cada frame (update + render) contra un presupuesto.
+
+    Se llama a begin() al empezar el update y a end() al terminar el render; lo que pasa entre
+    frames (esperar el vsync, el reloj) no cuenta.
+    """
+
+    def __init__(self, budget: float = 1 / 60) -> None:
+        """
+        Args:
+            budget: Tiempo máximo por frame en segundos (16.7 ms por defecto).
+        """
+        self.budget = budget
+        self.reset()
+
+    @property
+    def average(self) -> float:
+        return self.total / self.frames if self.frames else 0.0
+
+    def begin(self) -> None:
+        self._started = time.perf_counter()
+
+    def end(self) -> float:
+        """Cierra el frame en curso y devuelve su duración (0 si no se llamó a begin)."""
+        if self._started is None:
+            return 0.0
+        elapsed = time.perf_counter() - self._started
+        self._started = None
+        self.frames += 1
+        self.total  += elapsed
+        self.worst   = max(self.worst, elapsed)
+        if elapsed > self.budget:
+            self.over_budget += 1
+        return elapsed
+
+    def reset(self) -> None:
+        self.frames: int = 0
+        self.total: float = 0.0
+        self.worst: float = 0.0
+        self.over_budget: int = 0
+        self._started: float | None = None
+
+    def __str__(self) -> str:
+        return (f"{self.frames} frames, promedio {self.average * 1e3:.2f} ms, peor {self.worst * 1e3:.2f} ms, "
+                f"{self.over_budget} sobre {self.budget * 1e3:.1f} ms")
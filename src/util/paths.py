@@ -16,6 +16,9 @@ BASE_PATH = get_base_path()
 # Ruta a los assets
 ASSETS_ROOT = BASE_PATH / "assets"
 
+# Carpeta donde se guardan los replays de las partidas
+REPLAYS_ROOT = BASE_PATH / "replays"
+
 def get_path(*paths: str) -> Path:
     """Devuelve la ruta absoluta de una dirección como un objeto Path"""
     path = BASE_PATH.joinpath(*paths)